@@ -11,3 +11,13 @@ handler.setFormatter(formatter)
 if not logger.handlers:
     logger.addHandler(handler)
     logger.propagate = False
+
+from .lazy import attach
+
+__getattr__, __dir__, _ = attach(__name__, submodules=[
+    'backend', 'typing', 'decorator', 'quadrature', 'sparse', 'geometry',
+    'mesh', 'functionspace', 'fem', 'fdm', 'solver', 'writer', 'plotting',
+    'plotter', 'opt', 'graph', 'cfd', 'csm', 'cem', 'pde', 'material',
+    'physics', 'tools', 'utils',
+])
+del _
@@ -1,10 +1,12 @@
 
 from abc import ABCMeta
+from functools import partial
 from typing import(
     Union, Optional, Dict, Tuple, Any, Type, Generic, TypeVar, overload
 )
 
 from .. import logger
+from .einsum_plan import get_einsum_plan
 
 _Self = TypeVar("_Self")
 _DT = TypeVar("_DT")
@@ -235,6 +237,8 @@ class Backend(Generic[_DT]):
     Base class for all backends.
     """
     DATA_CLASS: Optional[Type[_DT]] = None
+    # Whether einsum plans lower pairwise contractions to batched matmul.
+    EINSUM_BMM: bool = False
     _available_backends: Dict[str, Type["Backend"]] = {}
 
     def __init_subclass__(cls, backend_name: str, **kwargs):
@@ -282,5 +286,18 @@ class Backend(Generic[_DT]):
     def is_tensor(cls, obj: Any, /) -> bool:
         return isinstance(obj, cls.DATA_CLASS)
 
+    @classmethod
+    def einsum_plan(cls, subscripts: str, /, *shapes: Tuple[int, ...]):
+        """Return the cached contraction plan of einsum for the subscripts
+        and the shapes of operands. See `EinsumPlan`."""
+        shapes = tuple(tuple(int(n) for n in s) for s in shapes)
+        return get_einsum_plan(cls, subscripts, shapes)
+
+    @classmethod
+    def _einsum_kernel(cls, subscripts: str, shapes: Tuple[Tuple[int, ...], ...]):
+        """Return the function contracting operands of the shapes by einsum.
+        Backends able to precompute the contraction path override this."""
+        return partial(cls.einsum, subscripts)
+
     # NOTE: Backend is the base class is for the backend system.
     # Do not implement any utils here.
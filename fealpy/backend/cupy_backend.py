@@ -6,6 +6,7 @@ from itertools import combinations_with_replacement
 import numpy as np
 import cupy as cp 
 import cupyx as cpx
+import cupyx.scipy.sparse
 from cupy.typing import NDArray
 from cupy.linalg import det
 
@@ -69,6 +70,23 @@ class CuPyBackend(Backend[NDArray], backend_name='cupy'):
         indices1[inverse] = range(inverse.shape[0]);
         return b, indices0, indices1, inverse, counts
 
+    ### Sparse Functions ###
+    @staticmethod
+    def coo_spmm(indices, values, shape, other):
+        if values.ndim != 1 or other.ndim > 2:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+        mat = cpx.scipy.sparse.coo_matrix((values, (indices[0], indices[1])), shape=shape)
+        return mat @ other
+
+    @staticmethod
+    def csr_spmm(crow, col, values, shape, other):
+        if values.ndim != 1 or other.ndim > 2:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+        mat = cpx.scipy.sparse.csr_matrix((values, col, crow), shape=shape)
+        return mat @ other
+
     ### FEALPy methods ###
 
     @staticmethod
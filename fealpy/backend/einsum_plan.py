@@ -0,0 +1,165 @@
+
+from typing import Tuple, List, Optional, Callable, Any
+from functools import lru_cache
+from math import prod
+
+Shape = Tuple[int, ...]
+
+_LETTERS = 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def parse_subscripts(subscripts: str, shapes: Tuple[Shape, ...]) -> Optional[Tuple[List[str], str]]:
+    """Parse the subscripts of einsum into the index strings of the inputs and
+    the output, with ellipses replaced by explicit indices according to the shapes.
+
+    Returns:
+        Tuple[List[str], str] | None: the input and output indices, or None if\
+            the output is implicit.
+    """
+    subscripts = subscripts.replace(' ', '')
+    if '->' not in subscripts:
+        return None
+    lhs, out = subscripts.split('->')
+    inputs = lhs.split(',')
+    if len(inputs) != len(shapes):
+        raise ValueError(f"einsum subscripts '{subscripts}' expect {len(inputs)} "
+                         f"operands, but {len(shapes)} shapes are given.")
+
+    if '...' not in subscripts:
+        return inputs, out
+
+    used = set(subscripts)
+    free = [c for c in _LETTERS if c not in used]
+    nell = [len(s) - len(t.replace('...', '')) for t, s in zip(inputs, shapes)]
+    NE = max(n for n, t in zip(nell, inputs) if '...' in t)
+    if NE > len(free):
+        return None
+    # ellipsis dimensions are aligned to the right, as broadcasting
+    ell = ''.join(free[:NE])
+    inputs = [t.replace('...', ell[NE-n:]) for n, t in zip(nell, inputs)]
+    out = out.replace('...', ell)
+    return inputs, out
+
+
+class EinsumPlan():
+    """A contraction of einsum prepared for fixed subscripts and operand shapes.
+
+    Plans are built by `backend_manager.einsum_plan(subscripts, *shapes)` and
+    cached for every backend, subscripts and shapes, so the analysis is done
+    once and then reused by every call with operands of these shapes.
+
+    Two kinds of plans are built:
+
+    - 'bmm': the contraction of two operands, scaled by some other operands
+      whose indices all belong to one of them, e.g. `q, c, cqid, cqjd -> cij`.
+      The scaling factors are multiplied into the smaller operand, and the
+      contraction is done as one batched matrix multiplication, which calls
+      BLAS. This is enabled by the backends with `EINSUM_BMM = True`.
+    - 'einsum': other contractions are done by the einsum of the backend,
+      with the contraction path precomputed if the backend supports it.
+
+    Plans only call the tensor functions of the backend with fixed arguments,
+    so they can be traced by `torch.compile` and `jax.jit`.
+
+    Examples:
+        >>> plan = bm.einsum_plan('q, c, cqid, cqjd -> cij', ws.shape, cm.shape, phi.shape, phi.shape)
+        >>> M = plan(ws, cm, phi, phi)
+    """
+    def __init__(self, backend, subscripts: str, shapes: Tuple[Shape, ...]):
+        self.backend = backend
+        self.subscripts = subscripts
+        self.shapes = shapes
+        self.kind = 'einsum'
+
+        if backend.EINSUM_BMM:
+            parsed = parse_subscripts(subscripts, shapes)
+            if parsed is not None:
+                self._analyze(*parsed)
+        if self.kind == 'einsum':
+            self._kernel = backend._einsum_kernel(subscripts, shapes)
+
+    def __repr__(self):
+        return f"EinsumPlan('{self.subscripts}', kind='{self.kind}')"
+
+    def _analyze(self, inputs: List[str], out: str):
+        """Try to lower the contraction to the scaled batched matmul."""
+        shapes = self.shapes
+        if len(inputs) < 2:
+            return
+        size = {}
+        for t, s in zip(inputs, shapes):
+            if len(t) != len(s) or len(set(t)) != len(t):
+                return # traces, diagonals or invalid subscripts
+            for c, n in zip(t, s):
+                if size.setdefault(c, n) != n:
+                    return # broadcasting
+        if len(set(out)) != len(out) or any(c not in size for c in out):
+            return
+
+        # the two largest operands are contracted, others scale one of them
+        order = sorted(range(len(inputs)), key=lambda i: prod(shapes[i]), reverse=True)
+        a, b = sorted(order[:2])
+        others = sorted(order[2:])
+        union = set(''.join(inputs[i] for i in others))
+        if prod(shapes[b]) < prod(shapes[a]):
+            targets = (b, a)
+        else:
+            targets = (a, b)
+        target = next((t for t in targets if union <= set(inputs[t])), None)
+        if target is None:
+            return
+
+        A, B = inputs[a], inputs[b]
+        batch = [c for c in A if c in B and c in out]
+        contr = [c for c in A if c in B and c not in out]
+        fa = [c for c in A if c not in B]
+        fb = [c for c in B if c not in A]
+        if any(c not in out for c in fa + fb):
+            return # summed over only one operand
+        if any(c not in A and c not in B for c in out):
+            return
+
+        T = inputs[target]
+        self._scale = None
+        if len(others) > 0:
+            sub = ''.join(c for c in T if c in union)
+            scale_shape = tuple(size[c] if c in union else 1 for c in T)
+            self._scale = (others, ','.join(inputs[i] for i in others) + '->' + sub,
+                           scale_shape, target)
+
+        result = batch + fa + fb
+        self._operands = (a, b)
+        self._perm_a = tuple(A.index(c) for c in batch + fa + contr)
+        self._perm_b = tuple(B.index(c) for c in batch + contr + fb)
+        nb = prod(size[c] for c in batch)
+        nc = prod(size[c] for c in contr)
+        self._shape_a = (nb, prod(size[c] for c in fa), nc)
+        self._shape_b = (nb, nc, prod(size[c] for c in fb))
+        self._shape_r = tuple(size[c] for c in result)
+        perm = tuple(result.index(c) for c in out)
+        self._perm_r = None if perm == tuple(range(len(perm))) else perm
+        self.kind = 'bmm'
+
+    def __call__(self, *operands):
+        if self.kind == 'einsum':
+            return self._kernel(*operands)
+
+        bk = self.backend
+        operands = list(operands)
+        if self._scale is not None:
+            others, sub, shape, target = self._scale
+            s = bk.einsum(sub, *[operands[i] for i in others])
+            operands[target] = operands[target] * bk.reshape(s, shape)
+
+        a, b = self._operands
+        A = bk.reshape(bk.permute_dims(operands[a], axes=self._perm_a), self._shape_a)
+        B = bk.reshape(bk.permute_dims(operands[b], axes=self._perm_b), self._shape_b)
+        r = bk.reshape(bk.matmul(A, B), self._shape_r)
+        if self._perm_r is not None:
+            r = bk.permute_dims(r, axes=self._perm_r)
+        return r
+
+
+@lru_cache(maxsize=1024)
+def get_einsum_plan(backend, subscripts: str, shapes: Tuple[Shape, ...]) -> EinsumPlan:
+    return EinsumPlan(backend, subscripts, shapes)
@@ -147,6 +147,24 @@ class JAXBackend(Backend[Array], backend_name='jax'):
         indices1 = indices1.at[inverse].set(idx)
         return b, indices0, indices1, inverse, counts
 
+    ### Sparse Functions ###
+    @staticmethod
+    def csr_spmm(crow, col, values, shape, other):
+        if values.ndim != 1 or other.ndim > 2:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
+        nrow = shape[0]
+        row = jnp.repeat(jnp.arange(nrow), crow[1:] - crow[:-1],
+                         total_repeat_length=col.shape[0])
+
+        if other.ndim == 1:
+            data = values * other[col]
+        else:
+            data = values[:, None] * other[col, :]
+
+        return jax.ops.segment_sum(data, row, num_segments=nrow,
+                                   indices_are_sorted=True)
+
     ### FEALPy functionals ###
     @staticmethod
     def multi_index_matrix(p: int, dim: int, *, dtype=None) -> Array:
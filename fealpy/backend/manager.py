@@ -31,8 +31,8 @@ class BackendManager():
         if name not in Backend._available_backends:
             try:
                 importlib.import_module(f"fealpy.backend.{name}_backend")
-            except ImportError:
-                raise RuntimeError(f"Backend '{name}' is not found.")
+            except ImportError as e:
+                raise RuntimeError(f"Backend '{name}' is not found.") from e
 
         if name in Backend._available_backends:
             backend = Backend._available_backends[name]()
@@ -202,6 +202,7 @@ class BackendManager():
     def cross(self, x1: _DT, x2: _DT, /, *, axis: Optional[int]=None) -> _DT: ...
     def dot(self, x1: _DT, x2: _DT, /, *, axis=-1) -> _DT: ...
     def einsum(self, subscripts: str, /, *operands: _DT, **kwargs) -> _DT: ...
+    def einsum_plan(self, subscripts: str, /, *shapes: Size) -> Callable[..., _DT]: ...
     def trace(self, x: _DT, /, *, offset: int = 0, axis1=0, axis2=1) -> _DT: ...
 
     ### Manipulation Functions ###
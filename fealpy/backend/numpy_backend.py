@@ -1,18 +1,22 @@
 
 from typing import Optional, Union, Tuple
-from functools import reduce
+from functools import reduce, partial
 from math import factorial
 from itertools import combinations_with_replacement
 
 import numpy as np
 from numpy.typing import NDArray
 from numpy.linalg import det
-from scipy.sparse._sparsetools import coo_matvec, csr_matvec, csr_matvecs, coo_tocsr
 
+from ..lazy import lazy_import
 from .base import (
     Backend, ATTRIBUTE_MAPPING, FUNCTION_MAPPING
 )
 
+# NOTE: the sparse kernels of scipy are loaded on the first sparse product,
+# as importing scipy.sparse takes longer than numpy itself.
+_sparsetools = lazy_import('scipy.sparse._sparsetools')
+
 
 def _remove_device(func):
     def wrapper(*args, **kwargs):
@@ -24,6 +28,7 @@ def _remove_device(func):
 
 class NumPyBackend(Backend[NDArray], backend_name='numpy'):
     DATA_CLASS = np.ndarray
+    EINSUM_BMM = True
 
     linalg = np.linalg
     random = np.random
@@ -92,6 +97,15 @@ class NumPyBackend(Backend[NDArray], backend_name='numpy'):
     def einsum(*args, **kwargs):
         return np.einsum(*args, **kwargs, optimize=True)
 
+    @classmethod
+    def _einsum_kernel(cls, subscripts, shapes):
+        # NOTE: the path only depends on the shapes, so it is searched on
+        # zero-strided dummy operands and then reused by every call.
+        dummy = [np.broadcast_to(np.empty((), dtype=np.float64), s) for s in shapes]
+        strategy = 'optimal' if len(shapes) <= 5 else 'greedy'
+        path = np.einsum_path(subscripts, *dummy, optimize=strategy)[0]
+        return partial(np.einsum, subscripts, optimize=path)
+
     ### Manipulation Functions ###
     # python array API standard v2023.12
     @staticmethod
@@ -104,6 +118,13 @@ class NumPyBackend(Backend[NDArray], backend_name='numpy'):
     # non-standard
 
     ### Sorting Functions ###
+    if np.lib.NumpyVersion(np.__version__) < '2.0.0':
+        # NOTE: the `stable` keyword is only accepted by numpy>=2.0.
+        @staticmethod
+        def argsort(a, axis=-1, kind=None, order=None, *, stable=None):
+            if stable:
+                kind = 'stable'
+            return np.argsort(a, axis=axis, kind=kind, order=order)
 
     ### Statistical Functions ###
     # python array API standard v2023.12
@@ -161,14 +182,14 @@ class NumPyBackend(Backend[NDArray], backend_name='numpy'):
         if value.ndim == 1:
             if other.ndim == 1:
                 result = np.zeros((shape[0],), dtype=other.dtype)
-                coo_matvec(nnz, row, col, value, other, result)
+                _sparsetools.coo_matvec(nnz, row, col, value, other, result)
                 return result
             elif other.ndim == 2:
                 new_shape = (shape[0], other.shape[-1])
                 result = np.zeros(new_shape, dtype=other.dtype)
                 rT = result.T
                 for i, acol in enumerate(other.T):
-                    coo_matvec(nnz, row, col, value, acol, rT[i])
+                    _sparsetools.coo_matvec(nnz, row, col, value, acol, rT[i])
                 return result
             else:
                 raise ValueError("`other` must be a 1-D or 2-D array.")
@@ -180,23 +201,46 @@ class NumPyBackend(Backend[NDArray], backend_name='numpy'):
     def csr_spmm(crow, col, value, shape, other):
         M, N = shape
 
-        if value.ndim == 1:
-            if other.ndim == 1:
-                result = np.zeros((shape[0],), dtype=other.dtype)
-                csr_matvec(M, N, crow, col, value, other, result)
-                return result
-            elif other.ndim == 2:
-                n_vecs = other.shape[-1]
-                new_shape = (shape[0], other.shape[-1])
-                result = np.zeros(new_shape, dtype=other.dtype)
-                csr_matvecs(M, N, n_vecs, crow, col, value, other.ravel(), result.ravel())
-                return result
-            else:
-                raise ValueError("`other` must be a 1-D or 2-D array.")
-        else:
+        if value.ndim != 1:
             raise NotImplementedError("Batch sparse matrix multiplication has "
                                       "not been supported yet.")
 
+        dtype = np.result_type(value, other)
+        value = value.astype(dtype, copy=False)
+        other = other.astype(dtype, copy=False)
+
+        if other.ndim == 1:
+            result = np.zeros((M,), dtype=dtype)
+            _sparsetools.csr_matvec(M, N, crow, col, value, other, result)
+            return result
+        else:
+            # Fold the batch dimensions of `other` into its columns,
+            # (*B, N, K) -> (N, B*K), so that one call to the kernel serves all.
+            batch = other.shape[:-2]
+            n_vecs = other.shape[-1]
+            x = np.ascontiguousarray(np.moveaxis(other, -2, 0)).reshape(N, -1)
+            result = np.zeros((M, x.shape[-1]), dtype=dtype)
+            _sparsetools.csr_matvecs(M, N, x.shape[-1], crow, col, value, x.ravel(), result.ravel())
+            result = result.reshape((M,) + batch + (n_vecs,))
+            return np.moveaxis(result, 0, -2)
+
+    @staticmethod
+    def bsr_spmm(crow, col, value, shape, other):
+        M, N = shape
+        R, C = value.shape[-2:]
+        dtype = np.result_type(value, other)
+        value = np.ascontiguousarray(value, dtype=dtype).ravel()
+        x = np.ascontiguousarray(other, dtype=dtype)
+
+        if x.ndim == 1:
+            result = np.zeros((M,), dtype=dtype)
+            _sparsetools.bsr_matvec(M//R, N//C, R, C, crow, col, value, x, result)
+        else:
+            result = np.zeros((M, x.shape[-1]), dtype=dtype)
+            _sparsetools.bsr_matvecs(M//R, N//C, x.shape[-1], R, C, crow, col, value,
+                        x.ravel(), result.ravel())
+        return result
+
     @staticmethod
     def coo_tocsr(indices, values, shape):
         M, N = shape
@@ -206,7 +250,7 @@ class NumPyBackend(Backend[NDArray], backend_name='numpy'):
         crow = np.empty(M+1, dtype=idx_dtype)
         col = np.empty_like(minor, dtype=idx_dtype)
         data = np.empty_like(values, dtype=values.dtype)
-        coo_tocsr(M, N, nnz, major, minor, values, crow, col, data)
+        _sparsetools.coo_tocsr(M, N, nnz, major, minor, values, crow, col, data)
 
         return crow, col, data
 
@@ -144,7 +144,11 @@ class PyTorchBackend(Backend[Tensor], backend_name='pytorch'):
     vecdot = staticmethod(_dim_to_axis(torch.linalg.vecdot))
 
     # non-standard
-    cross = staticmethod(_dim_to_axis(torch.cross))
+    @staticmethod
+    def cross(x1, x2, /, *, axis=-1):
+        # NOTE: torch.cross picks the first dimension of size 3 if `dim` is not
+        # given, which is wrong for stacks of exactly 3 vectors.
+        return torch.cross(x1, x2, dim=axis)
 
     @staticmethod
     def dot(x1, x2, /, *, axis=-1):
@@ -416,8 +420,11 @@ class PyTorchBackend(Backend[Tensor], backend_name='pytorch'):
     def _spmm(mat, other):
         if other.ndim == 1:
             return torch.sparse.mm(mat, other[:, None])[:, 0]
-        else:
+        elif other.ndim == 2:
             return torch.sparse.mm(mat, other)
+        else:
+            raise NotImplementedError("Batch sparse matrix multiplication has "
+                                      "not been supported yet.")
 
     @staticmethod
     def coo_tocsr(indices, values, shape):
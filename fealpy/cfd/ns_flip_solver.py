@@ -1,98 +1,110 @@
 #!/usr/bin/python3
-'''!    	
+'''!
 	@Author: wpx
 	@File Name: ns_flip_solver.py
-	@Mail: wpx15673207315@gmail.com 
+	@Mail: wpx15673207315@gmail.com
 	@Created Time: Sat 13 Apr 2024 04:32:23 PM CST
-	@bref 
-	@ref 
-'''  
-import numpy as np
-from scipy.sparse import diags,csr_matrix,hstack
+	@bref
+	@ref
+'''
+from math import prod
+
+from ..backend import backend_manager as bm
+from ..mesh.particle_transfer import (
+    particle_stencil, particle_to_grid_matrix, particle_to_grid, grid_to_particle
+)
 
 class NSFlipSolver:
-    def __init__(self, particles, mesh):
+    '''
+    @brief The FLIP/PIC transfers between the particles and a uniform mesh
+           (UniformMesh2d or UniformMesh3d).
+
+    The weights of the particles on the grid nodes are computed from the
+    coordinates by `fealpy.mesh.particle_transfer`, so a transfer costs
+    O(num_p) in time and memory, independently of the size of the grid.
+    '''
+    def __init__(self, particles, mesh, kernel='linear'):
+        '''
+        @param kernel: 'linear' for the bilinear (trilinear) weights, or
+               'quadratic' for the quadratic B-spline weights.
+        '''
         self.mesh = mesh
         self.particles = particles
-    
+        self.kernel = kernel
+
     def e(self, position):
-        i,j = self.mesh.cell_location(position)
-        node = self.mesh.node
-        cell = self.mesh.entity('cell')
-        result = position - node[i,j,:]
-        result += np.column_stack((i,j))
-        return result
+        '''
+        @brief The coordinates of the particles in the units of the grid,
+               whose integer parts are the indices of the cells.
+        '''
+        origin = bm.tensor(self.mesh.origin, dtype=position.dtype)
+        h = bm.tensor(self.mesh.h, dtype=position.dtype)
+        return (position - origin) / h
 
-    def coordinate(self,position):
-        i,j = self.mesh.cell_location(position)
-        nx = self.mesh.ds.nx
-        ny = self.mesh.ds.ny
-        result =  i * nx + j 
+    def coordinate(self, position):
+        '''
+        @brief The index of the cell containing every particle.
+        '''
+        mesh = self.mesh
+        GD = position.shape[-1]
+        n = [mesh.nx, mesh.ny] + ([mesh.nz] if GD == 3 else [])
+        index = bm.astype(bm.floor(self.e(position)), bm.int64)
+        result = bm.zeros(position.shape[:1], dtype=bm.int64)
+        for d in range(GD):
+            i = bm.minimum(bm.maximum(index[:, d], bm.zeros_like(index[:, d])),
+                           bm.full_like(index[:, d], n[d] - 1))
+            result = result * n[d] + i
         return result
 
-    def bilinear(self,position):
-        i0,j0 = self.mesh.cell_location(position)
-        e = self.e(position)
-        epsilon = e[:,0]
-        eta = e[:,1]
-        num_p = len(e)
-        num_v = (self.mesh.ds.nx + 1)*(self.mesh.ds.ny + 1)
-        distance0 = np.zeros((num_p,num_v))
-        distance1 = np.zeros((num_p,num_v))
-        for i in range(num_p):
-            distance0[i] = abs(i0-epsilon[i])
-            distance1[i] = abs(j0-eta[i])
-        distance = np.stack((distance0, distance1), axis=-1)
-        result = np.where(np.all(distance < 0.5, axis=-1), 1, 0)
-        result = csr_matrix(result)
-        return result
+    def bilinear(self, position):
+        '''
+        @brief The interpolation matrix S_pv from the grid nodes to the
+               particles, shaped (num_p, num_v), with 4 (8 in 3d) nonzeros in
+               every row for the linear kernel.
+        '''
+        return particle_to_grid_matrix(self.mesh, position, self.kernel)
 
-    def bilinear(self,position,vertex):
-        i0,j0 = self.mesh.cell_location(vertex)
-        e = self.e(position)
-        epsilon = e[:,0]
-        eta = e[:,1]
-        num_p = len(e)
-        num_v = (self.mesh.ds.nx + 1)*(self.mesh.ds.ny + 1)
-        distance0 = np.zeros((num_p,num_v))
-        distance1 = np.zeros((num_p,num_v))
-        for i in range(num_p):
-            distance0[i] = abs(i0-epsilon[i])
-            distance1[i] = abs(j0-eta[i])
-        distance = np.stack((distance0, distance1), axis=-1)
-        result = np.where(np.all(distance <= 1, axis=-1), (1-distance0)*(1-distance1), 0)
-        result = csr_matrix(result)
-        return result
-    
     def P2G_center(self, particles):
         m_p = particles["mass"]
         e_p = particles["internal_energy"]
-        position = self.particles["position"]
-        cell_center = self.mesh.cell_center()
-        Vc = self.mesh.cell_area()
-        num_p = len(position[:,0])
-        num_c = len(cell_center[:,0])
-        distance = np.zeros_like(position)
-        S_pc = np.zeros((num_p,num_c)) #求插值函数S_pc
-        for i in range(num_p):
-            S_pc[i,index[i]] = 1
-        rho_c = m_p@S_pc/Vc
-        I_c = (e_p@S_pc)/(rho_c*Vc)
-        print(rho_c)
-        print(I_c) #为什么有些会出现nan?
-        return rho_c,I_c
+        position = particles["position"]
+        index = self.coordinate(position)
+        Vc = prod(self.mesh.h)
+        NC = self.mesh.number_of_cells()
+        rho_c = bm.index_add(bm.zeros((NC, ), dtype=m_p.dtype), index, m_p) / Vc
+        I_c = bm.index_add(bm.zeros((NC, ), dtype=e_p.dtype), index, e_p)
+        # the empty cells have no density nor internal energy
+        flag = rho_c > 0
+        I_c = bm.where(flag, I_c / bm.where(flag, rho_c * Vc, 1.0), 0.0)
+        return rho_c, I_c
 
-    def P2G_vertex(self,particles):
+    def P2G_vertex(self, particles):
         m_p = particles["mass"] #粒子质量
         v_p = particles["velocity"] #粒子速度
-        num_v = (self.mesh.ds.nx + 1)*(self.mesh.ds.ny + 1)
-        vertex = self.mesh.node.reshape(num_v,2)
-        S_pv = self.bilinear(particles["position"],vertex)
-        M_v = m_p@S_pv
-        m_p = m_p[:,np.newaxis]
-        U_v = ((m_p*v_p).T@S_pv/M_v).T 
+        stencil = particle_stencil(self.mesh, particles["position"], self.kernel)
+        M_v = particle_to_grid(self.mesh, None, m_p, stencil=stencil)
+        P_v = particle_to_grid(self.mesh, None, m_p[:, None] * v_p, stencil=stencil)
+        flag = M_v > 0
+        U_v = bm.where(flag[:, None], P_v / bm.where(flag, M_v, 1.0)[:, None], 0.0)
         return M_v, U_v
 
+    def G2P(self, U_v, position):
+        '''
+        @brief Interpolate the grid velocity at the particles (PIC).
+        '''
+        return grid_to_particle(self.mesh, U_v, position, self.kernel)
+
+    def flip_update(self, particles, U_old, U_new, alpha=0.95):
+        '''
+        @brief Blend the FLIP update of the particle velocities, by the change
+               of the grid velocity, with the PIC one.
+        '''
+        position = particles["position"]
+        stencil = particle_stencil(self.mesh, position, self.kernel)
+        v_pic = grid_to_particle(self.mesh, U_new, position, stencil=stencil)
+        v_flip = particles["velocity"] + grid_to_particle(self.mesh, U_new - U_old, position,
+                                                          stencil=stencil)
+        return alpha * v_flip + (1 - alpha) * v_pic
+
     def pressure(self,rho_c,I_c,R,Cv):
         return (rho_c*R*I_c)/Cv
-
@@ -0,0 +1,4 @@
+
+from .stencil_operator import StencilOperator
+from .laplace_operator import LaplaceOperator
+from .gradient_operator import GradientOperator, DivergenceOperator
@@ -0,0 +1,141 @@
+
+from typing import Union, List, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from .stencil_operator import StencilOperator, grid_shape
+
+
+def difference_operators(mesh) -> List[StencilOperator]:
+    """Return the operators of the first derivatives along every axis of a\
+    uniform mesh, by central differences in the interior, and by one-sided\
+    differences on the boundary of the grid."""
+    shape = grid_shape(mesh)
+    TD = len(shape)
+    kwargs = {'dtype': mesh.ftype, 'device': getattr(mesh, 'device', None)}
+    operators = []
+    for axis, n in enumerate(shape):
+        if n < 2:
+            raise ValueError(f"the grid needs at least 2 nodes along axis {axis}.")
+        h = float(mesh.h[axis])
+        bshape = tuple(n if d == axis else 1 for d in range(TD))
+        forward = bm.full((n, ), 0.5 / h, **kwargs)
+        forward = bm.set_at(bm.set_at(forward, 0, 1.0 / h), -1, 0.0)
+        backward = bm.full((n, ), -0.5 / h, **kwargs)
+        backward = bm.set_at(bm.set_at(backward, 0, 0.0), -1, -1.0 / h)
+        center = bm.zeros((n, ), **kwargs)
+        center = bm.set_at(bm.set_at(center, 0, -1.0 / h), -1, 1.0 / h)
+        e = tuple(1 if d == axis else 0 for d in range(TD))
+        stencil = [
+            (e, forward.reshape(bshape)),
+            (tuple(-o for o in e), backward.reshape(bshape)),
+            ((0, ) * TD, center.reshape(bshape))
+        ]
+        operators.append(StencilOperator(shape, stencil, ftype=mesh.ftype,
+                                         device=kwargs['device']))
+    return operators
+
+
+def _to_sparse(A: COOTensor, format: str) -> Union[COOTensor, CSRTensor]:
+    if format not in ('csr', 'coo'):
+        raise ValueError(f"format should be 'csr' or 'coo', but got '{format}'.")
+    return A.tocsr() if format == 'csr' else A
+
+
+class GradientOperator():
+    """The finite difference gradient on the nodes of a uniform mesh, applied\
+    matrix-free. Central differences are used in the interior, and one-sided\
+    differences on the boundary of the grid.
+
+    The components of the gradient are stored in the last axis, and the
+    sparse export acts on the nodal values to give the components in the
+    component-major order, i.e. all nodes of the first component first.
+    """
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.components = difference_operators(mesh)
+        self.N = self.components[0].N
+
+    @property
+    def sparse_shape(self) -> Tuple[int, int]:
+        return (len(self.components) * self.N, self.N)
+
+    def matmul(self, u: TensorLike) -> TensorLike:
+        """
+        Parameters:
+            u (Tensor): The nodal values, shaped (N, ) or (N, ...).
+
+        Returns:
+            Tensor: The gradient, shaped (N, ..., TD).
+        """
+        return bm.stack([D.matmul(u) for D in self.components], axis=-1)
+
+    __matmul__ = matmul
+
+    def __call__(self, u: TensorLike) -> TensorLike:
+        return self.matmul(u)
+
+    def to_sparse(self, format: str='csr') -> Union[COOTensor, CSRTensor]:
+        """Export the operator as a sparse matrix shaped (TD*N, N)."""
+        rows, cols, vals = [], [], []
+        for d, D in enumerate(self.components):
+            row, col, val = D._coo_entries()
+            rows.append(row + d * self.N)
+            cols.append(col)
+            vals.append(val)
+        indices = bm.stack([bm.concat(rows), bm.concat(cols)], axis=0)
+        A = COOTensor(indices, bm.concat(vals), self.sparse_shape, is_coalesced=True)
+        return _to_sparse(A, format)
+
+
+class DivergenceOperator():
+    """The finite difference divergence of the nodal vector fields of a\
+    uniform mesh, applied matrix-free. Central differences are used in the\
+    interior, and one-sided differences on the boundary of the grid.
+
+    The sparse export acts on the vector field in the component-major order,
+    i.e. `v.T.reshape(-1)` for `v` shaped (N, TD).
+    """
+    def __init__(self, mesh):
+        self.mesh = mesh
+        self.components = difference_operators(mesh)
+        self.N = self.components[0].N
+
+    @property
+    def sparse_shape(self) -> Tuple[int, int]:
+        return (self.N, len(self.components) * self.N)
+
+    def matmul(self, v: TensorLike) -> TensorLike:
+        """
+        Parameters:
+            v (Tensor): The nodal vectors, shaped (N, ..., TD).
+
+        Returns:
+            Tensor: The divergence, shaped (N, ...).
+        """
+        TD = len(self.components)
+        if v.shape[-1] != TD:
+            raise ValueError(f"the vector field should have {TD} components in "
+                             f"the last axis, but got shape {tuple(v.shape)}.")
+        r = self.components[0].matmul(v[..., 0])
+        for d in range(1, TD):
+            r = r + self.components[d].matmul(v[..., d])
+        return r
+
+    __matmul__ = matmul
+
+    def __call__(self, v: TensorLike) -> TensorLike:
+        return self.matmul(v)
+
+    def to_sparse(self, format: str='csr') -> Union[COOTensor, CSRTensor]:
+        """Export the operator as a sparse matrix shaped (N, TD*N)."""
+        rows, cols, vals = [], [], []
+        for d, D in enumerate(self.components):
+            row, col, val = D._coo_entries()
+            rows.append(row)
+            cols.append(col + d * self.N)
+            vals.append(val)
+        indices = bm.stack([bm.concat(rows), bm.concat(cols)], axis=0)
+        A = COOTensor(indices, bm.concat(vals), self.sparse_shape, is_coalesced=True)
+        return _to_sparse(A, format)
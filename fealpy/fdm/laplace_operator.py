@@ -0,0 +1,124 @@
+
+from typing import Union, Optional, Callable, List, Tuple
+from itertools import product
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from .stencil_operator import StencilOperator, grid_shape
+
+CoefLike = Union[float, TensorLike, Callable[[TensorLike], TensorLike]]
+
+# the compact stencils of the dimensions, and the 9 and 27-point stencils
+_STENCILS = {1: (3, ), 2: (5, 9), 3: (7, 27)}
+
+
+def _axis_slice(ndim: int, axis: int, s: slice) -> Tuple[slice, ...]:
+    return tuple(s if d == axis else slice(None) for d in range(ndim))
+
+
+class LaplaceOperator(StencilOperator):
+    """The finite difference operator of -div(c grad u) on the nodes of a\
+    uniform mesh, applied matrix-free.
+
+    Stencils:
+
+    - 5-point (2d) and 7-point (3d): the compact stencil, with a constant or\
+      a variable coefficient `c`. The coefficient between two nodes is the\
+      mean of the nodal values.
+    - 9-point (2d) and 27-point (3d): the isotropic stencils, which are of\
+      fourth order for the Poisson equation with a corrected right-hand side.\
+      They require equal step sizes and a constant coefficient.
+
+    Rows of the boundary nodes keep the stencil with the neighbors outside
+    of the grid dropped, as the matrix of `laplace_operator` in the old
+    uniform meshes. Use `apply_dirichlet` to impose boundary values.
+
+    Examples:
+        >>> mesh = UniformMesh2d((0, 2048, 0, 2048), h=(1/2048, 1/2048))
+        >>> A = LaplaceOperator(mesh)
+        >>> A, b = A.apply_dirichlet(f, uD)
+        >>> uh = cg(A, b, atol=1e-10)
+    """
+    def __init__(self, mesh, coef: Optional[CoefLike]=None, stencil: Optional[int]=None):
+        """
+        Parameters:
+            mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+            coef (float | Tensor | Callable | None, optional): The diffusion\
+                coefficient, a number, the values on the nodes shaped (NN, ), or\
+                a function of the points. Default to 1.
+            stencil (int | None, optional): The number of points of the stencil.\
+                Default to the compact one, 5 in 2d and 7 in 3d.
+        """
+        shape = grid_shape(mesh)
+        TD = len(shape)
+        if stencil is None:
+            stencil = 2 * TD + 1
+        if stencil not in _STENCILS.get(TD, ()):
+            raise ValueError(f"the {stencil}-point stencil is not available in {TD}d, "
+                             f"expected one of {_STENCILS.get(TD, ())}.")
+        h = [float(v) for v in mesh.h[:TD]]
+        kwargs = {'ftype': mesh.ftype, 'device': getattr(mesh, 'device', None)}
+
+        if callable(coef):
+            coef = coef(mesh.entity('node'))
+        if coef is None:
+            coef = 1.0
+
+        if stencil == 2 * TD + 1:
+            if isinstance(coef, TensorLike):
+                weights = self._variable_stencil(coef.reshape(shape), h)
+            else:
+                weights = self._compact_stencil(float(coef), h)
+        else:
+            if isinstance(coef, TensorLike):
+                raise ValueError(f"the {stencil}-point stencil requires a constant coefficient.")
+            if max(h) - min(h) > 1e-12 * max(h):
+                raise ValueError(f"the {stencil}-point stencil requires equal step sizes, "
+                                 f"but got h = {h}.")
+            weights = self._isotropic_stencil(float(coef), h[0], TD)
+
+        super().__init__(shape, weights, **kwargs)
+        self.mesh = mesh
+        self.npoints = stencil
+
+    @staticmethod
+    def _compact_stencil(c: float, h: List[float]):
+        TD = len(h)
+        weights = [((0, ) * TD, sum(2.0 * c / v**2 for v in h))]
+        for axis, v in enumerate(h):
+            for sign in (-1, 1):
+                offset = tuple(sign if d == axis else 0 for d in range(TD))
+                weights.append((offset, -c / v**2))
+        return weights
+
+    @staticmethod
+    def _variable_stencil(c: TensorLike, h: List[float]):
+        TD = len(h)
+        center = 0.0
+        weights = []
+        for axis, v in enumerate(h):
+            first = c[_axis_slice(TD, axis, slice(0, 1))]
+            last = c[_axis_slice(TD, axis, slice(-1, None))]
+            mid = (c[_axis_slice(TD, axis, slice(1, None))]
+                   + c[_axis_slice(TD, axis, slice(0, -1))]) / 2
+            # coefficients at the midpoints to the next and the previous nodes
+            cp = bm.concat([mid, last], axis=axis) / v**2
+            cm = bm.concat([first, mid], axis=axis) / v**2
+            center = center + cp + cm
+            weights.append((tuple(1 if d == axis else 0 for d in range(TD)), -cp))
+            weights.append((tuple(-1 if d == axis else 0 for d in range(TD)), -cm))
+        weights.append(((0, ) * TD, center))
+        return weights
+
+    @staticmethod
+    def _isotropic_stencil(c: float, h: float, TD: int):
+        # weights of the neighbors by the number of non-zero offsets
+        if TD == 2:
+            scale, table = 6.0, {0: 20.0, 1: -4.0, 2: -1.0}
+        else:
+            scale, table = 30.0, {0: 128.0, 1: -14.0, 2: -3.0, 3: -1.0}
+        weights = []
+        for offset in product((-1, 0, 1), repeat=TD):
+            n = sum(o != 0 for o in offset)
+            weights.append((offset, c * table[n] / (scale * h**2)))
+        return weights
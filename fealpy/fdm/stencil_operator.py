@@ -0,0 +1,233 @@
+
+from typing import Union, Optional, Sequence, Tuple, List
+from math import prod
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+Offset = Tuple[int, ...]
+Weight = Union[float, TensorLike]
+
+
+def grid_shape(mesh) -> Tuple[int, ...]:
+    """Return the shape of the node grid of a uniform mesh, e.g. (nx+1, ny+1)."""
+    TD = mesh.top_dimension()
+    names = ('nx', 'ny', 'nz')[:TD]
+    return tuple(getattr(mesh, name) + 1 for name in names)
+
+
+def shift_slices(offset: Offset, shape: Tuple[int, ...]) -> Tuple[Tuple[slice, ...], Tuple[slice, ...]]:
+    """Return the slices (dst, src) of the grid such that `dst` node + offset\
+    is the `src` node, both inside the grid."""
+    dst, src = [], []
+    for o, n in zip(offset, shape):
+        if o >= 0:
+            dst.append(slice(0, n - o))
+            src.append(slice(o, n))
+        else:
+            dst.append(slice(-o, n))
+            src.append(slice(0, n + o))
+    return tuple(dst), tuple(src)
+
+
+class StencilOperator():
+    """A linear operator on the node grid of a uniform mesh, defined by a stencil.
+
+    The operator is a list of (offset, weight) pairs, and is applied as
+
+        (A u)[i] = sum_k weight_k[i] * u[i + offset_k],
+
+    where the neighbors outside of the grid are dropped. A weight is a number,
+    or a tensor broadcastable to the grid shape for variable coefficients.
+
+    The operator is applied matrix-free: `u` is reshaped to the grid, and every
+    offset adds the weighted values of a shifted view of the grid. No sparse
+    matrix is built, unless requested by `to_sparse()` for direct solvers.
+    Operators support `A @ u` with `u` shaped (N, ) or (N, ...), so they can
+    be passed to the iterative solvers in `fealpy.solver`.
+
+    Nodes are numbered in the row-major order of the grid, as in the uniform
+    meshes, i.e. the last axis is the fastest.
+    """
+    def __init__(self, shape: Sequence[int], stencil: Sequence[Tuple[Offset, Weight]], *,
+                 ftype=None, device=None):
+        """
+        Parameters:
+            shape (Sequence[int]): The shape of the node grid.
+            stencil (Sequence[Tuple[Offset, Weight]]): The offsets and weights.
+            ftype (dtype | None, optional): The float type of the sparse export.\
+                Default to bm.float64.
+            device (str | None, optional): The device of the sparse export.
+        """
+        self.shape = tuple(int(n) for n in shape)
+        self.N = prod(self.shape)
+        self.ftype = bm.float64 if ftype is None else ftype
+        self.device = device
+        self.stencil: List[Tuple[Offset, Weight]] = []
+        for offset, weight in stencil:
+            offset = tuple(int(o) for o in offset)
+            if len(offset) != len(self.shape):
+                raise ValueError(f"offset {offset} does not match the grid shape {self.shape}.")
+            self.stencil.append((offset, weight))
+        # sorted offsets give sorted columns in every row of the sparse export
+        self.stencil.sort(key=lambda item: item[0])
+        self._mask = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(shape={self.shape}, npoints={len(self.stencil)})"
+
+    @property
+    def sparse_shape(self) -> Tuple[int, int]:
+        return (self.N, self.N)
+
+    def _weight(self, weight: Weight, index: Tuple[slice, ...], ndim: int):
+        """Return the weight on the sliced grid, with dimensions of the batch."""
+        if isinstance(weight, TensorLike):
+            weight = bm.broadcast_to(weight, self.shape)[index]
+            return weight.reshape(weight.shape + (1, ) * ndim)
+        return weight
+
+    def matmul(self, u: TensorLike) -> TensorLike:
+        """Apply the operator to `u`.
+
+        Parameters:
+            u (Tensor): The nodal values, shaped (N, ) or (N, ...).
+
+        Returns:
+            Tensor: The result, with the same shape as `u`.
+        """
+        if u.shape[0] != self.N:
+            raise ValueError(f"the operator expects {self.N} nodal values, "
+                             f"but got shape {tuple(u.shape)}.")
+        rest = tuple(u.shape[1:])
+        nb = len(rest)
+        U = u.reshape(self.shape + rest)
+        mask = None
+        if self._mask is not None:
+            mask = self._mask.reshape(self.shape + (1, ) * nb)
+            V = bm.where(mask, U, 0)
+        else:
+            V = U
+
+        center = (0, ) * len(self.shape)
+        full = tuple(slice(None) for _ in self.shape)
+        r = None
+        for offset, weight in self.stencil:
+            if offset == center:
+                r = self._weight(weight, full, nb) * V
+                break
+        if r is None:
+            r = bm.zeros_like(V)
+
+        inplace = bm.backend_name != 'jax'
+        for offset, weight in self.stencil:
+            if offset == center:
+                continue
+            dst, src = shift_slices(offset, self.shape)
+            val = self._weight(weight, dst, nb) * V[src]
+            if inplace:
+                r[dst] += val
+            else:
+                r = bm.set_at(r, dst, r[dst] + val)
+
+        if mask is not None:
+            r = bm.where(mask, r, U)
+        return r.reshape(u.shape)
+
+    __matmul__ = matmul
+
+    def __call__(self, u: TensorLike) -> TensorLike:
+        return self.matmul(u)
+
+    def diagonal(self) -> TensorLike:
+        """Return the diagonal of the operator, shaped (N, )."""
+        d = bm.zeros(self.shape, dtype=self.ftype, device=self.device)
+        for offset, weight in self.stencil:
+            if all(o == 0 for o in offset):
+                d = d + weight
+        if self._mask is not None:
+            d = bm.where(self._mask, d, 1.0)
+        return d.reshape(-1)
+
+    def _coo_entries(self) -> Tuple[TensorLike, TensorLike, TensorLike]:
+        """Return the row, column and value of the non-zero entries."""
+        kwargs = {'dtype': bm.int64, 'device': self.device}
+        idx = bm.arange(self.N, **kwargs).reshape(self.shape)
+        mask = self._mask
+        rows, cols, vals = [], [], []
+        for offset, weight in self.stencil:
+            dst, src = shift_slices(offset, self.shape)
+            row = idx[dst].reshape(-1)
+            col = idx[src].reshape(-1)
+            if isinstance(weight, TensorLike):
+                val = bm.broadcast_to(weight, self.shape)[dst].reshape(-1)
+            else:
+                val = bm.full(row.shape, weight, dtype=self.ftype, device=self.device)
+            flag = val != 0
+            if mask is not None:
+                flag = flag & mask[dst].reshape(-1) & mask[src].reshape(-1)
+            rows.append(row[flag])
+            cols.append(col[flag])
+            vals.append(bm.astype(val[flag], self.ftype))
+        if mask is not None:
+            bd = idx[~mask]
+            rows.append(bd)
+            cols.append(bd)
+            vals.append(bm.ones(bd.shape, dtype=self.ftype, device=self.device))
+        return bm.concat(rows), bm.concat(cols), bm.concat(vals)
+
+    def to_sparse(self, format: str='csr') -> Union[COOTensor, CSRTensor]:
+        """Export the operator as a sparse matrix.
+
+        Parameters:
+            format (str, optional): 'csr' or 'coo'. Default to 'csr'.
+
+        Returns:
+            CSRTensor | COOTensor: The matrix shaped (N, N).
+        """
+        if format not in ('csr', 'coo'):
+            raise ValueError(f"format should be 'csr' or 'coo', but got '{format}'.")
+        row, col, val = self._coo_entries()
+        A = COOTensor(bm.stack([row, col], axis=0), val, self.sparse_shape,
+                      is_coalesced=True)
+        return A.tocsr() if format == 'csr' else A
+
+    def boundary_node_flag(self) -> TensorLike:
+        """Return the flag of the nodes on the boundary of the grid, shaped (N, )."""
+        flag = bm.zeros(self.shape, dtype=bm.bool, device=self.device)
+        for axis, n in enumerate(self.shape):
+            for k in (0, n - 1):
+                index = tuple(k if d == axis else slice(None) for d in range(len(self.shape)))
+                flag = bm.set_at(flag, index, True)
+        return flag.reshape(-1)
+
+    def apply_dirichlet(self, f: TensorLike, uD: TensorLike,
+                        isDDof: Optional[TensorLike]=None) -> Tuple['StencilOperator', TensorLike]:
+        """Impose the Dirichlet condition by eliminating the boundary nodes.
+
+        The rows of the Dirichlet nodes are replaced by the identity, and the
+        columns of them are moved to the right-hand side, so a symmetric
+        operator stays symmetric. The returned operator applies this
+        elimination matrix-free by masking.
+
+        Parameters:
+            f (Tensor): The right-hand side, shaped (N, ) or (N, ...).
+            uD (Tensor): The nodal values holding the Dirichlet data, shaped as `f`.\
+                Only the values on the Dirichlet nodes are used.
+            isDDof (Tensor | None, optional): The flag of the Dirichlet nodes,\
+                shaped (N, ). Default to the boundary of the grid.
+
+        Returns:
+            Tuple[StencilOperator, Tensor]: The eliminated operator and right-hand side.
+        """
+        if isDDof is None:
+            isDDof = self.boundary_node_flag()
+        flag = isDDof.reshape((-1, ) + (1, ) * (f.ndim - 1))
+        ub = bm.where(flag, uD, 0)
+        b = bm.where(flag, uD, f - self.matmul(ub))
+
+        A = self.__class__.__new__(self.__class__)
+        A.__dict__.update(self.__dict__)
+        A._mask = ~isDDof.reshape(self.shape)
+        return A, b
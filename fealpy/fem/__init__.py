@@ -1,37 +1,76 @@
-"""The FEM Module"""
-
-### Forms and bases
-from .integrator import *
-from .bilinear_form import BilinearForm
-from .linear_form import LinearForm
-from .semilinear_form import SemilinearForm
-from .block_form import BlockForm
-from .linear_block_form import LinearBlockForm
-
-### Cell Operator
-from .scalar_diffusion_integrator import ScalarDiffusionIntegrator
-from .scalar_semilinear_diffusion_integrator import ScalarSemilinearDiffusionIntegrator
-from .scalar_mass_integrator import ScalarMassIntegrator
-from .scalar_semilinear_mass_integrator import ScalarSemilinearMassIntegrator
-from .scalar_convection_integrator import ScalarConvectionIntegrator
-from .linear_elastic_integrator import LinearElasticIntegrator
-from .press_work_integrator import PressWorkIntegrator, PressWorkIntegrator0, PressWorkIntegrator1
-from .vector_mass_integrator import VectorMassIntegrator
-from .curl_integrator import CurlIntegrator
-
-
-### Cell Source
-from .scalar_source_integrator import ScalarSourceIntegrator
-from .vector_source_integrator import VectorSourceIntegrator
-
-### Face Operator
-from .scalar_neumann_bc_integrator import ScalarNeumannBCIntegrator
-
-### Face Source
-
-### Dirichlet BC
-from .dirichlet_bc import DirichletBC
-from .dirichlet_bc_operator import DirichletBCOperator
-
-### recovery estimate
-from .recovery_alg import RecoveryAlg
+"""The FEM Module
+
+The forms and integrators are imported on first access, see `fealpy.lazy`.
+"""
+from typing import TYPE_CHECKING
+
+from ..lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    ### Forms and bases
+    'integrator': ['Integrator', 'NonlinearInt', 'SemilinearInt', 'LinearInt',
+                   'OpInt', 'SrcInt', 'CellInt', 'FaceInt'],
+    'bilinear_form': ['BilinearForm'],
+    'linear_form': ['LinearForm'],
+    'semilinear_form': ['SemilinearForm'],
+    'block_form': ['BlockForm'],
+    'linear_block_form': ['LinearBlockForm'],
+
+    ### Cell Operator
+    'scalar_diffusion_integrator': ['ScalarDiffusionIntegrator'],
+    'scalar_semilinear_diffusion_integrator': ['ScalarSemilinearDiffusionIntegrator'],
+    'scalar_mass_integrator': ['ScalarMassIntegrator'],
+    'scalar_semilinear_mass_integrator': ['ScalarSemilinearMassIntegrator'],
+    'scalar_convection_integrator': ['ScalarConvectionIntegrator'],
+    'linear_elastic_integrator': ['LinearElasticIntegrator'],
+    'press_work_integrator': ['PressWorkIntegrator', 'PressWorkIntegrator0', 'PressWorkIntegrator1'],
+    'vector_mass_integrator': ['VectorMassIntegrator'],
+    'curl_integrator': ['CurlIntegrator'],
+
+    ### Cell Source
+    'scalar_source_integrator': ['ScalarSourceIntegrator'],
+    'vector_source_integrator': ['VectorSourceIntegrator'],
+
+    ### Face Operator
+    'scalar_neumann_bc_integrator': ['ScalarNeumannBCIntegrator'],
+
+    ### Dirichlet BC
+    'dirichlet_bc': ['DirichletBC'],
+    'dirichlet_bc_operator': ['DirichletBCOperator'],
+
+    ### recovery estimate
+    'recovery_alg': ['RecoveryAlg'],
+
+    ### parallel assembly
+    'parallel_assembly': ['ParallelAssembler'],
+})
+
+if TYPE_CHECKING:
+    from .integrator import *
+    from .bilinear_form import BilinearForm
+    from .linear_form import LinearForm
+    from .semilinear_form import SemilinearForm
+    from .block_form import BlockForm
+    from .linear_block_form import LinearBlockForm
+
+    from .scalar_diffusion_integrator import ScalarDiffusionIntegrator
+    from .scalar_semilinear_diffusion_integrator import ScalarSemilinearDiffusionIntegrator
+    from .scalar_mass_integrator import ScalarMassIntegrator
+    from .scalar_semilinear_mass_integrator import ScalarSemilinearMassIntegrator
+    from .scalar_convection_integrator import ScalarConvectionIntegrator
+    from .linear_elastic_integrator import LinearElasticIntegrator
+    from .press_work_integrator import PressWorkIntegrator, PressWorkIntegrator0, PressWorkIntegrator1
+    from .vector_mass_integrator import VectorMassIntegrator
+    from .curl_integrator import CurlIntegrator
+
+    from .scalar_source_integrator import ScalarSourceIntegrator
+    from .vector_source_integrator import VectorSourceIntegrator
+
+    from .scalar_neumann_bc_integrator import ScalarNeumannBCIntegrator
+
+    from .dirichlet_bc import DirichletBC
+    from .dirichlet_bc_operator import DirichletBCOperator
+
+    from .recovery_alg import RecoveryAlg
+
+    from .parallel_assembly import ParallelAssembler
@@ -4,13 +4,15 @@ from typing import Optional, Literal, overload
 from .. import logger
 from ..typing import TensorLike
 from ..backend import backend_manager as bm
-from ..sparse import COOTensor, CSRTensor
+from ..sparse import COOTensor, CSRTensor, BSRTensor
+from ..sparse.utils import csr_row_pointer, coalesce_indices
 from .form import Form
 from .integrator import LinearInt
 
 
 class BilinearForm(Form[LinearInt]):
     _M = None
+    _pattern = None
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -57,46 +59,177 @@ class BilinearForm(Form[LinearInt]):
             spshape = sparse_shape
         )
 
-        for group in self.integrators.keys():
-            group_tensor, e2dofs = self._assembly_group(group, retain_ints)
-            ue2dof = e2dofs[0]
-            ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
-            local_shape = group_tensor.shape[-3:] # (NC, vldof, uldof)
+        e2dof_list, tensor_list = self._collect_local(retain_ints, batch_size)
 
-            if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
-            I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
-            J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
-            indices = bm.stack([I.ravel(), J.ravel()], axis=0)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+        if len(e2dof_list) > 0:
+            I, J = self._local_indices(e2dof_list)
+            indices = bm.stack([I, J], axis=0)
+            values = bm.concat(tensor_list, axis=-1)
+            M = M.add(COOTensor(indices, values, sparse_shape))
 
         return M
 
+    def _collect_local(self, retain_ints: bool, batch_size: int):
+        e2dof_list = []
+        tensor_list = []
+
+        for group in self.integrators.keys():
+            for group_tensor, e2dofs in self._assembly_group_chunks(group, retain_ints):
+                ue2dof = e2dofs[0]
+                ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
+
+                if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
+                    group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+                e2dof_list.append((ve2dof, ue2dof))
+                tensor_list.append(bm.reshape(group_tensor, self._values_ravel_shape))
+
+        return e2dof_list, tensor_list
+
+    def _pattern_matches(self, e2dof_list) -> bool:
+        if self._pattern is None:
+            return False
+        cached = self._pattern[0]
+        if len(cached) != len(e2dof_list):
+            return False
+
+        for old, new in zip(cached, e2dof_list):
+            for a, b in zip(old, new):
+                if a is b:
+                    continue
+                if (a.shape != b.shape) or (not bm.all(a == b)):
+                    return False
+
+        return True
+
+    @staticmethod
+    def _local_indices(e2dof_list):
+        I_list = []
+        J_list = []
+
+        for ve2dof, ue2dof in e2dof_list:
+            local_shape = ve2dof.shape + ue2dof.shape[-1:] # (NC, vldof, uldof)
+            I_list.append(bm.broadcast_to(ve2dof[:, :, None], local_shape).reshape(-1))
+            J_list.append(bm.broadcast_to(ue2dof[:, None, :], local_shape).reshape(-1))
+
+        return bm.concat(I_list, axis=0), bm.concat(J_list, axis=0)
+
+    def _symbolic_assembly(self, e2dof_list, sparse_shape):
+        """Build the CSR sparsity pattern and the scatter map from the local
+        entries to the non-zero slots."""
+        I, J = self._local_indices(e2dof_list)
+        row, col, location = coalesce_indices(I, J, sparse_shape)
+        crow = csr_row_pointer(row, sparse_shape[0])
+
+        return e2dof_list, crow, col, location
+
+    def _scalar_assembly_with_pattern(self, retain_ints: bool, batch_size: int):
+        self.check_space()
+        space = self._spaces
+        ugdof = space[0].number_of_global_dofs()
+        vgdof = space[1].number_of_global_dofs() if (len(space) > 1) else ugdof
+        sparse_shape = (vgdof, ugdof)
+        e2dof_list, tensor_list = self._collect_local(retain_ints, batch_size)
+
+        if not self._pattern_matches(e2dof_list):
+            self._pattern = self._symbolic_assembly(e2dof_list, sparse_shape)
+            logger.info(f"Sparsity pattern of the bilinear form constructed, "
+                        f"with {self._pattern[2].shape[0]} non-zeros.")
+
+        _, crow, col, location = self._pattern
+        local_values = bm.concat(tensor_list, axis=-1)
+        values = bm.zeros(local_values.shape[:-1] + col.shape, **bm.context(local_values))
+        values = bm.index_add(values, location, local_values, axis=-1)
+
+        return CSRTensor(crow, col, values, sparse_shape)
+
+    @staticmethod
+    def _block_size(space) -> int:
+        if getattr(space, 'dof_priority', False) and space.dof_numel > 1:
+            raise ValueError("BSR assembly requires the components of every dof "
+                             "to be numbered contiguously, e.g. TensorFunctionSpace "
+                             "with shape (-1, GD).")
+        return getattr(space, 'dof_numel', 1)
+
+    def _block_assembly(self, retain_ints: bool):
+        """Assemble the matrix of vector-valued spaces in BSR format, where the
+        components of a pair of scalar dofs form a dense block."""
+        self.check_space()
+        if self.batch_size > 0:
+            raise ValueError("BSR assembly does not support batched forms.")
+        if getattr(self, '_transposed', False):
+            raise NotImplementedError("BSR assembly of transposed forms is not supported.")
+        space = self._spaces
+        C = self._block_size(space[0])
+        R = self._block_size(space[1]) if (len(space) > 1) else C
+        sparse_shape = self._get_sparse_shape()
+
+        e2dof_list = []
+        block_list = []
+        for group in self.integrators.keys():
+            for group_tensor, e2dofs in self._assembly_group_chunks(group, retain_ints):
+                ue2dof = e2dofs[0]
+                ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
+                NC = group_tensor.shape[0]
+                vldof, uldof = ve2dof.shape[1] // R, ue2dof.shape[1] // C
+                # dofs of components are contiguous: dof = block * size + component
+                e2dof_list.append((ve2dof[:, ::R] // R, ue2dof[:, ::C] // C))
+                local = group_tensor.reshape(NC, vldof, R, uldof, C)
+                local = bm.permute_dims(local, axes=(0, 1, 3, 2, 4))
+                block_list.append(local.reshape(-1, R, C))
+
+        I, J = self._local_indices(e2dof_list)
+        return BSRTensor.from_coo_blocks(I, J, bm.concat(block_list, axis=0), sparse_shape)
+
+    def clear_pattern(self) -> None:
+        """Clear the cached sparsity pattern used by `assembly(reuse_pattern=True)`."""
+        self._pattern = None
+
     @overload
-    def assembly(self, *, retain_ints: bool=False) -> CSRTensor: ...
+    def assembly(self, *, retain_ints: bool=False, reuse_pattern: bool=False) -> CSRTensor: ...
     @overload
-    def assembly(self, *, format: Literal['coo'], retain_ints: bool=False) -> COOTensor: ...
+    def assembly(self, *, format: Literal['coo'], retain_ints: bool=False, reuse_pattern: bool=False) -> COOTensor: ...
     @overload
-    def assembly(self, *, format: Literal['csr'], retain_ints: bool=False) -> CSRTensor: ...
-    def assembly(self, *, format='csr', retain_ints: bool=False):
+    def assembly(self, *, format: Literal['csr'], retain_ints: bool=False, reuse_pattern: bool=False) -> CSRTensor: ...
+    @overload
+    def assembly(self, *, format: Literal['bsr'], retain_ints: bool=False) -> BSRTensor: ...
+    def assembly(self, *, format='csr', retain_ints: bool=False, reuse_pattern: bool=False):
         """Assembly the bilinear form matrix.
 
         Parameters:
-            format (str, optional): Layout of the output ('csr' | 'coo'). Defaults to 'csr'.\n
-            retain_ints (bool, optional): Whether to retain the integrator cache.csr
+            format (str, optional): Layout of the output ('csr' | 'coo' | 'bsr').
+                The 'bsr' layout stores a dense block for the components of
+                every pair of scalar dofs of vector-valued spaces. Defaults to 'csr'.\n
+            retain_ints (bool, optional): Whether to retain the integrator cache.\n
+            reuse_pattern (bool, optional): Whether to cache the sparsity pattern.
+                If True, the first assembly builds the CSR pattern and a map from
+                the local entries to the non-zeros, and later assemblies with the
+                same entity-to-dof relationship only scatter the new values into it,
+                without sorting. Defaults to False.
 
         Returns:
-            global_matrix (CSRTensor | COOTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
+            global_matrix (CSRTensor | COOTensor | BSRTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
         """
-        M = self._scalar_assembly(retain_ints, self.batch_size)
-        if getattr(self, '_transposed', False):
-            M = M.T
+        if format == 'bsr':
+            self._M = self._block_assembly(retain_ints)
+            logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)} "
+                        f"and blocks {self._M.blockshape}.")
+            return self._M
+
+        if reuse_pattern:
+            M = self._scalar_assembly_with_pattern(retain_ints, self.batch_size)
+            if getattr(self, '_transposed', False):
+                M = M.T
+        else:
+            M = self._scalar_assembly(retain_ints, self.batch_size)
+            if getattr(self, '_transposed', False):
+                M = M.T
+            M = M.coalesce()
 
         if format == 'csr':
-            self._M = M.coalesce().tocsr()
+            self._M = M.tocsr()
         elif format == 'coo':
-            self._M = M.coalesce()
+            self._M = M.tocoo()
+            self._M.is_coalesced = True
         else:
             raise ValueError(f"Unsupported format {format}.")
         logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)}.")
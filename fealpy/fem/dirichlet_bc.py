@@ -10,17 +10,77 @@ CoefLike = Union[float, int, TensorLike, Callable[..., TensorLike]]
 _ST = TypeVar('_ST', bound=SparseTensor)
 
 
+class _BCPattern():
+    """Positions in the values of a sparse matrix touched by the boundary
+    condition, computed once for a sparsity pattern."""
+    def __init__(self, structure: Tuple[TensorLike, ...], row: TensorLike,
+                 col: TensorLike, is_bd_dof: TensorLike, bd_dof: TensorLike):
+        self.structure = structure
+        bd_row = is_bd_dof[row]
+        bd_col = is_bd_dof[col]
+        self.row_pos = bm.nonzero(bd_row)[0]
+        self.sym_pos = bm.nonzero(bd_row | bd_col)[0]
+        lift = bm.logical_not(bd_row) & bd_col
+        self.lift_pos = bm.nonzero(lift)[0]
+        self.lift_row = row[lift]
+        self.lift_col = col[lift]
+
+        diag_pos = bm.nonzero(bd_row & (row == col))[0]
+        diag_dof = row[diag_pos]
+        count = bm.zeros(is_bd_dof.shape, dtype=row.dtype, device=bm.get_device(row))
+        count = bm.index_add(count, diag_dof, bm.ones_like(diag_dof))
+        if bool(bm.any(count[bd_dof] != 1)):
+            raise ValueError("Every boundary dof must have exactly one diagonal "
+                             "entry in the sparsity pattern to apply the boundary "
+                             "condition in place. Coalesce the matrix, or use "
+                             "mode='rebuild'.")
+        # sort the diagonal entries by the boundary dofs
+        order = bm.argsort(diag_dof)
+        self.diag_pos = diag_pos[order]
+        self.lift_values = None
+        self.eliminated = None
+
+    def match(self, structure: Tuple[TensorLike, ...]) -> bool:
+        return len(structure) == len(self.structure) and \
+               all(a is b for a, b in zip(structure, self.structure))
+
+
 class DirichletBC():
-    """Dirichlet boundary condition."""
+    """Dirichlet boundary condition.
+
+    The boundary condition can be applied in several modes:
+
+    - 'rebuild' (default): the boundary rows and columns are removed from the
+      sparse structure and unit diagonal entries are added, building a new matrix.
+    - 'symmetric': the same elimination done in place on the values, keeping
+      the sparse structure with explicit zeros.
+    - 'row': only the boundary rows are replaced by unit rows in place, giving
+      a non-symmetric system without lifting the right-hand side.
+    - 'penalty': the diagonal entries of the boundary rows are set to
+      `penalty` in place, and the right-hand side to `penalty * gd`.
+
+    The in-place modes precompute the positions in the values array once for
+    a sparsity pattern and reuse them while the pattern is unchanged, as in
+    time loops. The diagonal entries of the boundary dofs must be in the
+    pattern. For backends without in-place operations, such as jax, a new
+    sparse tensor sharing the index arrays is returned.
+    """
+    MODES = ('rebuild', 'symmetric', 'row', 'penalty')
+
     def __init__(self, space: Tuple[FunctionSpace, ...],
                  gd: Optional[Tuple[CoefLike,...]]=None,
                  *, threshold: Optional[Tuple[CoefLike,...]]=None,
-                 method = None):
+                 method = None, mode: str='rebuild', penalty: float=1e30):
+        if mode not in self.MODES:
+            raise ValueError(f"mode should be one of {self.MODES}, but got '{mode}'.")
         self.space = space
         self.gd = gd
         self.threshold = threshold
         self.bctype = 'Dirichlet'
         self.method = method
+        self.mode = mode
+        self.penalty = penalty
+        self._pattern: Optional[_BCPattern] = None
 
         if isinstance(space, tuple):
             self.gdof = bm.array([i.number_of_global_dofs() for i in space])
@@ -129,8 +189,13 @@ class DirichletBC():
             check (bool, optional): Whether to check the matrix. Defaults to True.
 
         Returns:
-            SparseTensor: New adjusted left-hand-size matrix.
+            SparseTensor: New adjusted left-hand-size matrix. In the in-place\
+                modes, this is the input matrix with modified values.
         """
+        if self.mode != 'rebuild':
+            A = self.check_matrix(matrix) if check else matrix
+            return self._apply_matrix_inplace(A)
+
         # NOTE: Code in the numpy version:
         # ```
         # bdIdx = np.zeros(A.shape[0], dtype=np.int_)
@@ -237,11 +302,96 @@ class DirichletBC():
                 uh = bm.zeros_like(f)
             uh, _ = self.space.boundary_interpolate(gd, uh, self.threshold)
 
+        if self.mode != 'rebuild':
+            return self.apply_lifting(f, A, uh, check=False)
+
         bd_idx = self.boundary_dof_index
         f = f - A.matmul(uh[:])
         f = bm.set_at(f, bd_idx, uh[bd_idx])
         return f
 
+    def pattern(self, matrix: SparseTensor, /) -> _BCPattern:
+        """Return the positions touched by the boundary condition in the values
+        of the matrix, computed again only if the sparse structure has changed."""
+        if isinstance(matrix, COOTensor):
+            structure = (matrix.indices(), )
+        else:
+            structure = (matrix.crow(), matrix.col())
+
+        if (self._pattern is None) or (not self._pattern.match(structure)):
+            if isinstance(matrix, COOTensor):
+                row, col = matrix.indices()[0], matrix.indices()[1]
+            else:
+                row, col = matrix.row(), matrix.col()
+            self._pattern = _BCPattern(structure, row, col, self.is_boundary_dof,
+                                       self.boundary_dof_index)
+        return self._pattern
+
+    def _apply_matrix_inplace(self, A: _ST) -> _ST:
+        pattern = self.pattern(A)
+        values = A.values()
+
+        if self.mode == 'symmetric':
+            # keep the eliminated columns for lifting the right-hand side
+            if values is not pattern.eliminated:
+                pattern.lift_values = bm.copy(values[..., pattern.lift_pos])
+            values = bm.set_at(values, (..., pattern.sym_pos), 0.)
+            values = bm.set_at(values, (..., pattern.diag_pos), 1.)
+        elif self.mode == 'row':
+            values = bm.set_at(values, (..., pattern.row_pos), 0.)
+            values = bm.set_at(values, (..., pattern.diag_pos), 1.)
+        else:
+            values = bm.set_at(values, (..., pattern.diag_pos), self.penalty)
+        pattern.eliminated = values
+
+        if values is A.values():
+            return A
+        if isinstance(A, COOTensor):
+            return COOTensor(A.indices(), values, A.sparse_shape,
+                             is_coalesced=A.is_coalesced)
+        return CSRTensor(A.crow(), A.col(), values, A.sparse_shape)
+
+    def apply_lifting(self, vector: TensorLike, matrix: SparseTensor,
+                      uh: TensorLike, *, check=True) -> TensorLike:
+        """Lift the boundary values into the right-hand-side vector for the
+        in-place modes, using only the entries in the eliminated columns
+        instead of a full SpMV.
+
+        Parameters:
+            vector (TensorLike): The original right-hand-size vector, shaped\
+                (gdof, ) or (gdof, NB) for a batch of NB vectors.
+            matrix (SparseTensor): The matrix, either original or already\
+                adjusted by `apply_matrix` in place.
+            uh (TensorLike): The values of the solution on the boundary dofs,\
+                shaped as the vector.
+            check (bool, optional): Whether to check the vector. Defaults to True.
+
+        Returns:
+            TensorLike: New adjusted right-hand-size vector.
+        """
+        A = self.check_matrix(matrix) if check else matrix
+        f = self.check_vector(vector) if check else vector
+        bd_idx = self.boundary_dof_index
+
+        if self.mode == 'penalty':
+            f = bm.copy(f)
+            return bm.set_at(f, bd_idx, self.penalty * uh[bd_idx])
+
+        if self.mode == 'symmetric':
+            pattern = self.pattern(A)
+            if A.values() is pattern.eliminated:
+                val = pattern.lift_values
+            else:
+                val = A.values()[..., pattern.lift_pos]
+            if f.ndim == 2:
+                val = val[:, None]
+            f = bm.index_add(bm.copy(f), pattern.lift_row,
+                             val * uh[pattern.lift_col], alpha=-1)
+        else:
+            f = bm.copy(f)
+
+        return bm.set_at(f, bd_idx, uh[bd_idx])
+
 
     # def apply_for_vspace_with_scalar_basis(self, A, f, uh, dflag=None):
     #     """
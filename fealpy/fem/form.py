@@ -1,7 +1,8 @@
 
-from typing import Sequence, overload, List, Dict, Tuple, Optional, TypeVar, Generic
+from typing import Sequence, overload, List, Dict, Tuple, Optional, TypeVar, Generic, Iterator
 
 from ..typing import TensorLike, Size
+from ..backend import backend_manager as bm
 from ..functionspace import FunctionSpace as _FS
 from .integrator import Integrator
 
@@ -16,15 +17,29 @@ class Form(Generic[_I], ABC):
     integrators: Dict[str, Tuple[_I, ...]]
     memory: Dict[str, Tuple[TensorLike, List[TensorLike]]]
     batch_size: int
+    chunk_size: int
     sparse_shape: Tuple[int, ...]
 
     @overload
-    def __init__(self, space: _FS, *, batch_size: int=0): ...
+    def __init__(self, space: _FS, *, batch_size: int=0, chunk_size: int=0): ...
     @overload
-    def __init__(self, space: Tuple[_FS, ...], *, batch_size: int=0): ...
+    def __init__(self, space: Tuple[_FS, ...], *, batch_size: int=0, chunk_size: int=0): ...
     @overload
-    def __init__(self, *space: _FS, batch_size: int=0): ...
-    def __init__(self, *space, batch_size: int=0):
+    def __init__(self, *space: _FS, batch_size: int=0, chunk_size: int=0): ...
+    def __init__(self, *space, batch_size: int=0, chunk_size: int=0):
+        """
+        Parameters:
+            *space (FunctionSpace): The function space(s) of the form.
+            batch_size (int, optional): Size of the batch dimension of the
+                integrator outputs, 0 for no batch. Defaults to 0.
+            chunk_size (int, optional): Number of cells integrated at a time.
+                Integrators are then fed with blocks of cells through their
+                `index`, so the peak memory of the integrals is bounded by
+                `chunk_size` instead of the number of cells. Coefficients and
+                sources given as tensors of the integrated cells, shaped (NC, ...),
+                are sliced with the blocks. Use 0 to integrate all cells at once.
+                Defaults to 0.
+        """
         if len(space) == 0:
             raise ValueError("No space is given.")
         if isinstance(space[0], Sequence):
@@ -34,12 +49,14 @@ class Form(Generic[_I], ABC):
         self._cursor = 0
         self.memory = {}
         self.batch_size = batch_size
+        self.chunk_size = chunk_size
 
         self._values_ravel_shape = (-1,) if self.batch_size == 0 else (self.batch_size, -1)
         self.sparse_shape = self._get_sparse_shape()
 
     def copy(self):
-        new_obj = self.__class__(self._spaces, batch_size=self.batch_size)
+        new_obj = self.__class__(self._spaces, batch_size=self.batch_size,
+                                 chunk_size=self.chunk_size)
         new_obj.integrators.update(self.integrators)
         new_obj.memory.update(self.memory)
         new_obj._values_ravel_shape = self._values_ravel_shape
@@ -120,7 +137,14 @@ class Form(Generic[_I], ABC):
         if group in self.memory:
             return self.memory[group]
 
-        INTS = self.integrators[group]
+        ct, etg = self._integrate(self.integrators[group], group)
+
+        if retain_ints:
+            self.memory[group] = (ct, etg)
+
+        return ct, etg
+
+    def _integrate(self, INTS: Tuple[_I, ...], group: str):
         ct = INTS[0](self.space)
         etg = [INTS[0].to_global_dof(s) for s in self._spaces]
 
@@ -138,7 +162,85 @@ class Form(Generic[_I], ABC):
             else:
                 ct = ct + new_ct
 
-        if retain_ints:
-            self.memory[group] = (ct, etg)
-
         return ct, etg
+
+    def _chunk_index(self, group: str) -> Optional[List[TensorLike]]:
+        """Split the cells integrated by a group into blocks of `chunk_size`.
+        Return None if the group can not be assembled by blocks."""
+        INTS = self.integrators[group]
+        index = getattr(INTS[0], 'index', None)
+
+        if index is None:
+            return None
+        for int_ in INTS[1:]:
+            if getattr(int_, 'index', None) is not index:
+                return None
+
+        mesh = getattr(self._spaces[0], 'mesh', None)
+        if mesh is None:
+            return None
+        NC = mesh.number_of_cells()
+
+        if isinstance(index, slice):
+            cell_index = bm.arange(NC, dtype=mesh.itype, device=mesh.device)[index]
+        elif isinstance(index, TensorLike) and index.ndim == 1:
+            if index.dtype == bm.bool:
+                cell_index = bm.nonzero(index)[0]
+            else:
+                cell_index = index
+        else:
+            return None
+
+        N = cell_index.shape[0]
+        return [cell_index[i:i+self.chunk_size] for i in range(0, N, self.chunk_size)]
+
+    def _assembly_group_chunks(self, group: str, retain_ints: bool=False) -> Iterator[Tuple[TensorLike, List[TensorLike]]]:
+        """Yield the integral tensor and the entity-to-global relationship of a
+        group, block by block of cells when `chunk_size` is positive."""
+        chunks = self._chunk_index(group) if self.chunk_size > 0 else None
+
+        if (chunks is None) or (group in self.memory):
+            yield self._assembly_group(group, retain_ints)
+            return
+
+        INTS = self.integrators[group]
+        index = INTS[0].index
+        N = sum(chunk.shape[0] for chunk in chunks)
+        saved = [(int_._value, vars(int_).get('_cache', _MISSING), _cell_data(int_, N))
+                 for int_ in INTS]
+
+        try:
+            start = 0
+            for chunk in chunks:
+                block = slice(start, start + chunk.shape[0])
+                start = block.stop
+                for int_, (_, _, data) in zip(INTS, saved):
+                    int_.index = chunk
+                    int_._value = None
+                    int_._cache = {}
+                    for name, value in data.items():
+                        setattr(int_, name, value[block])
+                yield self._integrate(INTS, group)
+        finally:
+            for int_, (value, cache, data) in zip(INTS, saved):
+                int_.index = index
+                int_._value = value
+                if cache is _MISSING:
+                    del int_._cache
+                else:
+                    int_._cache = cache
+                for name, value in data.items():
+                    setattr(int_, name, value)
+
+
+_MISSING = object()
+
+def _cell_data(int_: Integrator, N: int) -> Dict[str, TensorLike]:
+    """The coefficients and sources of an integrator given as tensors with
+    a leading axis of the N integrated cells, which are sliced by blocks."""
+    data = {}
+    for name in ('coef', 'source'):
+        value = getattr(int_, name, None)
+        if isinstance(value, TensorLike) and value.ndim > 0 and value.shape[0] == N:
+            data[name] = value
+    return data
@@ -46,15 +46,22 @@ class LinearForm(Form[LinearInt]):
             spshape = sparse_shape
         )
 
+        indices_list = []
+        values_list = []
+
         for group in self.integrators.keys():
-            group_tensor, e2dofs = self._assembly_group(group, retain_ints)
+            for group_tensor, e2dofs in self._assembly_group_chunks(group, retain_ints):
+
+                if (batch_size > 0) and (group_tensor.ndim == 2):
+                    group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
 
-            if (batch_size > 0) and (group_tensor.ndim == 2):
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+                indices_list.append(e2dofs[0].reshape(1, -1))
+                values_list.append(bm.reshape(group_tensor, self._values_ravel_shape))
 
-            indices = e2dofs[0].reshape(1, -1)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+        if len(indices_list) > 0:
+            indices = bm.concat(indices_list, axis=1)
+            values = bm.concat(values_list, axis=-1)
+            M = M.add(COOTensor(indices, values, sparse_shape))
 
         return M
 
@@ -0,0 +1,242 @@
+
+from typing import Callable, Optional, Sequence, Tuple, Union, List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+import os
+
+import numpy as np
+
+from .. import logger
+from ..typing import TensorLike
+from ..backend import backend_manager as bm
+from ..sparse import CSRTensor
+from ..sparse.utils import csr_row_pointer, coalesce_indices
+from ..mesh.mesh_base import Mesh
+from ..mesh.partition import partition_mesh, cell_submesh, dof_l2g
+from .bilinear_form import BilinearForm
+from .linear_form import LinearForm
+
+Forms = Union[BilinearForm, LinearForm, Sequence[Union[BilinearForm, LinearForm]]]
+# (name, shape, dtype) of an array in shared memory
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def _share(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, ArraySpec]:
+    """Copy an array to a new block of shared memory."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach(spec: ArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach to an array in shared memory created by another process."""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    # NOTE: the creator owns the block, so it is not tracked by this process,
+    # otherwise it would be unlinked (with a warning) when this process exits.
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _assemble_part(mesh_class, factory: Callable, specs: Dict[str, Any], part: int):
+    """Assemble the forms on the cells of a part, in a worker process.
+
+    The results are the entries of the forms in the global numbering, written
+    to new blocks of shared memory which are handed over to the caller.
+    """
+    bm.set_backend('numpy')
+    blocks = []
+    try:
+        arrays = {}
+        for key, spec in specs.items():
+            if isinstance(spec, list):
+                attached = [_attach(s) for s in spec]
+                blocks.extend(shm for shm, _ in attached)
+                arrays[key] = [a for _, a in attached]
+            else:
+                shm, arrays[key] = _attach(spec)
+                blocks.append(shm)
+
+        offset = arrays['offset']
+        index = np.array(arrays['order'][offset[part]:offset[part+1]])
+        mesh, _ = cell_submesh(mesh_class, arrays['node'], arrays['cell'], index)
+        forms = factory(mesh)
+        forms = forms if isinstance(forms, (list, tuple)) else (forms, )
+
+        results = []
+        cell2dof = iter(arrays['cell2dof'])
+        for form in forms:
+            l2g = []
+            for space in form._spaces:
+                gc2d = next(cell2dof)[index]
+                l2g.append(dof_l2g(space.cell_to_dof(), gc2d, space.number_of_global_dofs()))
+
+            if isinstance(form, BilinearForm):
+                M = form.assembly(format='csr')
+                row = l2g[-1][M.row()]
+                col = l2g[0][M.col()]
+                output = (row, col, M.values())
+            else:
+                output = (l2g[0], form.assembly())
+
+            specs_out = []
+            for array in output:
+                shm, spec = _share(np.ascontiguousarray(array))
+                resource_tracker.unregister(shm._name, 'shared_memory')
+                shm.close()
+                specs_out.append(spec)
+            results.append(specs_out)
+        return results
+    finally:
+        for shm in blocks:
+            shm.close()
+
+
+class ParallelAssembler():
+    """Assemble finite element forms in parallel processes by partitions of\
+    the mesh.
+
+    The cells are partitioned by `fealpy.mesh.partition.partition_mesh`, and
+    the forms are assembled on the mesh of every part by a pool of processes.
+    The global mesh and the global cell-to-dof maps are passed to the workers
+    through shared memory, and every worker returns the entries of its part
+    in the global numbering, through shared memory as well. The entries are
+    then merged into a global CSR matrix, where those of the dofs on the
+    interfaces of the parts are summed.
+
+    The forms are built by `factory(mesh)`, called on the global mesh to get
+    the global spaces, and on the mesh of every part in the workers. So the
+    factory should be a picklable (module level) function, and the
+    coefficients of the integrators should be constants or functions of the
+    coordinates, not tensors defined on the global mesh. Workers run on the
+    numpy backend, and the results are converted to the current backend.
+
+    Example:
+        >>> def poisson(mesh):
+        ...     space = LagrangeFESpace(mesh, p=1)
+        ...     bform = BilinearForm(space)
+        ...     bform.add_integrator(ScalarDiffusionIntegrator())
+        ...     lform = LinearForm(space)
+        ...     lform.add_integrator(ScalarSourceIntegrator(source))
+        ...     return bform, lform
+        >>> assembler = ParallelAssembler(mesh, poisson, nparts=8)
+        >>> A, F = assembler.assembly()
+    """
+    def __init__(self, mesh: Mesh, factory: Callable[[Mesh], Forms],
+                 nparts: Optional[int]=None, *,
+                 parts: Optional[TensorLike]=None,
+                 method: str='auto',
+                 max_workers: Optional[int]=None,
+                 mp_context=None):
+        """
+        Parameters:
+            mesh (Mesh): The global mesh, constructed as `mesh.__class__(node, cell)`.
+            factory (Callable): The function building the form, or a sequence of\
+                forms, on a mesh.
+            nparts (int | None, optional): The number of parts. Default to the\
+                number of workers.
+            parts (Tensor | None, optional): The part of every cell, shaped (NC, ).\
+                Default to the partition by `method`.
+            method (str, optional): The partition method, see `partition_mesh`.\
+                Default to 'auto'.
+            max_workers (int | None, optional): The number of processes, 0 to\
+                assemble the parts in the current process. Default to the number\
+                of CPUs.
+            mp_context (optional): The multiprocessing context of the pool.
+        """
+        self.mesh = mesh
+        self.factory = factory
+        self.max_workers = os.cpu_count() if max_workers is None else max_workers
+        self.mp_context = mp_context
+        if parts is None:
+            nparts = max(self.max_workers, 1) if nparts is None else nparts
+            parts = partition_mesh(mesh, nparts, method=method)
+        self.parts = bm.to_numpy(parts).astype(np.int64)
+        self.nparts = int(self.parts.max()) + 1 if nparts is None else nparts
+
+    def assembly(self):
+        """Assemble the forms built by the factory.
+
+        Returns:
+            CSRTensor | Tensor | Tuple: The matrices of the bilinear forms and\
+                the vectors of the linear forms, in the same structure as the\
+                output of the factory.
+        """
+        forms = self.factory(self.mesh)
+        single = not isinstance(forms, (list, tuple))
+        forms = (forms, ) if single else tuple(forms)
+
+        order = np.argsort(self.parts, kind='stable')
+        count = np.bincount(self.parts, minlength=self.nparts)
+        arrays = {
+            'node': bm.to_numpy(self.mesh.entity('node')),
+            'cell': bm.to_numpy(self.mesh.entity('cell')),
+            'order': order,
+            'offset': np.concatenate([[0], np.cumsum(count)]),
+            'cell2dof': [bm.to_numpy(s.cell_to_dof()) for f in forms for s in f._spaces],
+        }
+
+        backend = bm.backend_name
+        blocks = []
+        try:
+            specs = {}
+            for key, array in arrays.items():
+                if isinstance(array, list):
+                    shared = [_share(np.ascontiguousarray(a)) for a in array]
+                    blocks.extend(shm for shm, _ in shared)
+                    specs[key] = [spec for _, spec in shared]
+                else:
+                    shm, specs[key] = _share(np.ascontiguousarray(array))
+                    blocks.append(shm)
+
+            args = (self.mesh.__class__, self.factory, specs)
+            if self.max_workers == 0:
+                outputs = [_assemble_part(*args, p) for p in range(self.nparts)]
+            else:
+                with ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context) as pool:
+                    futures = [pool.submit(_assemble_part, *args, p) for p in range(self.nparts)]
+                    outputs = [f.result() for f in futures]
+        finally:
+            bm.set_backend(backend)
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+        results = [self._merge(form, [out[i] for out in outputs])
+                   for i, form in enumerate(forms)]
+        logger.info(f"ParallelAssembler: {len(forms)} form(s) assembled on "
+                    f"{self.nparts} parts.")
+        return results[0] if single else tuple(results)
+
+    @staticmethod
+    def _collect(specs: List[ArraySpec]) -> List[np.ndarray]:
+        """Copy the arrays from the shared memory of a worker, and release it."""
+        arrays = []
+        for spec in specs:
+            name, shape, dtype = spec
+            shm = shared_memory.SharedMemory(name=name)
+            arrays.append(np.array(np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)))
+            shm.close()
+            shm.unlink()
+        return arrays
+
+    def _merge(self, form: Union[BilinearForm, LinearForm], outputs: List[List[ArraySpec]]):
+        parts = [self._collect(specs) for specs in outputs]
+        device = bm.get_device(self.mesh.entity('cell'))
+
+        if isinstance(form, BilinearForm):
+            shape = form.sparse_shape
+            I = bm.from_numpy(np.concatenate([p[0] for p in parts]))
+            J = bm.from_numpy(np.concatenate([p[1] for p in parts]))
+            V = bm.from_numpy(np.concatenate([p[2] for p in parts]))
+            I, J, V = bm.device_put(I, device), bm.device_put(J, device), bm.device_put(V, device)
+            row, col, location = coalesce_indices(I, J, shape)
+            values = bm.zeros(col.shape, **bm.context(V))
+            values = bm.index_add(values, location, V)
+            return CSRTensor(csr_row_pointer(row, shape[0]), col, values, shape)
+
+        gdof = form.sparse_shape[0]
+        F = np.zeros((gdof, ), dtype=parts[0][1].dtype)
+        for l2g, val in parts:
+            np.add.at(F, l2g, val)
+        return bm.device_put(bm.from_numpy(F), device)
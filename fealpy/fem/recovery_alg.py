@@ -7,18 +7,20 @@ from ..functionspace import TensorFunctionSpace
 
 class RecoveryAlg:
 
-    def recovery_estimate(self, uh: TensorLike, method='simple'):
+    def recovery_estimate(self, uh: TensorLike, method='simple', *, chunk_size: int=0):
         """
         Calculate the error estimate of gradient recovery for the true solution uh.
         ----------------------------------
         @param uh: The numerical solution uh.
         @param method: The method to compute the recovery estimate. Default is 'simple'.
+        @param chunk_size: The number of cells evaluated at a time, 0 for all the cells.
         @return: Error of the recovery estimate.
         TODO: 向量型的恢复误差估计
         """
         mesh = uh.space.mesh
         rguh = self.grad_recovery(uh, method=method)
-        eta = mesh.error(rguh.value, uh.grad_value, power=2, celltype=True) # 计算单元上的恢复型误差
+        eta = mesh.error(rguh.value, uh.grad_value, power=2, celltype=True,
+                         chunk_size=chunk_size) # 计算单元上的恢复型误差
         return eta
 
     def grad_recovery(self, uh: TensorLike, method='simple'):
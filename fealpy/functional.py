@@ -6,6 +6,14 @@ from .typing import TensorLike, CoefLike
 from .utils import is_scalar, is_tensor, fill_axis
 
 
+def _contract(subscripts: str, *operands: TensorLike) -> TensorLike:
+    """Einsum by the cached plan of the subscripts and operand shapes."""
+    if not all(is_tensor(op) for op in operands):
+        return bm.einsum(subscripts, *operands)
+    plan = bm.einsum_plan(subscripts, *[op.shape for op in operands])
+    return plan(*operands)
+
+
 def integral(value: TensorLike, weights: TensorLike, measure: TensorLike, *,
              entity_type=False) -> TensorLike:
     """Numerical integration.
@@ -21,7 +29,7 @@ def integral(value: TensorLike, weights: TensorLike, measure: TensorLike, *,
         if `entity_type` is True, otherwise [...].
     """
     subs = '...c' if entity_type else '...'
-    return bm.einsum(f'c, q, ...cq -> {subs}', measure, weights, value)
+    return _contract(f'c, q, ...cq -> {subs}', measure, weights, value)
 
 
 def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
@@ -44,10 +52,10 @@ def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
             If `batched` is True, there will be a batch dimension as the first axis.
     """
     if source is None:
-        return bm.einsum('c, q, cq... -> c...', measure, weights, basis)
+        return _contract('c, q, cq... -> c...', measure, weights, basis)
 
     if is_scalar(source):
-        return bm.einsum('c, q, cq... -> c...', measure, weights, basis) * source
+        return _contract('c, q, cq... -> c...', measure, weights, basis) * source
 
     elif is_tensor(source):
         dof_shape = basis.shape[3:]
@@ -55,11 +63,11 @@ def linear_integral(basis: TensorLike, weights: TensorLike, measure: TensorLike,
 
         if source.ndim <= 2 + int(batched):
             source = fill_axis(source, 3 if batched else 2)
-            r = bm.einsum(f'c, q, cqid, ...cq -> ...cid', measure, weights, basis, source)
+            r = _contract(f'c, q, cqid, ...cq -> ...cid', measure, weights, basis, source)
             return bm.reshape(r, r.shape[:-1] + dof_shape)
         else:
             source = fill_axis(source, 4 if batched else 3)
-            return bm.einsum(f'c, q, cqid, ...cqd -> ...ci', measure, weights, basis, source)
+            return _contract(f'c, q, cqid, ...cqd -> ...ci', measure, weights, basis, source)
 
     else:
         raise TypeError(f"source should be int, float or TensorLike, but got {type(source)}.")
@@ -89,14 +97,14 @@ def bilinear_integral(basis1: TensorLike, basis2: TensorLike, weights: TensorLik
     basis2 = basis2.reshape(*basis2.shape[:3], -1) # (C, Q, J, dof_numel)
 
     if coef is None:
-        return bm.einsum(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2)
+        return _contract(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2)
 
     if is_scalar(coef):
-        return bm.einsum(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2) * coef
+        return _contract(f'q, c, cqid, cqjd -> cij', weights, measure, basis1, basis2) * coef
 
     elif is_tensor(coef):
         coef = fill_axis(coef, 4 if batched else 3)
-        return bm.einsum(f'q, c, cqid, cqjd, ...cqd -> ...cij', weights, measure, basis1, basis2, coef)
+        return _contract(f'q, c, cqid, cqjd, ...cqd -> ...cij', weights, measure, basis1, basis2, coef)
 
     else:
         raise TypeError(f"coef should be int, float or TensorLike, but got {type(coef)}.")
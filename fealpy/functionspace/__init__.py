@@ -1,16 +1,42 @@
+"""The Function Space Module
 
-from .space import FunctionSpace
-from .function import Function
+The spaces are imported on first access, see `fealpy.lazy`.
+"""
+from typing import TYPE_CHECKING
 
-from .dofs import LinearMeshCFEDof
+from ..lazy import attach
 
-from .lagrange_fe_space import LagrangeFESpace
-from .tensor_space import TensorFunctionSpace
-from .cm_conforming_fe_space import CmConformingFESpace2d
-from .bernstein_fe_space import BernsteinFESpace
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'space': ['FunctionSpace'],
+    'function': ['Function'],
 
-from .first_nedelec_fe_space_2d import FirstNedelecFiniteElementSpace2d
-from .first_nedelec_fe_space_3d import FirstNedelecFiniteElementSpace3d
+    'dofs': ['LinearMeshCFEDof'],
 
-from.second_nedelec_fe_space_2d import SecondNedelecFiniteElementSpace2d
-from.second_nedelec_fe_space_3d import SecondNedelecFiniteElementSpace3d
+    'lagrange_fe_space': ['LagrangeFESpace'],
+    'tensor_space': ['TensorFunctionSpace'],
+    'cm_conforming_fe_space': ['CmConformingFESpace2d'],
+    'bernstein_fe_space': ['BernsteinFESpace'],
+
+    'first_nedelec_fe_space_2d': ['FirstNedelecFiniteElementSpace2d'],
+    'first_nedelec_fe_space_3d': ['FirstNedelecFiniteElementSpace3d'],
+
+    'second_nedelec_fe_space_2d': ['SecondNedelecFiniteElementSpace2d'],
+    'second_nedelec_fe_space_3d': ['SecondNedelecFiniteElementSpace3d'],
+})
+
+if TYPE_CHECKING:
+    from .space import FunctionSpace
+    from .function import Function
+
+    from .dofs import LinearMeshCFEDof
+
+    from .lagrange_fe_space import LagrangeFESpace
+    from .tensor_space import TensorFunctionSpace
+    from .cm_conforming_fe_space import CmConformingFESpace2d
+    from .bernstein_fe_space import BernsteinFESpace
+
+    from .first_nedelec_fe_space_2d import FirstNedelecFiniteElementSpace2d
+    from .first_nedelec_fe_space_3d import FirstNedelecFiniteElementSpace3d
+
+    from .second_nedelec_fe_space_2d import SecondNedelecFiniteElementSpace2d
+    from .second_nedelec_fe_space_3d import SecondNedelecFiniteElementSpace3d
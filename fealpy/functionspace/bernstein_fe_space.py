@@ -4,6 +4,7 @@ from typing import Union, TypeVar, Generic, Callable, Optional
 from ..backend import TensorLike
 from ..backend import backend_manager as bm
 from ..mesh.mesh_base import Mesh
+from ..mesh.tabulation import tabulation_cache
 from ..decorator import barycentric
 from .space import FunctionSpace
 from .dofs import LinearMeshCFEDof
@@ -79,7 +80,12 @@ class BernsteinFESpace(FunctionSpace, Generic[_MT]):
         """
         if p is None:
             p = self.p
+        phi = tabulation_cache.get('bernstein_basis', bcs,
+                                   lambda: self._reference_basis(bcs, p), p)
+        return phi[None, :]
 
+    def _reference_basis(self, bcs: TensorLike, p: int):
+        """Basis on the reference cell, in shape (NQ, ldof)."""
         NQ = bcs.shape[0]
         TD = bcs.shape[1]-1
         multiIndex = self.mesh.multi_index_matrix(p, etype=TD)
@@ -98,7 +104,7 @@ class BernsteinFESpace(FunctionSpace, Generic[_MT]):
         # B : (NQ, p+1, TD+1) 
         # B[:, multiIndex, bm.arange(TD+1).reshape(1, -1)]: (NQ, ldof, TD+1)
         phi = P[0, -1, 0]*bm.prod(B[:, multiIndex, bm.arange(TD+1).reshape(1, -1)], axis=-1)
-        return phi[None, :]
+        return phi
 
     @barycentric
     def grad_basis(self, bcs: TensorLike, index: Index=_S, variable='u',p=None):
@@ -125,7 +131,15 @@ class BernsteinFESpace(FunctionSpace, Generic[_MT]):
         """
         if p==None:
             p = self.p
+        R = tabulation_cache.get('bernstein_grad_basis', bcs,
+                                 lambda: self._reference_grad_basis(bcs, p), p)
+        Dlambda = self.mesh.grad_lambda()
+        gphi = bm.einsum("qlm, cmd->cqld", R, Dlambda)# TODO: optimize
+        return gphi[:, index]
 
+    def _reference_grad_basis(self, bcs: TensorLike, p: int):
+        """Gradient of the basis with respect to the barycentric coordinates,
+        in shape (NQ, ldof, TD+1)."""
         NQ = bcs.shape[0]
         TD = bcs.shape[1]-1
         multiIndex = self.mesh.multi_index_matrix(p, TD)
@@ -154,9 +168,7 @@ class BernsteinFESpace(FunctionSpace, Generic[_MT]):
             idx = bm.array(idx,device=self.device, dtype=self.itype)
             # R[..., i] = bm.prod(B[..., multiIndex[:, idx], idx.reshape(1, -1)],axis=-1)*F[..., multiIndex[:, i], [i]]
             R = bm.set_at(R,(...,i),bm.prod(B[..., multiIndex[:, idx], idx.reshape(1, -1)],axis=-1)*F[..., multiIndex[:, i], [i]])
-        Dlambda = self.mesh.grad_lambda()
-        gphi = P[0, -1, 0]*bm.einsum("qlm, cmd->cqld", R, Dlambda)# TODO: optimize
-        return gphi[:, index]
+        return P[0, -1, 0]*R
 
     @barycentric
     def hess_basis(self, bcs: TensorLike, index: Index=_S, variable='u'):
@@ -5,6 +5,7 @@ from functools import partial
 from ..backend import backend_manager as bm
 from ..backend import TensorLike, Number
 from ..typing import Index, _S
+from ..mesh.utils import cell_chunks
 
 _FS = TypeVar('_FS')
 
@@ -15,8 +16,48 @@ class Function(Generic[_FS]):
         self.array = array
         self.coordtype = coordtype
 
-    def __call__(self, bcs: TensorLike, index: Index=_S):
-        return self.space.value(self.array, bcs, index=index)
+    def __call__(self, bcs: TensorLike, index: Index=_S, *,
+                 out: Optional[TensorLike]=None):
+        if out is None:
+            return self.space.value(self.array, bcs, index=index)
+        return self.space.value(self.array, bcs, index=index, out=out)
+
+    @property
+    def batch_ndim(self) -> int:
+        """The number of batch dimensions of the dofs, created by\
+        `space.function(batch=...)`."""
+        return self.array.ndim - 1
+
+    def evaluate(self, bcs: TensorLike, variable: str='value', *,
+                 chunk_size: int=0, out: Optional[TensorLike]=None) -> TensorLike:
+        """Evaluate the function on the quadrature points of all the cells,\
+        block by block of cells.
+
+        Parameters:
+            bcs (Tensor): The barycentric coordinates, shaped (NQ, TD+1).
+            variable (str, optional): The name of the value method of the space,\
+                e.g. 'value' or 'grad_value'. Default to 'value'.
+            chunk_size (int, optional): The number of cells evaluated at a time,\
+                0 for all the cells at once. Default to 0.
+            out (Tensor | None, optional): The buffer shaped (*batch, NC, NQ, ...)\
+                to fill. Default to None, allocating one if `chunk_size` is positive.
+
+        Returns:
+            Tensor: The values shaped (*batch, NC, NQ, ...), in `out` if given.
+        """
+        func = getattr(self.space, variable)
+        NC = self.space.mesh.number_of_cells()
+        if chunk_size <= 0 and out is None:
+            return func(self.array, bcs)
+
+        nb = self.batch_ndim
+        for index in cell_chunks(NC, chunk_size):
+            val = func(self.array, bcs, index=index)
+            if out is None:
+                shape = val.shape[:nb] + (NC, ) + val.shape[nb+1:]
+                out = bm.empty(shape, **bm.context(val))
+            out = bm.set_at(out, (slice(None), ) * nb + (index, ), val)
+        return out
 
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.space}, {self.array})'
@@ -39,6 +80,7 @@ class Function(Generic[_FS]):
             if callable(attr):
                 func = partial(attr, self.array)
                 func.coordtype = attr.coordtype
+                func.batch_ndim = self.batch_ndim
                 return func
             else:
                 return attr
@@ -133,15 +133,36 @@ class LagrangeFESpace(FunctionSpace, Generic[_MT]):
         return self.mesh.hess_shape_function(bc, self.p, index=index, variables=variable)
 
     @barycentric
-    def value(self, uh: TensorLike, bc: TensorLike, index: Index=_S) -> TensorLike:
+    def value(self, uh: TensorLike, bc: TensorLike, index: Index=_S, *,
+              out: Optional[TensorLike]=None) -> TensorLike:
+        """Evaluate the finite element function on the quadrature points.
+
+        Parameters:
+            uh (Tensor): The dofs, shaped (gdof, ), or (*batch, gdof) for\
+                a batch of functions.
+            bc (Tensor): The barycentric coordinates, shaped (NQ, TD+1).
+            index (Index, optional): The index of the cells. Default to all.
+            out (Tensor | None, optional): The buffer shaped (*batch, NC, NQ)\
+                to store the values. Default to None.
+
+        Returns:
+            Tensor: The values shaped (*batch, NC, NQ), in `out` if given.
+        """
         phi = self.basis(bc, index=index)
         e2dof = self.dof.cell_to_dof(index=index)
         val = bm.einsum('cql, ...cl -> ...cq', phi, uh[..., e2dof])
-        return val
+        if out is None:
+            return val
+        return bm.set_at(out, ..., val)
 
     @barycentric
-    def grad_value(self, uh: TensorLike, bc: TensorLike, index: Index=_S) -> TensorLike:
+    def grad_value(self, uh: TensorLike, bc: TensorLike, index: Index=_S, *,
+                   out: Optional[TensorLike]=None) -> TensorLike:
+        """Evaluate the gradient of the finite element function on the\
+        quadrature points, shaped (*batch, NC, NQ, GD). See `value`."""
         gphi = self.grad_basis(bc, index=index)
         cell2dof = self.dof.cell_to_dof(index=index)
-        val = bm.einsum('cilm, cl -> cim', gphi, uh[cell2dof])
-        return val[...]
+        val = bm.einsum('cilm, ...cl -> ...cim', gphi, uh[..., cell2dof])
+        if out is None:
+            return val
+        return bm.set_at(out, ..., val)
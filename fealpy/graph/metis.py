@@ -669,7 +669,7 @@ def array_to_metis(adj, adjLocation, nodew=None, nodesz=None):
     m2 = adjLocation[-1] 
 
     if adj.dtype == 'int32':
-        if idx_t == ctypes.POINTER(ctypes.c_int64):
+        if idx_t == ctypes.c_int64:
             adj = adj.astype(np.int64)
             adjLocation = adjLocation.astype(np.int64)
 
@@ -679,10 +679,10 @@ def array_to_metis(adj, adjLocation, nodew=None, nodesz=None):
             adjncy = adj.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
             xadj = adjLocation.ctypes.data_as(ctypes.POINTER(ctypes.c_int32)) 
     elif adj.dtype == 'int64':
-        if idx_t == ctypes.POINTER(ctypes.c_int32):
+        if idx_t == ctypes.c_int32:
             raise TypeError
-        adjncy = adj.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
-        xadj = adjLocation.ctypes.data_as(ctypes.POINTER(ctypes.c_int32)) 
+        adjncy = adj.ctypes.data_as(ctypes.POINTER(ctypes.c_int64))
+        xadj = adjLocation.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)) 
     else:
         raise TypeError
 
@@ -737,50 +737,38 @@ def _METIS_PartGraphRecursive(nvtxs, ncon, xadj, adjncy, vwgt, vsize,
 
 ### End METIS wrappers. ###
 
-def part_mesh(mesh, entity='cell', nparts=2, 
+def part_mesh(mesh, entity='cell', nparts=2,
         tpwgts=None, ubvec=None, recursive=False, **opts):
-    """ Perform graph partitioning using k-way or recursive methods
+    """ Perform graph partitioning of the cells or the nodes of a mesh using
+    k-way or recursive methods.
 
-    Return ....
+    Returns a 2-tuple `(objval, parts)`, where `parts` is an array of the
+    partition indices of the entities, see :func:`part_graph`.
 
-    :param mesh: a mesh 
-    
+    :param mesh: a mesh with the `face2cell` relationship
+    :param entity: 'cell' to partition the dual graph of the cells sharing a
+      face, or 'node' to partition the graph of the nodes connected by edges
     """
+    from ..backend import backend_manager as bm
+    from ..mesh.partition import dual_graph, node_graph
+
     if entity == 'cell':
-        adj, adjLocation = mesh.ds.cell_to_cell(return_array=True)
+        adjLocation, adj = dual_graph(mesh)
     elif entity == 'node':
-        adj, adjLocation = mesh.ds.node_to_node(return_array=True)
+        adjLocation, adj = node_graph(mesh)
+    else:
+        raise ValueError(f"entity should be 'cell' or 'node', but got '{entity}'")
 
+    # NOTE: the arrays are referenced by the METIS graph, so they should be
+    # kept alive until the end of the call.
+    dtype = np.int64 if idx_t == ctypes.c_int64 else np.int32
+    adj = np.ascontiguousarray(bm.to_numpy(adj), dtype=dtype)
+    adjLocation = np.ascontiguousarray(bm.to_numpy(adjLocation), dtype=dtype)
     graph = array_to_metis(adj, adjLocation)
 
-    options = METIS_Options(**opts)
-    print(options)
-    print(options.keys());
-    if tpwgts and not isinstance(tpwgts, ctypes.Array):
-        if isinstance(tpwgts[0], (tuple, list)):
-            tpwgts = reduce(op.add, tpwgts)
-        tpwgts = (real_t*len(tpwgts))(*tpwgts)
-    if ubvec and not isinstance(ubvec, ctypes.Array):
-        ubvec = (real_t*len(ubvect))(*ubvec)
-
-    if tpwgts: assert len(tpwgts) == nparts * graph.ncon
-    if ubvec: assert len(ubvec) == graph.ncon
-
-    nparts_var = idx_t(nparts)
-
-    objval = idx_t()
-    partition = (idx_t*graph.nvtxs.value)()
-
-    args = (byref(graph.nvtxs), byref(graph.ncon), graph.xadj,
-            graph.adjncy, graph.vwgt, graph.vsize, graph.adjwgt,
-            byref(nparts_var), tpwgts, ubvec, options.array,
-            byref(objval), partition)
-    if recursive:
-        _METIS_PartGraphRecursive(*args)
-    else:
-        _METIS_PartGraphKway(*args)
-
-    return objval.value, np.ctypeslib.as_array(partition)
+    objval, partition = part_graph(graph, nparts=nparts, tpwgts=tpwgts,
+                                   ubvec=ubvec, recursive=recursive, **opts)
+    return objval, np.array(partition)
 
 def part_graph(graph, nparts=2,
     tpwgts=None, ubvec=None, recursive=False, **opts):
@@ -873,7 +861,7 @@ def part_graph(graph, nparts=2,
             tpwgts = reduce(op.add, tpwgts)
         tpwgts = (real_t*len(tpwgts))(*tpwgts)
     if ubvec and not isinstance(ubvec, ctypes.Array):
-        ubvec = (real_t*len(ubvect))(*ubvec)
+        ubvec = (real_t*len(ubvec))(*ubvec)
 
     if tpwgts: assert len(tpwgts) == nparts * graph.ncon
     if ubvec: assert len(ubvec) == graph.ncon
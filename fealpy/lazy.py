@@ -0,0 +1,141 @@
+"""
+Lazy loading of the subpackages
+===============================
+
+The packages of FEALPy export many classes from many modules, and some of
+them depend on heavy or optional libraries (scipy, matplotlib, vtk, ...).
+With `attach`, a package only declares where its public names live, and the
+modules are imported on the first access of the names (PEP 562), so that
+`import fealpy.mesh` does not pay for the modules that are never used.
+
+Example:
+    >>> # in fealpy/xxx/__init__.py
+    >>> from typing import TYPE_CHECKING
+    >>> from ..lazy import attach
+    >>> __getattr__, __dir__, __all__ = attach(__name__, {
+    ...     'triangle_mesh': ['TriangleMesh'],
+    ... })
+    >>> if TYPE_CHECKING:
+    ...     from .triangle_mesh import TriangleMesh
+
+Set the environment variable `FEALPY_EAGER_IMPORT=1` to import everything at
+once instead, e.g. to find broken imports early.
+
+The optional dependencies are deferred in the same way by `lazy_import`,
+which returns a proxy importing the module on the first attribute access:
+
+    >>> vtk = lazy_import('vtk', hint="Run `pip install vtk` to write VTU files.")
+"""
+from typing import Dict, Sequence, Callable, List, Tuple, Optional
+import importlib
+import types
+import os
+import sys
+
+
+class _LazyPackage(types.ModuleType):
+    def __setattr__(self, name: str, value):
+        if name in self.__dict__.get('_lazy_shadowed', ()) and \
+                isinstance(value, types.ModuleType) and \
+                value.__name__ == f"{self.__name__}.{name}":
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+def attach(package_name: str, submod_attrs: Optional[Dict[str, Sequence[str]]]=None,
+           submodules: Sequence[str]=()) -> Tuple[Callable, Callable, List[str]]:
+    """Attach lazily loaded attributes to a package.
+
+    Parameters:
+        package_name (str): The name of the package, i.e. `__name__` in its `__init__`.
+        submod_attrs (Dict[str, Sequence[str]], optional): The names exported by\
+            every submodule, keyed by the submodule names relative to the package.
+        submodules (Sequence[str], optional): The submodules, or subpackages,\
+            exported as attributes of the package. The submodules in\
+            `submod_attrs` are accessible as attributes as well, but they are\
+            not listed in `__all__`.
+
+    Returns:
+        Tuple[Callable, Callable, List[str]]: The `__getattr__`, `__dir__` and\
+            `__all__` of the package.
+    """
+    submod_attrs = {} if submod_attrs is None else submod_attrs
+    submodules = set(submodules)
+    attr_to_module = {attr: mod for mod, attrs in submod_attrs.items() for attr in attrs}
+    __all__ = sorted(submodules | attr_to_module.keys())
+
+    def __getattr__(name: str):
+        if name in attr_to_module:
+            module = importlib.import_module(f"{package_name}.{attr_to_module[name]}")
+            value = getattr(module, name)
+            # cache the value, so that __getattr__ is not called again
+            setattr(sys.modules[package_name], name, value)
+            return value
+        if name in submodules or name in submod_attrs:
+            return importlib.import_module(f"{package_name}.{name}")
+        raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__))
+
+    # NOTE: importing a submodule sets it as an attribute of the package,
+    # which would shadow the attribute of the same name, e.g. the function
+    # `minres` of the module `minres`. The package keeps the attribute instead.
+    shadowed = {name for name, mod in attr_to_module.items() if name == mod}
+    if shadowed:
+        package = sys.modules[package_name]
+        package.__class__ = _LazyPackage
+        package.__dict__['_lazy_shadowed'] = frozenset(shadowed)
+
+    if os.environ.get('FEALPY_EAGER_IMPORT', '0') not in ('', '0'):
+        for name in attr_to_module:
+            __getattr__(name)
+
+    return __getattr__, __dir__, list(__all__)
+
+
+class LazyModule(types.ModuleType):
+    """A module imported on the first access of its attributes."""
+    def __init__(self, name: str, hint: Optional[str]=None):
+        super().__init__(name)
+        self.__dict__['_lazy_hint'] = hint
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            try:
+                module = importlib.import_module(self.__name__)
+            except ImportError as e:
+                hint = self.__dict__['_lazy_hint']
+                msg = f"The optional dependency '{self.__name__}' is not available."
+                raise ImportError(msg if hint is None else f"{msg} {hint}") from e
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, item: str):
+        return getattr(self._load(), item)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str, hint: Optional[str]=None) -> types.ModuleType:
+    """Return a module, or a proxy importing it on the first attribute access.
+
+    Parameters:
+        name (str): The absolute name of the module, e.g. 'matplotlib.pyplot'.
+        hint (str | None, optional): The hint appended to the ImportError\
+            raised on the first access if the module is not installed,\
+            e.g. how to install it.
+
+    Returns:
+        ModuleType: The module if it has already been imported, or the proxy.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name, hint)
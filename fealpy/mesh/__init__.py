@@ -1,12 +1,44 @@
+"""The Mesh Module
 
-from .mesh_data_structure import MeshDS
-from .mesh_base import Mesh, HomogeneousMesh, SimplexMesh, TensorMesh, StructuredMesh
+The mesh classes are imported on first access, see `fealpy.lazy`.
+"""
+from typing import TYPE_CHECKING
 
-from .interval_mesh import IntervalMesh
-from .triangle_mesh import TriangleMesh
-from .tetrahedron_mesh import TetrahedronMesh
-from .quadrangle_mesh import QuadrangleMesh
-from .hexahedron_mesh import HexahedronMesh
+from ..lazy import attach
 
-from .uniform_mesh_2d import UniformMesh2d
-from .uniform_mesh_3d import UniformMesh3d
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'mesh_data_structure': ['MeshDS'],
+    'mesh_base': ['Mesh', 'HomogeneousMesh', 'SimplexMesh', 'TensorMesh', 'StructuredMesh'],
+
+    'interval_mesh': ['IntervalMesh'],
+    'triangle_mesh': ['TriangleMesh'],
+    'tetrahedron_mesh': ['TetrahedronMesh'],
+    'quadrangle_mesh': ['QuadrangleMesh'],
+    'hexahedron_mesh': ['HexahedronMesh'],
+
+    'uniform_mesh_2d': ['UniformMesh2d'],
+    'uniform_mesh_3d': ['UniformMesh3d'],
+
+    'partition': ['partition_mesh', 'extract_submesh', 'SubMesh'],
+    'neighbor_search': ['NeighborList', 'cell_list_neighbors'],
+    'particle_transfer': ['particle_stencil', 'particle_to_grid_matrix',
+                          'particle_to_grid', 'grid_to_particle'],
+})
+
+if TYPE_CHECKING:
+    from .mesh_data_structure import MeshDS
+    from .mesh_base import Mesh, HomogeneousMesh, SimplexMesh, TensorMesh, StructuredMesh
+
+    from .interval_mesh import IntervalMesh
+    from .triangle_mesh import TriangleMesh
+    from .tetrahedron_mesh import TetrahedronMesh
+    from .quadrangle_mesh import QuadrangleMesh
+    from .hexahedron_mesh import HexahedronMesh
+
+    from .uniform_mesh_2d import UniformMesh2d
+    from .uniform_mesh_3d import UniformMesh3d
+
+    from .partition import partition_mesh, extract_submesh, SubMesh
+    from .neighbor_search import NeighborList, cell_list_neighbors
+    from .particle_transfer import (particle_stencil, particle_to_grid_matrix,
+                                    particle_to_grid, grid_to_particle)
@@ -3,8 +3,10 @@ from typing import Union, Optional
 from math import sqrt
 from ..backend import backend_manager as bm
 from .mesh_base import TensorMesh
+from .utils import cachedmethod
 from ..typing import TensorLike, Index, _S
 from .plot import Plotable
+from .refine_topology import parent_topology, refine_topology, HEXAHEDRON
 
 
 class HexahedronMesh(TensorMesh, Plotable):
@@ -137,6 +139,7 @@ class HexahedronMesh(TensorMesh, Plotable):
         G = bm.concatenate(data, axis=-1).reshape(shape)
         return G
 
+    @cachedmethod
     def interpolation_points(self, p, index=_S):
         """
         @brief Generate interpolation points for the entire mesh
@@ -157,12 +160,14 @@ class HexahedronMesh(TensorMesh, Plotable):
 
         return ipoint
 
+    @cachedmethod
     def face_to_ipoint(self, p, index=_S):
         """
         @brief 生成每个面上的插值点全局编号
         """
         return self.quad_to_ipoint(p, index) 
 
+    @cachedmethod
     def cell_to_ipoint(self, p, index=_S):
         """!
         @brief Generate global indices for interpolation points in each cell
@@ -233,11 +238,17 @@ class HexahedronMesh(TensorMesh, Plotable):
 
         return cell2ipoint[index]
 
-    def uniform_refine(self, n=1):
+    def uniform_refine(self, n=1, *, incremental: bool=False):
         """
         @brief Uniformly refine the hexahedral mesh n times
+
+        @param incremental: derive the topology of the refined mesh from the
+        parent mesh in O(N) instead of calling `construct()`. The faces and
+        edges are then numbered by the parent entities they lie in, rather
+        than in the lexicographic order, see `refine_topology`.
         """
         for i in range(n):
+            parent = parent_topology(self) if incremental else None
             NN = self.number_of_nodes()
             NE = self.number_of_edges()
             NF = self.number_of_faces()
@@ -338,7 +349,10 @@ class HexahedronMesh(TensorMesh, Plotable):
 
             self.node = node
             self.cell = cell
-            self.construct()
+            if incremental:
+                refine_topology(self, parent, HEXAHEDRON)
+            else:
+                self.construct()
 
 
     @classmethod
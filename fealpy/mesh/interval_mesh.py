@@ -2,11 +2,11 @@ from typing import Union, Optional, Sequence, Tuple, Any
 from ..backend import backend_manager as bm
 from ..typing import TensorLike , Index, _S,_int_func
 from .. import logger
-from scipy.sparse import coo_matrix
 from .mesh_data_structure import MeshDS
 from .utils import estr2dim
 from .plot import Plotable
 from .mesh_base import SimplexMesh
+from .tabulation import tabulation_cache
 
 
 class IntervalMeshDataStructure(MeshDS):
@@ -108,6 +108,7 @@ class IntervalMesh(SimplexMesh,Plotable):
         """
         @brief 生成从 p0 元到 p1 元的延拓矩阵，假定 0 < p0 < p1
         """
+        from scipy.sparse import coo_matrix
         
         assert 0 < p0 < p1
 
@@ -427,8 +428,13 @@ class IntervalMesh(SimplexMesh,Plotable):
                        variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         TD = bcs.shape[-1] - 1
         if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        phi = bm.simplex_shape_function(bcs, p, mi)
+            phi = tabulation_cache.get(
+                'simplex_shape_function', bcs,
+                lambda: bm.simplex_shape_function(bcs, p, bm.multi_index_matrix(p, TD, dtype=self.itype)),
+                p
+            )
+        else:
+            phi = bm.simplex_shape_function(bcs, p, mi)
         if variables == 'u':
             return phi
         elif variables == 'x':
@@ -441,8 +447,13 @@ class IntervalMesh(SimplexMesh,Plotable):
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         TD = bcs.shape[-1] - 1
         if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        R = bm.simplex_grad_shape_function(bcs, p, mi) # (NQ, ldof, bc)
+            R = tabulation_cache.get(
+                'simplex_grad_shape_function', bcs,
+                lambda: bm.simplex_grad_shape_function(bcs, p, bm.multi_index_matrix(p, TD, dtype=self.itype)),
+                p
+            ) # (NQ, ldof, bc)
+        else:
+            R = bm.simplex_grad_shape_function(bcs, p, mi)
         if variables == 'u':
             return R
         elif variables == 'x':
@@ -6,8 +6,10 @@ from ..typing import TensorLike, Index, _S
 from .. import logger
 from ..quadrature import Quadrature
 from .mesh_data_structure import MeshDS
+from .tabulation import tabulation_cache
 from .utils import (
-    estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof
+    estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof, cachedmethod,
+    cell_chunks
 )
 
 
@@ -129,6 +131,7 @@ class Mesh(MeshDS):
         return self.quadrature_formula(q, etype, qtype)
 
     # ipoints
+    @cachedmethod
     def edge_to_ipoint(self, p: int, index: Index=_S) -> TensorLike:
         """Get the relationship between edges and integration points."""
         NN = self.number_of_nodes()
@@ -374,86 +377,143 @@ class HomogeneousMesh(Mesh):
         raise NotImplementedError
 
     # tools
-    def integral(self, f, q=3, celltype=False) -> TensorLike:
-        """
-        @brief 在网格中数值积分一个函数
-        """
-        GD = self.geo_dimension()
-        qf = self.integrator(q, etype='cell')
-        bcs, ws = qf.get_quadrature_points_and_weights()
-        ps = self.bc_to_point(bcs)
-
+    def _cell_values(self, f, bcs, index: Index=_S, nc: Optional[int]=None):
+        """Evaluate `f` on the quadrature points of the cells in `index`."""
         if callable(f):
             if getattr(f, 'coordtype', None) == 'barycentric':
-                f = f(bcs)
+                f = f(bcs) if index is _S else f(bcs, index=index)
             else:
-                f = f(ps)
-
-        cm = self.entity_measure('cell')
+                f = f(self.bc_to_point(bcs, index=index))
+        elif bm.is_tensor(f) and (index is not _S) and f.ndim > 0 \
+                and f.shape[0] == self.number_of_cells():
+            f = f[index]
+        if bm.is_tensor(f) and f.ndim > 1 and f.shape[-1] == nc and f.shape[0] != nc:
+            f = bm.swapaxes(f, 0, -1) # values shaped (NQ, ..., NC)
+        return f
+
+    def _cell_reduce(self, f, op: str, ws: TensorLike, cm, nb: int=0):
+        """Reduce the values `f` shaped (*batch, NC, NQ, ...) over the\
+        quadrature points of every cell, with `nb` batch dimensions."""
+        GD = self.geo_dimension()
+        if bm.is_tensor(cm) and cm.ndim > 0:
+            cm = cm.reshape(cm.shape + (1, ) * 2)
 
-        if isinstance(f, (int, float)): #  u 为标量常函数
-            e = f*cm
-        elif bm.is_tensor(f):
-            if f.shape == (GD, ): # 常向量函数
-                e = cm[:, None]*f
-            elif f.shape == (GD, GD):
-                e = cm[:, None, None]*f
+        if isinstance(f, (int, float)): # f为标量常函数
+            f = f + bm.zeros(cm.shape[:1] + (1, ), dtype=self.ftype, device=self.device)
+        elif not bm.is_tensor(f):
+            raise ValueError(f"Unsupported type of return value: {f.__class__.__name__}.")
+        elif nb == 0 and f.shape in ((GD, ), (GD, GD)): # 常向量或常矩阵函数
+            f = f[None, None, ...]
+        elif f.ndim == nb + 1: # 单元上的常数
+            f = f[..., None]
+
+        shape = f.shape
+        NQ = shape[nb + 1]
+        f = f.reshape(shape[:nb + 2] + (-1, )) # (*batch, NC, NQ, V)
+        if op == 'integral':
+            if NQ == 1:
+                e = f[..., 0, :] * bm.sum(ws)
             else:
-                e = bm.einsum('q, cq..., c -> c...', ws, f, cm)
+                e = bm.einsum('...cqv, q -> ...cv', f, ws)
+            e = e * (cm[..., 0] if bm.is_tensor(cm) and cm.ndim > 0 else cm)
+        elif op == 'max':
+            e = bm.max(f, axis=nb + 1)
+        elif op == 'min':
+            e = bm.min(f, axis=nb + 1)
         else:
-            raise ValueError(f"Unsupported type of return value: {f.__class__.__name__}.")
+            raise ValueError(f"Unknown reduction '{op}', expected 'integral', 'max' or 'min'.")
+        return e.reshape(e.shape[:nb + 1] + shape[nb + 2:])
+
+    def cell_reduce(self, f, op: str='integral', q: int=3, *, chunk_size: int=0) -> TensorLike:
+        """Reduce a function over the quadrature points of every cell.
+
+        The function is evaluated and reduced block by block of cells, so the
+        values on the quadrature points of all the cells are never stored at
+        once when `chunk_size` is positive.
+
+        Parameters:
+            f (Callable | Tensor | float): The function, cartesian or barycentric,\
+                returning values shaped (NC, NQ, ...). The batched functions,\
+                such as a `Function` with a stack of coefficients, return\
+                (*batch, NC, NQ, ...) and have the attribute `batch_ndim`.
+            op (str, optional): 'integral', 'max' or 'min'. Default to 'integral'.
+            q (int, optional): The index of the quadrature formula. Default to 3.
+            chunk_size (int, optional): The number of cells evaluated at a time,\
+                0 for all the cells at once. Default to 0.
+
+        Returns:
+            Tensor: The reduction on every cell, shaped (*batch, NC, ...).
+        """
+        qf = self.quadrature_formula(q, etype='cell')
+        bcs, ws = qf.get_quadrature_points_and_weights()
+        cm = self.entity_measure('cell')
+        NC = self.number_of_cells()
+        nb = getattr(f, 'batch_ndim', 0) if callable(f) else 0
+
+        es = []
+        for index in cell_chunks(NC, chunk_size):
+            cmc = cm[index] if bm.is_tensor(cm) and cm.ndim > 0 else cm
+            nc = NC if index is _S else index.stop - index.start
+            es.append(self._cell_reduce(self._cell_values(f, bcs, index, nc), op, ws, cmc, nb))
+        return es[0] if len(es) == 1 else bm.concat(es, axis=nb)
+
+    def integral(self, f, q=3, celltype=False, *, chunk_size: int=0) -> TensorLike:
+        """
+        @brief 在网格中数值积分一个函数
 
+        @param chunk_size: the number of cells integrated at a time, 0 for all
+        the cells at once. See `cell_reduce`.
+        """
+        e = self.cell_reduce(f, 'integral', q, chunk_size=chunk_size)
         if celltype:
             return e
-        else:
+        nb = getattr(f, 'batch_ndim', 0) if callable(f) else 0
+        if nb == 0:
             return bm.sum(e)
+        return bm.sum(e.reshape(e.shape[:nb] + (-1, )), axis=-1)
 
-    def error(self, u, v, q=3, power=2, celltype=False) -> TensorLike:
+    def error(self, u, v, q=3, power=2, celltype=False, *, chunk_size: int=0) -> TensorLike:
         """
         @brief Calculate the error between two functions.
-        """
-        GD = self.geo_dimension()
 
+        @param power: the power of the Lp norm, or `bm.inf` for the maximum norm
+        on the quadrature points.
+        @param chunk_size: the number of cells evaluated at a time, 0 for all
+        the cells at once. The values on the quadrature points of all the cells
+        are never stored at once when it is positive.
+        @return: the error, or the error on every cell shaped (NC, ) if
+        `celltype` is True. For batched functions, the leading dimensions of
+        the batch are kept.
+        """
         qf = self.quadrature_formula(q, etype='cell')
         bcs, ws = qf.get_quadrature_points_and_weights()
-        ps = self.bc_to_point(bcs)
-
-        if callable(u):
-            if getattr(u, 'coordtype', None) == 'barycentric':
-                u = u(bcs)
-            else:
-                u = u(ps)
-
-        if callable(v):
-            if getattr(v, 'coordtype', None) == 'barycentric':
-                v = v(bcs)
-            else:
-                v = v(ps)
         cm = self.entity_measure('cell')
         NC = self.number_of_cells()
-        if v.shape[-1] == NC:
-            v = bm.swapaxes(v, 0, -1)
-        #f = bm.power(bm.abs(u - v), power)
-        f = bm.abs(u - v)**power
-        if len(f.shape) == 1:
-            f = f[:, None]
-
-        if isinstance(f, (int, float)): # f为标量常函数
-            e = f*cm
-        elif bm.is_tensor(f):
-            if f.shape == (GD, ): # 常向量函数
-                e = cm[:, None]*f
-            elif f.shape == (GD, GD):
-                e = cm[:, None, None]*f
-            else:
-                e = bm.einsum('q, cq..., c -> c...', ws, f, cm)
-
+        nb = max(getattr(u, 'batch_ndim', 0) if callable(u) else 0,
+                 getattr(v, 'batch_ndim', 0) if callable(v) else 0)
+        op = 'max' if power == bm.inf else 'integral'
+
+        es = []
+        for index in cell_chunks(NC, chunk_size):
+            cmc = cm[index] if bm.is_tensor(cm) and cm.ndim > 0 else cm
+            nc = NC if index is _S else index.stop - index.start
+            f = bm.abs(self._cell_values(u, bcs, index, nc) - self._cell_values(v, bcs, index, nc))
+            if op == 'integral':
+                f = f**power
+            es.append(self._cell_reduce(f, op, ws, cmc, nb))
+        e = es[0] if len(es) == 1 else bm.concat(es, axis=nb)
+
+        if op == 'max':
+            if celltype is False:
+                return bm.max(e.reshape(e.shape[:nb] + (-1, )), axis=-1)
+            return bm.max(e.reshape(e.shape[:nb + 1] + (-1, )), axis=-1)
         if celltype is False:
-            #e = bm.power(bm.sum(e), 1/power)
-            e = bm.sum(e)**(1/power)
-        else:
-            e = bm.power(bm.sum(e, axis=tuple(range(1, len(e.shape)))), 1/power)
-        return e # float or (NC, )
+            if nb == 0:
+                return bm.sum(e)**(1/power)
+            return bm.sum(e.reshape(e.shape[:nb] + (-1, )), axis=-1)**(1/power)
+        if e.ndim > nb + 1:
+            e = bm.sum(e.reshape(e.shape[:nb + 1] + (-1, )), axis=-1)
+        return bm.power(e, 1/power) # float or (NC, )
 
 
 class SimplexMesh(HomogeneousMesh):
@@ -474,17 +534,25 @@ class SimplexMesh(HomogeneousMesh):
     def shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                        mi: Optional[TensorLike]=None) -> TensorLike:
         TD = bcs.shape[-1] - 1
-        if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        phi = bm.simplex_shape_function(bcs, p, mi)
-        return phi
+        if mi is not None:
+            return bm.simplex_shape_function(bcs, p, mi)
+        return tabulation_cache.get(
+            'simplex_shape_function', bcs,
+            lambda: bm.simplex_shape_function(bcs, p, bm.multi_index_matrix(p, TD, dtype=self.itype)),
+            p
+        )
 
     def grad_shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         TD = bcs.shape[-1] - 1
-        if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        R = bm.simplex_grad_shape_function(bcs, p, mi) # (NQ, ldof, bc)
+        if mi is not None:
+            R = bm.simplex_grad_shape_function(bcs, p, mi)
+        else:
+            R = tabulation_cache.get(
+                'simplex_grad_shape_function', bcs,
+                lambda: bm.simplex_grad_shape_function(bcs, p, bm.multi_index_matrix(p, TD, dtype=self.itype)),
+                p
+            ) # (NQ, ldof, bc)
         if variables == 'u':
             return R
         elif variables == 'x':
@@ -495,7 +563,36 @@ class SimplexMesh(HomogeneousMesh):
         else:
             raise ValueError("Variables type is expected to be 'u' or 'x', "
                              f"but got '{variables}'.")
-    
+
+    # point location
+    def cell_locator(self):
+        """Return the spatial index of cells, see `CellLocator`. It is built on
+        the first call, and refreshed when the mesh has changed."""
+        from .spatial_index import CellLocator
+        locator = getattr(self, '_cell_locator', None)
+        if locator is None:
+            locator = CellLocator(self)
+            self._cell_locator = locator
+        return locator.refresh()
+
+    def location(self, points: TensorLike, *, tol: float=1e-12) -> TensorLike:
+        """Find the cells containing the points, shaped (NP, GD).
+
+        Returns:
+            Tensor: The cell index of every point, -1 if it is not in the mesh.
+        """
+        return self.cell_locator().locate(points, tol=tol)[0]
+
+    def point_to_bc(self, points: TensorLike, *, tol: float=1e-12) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points, shaped (NP, GD), and the
+        barycentric coordinates of the points in them.
+
+        Returns:
+            Tuple[Tensor, Tensor]: The cell index shaped (NP, ), -1 if the point\
+                is not in the mesh; and the barycentric coordinates shaped (NP, TD+1).
+        """
+        return self.cell_locator().locate(points, tol=tol)
+
 
 class TensorMesh(HomogeneousMesh):
     # ipoints
@@ -553,8 +650,14 @@ class TensorMesh(HomogeneousMesh):
         TD = len(bcs)
         if mi is None:
             mi = bm.multi_index_matrix(p, 1, dtype=self.itype)
-        raw_phi = [bm.simplex_shape_function(bc, p, mi) for bc in bcs]
-        phi = bm.tensorprod(*raw_phi)
+            phi = tabulation_cache.get(
+                'tensor_shape_function', bcs,
+                lambda: bm.tensorprod(*[bm.simplex_shape_function(bc, p, mi) for bc in bcs]),
+                p
+            )
+        else:
+            raw_phi = [bm.simplex_shape_function(bc, p, mi) for bc in bcs]
+            phi = bm.tensorprod(*raw_phi)
         if variables == 'u':
             return phi
         elif variables == 'x':
@@ -567,6 +670,30 @@ class TensorMesh(HomogeneousMesh):
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
         assert isinstance(bcs, tuple)
         TD = len(bcs)
+        gphi = tabulation_cache.get(
+            'tensor_grad_shape_function', bcs,
+            lambda: self._tensor_grad_shape_function(bcs, p), p
+        )
+
+        if variables == 'x':
+            if TD == 3:
+                J = self.jacobi_matrix(bcs, index=index)
+                J = bm.linalg.inv(J)
+                # J^{-T}\nabla_u phi
+                gphi = bm.einsum('qcmn, qlm -> cqln', J, gphi)
+                # gphi = bm.concatenate((gphi0, gphi1), axis=-1)
+            elif TD == 2:
+                J = self.jacobi_matrix(bcs, index=index)
+                G = self.first_fundamental_form(J)
+                G = bm.linalg.inv(G)
+                # gphi = bm.einsum('qikm, qimn, qln -> qilk', J, G, gphi)
+                gphi = bm.einsum('qikm, qimn, qln -> iqlk', J, G, gphi)
+
+        return gphi
+
+    def _tensor_grad_shape_function(self, bcs: Tuple[TensorLike], p: int) -> TensorLike:
+        """Gradient of the shape functions on the reference cell, in shape (NQ, ldof, TD)."""
+        TD = len(bcs)
         Dlambda = bm.array([-1, 1], dtype=self.ftype, device=bm.get_device(bcs[0]))
         phi = bm.simplex_shape_function(bcs[0], p=p)
         R = bm.simplex_grad_shape_function(bcs[0], p=p)
@@ -585,27 +712,11 @@ class TensorMesh(HomogeneousMesh):
             gphi2 = bm.einsum('im, jn, ko->ijkmno', phi, phi,
                                      dphi).reshape(-1, ldof, 1)
             gphi = bm.concatenate((gphi0, gphi1, gphi2), axis=-1)
-            if variables == 'x':
-                J = self.jacobi_matrix(bcs, index=index)
-                J = bm.linalg.inv(J)
-                # J^{-T}\nabla_u phi
-                gphi = bm.einsum('qcmn, qlm -> cqln', J, gphi)
-                # gphi = bm.concatenate((gphi0, gphi1), axis=-1)
-
-                return gphi
         elif TD == 2:
             gphi0 = bm.einsum('im, jn -> ijmn', dphi, phi).reshape(-1, ldof, 1)
             gphi1 = bm.einsum('im, jn -> ijmn', phi, dphi).reshape(-1, ldof, 1)
             gphi = bm.concatenate((gphi0, gphi1), axis=-1)
-            if variables == 'x':
-                J = self.jacobi_matrix(bcs, index=index)
-                G = self.first_fundamental_form(J)
-                G = bm.linalg.inv(G)
-                # gphi = bm.einsum('qikm, qimn, qln -> qilk', J, G, gphi)
-                gphi = bm.einsum('qikm, qimn, qln -> iqlk', J, G, gphi)
 
-                return gphi
-            
         return gphi
 
     def quad_to_ipoint(self, p, index=None):
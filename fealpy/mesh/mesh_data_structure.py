@@ -26,6 +26,9 @@ class MeshDS(metaclass=MeshMeta):
 
     def __init__(self, *, TD: int, itype, ftype) -> None:
         assert hasattr(self, '_entity_dim_method_name_map')
+        self._version = 0
+        self._cache: Dict[Any, Any] = {}
+        self._cache_stats = {'hits': 0, 'misses': 0}
         self._entity_storage: Dict[int, TensorLike] = {}
         self._entity_factory: Dict[int, Callable] = {
             k: getattr(self, self._entity_dim_method_name_map[k])
@@ -50,18 +53,53 @@ class MeshDS(metaclass=MeshMeta):
                 raise RuntimeError('please call super().__init__() before setting attributes.')
             etype_dim = estr2dim(self, name)
             self._entity_storage[etype_dim] = value
+            self.bump_version()
         else:
             super().__setattr__(name, value)
 
     def __delattr__(self, name: str) -> None:
         if name in self._STORAGE_ATTR:
             del self._entity_storage[estr2dim(self, name)]
+            self.bump_version()
         else:
             super().__delattr__(name)
 
     def clear(self) -> None:
         """Remove all entities from the storage."""
         self._entity_storage.clear()
+        self.bump_version()
+
+    ### cache of derived data
+    # NOTE: Maps derived from the entities, such as cell_to_ipoint, are cached
+    # by the version of the mesh. Setting or deleting an entity, e.g. in
+    # construct(), uniform_refine() or moving the nodes by `mesh.node = ...`,
+    # increases the version and evicts the cache. Modifying an entity in place
+    # is not detected, call `bump_version()` after it.
+    @property
+    def version(self) -> int:
+        """The version of the mesh, increased whenever the entities change."""
+        return self._version
+
+    def bump_version(self) -> None:
+        """Increase the version of the mesh and clear the cache of derived data."""
+        self._version += 1
+        self._cache.clear()
+
+    def cached(self, key: Any, func: Callable[[], Any]) -> Any:
+        """Return the cached value of the key, or compute it by `func()` and
+        cache it. The cache is cleared when the mesh version changes."""
+        if key in self._cache:
+            self._cache_stats['hits'] += 1
+            return self._cache[key]
+        self._cache_stats['misses'] += 1
+        value = func()
+        self._cache[key] = value
+        return value
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the numbers of hits and misses of the cache since the mesh
+        was created, the number of cached items and the mesh version."""
+        return {**self._cache_stats, 'size': len(self._cache), 'version': self._version}
 
     ### properties
     def top_dimension(self) -> int: return self.TD
@@ -287,6 +325,7 @@ class MeshDS(metaclass=MeshMeta):
             self.edge2cell = self.face2cell
             self.cell2edge = self.cell2face
 
+        self.bump_version()
         NN = self.number_of_nodes()
         NF = i0.shape[0]
         logger.info(f"Mesh toplogy relation constructed, with {NC} cells, {NF} "
@@ -0,0 +1,259 @@
+
+from typing import Optional, Tuple, Union, Sequence
+from itertools import product
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+def _csr(src: TensorLike, dst: TensorLike, N: int) -> Tuple[TensorLike, TensorLike]:
+    """Return the pairs grouped by the source, in CSR layout (index, indptr)."""
+    kwargs = bm.context(src)
+    count = bm.zeros((N, ), **kwargs)
+    count = bm.index_add(count, src, bm.ones(src.shape, **kwargs))
+    indptr = bm.concat([bm.zeros((1, ), **kwargs), bm.cumsum(count, axis=0)])
+    return dst, indptr
+
+
+class NeighborList():
+    """Cell-list (Verlet list) search of the neighbor particles within a cutoff.
+
+    The particles are sorted into cells of a width no less than `cutoff + skin`,
+    so the candidate neighbors of a particle are those in the adjacent cells,
+    and the search costs O(N) for a bounded number of particles per cell. The
+    candidate pairs within `cutoff + skin` are kept, and reused by `update`
+    until some particle has moved more than half of the skin since the last
+    build, so the list is only filtered by the distances in most steps.
+
+    In a periodic box, the distances are those of the minimum images, so the
+    cutoff should be less than half of the box size. Otherwise, the cells
+    cover the bounding box of the particles.
+
+    Example:
+        >>> nlist = NeighborList(h, box_size, skin=0.1*h)
+        >>> for step in range(nsteps):
+        ...     index, indptr = nlist.update(position)
+        ...     ...
+    """
+    def __init__(self, cutoff: float,
+                 box_size: Union[float, Sequence[float], TensorLike, None]=None, *,
+                 skin: float=0.0,
+                 periodic: bool=True,
+                 include_self: bool=True,
+                 chunk_size: int=0):
+        """
+        Parameters:
+            cutoff (float): The cutoff radius, pairs closer than it are neighbors.
+            box_size (float | Sequence[float] | Tensor | None, optional): The size\
+                of the periodic box [0, box_size), for every dimension or for all.\
+                Default to None, the non-periodic search.
+            skin (float, optional): The extra radius of the candidate pairs kept\
+                between rebuilds. Default to 0.
+            periodic (bool, optional): Whether the box is periodic, ignored\
+                if the box size is not given. Default to True.
+            include_self (bool, optional): Whether a particle is a neighbor of\
+                itself. Default to True.
+            chunk_size (int, optional): The number of particles whose candidates\
+                are examined at once, to bound the memory. Default to 0, all of them.
+        """
+        if cutoff <= 0 or skin < 0:
+            raise ValueError(f"cutoff should be positive and skin non-negative, "
+                             f"but got cutoff={cutoff} and skin={skin}.")
+        self.cutoff = float(cutoff)
+        self.skin = float(skin)
+        self.box_size = box_size
+        self.periodic = periodic and box_size is not None
+        self.include_self = include_self
+        self.chunk_size = chunk_size
+
+        self.reference: Optional[TensorLike] = None
+        self.src: Optional[TensorLike] = None
+        self.dst: Optional[TensorLike] = None
+        self.number_of_builds = 0
+
+    def _box(self, points: TensorLike) -> Optional[TensorLike]:
+        if not self.periodic:
+            return None
+        GD = points.shape[-1]
+        box = bm.tensor(self.box_size, dtype=points.dtype, device=bm.get_device(points))
+        return bm.broadcast_to(box, (GD, ))
+
+    def displacement(self, p: TensorLike, q: TensorLike) -> TensorLike:
+        """Return the displacements `p - q`, of the minimum images in a periodic box."""
+        d = p - q
+        box = self._box(p)
+        if box is not None:
+            d = d - box * bm.round(d / box)
+        return d
+
+    def needs_rebuild(self, points: TensorLike) -> bool:
+        """Whether some particle has moved more than half of the skin since the\
+        last build, or the number of particles has changed."""
+        if self.reference is None or self.reference.shape != points.shape:
+            return True
+        d = self.displacement(points, self.reference)
+        return bool(bm.max(bm.sum(d**2, axis=-1)) > (0.5 * self.skin)**2)
+
+    def build(self, points: TensorLike) -> 'NeighborList':
+        """Build the candidate pairs within `cutoff + skin` by the cell list.
+
+        Parameters:
+            points (Tensor): The positions of the particles, shaped (N, GD).
+
+        Returns:
+            NeighborList: self.
+        """
+        N, GD = points.shape
+        device = bm.get_device(points)
+        ikwargs = {'dtype': bm.int64, 'device': device}
+        radius = self.cutoff + self.skin
+        box = self._box(points)
+
+        if box is not None:
+            origin = bm.zeros((GD, ), dtype=points.dtype, device=device)
+            points = points - box * bm.floor(points / box)
+            length = box
+        else:
+            origin = bm.min(points, axis=0)
+            length = bm.max(points, axis=0) - origin
+        ncell_list = [max(int(l // radius), 1) for l in bm.to_numpy(length)]
+        ncell = bm.tensor(ncell_list, **ikwargs)
+        width = bm.where(length > 0, length / ncell, radius)
+        strides = [1] * GD
+        for d in range(GD - 2, -1, -1):
+            strides[d] = strides[d + 1] * ncell_list[d + 1]
+        NCell = strides[0] * ncell_list[0]
+        strides = bm.tensor(strides, **ikwargs)
+
+        # sort the particles by the cells, so the particles of a cell are
+        # contiguous and the search below reads the nearby memory
+        cidx = bm.astype(bm.floor((points - origin) / width), bm.int64)
+        cidx = bm.minimum(cidx, ncell - 1)
+        cid = bm.sum(cidx * strides, axis=-1)
+        order = bm.argsort(cid, stable=True)
+        cidx, points = cidx[order], points[order]
+        count = bm.zeros((NCell, ), **ikwargs)
+        count = bm.index_add(count, cid, bm.ones((N, ), **ikwargs))
+        start = bm.cumsum(count, axis=0) - count
+
+        # the adjacent cells, without the repeated ones of the small periodic grids
+        offsets = []
+        for n in ncell_list:
+            if box is None or n >= 3:
+                offsets.append((-1, 0, 1))
+            else:
+                offsets.append(tuple(range(n)))
+        stencil = bm.tensor(list(product(*offsets)), **ikwargs)
+        K = stencil.shape[0]
+
+        # the images across the periodic boundary are found by the shifts of
+        # the adjacent cells, if the grid is not too coarse for that
+        shifted = box is not None and min(ncell_list) >= 3
+
+        coords = [bm.copy(points[:, k]) for k in range(GD)]
+        chunk = N if self.chunk_size <= 0 else self.chunk_size
+        src, dst = [], []
+        for s in range(0, N, chunk):
+            index = bm.arange(s, min(s + chunk, N), **ikwargs)
+            nidx = cidx[index, None, :] + stencil # (NI, K, GD)
+            if box is not None:
+                wrapped = nidx % ncell
+                shift = box * bm.astype((nidx - wrapped) // ncell, points.dtype)
+                ncid = bm.sum(wrapped * strides, axis=-1).reshape(-1)
+                ncount = count[ncid]
+            else:
+                valid = bm.all((nidx >= 0) & (nidx < ncell), axis=-1).reshape(-1)
+                ncid = bm.sum(nidx * strides, axis=-1).reshape(-1)
+                ncid = bm.where(valid, ncid, 0)
+                ncount = bm.where(valid, count[ncid], 0)
+
+            # the particles in the adjacent cells of every particle
+            total = int(bm.sum(ncount))
+            first = bm.cumsum(ncount, axis=0) - ncount
+            pos = bm.arange(total, **ikwargs) - bm.repeat(first, ncount, axis=0)
+            i = bm.repeat(bm.repeat(index, K, axis=0), ncount, axis=0)
+            j = bm.repeat(start[ncid], ncount, axis=0) + pos
+            if shifted:
+                shift = bm.repeat(shift.reshape(-1, GD), ncount, axis=0)
+
+            # NOTE: the shift is subtracted after the difference, so that the
+            # distances, and the lists, are symmetric in floating point
+            dist2 = 0.
+            for k in range(GD):
+                d = coords[k][i] - coords[k][j]
+                if shifted:
+                    d = d - shift[:, k]
+                elif box is not None:
+                    d = d - box[k] * bm.round(d / box[k])
+                dist2 = dist2 + d * d
+            flag = dist2 < radius**2
+            if not self.include_self:
+                flag = flag & (i != j)
+            src.append(i[flag])
+            dst.append(j[flag])
+
+        src = bm.concat(src) if len(src) > 0 else bm.zeros((0, ), **ikwargs)
+        dst = bm.concat(dst) if len(dst) > 0 else bm.zeros((0, ), **ikwargs)
+
+        # back to the original numbering, keeping the pairs grouped by the rows
+        _, sindptr = _csr(src, dst, N)
+        rank = bm.zeros((N, ), **ikwargs)
+        rank = bm.set_at(rank, order, bm.arange(N, **ikwargs))
+        rcount = (sindptr[1:] - sindptr[:-1])[rank]
+        first = bm.cumsum(rcount, axis=0) - rcount
+        M = src.shape[0]
+        pos = bm.arange(M, **ikwargs) - bm.repeat(first, rcount, axis=0)
+        self.src = bm.repeat(bm.arange(N, **ikwargs), rcount, axis=0)
+        self.dst = order[dst[bm.repeat(sindptr[:-1][rank], rcount, axis=0) + pos]]
+        self.reference = bm.copy(points[rank])
+        self.number_of_builds += 1
+        return self
+
+    def update(self, points: TensorLike) -> Tuple[TensorLike, TensorLike]:
+        """Return the neighbors of the particles at the new positions, rebuilding\
+        the candidate pairs only if needed.
+
+        Parameters:
+            points (Tensor): The positions of the particles, shaped (N, GD).
+
+        Returns:
+            Tuple[Tensor, Tensor]: The neighbors in CSR layout (index, indptr),\
+                i.e. the neighbors of the particle `i` are `index[indptr[i]:indptr[i+1]]`,\
+                ordered by the cells.
+        """
+        if self.needs_rebuild(points):
+            self.build(points)
+        src, dst = self.src, self.dst
+        if self.skin > 0:
+            d = self.displacement(points[src], points[dst])
+            flag = bm.sum(d**2, axis=-1) < self.cutoff**2
+            src, dst = src[flag], dst[flag]
+        return _csr(src, dst, points.shape[0])
+
+
+def cell_list_neighbors(points: TensorLike, cutoff: float,
+                        box_size: Union[float, Sequence[float], TensorLike, None]=None, *,
+                        periodic: bool=True, include_self: bool=True,
+                        chunk_size: int=0) -> Tuple[TensorLike, TensorLike]:
+    """Find the neighbor particles within a cutoff by the cell list.
+
+    Parameters:
+        points (Tensor): The positions of the particles, shaped (N, GD).
+        cutoff (float): The cutoff radius.
+        box_size (float | Sequence[float] | Tensor | None, optional): The size of\
+            the periodic box. Default to None, the non-periodic search.
+        periodic (bool, optional): Whether the box is periodic. Default to True.
+        include_self (bool, optional): Whether a particle is a neighbor of itself.\
+            Default to True.
+        chunk_size (int, optional): The number of particles examined at once.\
+            Default to 0, all of them.
+
+    Returns:
+        Tuple[Tensor, Tensor]: The neighbors in CSR layout (index, indptr).
+
+    See Also:
+        NeighborList: for the reuse of the list across time steps.
+    """
+    nlist = NeighborList(cutoff, box_size, periodic=periodic,
+                         include_self=include_self, chunk_size=chunk_size)
+    return nlist.update(points)
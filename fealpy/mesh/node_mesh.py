@@ -5,19 +5,25 @@ from ..typing import TensorLike, Index, _S
 from .. import logger
 
 from .mesh_base import MeshDS 
+from .neighbor_search import NeighborList
+
+
+def _grid(*axes: TensorLike) -> TensorLike:
+    '''
+    @brief The points of the tensor grid of the coordinates, ordered as those
+           of `numpy.mgrid[...].reshape(GD, -1).T`.
+    '''
+    grid = bm.meshgrid(*axes, indexing='ij')
+    return bm.stack([g.reshape(-1) for g in grid], axis=1)
+
+
+def _arange(start, stop, step) -> TensorLike:
+    return bm.arange(start, stop, step, dtype=bm.float64)
 
-import jax.numpy as jnp
-import jax
-from jax_md import space, partition
-from jax import vmap, lax
 
 class NodeMesh(MeshDS):
     def __init__(self, node: TensorLike, nodedata:Optional[Dict]=None) -> None: 
-        super().__init__(TD=0)
-        '''
-        note : Currently using jax's own jax_md, vmap, lax, vstack , ravel,
-               full, where, mgrid, column_stack, full_like, hstack.
-        '''
+        super().__init__(TD=0, itype=bm.int64, ftype=node.dtype)
         self.node = node
 
         if nodedata is None:
@@ -47,49 +53,51 @@ class NodeMesh(MeshDS):
         axes.set_aspect('equal')
         return axes.scatter(self.node[..., 0], self.node[..., 1], c=color, s=markersize)
 
-    def neighbors(self, box_size, h) -> TensorLike: 
+    def neighbors(self, box_size, h, periodic: bool=True) -> Tuple[TensorLike, TensorLike]: 
         '''
-        @brief Find neighbor particles within the smoothing radius.
-
-        note : Currently using jax's own jax_md, vmap, lax
+        @brief Find neighbor particles within the smoothing radius, including
+               the particles themselves, by the cell list.
+
+        @param box_size: the size of the box [0, box_size), for every dimension
+               or for all.
+        @param h: the smoothing radius.
+        @param periodic: whether the box is periodic, otherwise the cells cover
+               the bounding box of the particles.
+        @return: the neighbors in CSR layout (index, indptr), i.e. the neighbors
+                 of the particle `i` are `index[indptr[i]:indptr[i+1]]`.
+
+        note : Use `neighbor_list` to reuse the list across time steps.
         '''
-        displacement, shift = space.periodic(box_size)
-        neighbor_fn = partition.neighbor_list(displacement, box_size, h)
+        return self.neighbor_list(box_size, h, periodic=periodic).update(self.node)
 
-        nbrs = neighbor_fn.allocate(self.node)
-        nbrs = neighbor_fn.update(self.node, nbrs)
-        neighbor = nbrs.idx
-        num = self.node.shape[0]
-        index = vmap(lambda idx, row: jnp.hstack([row, jnp.array([idx])]))(bm.arange(neighbor.shape[0]), neighbor)
-        row_len = bm.sum(index != num,axis=1)
-        indptr = lax.scan(lambda carry, x: (carry + x, carry + x), 0, row_len)[1]
-        indptr = bm.concatenate((bm.tensor([0]), indptr))
-        index = index[index != num]
+    def neighbor_list(self, box_size, h, skin: float=0.0, periodic: bool=True,
+                      chunk_size: int=0) -> NeighborList:
+        '''
+        @brief The Verlet list of the particles within the smoothing radius,
+               which is only rebuilt when some particle has moved more than
+               half of the skin, see `fealpy.mesh.neighbor_search.NeighborList`.
 
-        return index, indptr
+        @param skin: the extra radius of the list.
+        @param chunk_size: the number of particles searched at once.
+        '''
+        return NeighborList(h, box_size if periodic else None, skin=skin,
+                            chunk_size=chunk_size)
 
     @classmethod
     def from_tgv_domain(cls, box_size, dx=0.02, dy=0.02):
         rho0 = 1.0 #参考密度
         eta0 = 0.01 #参考动态粘度
-        n = bm.tensor((box_size / dx).round(), dtype=int)
-        grid = bm.meshgrid(bm.arange(n[0]), bm.arange(n[1]), indexing="xy")
+        n = [int(round(float(l) / dx)) for l in box_size]
+        grid = bm.meshgrid(bm.arange(n[0], dtype=bm.float64), bm.arange(n[1], dtype=bm.float64), indexing="xy")
         
-        r = bm.tensor((jnp.vstack(list(map(jnp.ravel, grid))).T + 0.5) * dx)
+        r = (bm.stack([g.reshape(-1) for g in grid], axis=1) + 0.5) * dx
         NN = r.shape[0]
-        tag = jnp.full(NN, 0, dtype=int)
-        mv = bm.zeros((NN, 2), dtype=bm.float64)
-        tv = bm.zeros((NN, 2), dtype=bm.float64)
+        tag = bm.zeros((NN, ), dtype=bm.int64)
         x = r[:, 0]
         y = r[:, 1]
         u0 = -bm.cos(2.0 * bm.pi * x) * bm.sin(2.0 * bm.pi * y)
         v0 = bm.sin(2.0 * bm.pi * x) * bm.cos(2.0 * bm.pi * y)
-        if hasattr(mv, 'at'):  
-            mv = mv.at[:, 0].set(u0)
-            mv = mv.at[:, 1].set(v0)
-        else:  
-            mv[:, 0] = u0
-            mv[:, 1] = v0
+        mv = bm.stack([u0, v0], axis=1)
         tv = mv
         volume = bm.ones(NN, dtype=bm.float64) * dx * dy
         rho = bm.ones(NN, dtype=bm.float64) * rho0
@@ -123,17 +131,17 @@ class NodeMesh(MeshDS):
 
         #wall particles
         dxn1 = dx * n_walls
-        n1 = bm.tensor((bm.tensor([L, dxn1]) / dx).round(), dtype=int)
-        grid1 = bm.meshgrid(bm.arange(n1[0]), bm.arange(n1[1]), indexing="xy")
-        r1 = (jnp.vstack(list(map(jnp.ravel, grid1))).T + 0.5) * dx
-        wall_b = r1.copy()
-        wall_t = r1.copy() + bm.tensor([0.0, H + dxn1])
+        n1 = [int(round(L / dx)), int(round(dxn1 / dx))]
+        grid1 = bm.meshgrid(bm.arange(n1[0], dtype=bm.float64), bm.arange(n1[1], dtype=bm.float64), indexing="xy")
+        r1 = (bm.stack([g.reshape(-1) for g in grid1], axis=1) + 0.5) * dx
+        wall_b = bm.copy(r1)
+        wall_t = bm.copy(r1) + bm.tensor([0.0, H + dxn1])
         r_w = bm.concatenate([wall_b, wall_t])
 
         #fuild particles
-        n2 = bm.tensor((bm.tensor([L, H]) / dx).round(), dtype=int)
-        grid2 = bm.meshgrid(bm.arange(n2[0]), bm.arange(n2[1]), indexing="xy")
-        r2 = (jnp.vstack(list(map(jnp.ravel, grid2))).T + 0.5) * dx
+        n2 = [int(round(L / dx)), int(round(H / dx))]
+        grid2 = bm.meshgrid(bm.arange(n2[0], dtype=bm.float64), bm.arange(n2[1], dtype=bm.float64), indexing="xy")
+        r2 = (bm.stack([g.reshape(-1) for g in grid2], axis=1) + 0.5) * dx
         r_f = bm.tensor([0.0, 1.0]) * n_walls * dx + r2
 
         #tag
@@ -143,25 +151,25 @@ class NodeMesh(MeshDS):
         2 moving wall
         3 dirchilet wall
         '''
-        tag_f = jnp.full(len(r_f), 0, dtype=int)
-        tag_w = jnp.full(len(r_w), 1, dtype=int)
-        r = bm.tensor(bm.concatenate([r_w, r_f]))
+        tag_f = bm.full((r_f.shape[0], ), 0, dtype=bm.int64)
+        tag_w = bm.full((r_w.shape[0], ), 1, dtype=bm.int64)
+        r = bm.concatenate([r_w, r_f])
         tag = bm.concatenate([tag_w, tag_f])
 
         dx2n = dx * n_walls * 2
         _box_size = bm.tensor([L, H + dx2n])
         mask_hot_wall = ((r[:, 1] < dx * n_walls) * (r[:, 0] < (_box_size[0] / 2) + \
                 hot_wall_half_width) * (r[:, 0] > (_box_size[0] / 2) - hot_wall_half_width))
-        tag = jnp.where(mask_hot_wall, 3, tag)
+        tag = bm.where(mask_hot_wall, 3, tag)
         
         NN_sum = r.shape[0]
         mv = bm.zeros_like(r)
-        rho = bm.ones(NN_sum) * rho0
-        mass = bm.ones(NN_sum) * dx * dy * rho0
-        eta = bm.ones(NN_sum) * eta0
-        temperature = bm.ones(NN_sum) * T0
-        kappa = bm.ones(NN_sum) * kappa0
-        Cp = bm.ones(NN_sum) * Cp0
+        rho = bm.ones(NN_sum, dtype=bm.float64) * rho0
+        mass = bm.ones(NN_sum, dtype=bm.float64) * dx * dy * rho0
+        eta = bm.ones(NN_sum, dtype=bm.float64) * eta0
+        temperature = bm.ones(NN_sum, dtype=bm.float64) * T0
+        kappa = bm.ones(NN_sum, dtype=bm.float64) * kappa0
+        Cp = bm.ones(NN_sum, dtype=bm.float64) * Cp0
 
         nodedata = {
             "position": r,
@@ -196,17 +204,17 @@ class NodeMesh(MeshDS):
 
         #wall particles
         dxn1 = dx * n_walls
-        n1 = bm.tensor((bm.tensor([L, dxn1]) / dx).round(), dtype=int)
-        grid1 = bm.meshgrid(bm.arange(n1[0]), bm.arange(n1[1]), indexing="xy")
-        r1 = (jnp.vstack(list(map(jnp.ravel, grid1))).T + 0.5) * dx
-        wall_b = r1.copy()
-        wall_t = r1.copy() + bm.tensor([0.0, H + dxn1])
+        n1 = [int(round(L / dx)), int(round(dxn1 / dx))]
+        grid1 = bm.meshgrid(bm.arange(n1[0], dtype=bm.float64), bm.arange(n1[1], dtype=bm.float64), indexing="xy")
+        r1 = (bm.stack([g.reshape(-1) for g in grid1], axis=1) + 0.5) * dx
+        wall_b = bm.copy(r1)
+        wall_t = bm.copy(r1) + bm.tensor([0.0, H + dxn1])
         r_w = bm.concatenate([wall_b, wall_t])
 
         #fuild particles
-        n2 = bm.array((bm.array([L, H]) / dx).round(), dtype=int)
-        grid2 = bm.meshgrid(bm.arange(n2[0]), bm.arange(n2[1]), indexing="xy")
-        r2 = (jnp.vstack(list(map(jnp.ravel, grid2))).T + 0.5) * dx
+        n2 = [int(round(L / dx)), int(round(H / dx))]
+        grid2 = bm.meshgrid(bm.arange(n2[0], dtype=bm.float64), bm.arange(n2[1], dtype=bm.float64), indexing="xy")
+        r2 = (bm.stack([g.reshape(-1) for g in grid2], axis=1) + 0.5) * dx
         r_f = bm.tensor([0.0, 1.0]) * n_walls * dx + r2
 
         #tag
@@ -216,10 +224,9 @@ class NodeMesh(MeshDS):
         2 moving wall
         3 velocity wall
         '''
-        r = bm.tensor(bm.concatenate([r_w, r_f])) 
-        tag_f = jnp.full(len(r_f), 0, dtype=int)
-        tag_w = jnp.full(len(r_w), 1, dtype=int)
-        r = bm.tensor(bm.concatenate([r_w, r_f]))
+        tag_f = bm.full((r_f.shape[0], ), 0, dtype=bm.int64)
+        tag_w = bm.full((r_w.shape[0], ), 1, dtype=bm.int64)
+        r = bm.concatenate([r_w, r_f])
         tag = bm.concatenate([tag_w, tag_f])
 
         dx2n = dx * n_walls * 2
@@ -228,16 +235,16 @@ class NodeMesh(MeshDS):
         ((r[:, 1] < dx * n_walls) | (r[:, 1] > H + dx * n_walls)) &
         (((r[:, 0] > 0.3) & (r[:, 0] < 0.6)) | ((r[:, 0] > 0.9) & (r[:, 0] < 1.2)))
     )
-        tag = jnp.where(mask_hot_wall, 3, tag)
+        tag = bm.where(mask_hot_wall, 3, tag)
 
         NN_sum = r.shape[0]
         mv = bm.zeros_like(r)
-        rho = bm.ones(NN_sum) * rho0
-        mass = bm.ones(NN_sum) * dx * dy * rho0
-        eta = bm.ones(NN_sum) * eta0
-        temperature = bm.ones(NN_sum) * T0
-        kappa = bm.ones(NN_sum) * kappa0
-        Cp = bm.ones(NN_sum) * Cp0
+        rho = bm.ones(NN_sum, dtype=bm.float64) * rho0
+        mass = bm.ones(NN_sum, dtype=bm.float64) * dx * dy * rho0
+        eta = bm.ones(NN_sum, dtype=bm.float64) * eta0
+        temperature = bm.ones(NN_sum, dtype=bm.float64) * T0
+        kappa = bm.ones(NN_sum, dtype=bm.float64) * kappa0
+        Cp = bm.ones(NN_sum, dtype=bm.float64) * Cp0
 
         nodedata = {
             "position": r,
@@ -260,32 +267,32 @@ class NodeMesh(MeshDS):
         return cls(r, nodedata=nodedata)
 
     @classmethod
-    def from_long_rectangular_cavity_domain(cls, init_domain=bm.tensor([0.0,0.005,0,0.005]), domain=bm.tensor([0,0.05,0,0.005]), uin=bm.tensor([5.0, 0.0]), dx=1.25e-4):
+    def from_long_rectangular_cavity_domain(cls, init_domain=(0.0, 0.005, 0, 0.005), domain=(0, 0.05, 0, 0.005), uin=(5.0, 0.0), dx=1.25e-4):
         H = 1.5 * dx
         dy = dx
         rho0 = 737.54
 
         #fluid particles
-        fp = jnp.mgrid[init_domain[0]:init_domain[1]:dx, \
-            init_domain[2]+dx:init_domain[3]:dx].reshape(2,-1).T
+        fp = _grid(_arange(init_domain[0], init_domain[1], dx), \
+            _arange(init_domain[2]+dx, init_domain[3], dx))
 
         #wall particles
-        x0 = bm.arange(domain[0],domain[1],dx)
+        x0 = _arange(domain[0], domain[1], dx)
 
-        bwp = jnp.column_stack((x0,jnp.full_like(x0,domain[2])))
-        uwp = jnp.column_stack((x0,jnp.full_like(x0,domain[3])))
-        wp = jnp.vstack((bwp,uwp))
+        bwp = bm.stack((x0, bm.full_like(x0, domain[2])), axis=1)
+        uwp = bm.stack((x0, bm.full_like(x0, domain[3])), axis=1)
+        wp = bm.concat((bwp, uwp), axis=0)
 
         #dummy particles
-        bdp = jnp.mgrid[domain[0]:domain[1]:dx, \
-                domain[2]-dx:domain[2]-dx*4:-dx].reshape(2,-1).T
-        udp = jnp.mgrid[domain[0]:domain[1]:dx, \
-                domain[3]+dx:domain[3]+dx*3:dx].reshape(2,-1).T
-        dp = jnp.vstack((bdp,udp))
+        bdp = _grid(_arange(domain[0], domain[1], dx), \
+                _arange(domain[2]-dx, domain[2]-dx*4, -dx))
+        udp = _grid(_arange(domain[0], domain[1], dx), \
+                _arange(domain[3]+dx, domain[3]+dx*3, dx))
+        dp = bm.concat((bdp, udp), axis=0)
 
         #gate particles
-        gp = jnp.mgrid[-dx:-dx-4*H:-dx, \
-                domain[2]+dx:domain[3]:dx].reshape(2,-1).T
+        gp = _grid(_arange(-dx, -dx-4*H, -dx), \
+                _arange(domain[2]+dx, domain[3], dx))
 
         #tag
         '''
@@ -294,19 +301,19 @@ class NodeMesh(MeshDS):
         dummy particles: 2
         gate particles: 3
         '''
-        tag_f = jnp.full((fp.shape[0],), 0, dtype=int)
-        tag_w = jnp.full((wp.shape[0],), 1, dtype=int)
-        tag_d = jnp.full((dp.shape[0],), 2,dtype=int)
-        tag_g = jnp.full((gp.shape[0],), 3,dtype=int)
+        tag_f = bm.full((fp.shape[0], ), 0, dtype=bm.int64)
+        tag_w = bm.full((wp.shape[0], ), 1, dtype=bm.int64)
+        tag_d = bm.full((dp.shape[0], ), 2, dtype=bm.int64)
+        tag_g = bm.full((gp.shape[0], ), 3, dtype=bm.int64)
 
-        r = jnp.vstack((fp, gp, wp, dp))
+        r = bm.concat((fp, gp, wp, dp), axis=0)
         NN = r.shape[0]
-        tag = jnp.hstack((tag_f, tag_g, tag_w, tag_d))
-        fg_v =  bm.ones_like(jnp.vstack((fp, gp))) * uin
-        wd_v =  bm.zeros_like(jnp.vstack((wp, dp)))
-        v = jnp.vstack((fg_v, wd_v))
-        rho = bm.ones(NN) * rho0
-        mass = bm.ones(NN) * dx * dy * rho0
+        tag = bm.concat((tag_f, tag_g, tag_w, tag_d))
+        fg_v =  bm.ones_like(bm.concat((fp, gp), axis=0)) * bm.tensor(uin, dtype=bm.float64)
+        wd_v =  bm.zeros_like(bm.concat((wp, dp), axis=0))
+        v = bm.concat((fg_v, wd_v), axis=0)
+        rho = bm.ones(NN, dtype=bm.float64) * rho0
+        mass = bm.ones(NN, dtype=bm.float64) * dx * dy * rho0
 
         nodedata = {
             "position": r,
@@ -322,24 +329,24 @@ class NodeMesh(MeshDS):
 
     @classmethod
     def from_dam_break_domain(cls, dx=0.02, dy=0.02):
-        pp = jnp.mgrid[dx:1+dx:dx, dy:2+dy:dy].reshape(2, -1).T
+        pp = _grid(_arange(dx, 1+dx, dx), _arange(dy, 2+dy, dy))
 
         #down
-        bp0 = jnp.mgrid[0:4+dx:dx, 0:dy:dy].reshape(2, -1).T
-        bp1 = jnp.mgrid[-dx/2:4+dx/2:dx, -dy/2:dy/2:dy].reshape(2, -1).T
-        bp = jnp.vstack((bp0, bp1))
+        bp0 = _grid(_arange(0, 4+dx, dx), _arange(0, dy, dy))
+        bp1 = _grid(_arange(-dx/2, 4+dx/2, dx), _arange(-dy/2, dy/2, dy))
+        bp = bm.concat((bp0, bp1), axis=0)
 
         #left
-        lp0 = jnp.mgrid[0:dx:dx, dy:4+dy:dy].reshape(2, -1).T
-        lp1 = jnp.mgrid[-dx/2:dx/2:dx, dy-dy/2:4+dy/2:dy].reshape(2, -1).T
-        lp = jnp.vstack((lp0, lp1))
+        lp0 = _grid(_arange(0, dx, dx), _arange(dy, 4+dy, dy))
+        lp1 = _grid(_arange(-dx/2, dx/2, dx), _arange(dy-dy/2, 4+dy/2, dy))
+        lp = bm.concat((lp0, lp1), axis=0)
 
         #right
-        rp0 = jnp.mgrid[4:4+dx/2:dx, dy:4+dy:dy].reshape(2, -1).T
-        rp1 = jnp.mgrid[4+dx/2:4+dx:dx, dy-dy/2:4+dy/2:dy].reshape(2, -1).T
-        rp = jnp.vstack((rp0, rp1))
+        rp0 = _grid(_arange(4, 4+dx/2, dx), _arange(dy, 4+dy, dy))
+        rp1 = _grid(_arange(4+dx/2, 4+dx, dx), _arange(dy-dy/2, 4+dy/2, dy))
+        rp = bm.concat((rp0, rp1), axis=0)
 
-        boundaryp = jnp.vstack((bp, lp, rp))
-        node = jnp.vstack((pp, boundaryp))
+        boundaryp = bm.concat((bp, lp, rp), axis=0)
+        node = bm.concat((pp, boundaryp), axis=0)
 
         return cls(node)
@@ -0,0 +1,154 @@
+
+from typing import Optional, Tuple, Literal
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import CSRTensor
+from .mesh_base import StructuredMesh
+
+Kernel = Literal['linear', 'quadratic']
+Stencil = Tuple[TensorLike, TensorLike]
+
+
+def _grid(mesh: StructuredMesh):
+    """Return the origin, the step sizes and the number of nodes along every\
+    axis of a uniform mesh."""
+    if getattr(mesh, 'flip_direction', None) is not None:
+        raise ValueError("the uniform meshes with flipped node numbering "
+                         "are not supported.")
+    GD = mesh.geo_dimension()
+    shape = [mesh.nx + 1, mesh.ny + 1] + ([mesh.nz + 1] if GD == 3 else [])
+    return mesh.origin, mesh.h, shape
+
+
+def particle_stencil(mesh: StructuredMesh, points: TensorLike,
+                     kernel: Kernel='linear') -> Stencil:
+    """Return the grid nodes of every particle and their interpolation weights.
+
+    The cells containing the particles are found arithmetically from the
+    coordinates, so this costs O(NP) for any size of the grid. The weights of
+    the `linear` kernel are those of the multilinear interpolation in the cell,
+    on 2^GD nodes, and the weights of the `quadratic` kernel are those of the
+    quadratic B-splines centered at the nodes, on 3^GD nodes. The weights of
+    the nodes outside the grid are moved to the nearest boundary nodes, so
+    they always sum to 1.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        points (Tensor): The positions of the particles, shaped (NP, GD).
+        kernel (str, optional): 'linear' or 'quadratic'. Default to 'linear'.
+
+    Returns:
+        Tuple[Tensor, Tensor]: The nodes and the weights, both shaped (NP, S),\
+            where S is 2^GD or 3^GD.
+    """
+    origin, h, shape = _grid(mesh)
+    NP, GD = points.shape
+    kwargs = {'dtype': bm.int64, 'device': bm.get_device(points)}
+
+    index = bm.zeros((NP, 1), **kwargs)
+    weight = bm.ones((NP, 1), dtype=points.dtype, device=bm.get_device(points))
+
+    for d in range(GD):
+        n = shape[d]
+        xi = (points[:, d] - origin[d]) / h[d]
+        if kernel == 'linear':
+            base = bm.astype(bm.floor(xi), bm.int64)
+            base = bm.minimum(bm.maximum(base, bm.zeros_like(base)), bm.full_like(base, n - 2))
+            t = xi - base
+            w = bm.stack([1 - t, t], axis=1)
+            m = 2
+        elif kernel == 'quadratic':
+            base = bm.astype(bm.floor(xi - 0.5), bm.int64)
+            t = xi - base
+            w = bm.stack([0.5 * (1.5 - t)**2, 0.75 - (t - 1)**2, 0.5 * (t - 0.5)**2], axis=1)
+            m = 3
+        else:
+            raise ValueError(f"Unknown kernel '{kernel}', expected 'linear' or 'quadratic'.")
+
+        i = base[:, None] + bm.arange(m, **kwargs)
+        i = bm.minimum(bm.maximum(i, bm.zeros_like(i)), bm.full_like(i, n - 1))
+        # tensor product with the axes before, in the row-major node numbering
+        index = (index[:, :, None] * n + i[:, None, :]).reshape(NP, -1)
+        weight = (weight[:, :, None] * w[:, None, :]).reshape(NP, -1)
+
+    return index, weight
+
+
+def particle_to_grid_matrix(mesh: StructuredMesh, points: TensorLike,
+                            kernel: Kernel='linear', *,
+                            stencil: Optional[Stencil]=None) -> CSRTensor:
+    """Return the interpolation matrix from the grid nodes to the particles.
+
+    Its transpose spreads the values of the particles to the nodes, so for
+    the masses `m` and the velocities `v` of the particles,
+    `W.T @ m` is the mass and `W.T @ (m[:, None] * v)` the momentum on the
+    grid, and `W @ u` interpolates the grid velocity `u` at the particles.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        points (Tensor): The positions of the particles, shaped (NP, GD).
+        kernel (str, optional): 'linear' or 'quadratic'. Default to 'linear'.
+        stencil (Tuple[Tensor, Tensor] | None, optional): The output of\
+            `particle_stencil`, computed if not given.
+
+    Returns:
+        CSRTensor: The matrix shaped (NP, NN), with S nonzeros in every row.
+    """
+    index, weight = particle_stencil(mesh, points, kernel) if stencil is None else stencil
+    NP, S = index.shape
+    crow = bm.arange(NP + 1, **bm.context(index)) * S
+    return CSRTensor(crow, index.reshape(-1), weight.reshape(-1),
+                     spshape=(NP, mesh.number_of_nodes()))
+
+
+def particle_to_grid(mesh: StructuredMesh, points: TensorLike, values: TensorLike,
+                     kernel: Kernel='linear', *,
+                     stencil: Optional[Stencil]=None,
+                     out: Optional[TensorLike]=None) -> TensorLike:
+    """Spread the values of the particles to the grid nodes by scatter-add,\
+    without building the matrix.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        points (Tensor): The positions of the particles, shaped (NP, GD).
+        values (Tensor): The values of the particles, shaped (NP, ...).
+        kernel (str, optional): 'linear' or 'quadratic'. Default to 'linear'.
+        stencil (Tuple[Tensor, Tensor] | None, optional): The output of\
+            `particle_stencil`, computed if not given.
+        out (Tensor | None, optional): The grid values to add to, shaped (NN, ...).
+
+    Returns:
+        Tensor: The grid values shaped (NN, ...).
+    """
+    index, weight = particle_stencil(mesh, points, kernel) if stencil is None else stencil
+    NP, S = index.shape
+    shape = values.shape[1:]
+    if out is None:
+        out = bm.zeros((mesh.number_of_nodes(), ) + shape, dtype=values.dtype,
+                       device=bm.get_device(values))
+    w = weight.reshape((NP, S) + (1, ) * len(shape))
+    src = (w * values[:, None, ...]).reshape((NP * S, ) + shape)
+    return bm.index_add(out, index.reshape(-1), src)
+
+
+def grid_to_particle(mesh: StructuredMesh, grid_values: TensorLike, points: TensorLike,
+                     kernel: Kernel='linear', *,
+                     stencil: Optional[Stencil]=None) -> TensorLike:
+    """Interpolate the values on the grid nodes at the particles.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The uniform mesh.
+        grid_values (Tensor): The values on the nodes, shaped (NN, ...).
+        points (Tensor): The positions of the particles, shaped (NP, GD).
+        kernel (str, optional): 'linear' or 'quadratic'. Default to 'linear'.
+        stencil (Tuple[Tensor, Tensor] | None, optional): The output of\
+            `particle_stencil`, computed if not given.
+
+    Returns:
+        Tensor: The values at the particles shaped (NP, ...).
+    """
+    index, weight = particle_stencil(mesh, points, kernel) if stencil is None else stencil
+    shape = grid_values.shape[1:]
+    w = weight.reshape(weight.shape + (1, ) * len(shape))
+    return bm.sum(w * grid_values[index], axis=1)
@@ -0,0 +1,297 @@
+
+from typing import Optional, Tuple, Literal
+from dataclasses import dataclass
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from .. import logger
+from .mesh_base import Mesh
+
+
+def _adjacency(i: TensorLike, j: TensorLike, n: int) -> Tuple[TensorLike, TensorLike]:
+    """Return the symmetric adjacency (xadj, adjncy) in CSR layout of a graph\
+    with `n` vertices and the undirected edges (i, j)."""
+    row = bm.concat([i, j])
+    col = bm.concat([j, i])
+    order = bm.lexsort((col, row))
+    row, col = row[order], col[order]
+    kwargs = bm.context(row)
+    count = bm.zeros((n, ), **kwargs)
+    count = bm.index_add(count, row, bm.ones(row.shape, **kwargs))
+    xadj = bm.concat([bm.zeros((1, ), **kwargs), bm.cumsum(count, axis=0)])
+    return xadj, col
+
+
+def dual_graph(mesh: Mesh) -> Tuple[TensorLike, TensorLike]:
+    """Return the dual graph of a mesh, whose vertices are the cells and whose\
+    edges connect the cells sharing a face.
+
+    Parameters:
+        mesh (Mesh): The mesh with the `face2cell` relationship.
+
+    Returns:
+        Tuple[Tensor, Tensor]: The adjacency (xadj, adjncy) in CSR layout, i.e.\
+            the neighbors of the cell `i` are `adjncy[xadj[i]:xadj[i+1]]`.
+    """
+    face2cell = mesh.face_to_cell()
+    flag = face2cell[:, 0] != face2cell[:, 1]
+    return _adjacency(face2cell[flag, 0], face2cell[flag, 1], mesh.number_of_cells())
+
+
+def node_graph(mesh: Mesh) -> Tuple[TensorLike, TensorLike]:
+    """Return the graph of the nodes connected by the edges of a mesh, in the\
+    same layout as `dual_graph`."""
+    edge = mesh.entity('edge')
+    return _adjacency(edge[:, 0], edge[:, 1], mesh.number_of_nodes())
+
+
+def _split_sizes(n: int, nparts: int) -> Tuple[int, int]:
+    """Split `nparts` into two halves, returning the number of parts and the\
+    number of items of the first half."""
+    nleft = nparts // 2
+    return nleft, (n * nleft) // nparts
+
+
+def rcb_partition(points: TensorLike, nparts: int) -> TensorLike:
+    """Partition points by recursive coordinate bisection.
+
+    Every set of points is split across its longest extent, into two sets whose
+    sizes are proportional to the numbers of parts they are further split into,
+    so `nparts` needs not be a power of two.
+
+    Parameters:
+        points (Tensor): The coordinates, shaped (N, GD).
+        nparts (int): The number of parts.
+
+    Returns:
+        Tensor: The part of every point, shaped (N, ).
+    """
+    N = points.shape[0]
+    device = bm.get_device(points)
+    parts = bm.zeros((N, ), dtype=bm.int64, device=device)
+    stack = [(bm.arange(N, dtype=bm.int64, device=device), 0, nparts)]
+
+    while stack:
+        index, start, n = stack.pop()
+        if n == 1:
+            parts = bm.set_at(parts, index, start)
+            continue
+        p = points[index]
+        axis = int(bm.argmax(bm.max(p, axis=0) - bm.min(p, axis=0)))
+        order = bm.argsort(p[:, axis], stable=True)
+        nleft, k = _split_sizes(index.shape[0], n)
+        stack.append((index[order[:k]], start, nleft))
+        stack.append((index[order[k:]], start + nleft, n - nleft))
+
+    return parts
+
+
+def morton_code(points: TensorLike, nbits: Optional[int]=None) -> TensorLike:
+    """Return the Morton (Z-order) codes of points, by interleaving the bits of\
+    their coordinates quantized on the bounding box.
+
+    Parameters:
+        points (Tensor): The coordinates, shaped (N, GD).
+        nbits (int | None, optional): The number of bits for every coordinate.\
+            Default to the most fitting in 63 bits.
+
+    Returns:
+        Tensor: The codes in int64, shaped (N, ).
+    """
+    GD = points.shape[-1]
+    nbits = 63 // GD if nbits is None else nbits
+    pmin = bm.min(points, axis=0)
+    extent = bm.max(points, axis=0) - pmin
+    extent = bm.where(extent > 0, extent, 1.0)
+    scale = float(2**nbits - 1)
+    q = bm.astype((points - pmin) / extent * scale, bm.int64)
+
+    code = bm.zeros(q.shape[:1], dtype=bm.int64, device=bm.get_device(q))
+    for b in range(nbits):
+        for d in range(GD):
+            bit = (q[:, d] >> b) & 1
+            code = code | (bit << (GD * b + d))
+    return code
+
+
+def sfc_partition(points: TensorLike, nparts: int) -> TensorLike:
+    """Partition points into contiguous pieces of equal sizes along the Morton\
+    space-filling curve.
+
+    Parameters:
+        points (Tensor): The coordinates, shaped (N, GD).
+        nparts (int): The number of parts.
+
+    Returns:
+        Tensor: The part of every point, shaped (N, ).
+    """
+    N = points.shape[0]
+    order = bm.argsort(morton_code(points), stable=True)
+    rank = bm.zeros((N, ), dtype=bm.int64, device=bm.get_device(order))
+    rank = bm.set_at(rank, order, bm.arange(N, dtype=bm.int64, device=bm.get_device(order)))
+    return (rank * nparts) // N
+
+
+def metis_partition(mesh: Mesh, nparts: int, **options) -> TensorLike:
+    """Partition the cells of a mesh with METIS on the dual graph.
+
+    Parameters:
+        mesh (Mesh): The mesh.
+        nparts (int): The number of parts.
+        **options: The METIS options, see `fealpy.graph.metis.part_graph`.
+
+    Returns:
+        Tensor: The part of every cell, shaped (NC, ).
+
+    Raises:
+        RuntimeError: If the METIS shared library is not available.
+    """
+    from ..graph import metis
+    _, parts = metis.part_mesh(mesh, entity='cell', nparts=nparts, **options)
+    return bm.tensor(parts, dtype=bm.int64, device=bm.get_device(mesh.entity('cell')))
+
+
+PartitionMethod = Literal['auto', 'metis', 'rcb', 'sfc']
+
+def partition_mesh(mesh: Mesh, nparts: int, method: PartitionMethod='auto',
+                   **options) -> TensorLike:
+    """Partition the cells of a mesh.
+
+    Parameters:
+        mesh (Mesh): The mesh.
+        nparts (int): The number of parts.
+        method (str, optional): 'metis' for the graph partitioning of the dual\
+            graph by METIS, 'rcb' for the recursive coordinate bisection of the\
+            cell barycenters, 'sfc' for the pieces of the Morton curve of the\
+            barycenters, or 'auto' for METIS when its shared library can be\
+            loaded and RCB otherwise. Default to 'auto'.
+        **options: The METIS options.
+
+    Returns:
+        Tensor: The part of every cell, shaped (NC, ), in [0, nparts).
+    """
+    if nparts < 1:
+        raise ValueError(f"nparts should be positive, but got {nparts}.")
+    if method in ('auto', 'metis'):
+        try:
+            return metis_partition(mesh, nparts, **options)
+        except (RuntimeError, OSError, ImportError) as e:
+            if method == 'metis':
+                raise
+            logger.info(f"METIS is not available ({e}), using RCB to partition the mesh.")
+        method = 'rcb'
+
+    bc = mesh.entity_barycenter('cell')
+    if method == 'rcb':
+        return rcb_partition(bc, nparts)
+    elif method == 'sfc':
+        return sfc_partition(bc, nparts)
+    raise ValueError(f"Unknown partition method '{method}', "
+                     "expected 'auto', 'metis', 'rcb' or 'sfc'.")
+
+
+@dataclass
+class SubMesh:
+    """A part of a mesh with the layers of ghost cells around it.
+
+    The owned cells are numbered before the ghost cells, so the owned cells of
+    the local mesh are `mesh.entity('cell')[:number_of_owned_cells]`, and the
+    nodes keep the order of their global numbering.
+    """
+    mesh: Mesh
+    """The local mesh."""
+    part: int
+    """The index of the part."""
+    cell_l2g: TensorLike
+    """The global index of every local cell, shaped (NC_local, )."""
+    node_l2g: TensorLike
+    """The global index of every local node, shaped (NN_local, )."""
+    number_of_owned_cells: int
+
+    def is_ghost_cell(self) -> TensorLike:
+        """Return the flag of the ghost cells, shaped (NC_local, )."""
+        NC = self.cell_l2g.shape[0]
+        index = bm.arange(NC, device=bm.get_device(self.cell_l2g))
+        return index >= self.number_of_owned_cells
+
+    def dof_l2g(self, local_space, global_space) -> TensorLike:
+        """Return the global index of every dof of a space on the local mesh.
+
+        The spaces should be of the same kind, built on the local and the global
+        meshes respectively, such that the dofs of a cell are in the same local
+        order on both meshes, e.g. Lagrange spaces.
+
+        Parameters:
+            local_space (FunctionSpace): The space on the local mesh.
+            global_space (FunctionSpace): The space on the global mesh.
+
+        Returns:
+            Tensor: The global dofs, shaped (local_gdof, ).
+        """
+        return dof_l2g(local_space.cell_to_dof(),
+                       global_space.cell_to_dof(index=self.cell_l2g),
+                       local_space.number_of_global_dofs())
+
+
+def dof_l2g(local_cell2dof: TensorLike, global_cell2dof: TensorLike, gdof: int) -> TensorLike:
+    """Return the global index of every local dof, by matching the dofs of the\
+    same cells in the local and the global numbering.
+
+    Parameters:
+        local_cell2dof (Tensor): The local dofs of the local cells, shaped (NC, ldof).
+        global_cell2dof (Tensor): The global dofs of the same cells, shaped (NC, ldof).
+        gdof (int): The number of the local dofs.
+
+    Returns:
+        Tensor: The global dofs, shaped (gdof, ).
+    """
+    l2g = bm.zeros((gdof, ), **bm.context(global_cell2dof))
+    return bm.set_at(l2g, local_cell2dof.reshape(-1), global_cell2dof.reshape(-1))
+
+
+def cell_submesh(mesh_class, node: TensorLike, cell: TensorLike,
+                 index: TensorLike) -> Tuple[Mesh, TensorLike]:
+    """Build the mesh of the cells `cell[index]` and the nodes they use,\
+    returning it with the global index of the local nodes, in ascending order."""
+    NN = node.shape[0]
+    lcell = cell[index]
+    isNode = bm.zeros((NN, ), dtype=bm.bool, device=bm.get_device(cell))
+    isNode = bm.set_at(isNode, lcell.reshape(-1), True)
+    node_l2g = bm.nonzero(isNode)[0]
+    g2l = bm.zeros((NN, ), **bm.context(cell))
+    g2l = bm.set_at(g2l, node_l2g, bm.arange(node_l2g.shape[0], **bm.context(cell)))
+    return mesh_class(node[node_l2g], g2l[lcell]), node_l2g
+
+
+def extract_submesh(mesh: Mesh, parts: TensorLike, part: int, nghost: int=0) -> SubMesh:
+    """Extract the cells of a part and `nghost` layers of ghost cells around\
+    them as a mesh. The ghost cells of a layer share a node with the cells\
+    of the previous ones.
+
+    The mesh class should be constructed as `mesh.__class__(node, cell)`, as
+    the simplex and the unstructured tensor meshes are.
+
+    Parameters:
+        mesh (Mesh): The global mesh.
+        parts (Tensor): The part of every cell, shaped (NC, ).
+        part (int): The index of the part to extract.
+        nghost (int, optional): The number of the layers of ghost cells.\
+            Default to 0.
+
+    Returns:
+        SubMesh: The local mesh and its maps to the global mesh.
+    """
+    cell = mesh.entity('cell')
+    NN = mesh.number_of_nodes()
+    owned = parts == part
+    flag = owned
+    for _ in range(nghost):
+        isNode = bm.zeros((NN, ), dtype=bm.bool, device=bm.get_device(cell))
+        isNode = bm.set_at(isNode, cell[flag].reshape(-1), True)
+        flag = bm.any(isNode[cell], axis=1)
+
+    owned_cell = bm.nonzero(owned)[0]
+    ghost_cell = bm.nonzero(flag & ~owned)[0]
+    cell_l2g = bm.concat([owned_cell, ghost_cell])
+    submesh, node_l2g = cell_submesh(mesh.__class__, mesh.entity('node'), cell, cell_l2g)
+    return SubMesh(submesh, part, cell_l2g, node_l2g, int(owned_cell.shape[0]))
@@ -0,0 +1,69 @@
+
+from typing import Sequence
+from math import prod
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+
+def edge_prolongation(NN: int, edge: TensorLike, *, dtype=None, device=None) -> CSRTensor:
+    """Return the interpolation of the linear nodal functions from a mesh to\
+    the mesh refined by bisecting every edge, whose new nodes are numbered\
+    after the old ones in the order of the edges.
+
+    Parameters:
+        NN (int): The number of nodes of the coarse mesh.
+        edge (Tensor): The edges of the coarse mesh, shaped (NE, 2).
+
+    Returns:
+        CSRTensor: The prolongation shaped (NN + NE, NN).
+    """
+    dtype = bm.float64 if dtype is None else dtype
+    kwargs = bm.context(edge)
+    NE = edge.shape[0]
+    crow = bm.concat([bm.arange(NN + 1, **kwargs),
+                      NN + 2 * bm.arange(1, NE + 1, **kwargs)])
+    # columns are sorted in every row
+    e0 = bm.minimum(edge[:, 0], edge[:, 1])
+    e1 = bm.maximum(edge[:, 0], edge[:, 1])
+    col = bm.concat([bm.arange(NN, **kwargs), bm.stack([e0, e1], axis=1).reshape(-1)])
+    values = bm.concat([bm.ones((NN, ), dtype=dtype, device=device),
+                        bm.full((2 * NE, ), 0.5, dtype=dtype, device=device)])
+    return CSRTensor(crow, col, values, spshape=(NN + NE, NN))
+
+
+def grid_prolongation(shape: Sequence[int], *, dtype=None, device=None) -> CSRTensor:
+    """Return the multilinear interpolation from a node grid to the grid\
+    refined by halving every step size, with nodes numbered in the row-major\
+    order of the grid as the uniform meshes.
+
+    Parameters:
+        shape (Sequence[int]): The number of nodes of the coarse grid along every axis.
+
+    Returns:
+        CSRTensor: The prolongation shaped (prod(2*shape - 1), prod(shape)).
+    """
+    dtype = bm.float64 if dtype is None else dtype
+    kwargs = {'dtype': bm.int64, 'device': device}
+    fine = tuple(2 * n - 1 for n in shape)
+    row = bm.zeros((1, ), **kwargs)
+    col = bm.zeros((1, ), **kwargs)
+    val = bm.ones((1, ), dtype=dtype, device=device)
+
+    for n, m in zip(shape, fine):
+        # 1d interpolation: even fine nodes are coarse nodes, odd ones midpoints
+        i = bm.arange(n, **kwargs)
+        j = bm.arange(n - 1, **kwargs)
+        r1 = bm.concat([2 * i, 2 * j + 1, 2 * j + 1])
+        c1 = bm.concat([i, j, j + 1])
+        v1 = bm.concat([bm.ones((n, ), dtype=dtype, device=device),
+                        bm.full((2 * (n - 1), ), 0.5, dtype=dtype, device=device)])
+        # Kronecker product with the axes before
+        row = (row[:, None] * m + r1[None, :]).reshape(-1)
+        col = (col[:, None] * n + c1[None, :]).reshape(-1)
+        val = (val[:, None] * v1[None, :]).reshape(-1)
+
+    P = COOTensor(bm.stack([row, col], axis=0), val, (prod(fine), prod(shape)),
+                  is_coalesced=True)
+    return P.tocsr()
@@ -3,10 +3,11 @@ from typing import Union, Optional, List, Tuple, Any, Callable
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-from .utils import estr2dim
+from .utils import estr2dim, cachedmethod
 
 from .mesh_base import TensorMesh
 from .plot import Plotable
+from .refine_topology import parent_topology, refine_topology, QUADRANGLE
 
 
 class QuadrangleMesh(TensorMesh, Plotable):
@@ -159,6 +160,7 @@ class QuadrangleMesh(TensorMesh, Plotable):
         n = t @ w
         return n, t
 
+    @cachedmethod
     def interpolation_points(self, p:int, index: Index = _S):
         """
         @brief Get all p-th order interpolation points on the quadrilateral mesh
@@ -186,6 +188,7 @@ class QuadrangleMesh(TensorMesh, Plotable):
     def number_of_corner_nodes(self):
         return self.number_of_nodes()
 
+    @cachedmethod
     def cell_to_ipoint(self, p:int, index: Index = _S):
         """
         @brief 获取单元上的双 p 次插值点
@@ -336,11 +339,17 @@ class QuadrangleMesh(TensorMesh, Plotable):
         # cell = cell[bm.arange(NC).reshape(-1, 1), self.localCell[idx]]
         # self.ds.reinit(NN, cell)
 
-    def uniform_refine(self, n:int=1) -> 'QuadrangleMesh':
+    def uniform_refine(self, n:int=1, *, incremental: bool=False) -> 'QuadrangleMesh':
         """
         @brief Uniformly refine the quadrilateral mesh
+
+        @param incremental: derive the topology of the refined mesh from the
+        parent mesh in O(N) instead of calling `construct()`. The faces and
+        edges are then numbered by the parent entities they lie in, rather
+        than in the lexicographic order, see `refine_topology`.
         """
         for i in range(n):
+            parent = parent_topology(self) if incremental else None
             NN = self.number_of_nodes()
             NE = self.number_of_edges()
             NC = self.number_of_cells()
@@ -391,8 +400,11 @@ class QuadrangleMesh(TensorMesh, Plotable):
 
             self.node = bm.concatenate([self.node, edgeCenter, cellCenter], axis=0)
             self.cell = cell
-            
-            self.construct()
+
+            if incremental:
+                refine_topology(self, parent, QUADRANGLE)
+            else:
+                self.construct()
 
     def vtk_cell_type(self, etype='cell'):
         if etype in {'cell', 2}:
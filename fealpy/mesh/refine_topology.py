@@ -0,0 +1,293 @@
+
+from typing import Sequence, Optional, Dict
+from itertools import permutations
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+def _key(signature: frozenset):
+    return sorted(sorted(s) for s in signature)
+
+
+class RefinementTemplate():
+    """Uniform refinement of one reference cell, used to derive the topology of
+    a refined mesh from its parent mesh without sorting.
+
+    Every vertex of the children is the barycenter of a parent-local entity,
+    a node, an edge, a face or the cell. So every entity of the children
+    lies in a parent-local entity and is identified by its vertices, written
+    as the sets of the corners of that parent entity they are centers of.
+
+    The children of a parent entity P are numbered by their signatures in the
+    corner order of the *global* P, so the two cells sharing a parent face
+    number the children of it in the same way. The signatures do not depend
+    on the cells in the global order; they only depend on the permutation
+    from the local to the global corner order, which is tabulated here.
+
+    Parameters:
+        TD (int): The topological dimension of the cells.
+        localEdge (Sequence): The local edges of the cell.
+        localFace (Sequence): The local faces of the cell.
+        centers (Sequence[int]): The dimensions of the entities whose\
+            barycenters are the vertices of the children, following the\
+            order of the nodes of the refined mesh, e.g. (0, 1) for the\
+            nodes and the midpoints of the edges.
+        children (Sequence): The child cells in the local numbering of the\
+            vertices above. A list of them for each variant of refinement.
+        interleave (bool): Whether the children of the cell c are numbered\
+            NCH*c + t, otherwise t*NC + c.
+    """
+    def __init__(self, TD: int, localEdge: Sequence, localFace: Sequence,
+                 centers: Sequence[int], children: Sequence, *, interleave: bool):
+        self.TD = TD
+        self.interleave = interleave
+        self.localEdge = [tuple(e) for e in localEdge]
+        self.localFace = [tuple(f) for f in localFace]
+        NVC = max(max(f) for f in self.localFace) + 1
+        self.NCH = len(children[0])
+
+        points = []
+        for d in centers:
+            if d == 0:
+                points.extend((i, ) for i in range(NVC))
+            elif d == 1:
+                points.extend(self.localEdge)
+            elif d == TD:
+                points.append(tuple(range(NVC)))
+            else:
+                points.extend(self.localFace)
+        self.points = [frozenset(p) for p in points]
+
+        # the parent-local entities containing the child entities, smallest first
+        self.parents = {'face': [('face', i, f) for i, f in enumerate(self.localFace)]}
+        if TD == 3:
+            self.parents['edge'] = [('edge', i, e) for i, e in enumerate(self.localEdge)] \
+                                 + self.parents['face']
+        self.tables = {kind: self._tabulate(kind, children) for kind in self.parents}
+
+    def _locate(self, kind: str, vertices: Sequence[int]):
+        corners = frozenset().union(*(self.points[v] for v in vertices))
+        for pkind, idx, pcorners in self.parents[kind]:
+            if corners <= frozenset(pcorners):
+                sig = frozenset(frozenset(pcorners.index(c) for c in self.points[v])
+                                for v in vertices)
+                return pkind, idx, sig
+        return 'cell', 0, frozenset(self.points[v] for v in vertices)
+
+    def _tabulate(self, kind: str, children: Sequence):
+        local = self.localFace if kind == 'face' else self.localEdge
+        entries = []
+        for variant in children:
+            entries.append([[self._locate(kind, [child[k] for k in l]) for l in local]
+                            for child in variant])
+
+        table = {}
+        # 1. children of the parent faces and edges, in the global corner order
+        for pkind in ('edge', 'face'):
+            sigs = {e[2] for var in entries for child in var for e in child if e[0] == pkind}
+            if len(sigs) == 0:
+                continue
+            n = 2 if pkind == 'edge' else len(self.localFace[0])
+            family = sorted(sigs, key=_key)
+            code = {s: i for i, s in enumerate(family)}
+            slots = {}
+            for perm in permutations(range(n)):
+                mapped = {frozenset(frozenset(perm[k] for k in s) for s in sig): sig
+                          for sig in sigs}
+                if set(mapped) != sigs:
+                    continue # not a symmetry of the refinement
+                pcode = 0
+                for k in range(n):
+                    pcode = pcode * n + perm[k]
+                for new, sig in mapped.items():
+                    slots.setdefault(sig, [0] * n**n)[pcode] = code[new]
+            table[pkind] = (len(family), n, {s: v for s, v in slots.items()})
+
+        # 2. children inside the cell, numbered in every variant separately
+        fams = [sorted({e[2] for child in var for e in child if e[0] == 'cell'}, key=_key)
+                for var in entries]
+        if len(set(len(f) for f in fams)) != 1:
+            raise ValueError("the variants have different numbers of interior entities.")
+        fams = [{s: i for i, s in enumerate(f)} for f in fams]
+
+        # 3. for every child t and local entity j, and every variant:
+        # (parent kind, parent index, slots), where the slots are indexed by
+        # the permutation codes of the parent entity
+        result = []
+        for t in range(self.NCH):
+            row = []
+            for j in range(len(local)):
+                cases = []
+                for v, var in enumerate(entries):
+                    pkind, idx, sig = var[t][j]
+                    slots = [fams[v][sig]] if pkind == 'cell' else table[pkind][2][sig]
+                    cases.append((pkind, idx, slots))
+                if all(c == cases[0] for c in cases):
+                    cases = cases[:1]
+                row.append(cases)
+            result.append(row)
+
+        counts = {pkind: table[pkind][0] for pkind in table}
+        counts['cell'] = len(fams[0])
+        return counts, result
+
+
+def _perm_code(local: TensorLike, glob: TensorLike) -> TensorLike:
+    """The code of the positions of the local corners in the global entities."""
+    n = local.shape[1]
+    code = bm.zeros((local.shape[0], ), **bm.context(glob))
+    for k in range(n):
+        pos = bm.zeros_like(code)
+        for m in range(1, n):
+            pos = pos + m * bm.astype(glob[:, m] == local[:, k], code.dtype)
+        code = code * n + pos
+    return code
+
+
+def _child_ids(template: RefinementTemplate, kind: str, parent: Dict[str, TensorLike],
+               variant: Optional[TensorLike]):
+    """Number the child entities of the kind, return the ids shaped (NCH*NC, NLE)
+    in the order of the child cells, and the number of them."""
+    counts, entries = template.tables[kind]
+    cell = parent['cell']
+    NC = cell.shape[0]
+    kwargs = bm.context(cell)
+
+    offset = {}
+    start = 0
+    codes = {}
+    for pkind in ('edge', 'face'):
+        if pkind not in counts:
+            continue
+        local = template.localEdge if pkind == 'edge' else template.localFace
+        entity, c2e = parent[pkind], parent['cell2' + pkind]
+        offset[pkind] = start
+        start += entity.shape[0] * counts[pkind]
+        codes[pkind] = [_perm_code(cell[:, list(l)], entity[c2e[:, i]])
+                        for i, l in enumerate(local)]
+    offset['cell'] = start
+    total = start + NC * counts['cell']
+    cidx = bm.arange(NC, **kwargs)
+
+    ids = []
+    for row in entries:
+        ids_t = []
+        for cases in row:
+            for v, (pkind, idx, slots) in enumerate(cases):
+                slots = bm.tensor(slots, **kwargs)
+                if pkind == 'cell':
+                    val = offset['cell'] + cidx * counts['cell'] + slots[0]
+                else:
+                    pidx = parent['cell2' + pkind][:, idx]
+                    val = offset[pkind] + pidx * counts[pkind] + slots[codes[pkind][idx]]
+                ids_v = val if v == 0 else bm.where(variant == v, val, ids_v)
+            ids_t.append(ids_v)
+        ids.append(bm.stack(ids_t, axis=-1))
+
+    ids = bm.stack(ids, axis=1 if template.interleave else 0) # (NC, NCH, ...) or (NCH, NC, ...)
+    return ids.reshape(NC * template.NCH, -1), total
+
+
+def parent_topology(mesh) -> Dict[str, TensorLike]:
+    """Return the arrays of the mesh needed by `refine_topology`, to be taken
+    before the mesh is refined."""
+    parent = {'cell': mesh.cell, 'face': mesh.face, 'cell2face': mesh.cell2face}
+    if mesh.TD == 3:
+        parent['edge'] = mesh.edge
+        parent['cell2edge'] = mesh.cell2edge
+    return parent
+
+
+def refine_topology(mesh, parent: Dict[str, TensorLike], template: RefinementTemplate,
+                    variant: Optional[TensorLike]=None):
+    """Set the faces, edges and their adjacency of a uniformly refined mesh
+    from the parent mesh, in O(N) without sorting.
+
+    Parameters:
+        mesh (MeshDS): The refined mesh, whose cells are already set.
+        parent (Dict[str, Tensor]): The 'cell', 'face' and 'cell2face' of the\
+            parent mesh, and 'edge', 'cell2edge' for 3-d meshes.
+        template (RefinementTemplate): How the cells are refined.
+        variant (Tensor | None, optional): The variant of refinement of\
+            every parent cell, if the template has several. Default is None.
+
+    Note:
+        The results are the same as `construct()` except for the numbering of
+        faces and edges: the children of the parent faces come first in the
+        order of the parent faces, then those inside the parent cells. The
+        faces are oriented as in `construct()`, and the edges of 3-d meshes
+        are from the smaller node to the larger one.
+    """
+    cell2face, NF = _child_ids(template, 'face', parent, variant)
+    cell2face = bm.astype(cell2face, mesh.itype)
+    NCn, NFC = cell2face.shape
+    kwargs = bm.context(cell2face)
+
+    # the two occurrences of every face, by the sums of their indices
+    occ = bm.arange(NCn * NFC, **kwargs)
+    j = cell2face.reshape(-1)
+    count = bm.index_add(bm.zeros((NF, ), **kwargs), j, bm.ones_like(occ))
+    total = bm.index_add(bm.zeros((NF, ), **kwargs), j, occ)
+    partner = bm.where(count[j] == 2, total[j] - occ, occ)
+    first = occ <= partner
+    i0 = bm.zeros((NF, ), **kwargs)
+    i0 = bm.set_at(i0, j[first], occ[first])
+    i1 = bm.where(count == 2, total - i0, i0)
+
+    mesh.face = mesh.total_face()[i0, :]
+    mesh.cell2face = cell2face
+    mesh.face2cell = bm.stack([i0//NFC, i1//NFC, i0%NFC, i1%NFC], axis=-1)
+
+    if mesh.TD == 3:
+        cell2edge, NE = _child_ids(template, 'edge', parent, variant)
+        cell2edge = bm.astype(cell2edge, mesh.itype)
+        totalEdge = bm.sort(mesh.total_edge(), axis=1)
+        edge = bm.zeros((NE, 2), **kwargs)
+        # NOTE: all the occurrences of an edge write the same values.
+        mesh.edge = bm.set_at(edge, cell2edge.reshape(-1), totalEdge)
+        mesh.cell2edge = cell2edge
+    elif mesh.TD == 2:
+        mesh.edge2cell = mesh.face2cell
+        mesh.cell2edge = mesh.cell2face
+
+
+TRIANGLE = RefinementTemplate(
+    2, [(1, 2), (2, 0), (0, 1)], [(1, 2), (2, 0), (0, 1)], (0, 1),
+    [[(0, 5, 4), (5, 1, 3), (4, 3, 2), (3, 4, 5)]],
+    interleave=False
+)
+
+QUADRANGLE = RefinementTemplate(
+    2, [(0, 1), (1, 2), (2, 3), (3, 0)], [(0, 1), (1, 2), (2, 3), (3, 0)], (0, 1, 2),
+    [[(0, 4, 8, 7), (4, 1, 5, 8), (8, 5, 2, 6), (7, 8, 6, 3)]],
+    interleave=True
+)
+
+# the corner tetrahedra, then the octahedron split by one of its diagonals,
+# see `TetrahedronMesh.uniform_refine` for the table T of the variants.
+_TET_CORNER = [(4, 6, 5, 0), (4, 7, 8, 1), (5, 9, 7, 2), (6, 8, 9, 3)]
+
+def _tet_variant(T):
+    T = [4 + t for t in T]
+    return _TET_CORNER + [(T[0], T[1], T[4], T[5]), (T[1], T[2], T[4], T[5]),
+                          (T[2], T[3], T[4], T[5]), (T[3], T[0], T[4], T[5])]
+
+TETRAHEDRON = RefinementTemplate(
+    3, [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)],
+    [(1, 2, 3), (0, 3, 2), (0, 1, 3), (0, 2, 1)], (0, 1),
+    [_tet_variant(T) for T in [(1, 3, 4, 2, 5, 0), (0, 2, 5, 3, 4, 1), (0, 4, 5, 1, 3, 2)]],
+    interleave=False
+)
+
+HEXAHEDRON = RefinementTemplate(
+    3, [(0, 1), (1, 2), (2, 3), (0, 3), (0, 4), (1, 5),
+        (2, 6), (3, 7), (4, 5), (5, 6), (6, 7), (4, 7)],
+    [(0, 3, 2, 1), (4, 5, 6, 7), (0, 4, 7, 3), (1, 2, 6, 5), (0, 1, 5, 4), (2, 3, 7, 6)],
+    (0, 1, 2, 3),
+    [[(0, 8, 20, 11, 12, 24, 26, 22), (1, 9, 20, 8, 13, 23, 26, 24),
+      (2, 10, 20, 9, 14, 25, 26, 23), (3, 11, 20, 10, 15, 22, 26, 25),
+      (4, 19, 21, 16, 12, 22, 26, 24), (5, 16, 21, 17, 13, 24, 26, 23),
+      (6, 17, 21, 18, 14, 23, 26, 25), (7, 18, 21, 19, 15, 25, 26, 22)]],
+    interleave=True
+)
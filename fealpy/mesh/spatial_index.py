@@ -0,0 +1,256 @@
+
+from typing import Tuple, Optional
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse.utils import csr_row_pointer, index_ranges
+
+
+class CellLocator():
+    """Uniform-bin spatial index of the cells of a simplex mesh.
+
+    The bounding box of the mesh is divided into bins of equal size, about four
+    bins per cell, and every bin lists the cells whose bounding box overlaps it.
+    A point is then tested only against the cells listed in its bin, and
+    the barycentric coordinates of the test are returned as well.
+
+    All the work is done by vectorized backend operations, both in building
+    the index and in the batched queries.
+
+    The locator records the node and cell arrays it was built from, and
+    rebuilds itself lazily when the mesh has changed, e.g. after
+    `uniform_refine` or `bisect`. The bin grid is kept if the refined
+    mesh still lies in it, and only the bin size is adapted to the new
+    number of cells.
+
+    Examples:
+        >>> locator = CellLocator(mesh)
+        >>> cell, bc = locator.locate(points)
+    """
+    def __init__(self, mesh, *, cells_per_bin: float=0.25):
+        """
+        Parameters:
+            mesh (SimplexMesh): A simplex mesh whose geometric dimension equals\
+                its topological dimension, such as TriangleMesh in 2-d and\
+                TetrahedronMesh in 3-d.
+            cells_per_bin (float, optional): The average number of cells per bin.\
+                Default is 0.25.
+        """
+        GD = mesh.geo_dimension()
+        TD = mesh.top_dimension()
+        if GD != TD:
+            raise ValueError("CellLocator requires the geometric dimension to be "
+                             f"equal to the topological dimension, but got GD={GD}, TD={TD}.")
+        self.mesh = mesh
+        self.cells_per_bin = cells_per_bin
+        self._node = None
+        self._cell = None
+        self.origin = None
+        self.refresh()
+
+    def is_outdated(self) -> bool:
+        """Whether the mesh has changed since the locator was built."""
+        return (self.mesh.node is not self._node) or (self.mesh.cell is not self._cell)
+
+    def refresh(self, force: bool=False):
+        """Rebuild the index if the mesh has changed, or if `force` is True."""
+        if (not force) and (not self.is_outdated()):
+            return self
+
+        mesh = self.mesh
+        node = mesh.entity('node')
+        cell = mesh.entity('cell')
+        NC = cell.shape[0]
+        GD = node.shape[1]
+        kwargs = bm.context(cell)
+
+        # 1. affine maps from the cells to the barycentric coordinates,
+        # lambda_i = sum_j affine[c, i-1, j] x_j + affine[c, i-1, GD], i >= 1
+        x0 = node[cell[:, 0]]
+        J = bm.stack([node[cell[:, i]] - x0 for i in range(1, GD+1)], axis=-1) # (NC, GD, TD)
+        Jinv = bm.linalg.inv(J)
+        shift = -bm.einsum('cij, cj -> ci', Jinv, x0)
+        affine = bm.concat([Jinv, shift[..., None]], axis=-1) # (NC, TD, GD+1)
+        # NOTE: stored by coefficients, so that gathering one coefficient of
+        # many cells reads contiguous memory.
+        self.affine = [[bm.copy(affine[:, i, j]) for j in range(GD+1)] for i in range(GD)]
+
+        # 2. the bin grid, kept if the mesh lies in the current one
+        cmin = bm.min(node[cell], axis=1)
+        cmax = bm.max(node[cell], axis=1)
+        lower = bm.min(cmin, axis=0)
+        upper = bm.max(cmax, axis=0)
+        if (self.origin is None) or bool(bm.any(lower < self.origin)) or \
+                bool(bm.any(upper > self.origin + self.length)):
+            self.origin = lower
+            self.length = upper - lower
+
+        nbin = max(int(NC / self.cells_per_bin), 1)
+        h = float(bm.prod(self.length)) / nbin
+        h = h ** (1.0 / GD)
+        shape = bm.astype(bm.ceil(self.length / h), bm.int64)
+        shape = bm.where(shape > 0, shape, 1)
+        self.h = h
+        self.shape = tuple(int(n) for n in bm.to_numpy(shape))
+
+        # 3. enumerate the bins overlapped by the bounding box of every cell
+        lo = self._bin_coordinate(cmin)
+        hi = self._bin_coordinate(cmax)
+        width = hi - lo + 1
+        count = bm.prod(width, axis=1)
+        local = index_ranges(bm.zeros((NC, ), dtype=count.dtype, device=bm.get_device(cell)), count)
+        seg = bm.repeat(bm.arange(NC, **kwargs), count)
+
+        flat = bm.zeros(local.shape, dtype=bm.int64, device=bm.get_device(cell))
+        for i in range(GD):
+            w = width[seg, i]
+            flat = flat * self.shape[i] + lo[seg, i] + local % w
+            local = local // w
+
+        order = bm.argsort(flat, stable=True)
+        self.bin2cell = seg[order]
+        self.bin_ptr = csr_row_pointer(flat[order], self.number_of_bins())
+
+        self._node = mesh.node
+        self._cell = mesh.cell
+        return self
+
+    def number_of_bins(self) -> int:
+        n = 1
+        for s in self.shape:
+            n *= s
+        return n
+
+    def _bin_coordinate(self, points: TensorLike) -> TensorLike:
+        """Return the multi-index of the bins containing the points, clipped to the grid."""
+        idx = bm.astype(bm.floor((points - self.origin) / self.h), bm.int64)
+        upper = bm.tensor(self.shape, dtype=bm.int64, device=bm.get_device(idx)) - 1
+        idx = bm.where(idx < 0, 0, idx)
+        return bm.where(idx > upper, upper, idx)
+
+    def candidates(self, points: TensorLike, *, tol: float=1e-12):
+        """Return the (point, cell) pairs to be tested.
+
+        Returns:
+            Tuple[Tensor, Tensor, Tensor]: the index of points and the index of\
+                cells of the pairs, grouped by points in order; and the number\
+                of pairs of every point.
+        """
+        NP, GD = points.shape
+        kwargs = bm.context(self.bin_ptr)
+        eps = tol * (1.0 + bm.max(bm.abs(self.length)))
+        lower = self.origin - eps
+        upper = self.origin + self.length + eps
+        inbox = bm.all((points >= lower) & (points <= upper), axis=1)
+
+        idx = self._bin_coordinate(points)
+        flat = bm.zeros((NP, ), dtype=bm.int64, device=bm.get_device(points))
+        for i in range(GD):
+            flat = flat * self.shape[i] + idx[:, i]
+        flat = bm.astype(flat, self.bin_ptr.dtype)
+
+        start = self.bin_ptr[flat]
+        count = self.bin_ptr[flat + 1] - start
+        count = bm.where(inbox, count, 0)
+        pidx = bm.repeat(bm.arange(NP, **kwargs), count)
+        cidx = self.bin2cell[index_ranges(start, count)]
+        return pidx, cidx, count
+
+    def box_candidates(self, lower: TensorLike, upper: TensorLike):
+        """Return the (box, cell) pairs of the cells in the bins overlapped by
+        the boxes [lower, upper], both shaped (NB, GD).
+
+        Returns:
+            Tuple[Tensor, Tensor]: the index of boxes and the index of cells\
+                of the pairs. A cell may appear several times for one box.
+        """
+        NB, GD = lower.shape
+        kwargs = bm.context(self.bin_ptr)
+        lo = self._bin_coordinate(lower)
+        width = self._bin_coordinate(upper) - lo + 1
+        nbin = bm.prod(width, axis=1)
+        bidx = bm.repeat(bm.arange(NB, **kwargs), nbin)
+        local = index_ranges(bm.zeros((NB, ), **kwargs), bm.astype(nbin, kwargs['dtype']))
+
+        flat = bm.zeros(local.shape, dtype=bm.int64, device=bm.get_device(lower))
+        for i in range(GD):
+            w = width[bidx, i]
+            flat = flat * self.shape[i] + lo[bidx, i] + local % w
+            local = local // w
+        flat = bm.astype(flat, self.bin_ptr.dtype)
+
+        start = self.bin_ptr[flat]
+        count = self.bin_ptr[flat + 1] - start
+        return bm.repeat(bidx, count), self.bin2cell[index_ranges(start, count)]
+
+    def barycentric(self, points: TensorLike, index: TensorLike) -> TensorLike:
+        """Return the barycentric coordinates of the points in the given cells,
+        shaped (NP, TD+1)."""
+        lam = self._lambda(points, index)
+        return bm.stack([1.0 - sum(lam), ] + lam, axis=1)
+
+    def _lambda(self, points: TensorLike, index: TensorLike, pindex: Optional[TensorLike]=None):
+        """Return the list of lambda_1, ..., lambda_TD of points[pindex] in the cells."""
+        GD = points.shape[1]
+        if pindex is None:
+            x = [points[:, j] for j in range(GD)]
+        else:
+            x = [points[:, j][pindex] for j in range(GD)]
+        lam = []
+        for coef in self.affine:
+            val = coef[GD][index]
+            for j in range(GD):
+                val = val + coef[j][index] * x[j]
+            lam.append(val)
+        return lam
+
+    def locate(self, points: TensorLike, *, tol: float=1e-12,
+               chunk_size: Optional[int]=2**16) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points.
+
+        Parameters:
+            points (Tensor): The points, shaped (NP, GD).
+            tol (float, optional): The tolerance of the barycentric coordinates,\
+                points within it outside of a cell are counted in. Default is 1e-12.
+            chunk_size (int | None, optional): The number of points processed\
+                at once, bounding the memory of the queries. Default is 2**16.
+
+        Returns:
+            Tuple[Tensor, Tensor]: the cell index of the points shaped (NP, ),\
+                -1 for the points not in the mesh; and the barycentric\
+                coordinates shaped (NP, TD+1), zeros for the points not in the mesh.
+
+        Note:
+            A point on the boundary of several cells is located in one of them.
+        """
+        self.refresh()
+        NP = points.shape[0]
+        if (chunk_size is None) or (NP <= chunk_size):
+            return self._locate(points, tol)
+
+        results = [self._locate(points[s:s+chunk_size], tol)
+                   for s in range(0, NP, chunk_size)]
+        return (bm.concat([r[0] for r in results], axis=0),
+                bm.concat([r[1] for r in results], axis=0))
+
+    def _locate(self, points: TensorLike, tol: float):
+        NP, GD = points.shape
+        pidx, cidx, count = self.candidates(points, tol=tol)
+        lam = self._lambda(points, cidx, pidx)
+        inside = (1.0 - sum(lam)) >= -tol
+        for val in lam:
+            inside = inside & (val >= -tol)
+
+        # the first inside cell of every point, pairs are grouped by points
+        kwargs = bm.context(pidx)
+        acc = bm.cumsum(bm.astype(inside, pidx.dtype), axis=0)
+        prev = bm.concat([bm.zeros((1, ), **kwargs), acc[:-1]], axis=0)
+        start = bm.cumsum(count, axis=0) - count
+        first = inside & ((acc - prev[start[pidx]]) == 1)
+
+        index = pidx[first]
+        cell = bm.full((NP, ), -1, **bm.context(cidx))
+        cell = bm.set_at(cell, index, cidx[first])
+        bc = bm.zeros((NP, GD+1), **bm.context(points))
+        bc = bm.set_at(bc, index, self.barycentric(points[index], cidx[first]))
+        return cell, bc
@@ -0,0 +1,132 @@
+
+from typing import Union, Tuple, Dict, Hashable, Callable, Any
+from collections import OrderedDict
+from functools import partial
+from threading import Lock
+import hashlib
+import weakref
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+_KEYS: Dict[int, Tuple[weakref.ref, Tuple[Hashable, ...]]] = {}
+
+def _forget(i: int, ref: weakref.ref):
+    entry = _KEYS.get(i)
+    if entry is not None and entry[0] is ref:
+        del _KEYS[i]
+
+
+def points_key(points: Union[TensorLike, Tuple[TensorLike, ...]]) -> Tuple[Hashable, ...]:
+    """Return a hashable key of the reference points made of the backend,
+    device, dtype, shape and the digest of the values. A tuple of tensors,
+    as the points of tensor-product meshes, is keyed element-wise.
+
+    The key of a tensor is memoized while it is alive, so the points held by
+    a quadrature formula are hashed once. They must not be modified in place.
+    """
+    if isinstance(points, tuple):
+        return tuple(points_key(p) for p in points)
+    entry = _KEYS.get(id(points))
+    if entry is not None and entry[0]() is points:
+        return entry[1]
+
+    values = np.ascontiguousarray(bm.to_numpy(points))
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+    key = (bm.backend_name, str(bm.get_device(points)), str(values.dtype),
+           values.shape, digest)
+    try:
+        ref = weakref.ref(points, partial(_forget, id(points)))
+    except TypeError: # not weakly referenceable
+        return key
+    _KEYS[id(points)] = (ref, key)
+    return key
+
+
+def _on_cpu(points) -> bool:
+    if isinstance(points, tuple):
+        return all(_on_cpu(p) for p in points)
+    return 'cpu' in str(bm.get_device(points)).lower()
+
+
+def _is_traced(points) -> bool:
+    """Whether the points require gradients, or are traced by jax."""
+    if isinstance(points, tuple):
+        return any(_is_traced(p) for p in points)
+    return bool(getattr(points, 'requires_grad', False)) or \
+           type(points).__name__.endswith('Tracer')
+
+
+def _readonly(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+    return value
+
+
+class TabulationCache():
+    """A process-wide least-recently-used cache of the basis tabulated on
+    reference points, such as the values, gradients and Hessians of the
+    shape functions on the quadrature points.
+
+    Every mesh and space with the same reference basis shares one table, so
+    the integrators of a model tabulate the basis once for every (p, q).
+    The cached arrays are read-only for the numpy backend; tensors of other
+    backends must not be modified in place either.
+
+    Tables are not cached for points requiring gradients or traced by jax,
+    as the tables are then part of the autograd graph or the trace, and for
+    points on other devices than the CPU, where keying the points would copy
+    them to the host.
+    """
+    def __init__(self, maxsize: int=256):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, but got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, name: str, points: Union[TensorLike, Tuple[TensorLike, ...]],
+            func: Callable[[], Any], *args: Hashable) -> Any:
+        """Return the table `name` on the points, computed by `func()` if not cached.
+
+        Parameters:
+            name (str): The name of the table, e.g. 'simplex_shape_function'.
+            points (Tensor | Tuple[Tensor, ...]): The reference points.
+            func (Callable): Computing the table.
+            *args (Hashable): Other parameters of the table, such as the degree.
+        """
+        if _is_traced(points) or not _on_cpu(points):
+            return func()
+        key = (name, ) + args + points_key(points)
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+
+        value = _readonly(func())
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all the tables and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+tabulation_cache = TabulationCache()
@@ -3,9 +3,10 @@ from math import sqrt
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .mesh_base import SimplexMesh
+from .utils import cachedmethod
 from .plot import Plotable
-from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
-from scipy.sparse import spdiags, eye, tril, triu, bmat
+from .refine_topology import parent_topology, refine_topology, TETRAHEDRON
+from .prolongation import edge_prolongation
 
 class TetrahedronMesh(SimplexMesh, Plotable): 
     def __init__(self, node, cell):
@@ -193,9 +194,9 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         localFace = self.localFace
         node = self.node
         cell = self.cell
-        NC = self.number_of_cells() if index == _S else len(index)
-        Dlambda = bm.zeros((NC, 4, 3), device=self.device, dtype=self.ftype)
         volume = self.entity_measure('cell', index=index)
+        NC = volume.shape[0]
+        Dlambda = bm.zeros((NC, 4, 3), device=self.device, dtype=self.ftype)
         for i in range(4):
             j,k,m = localFace[i]
             vjk = node[cell[index, k],:] - node[cell[index, j],:]
@@ -268,6 +269,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         NC = self.number_of_cells()
         return NN + NE*(p-1) + NF*(p-2)*(p-1)//2 + NC*(p-3)*(p-2)*(p-1)//6
 
+    @cachedmethod
     def interpolation_points(self, p, index=_S):
         """
         @brief 获取整个四面体网格上的全部插值点
@@ -314,6 +316,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
                     node[cell,:]).reshape(-1, GD)
         return ipoints[index]
 
+    @cachedmethod
     def face_to_ipoint(self, p, index=_S):
         """
         @brief 获取网格中每个三角形面与插值点的对应关系
@@ -353,6 +356,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
         return face2ipoint[index]
 
+    @cachedmethod
     def cell_to_ipoint(self, p, index=_S):
         """
         @brief 获取单元与插值点的对应关系
@@ -446,17 +450,26 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
 
 
-    def uniform_refine(self, n=1, returnim=False):
+    def uniform_refine(self, n=1, returnim=False, *, incremental: bool=False):
         """
         Perform uniform refinement on the tetrahedral mesh.
 
         @param n Number of refinement iterations (default: 1)
+
+        @param incremental derive the topology of the refined mesh from the
+        parent mesh in O(N) instead of calling `construct()`. The faces and
+        edges are then numbered by the parent entities they lie in, rather
+        than in the lexicographic order, see `refine_topology`.
+
+        @param returnim Return the list of the interpolation matrices of the
+        linear nodal functions from every mesh to the refined one, as
+        `CSRTensor` shaped (NN_fine, NN_coarse), from the coarsest.
         """
         if returnim:
-            nodeIMatrix = []
-            cellIMatrix = []
+            IM = []
 
         for i in range(n):
+            parent = parent_topology(self) if incremental else None
             NN = self.number_of_nodes()
             NC = self.number_of_cells()
             NE = self.number_of_edges()
@@ -472,14 +485,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             self.node = bm.concatenate((node, newNode), axis=0)
 
             if returnim:
-                A = coo_matrix((bm.ones(NN), (range(NN), range(NN))), shape=(NN+NE, NN), dtype=self.ftype)
-                A += coo_matrix((0.5*bm.ones(NE), (range(NN, NN+NE), edge[:, 0])), shape=(NN+NE, NN), dtype=self.ftype)
-                A += coo_matrix((0.5*bm.ones(NE), (range(NN, NN+NE), edge[:, 1])), shape=(NN+NE, NN), dtype=self.ftype)
-                nodeIMatrix.append(A.tocsr())
-
-                B = eye(NC, dtype=self.ftype)
-                B = bmat([[B], [B], [B], [B], [B], [B], [B], [B]])
-                cellIMatrix.append(B.tocsr())
+                IM.append(edge_prolongation(NN, edge, dtype=self.ftype, device=self.device))
 
             p = edge2newNode[cell2edge]
             newCell = bm.zeros((8*NC, 4), dtype=self.itype)
@@ -524,9 +530,16 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),2) , p[bm.arange(NC), T[:, 4]])
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),3) , p[bm.arange(NC), T[:, 5]])
             self.cell = newCell
-            self.construct()
+            if incremental:
+                refine_topology(self, parent, TETRAHEDRON, idx)
+            else:
+                self.construct()
 
             #self.ds.reinit(NN+NE, newCell)
+
+        if returnim:
+            return IM
+
     def circumcenter(self, index=_S, returnradius=False):
         """
         @brief 计算外接圆圆心和半径
@@ -606,6 +619,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         return options
            
     def bisect(self, isMarkedCell=None, data=None, returnim=False, options={'disp': True}):
+        from scipy.sparse import coo_matrix, csr_matrix, eye, bmat
 
         if options['disp']:
             print('Bisection begining.......')
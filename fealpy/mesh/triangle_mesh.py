@@ -1,18 +1,20 @@
 from typing import Union, Optional, Callable
+import math
 
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
 
-from .utils import simplex_gdof, simplex_ldof
+from .utils import simplex_gdof, simplex_ldof, cachedmethod
 from .mesh_base import SimplexMesh, estr2dim
 from .plot import Plotable
+from .refine_topology import parent_topology, refine_topology, TRIANGLE
+from .prolongation import edge_prolongation
+from .tabulation import tabulation_cache
 
 from fealpy.sparse.coo_tensor import COOTensor
 from fealpy.sparse.csr_tensor import CSRTensor
 
-from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
-from scipy.sparse import spdiags, eye, tril, triu, bmat
 
 class TriangleMesh(SimplexMesh, Plotable):
     def __init__(self, node: TensorLike, cell: TensorLike) -> None:
@@ -105,7 +107,10 @@ class TriangleMesh(SimplexMesh, Plotable):
         """
         @berif 这里调用的是网格空间基函数的梯度
         """
-        R = bm.simplex_grad_shape_function(bc, p)
+        R = tabulation_cache.get(
+            'simplex_grad_shape_function', bc,
+            lambda: bm.simplex_grad_shape_function(bc, p), p
+        )
         if variables == 'x':
             Dlambda = self.grad_lambda(index=index)
             gphi = bm.einsum('...ij, kjm -> k...im', R, Dlambda)
@@ -139,6 +144,7 @@ class TriangleMesh(SimplexMesh, Plotable):
         num = (NN, NE, NC)
         return simplex_gdof(p, num)
     
+    @cachedmethod
     def interpolation_points(self, p: int, index: Index=_S):
         """Fetch all p-order interpolation points on the triangle mesh."""
         node = self.entity('node')
@@ -176,6 +182,7 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         return bm.concatenate(ipoint_list, axis=0)[index]  # (gdof, GD)
 
+    @cachedmethod
     def cell_to_ipoint(self, p: int, index: Index=_S):
         """
         Get the map from local index to global index for interpolation points.
@@ -264,12 +271,25 @@ class TriangleMesh(SimplexMesh, Plotable):
         length = bm.sqrt(bm.square(v).sum(axis=1))
         return v/length.reshape(-1, 1)
 
-    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False):
+    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False, *,
+                       incremental: bool=False):
         """
+        @brief Uniformly refine the triangle mesh n times.
+
+        @param incremental: derive the topology of the refined mesh from the
+        parent mesh in O(N) instead of calling `construct()`. The faces and
+        edges are then numbered by the parent entities they lie in, rather
+        than in the lexicographic order, see `refine_topology`.
 
+        @param returnim: return the list of the interpolation matrices of the
+        linear nodal functions from every mesh to the refined one, as
+        `CSRTensor` shaped (NN_fine, NN_coarse), from the coarsest.
         """
+        if returnim:
+            IM = []
 
         for i in range(n):
+            parent = parent_topology(self) if incremental else None
             NN = self.number_of_nodes()
             NC = self.number_of_cells()
             NE = self.number_of_edges()
@@ -280,31 +300,59 @@ class TriangleMesh(SimplexMesh, Plotable):
             edge2newNode = bm.arange(NN, NN + NE, dtype=self.itype, device=self.device)
             newNode = (node[edge[:, 0], :] + node[edge[:, 1], :]) / 2.0
 
+            if returnim:
+                IM.append(edge_prolongation(NN, edge, dtype=self.ftype, device=self.device))
+
             self.node = bm.concatenate((node, newNode), axis=0)
             p = bm.concatenate((cell, edge2newNode[cell2edge]), axis=1)
             self.cell = bm.concatenate(
                     (p[:,[0,5,4]], p[:,[5,1,3]], p[:,[4,3,2]], p[:,[3,4,5]]),
                     axis=0)
-            self.construct()
+            if incremental:
+                refine_topology(self, parent, TRIANGLE)
+            else:
+                self.construct()
+
+        if returnim:
+            return IM
 
     def is_crossed_cell(self, point, segment):
         """
-        @berif 给定一组线段，找到这些线段的一个邻域单元集合, 且这些单元要满足一定的连通
-        性
-        """
-        pass
-    
-    def location(self, points):
+        @berif 给定一组线段，找到这些线段穿过的单元
+
+        @param point: 线段端点的坐标, (NP, 2)
+        @param segment: 线段端点的编号, (NS, 2)
+        @return: 被线段穿过的单元的标记, (NC, )
         """
-        @breif  给定一组点 p , 找到这些点所在的单元
+        locator = self.cell_locator()
+        NC = self.number_of_cells()
+        p0 = point[segment[:, 0]]
+        p1 = point[segment[:, 1]]
 
-        这里假设：
+        # the candidate (segment, cell) pairs from the bins overlapped by the segments
+        sidx, cidx = locator.box_candidates(bm.where(p0 < p1, p0, p1),
+                                            bm.where(p0 < p1, p1, p0))
 
-        1. 所有点在网格内部，
-        2. 网格中没有洞
-        3. 区域还要是凸的
-        """
-        pass
+        # the separating axis test of the segments and the triangles
+        node = self.entity('node')
+        tri = node[self.entity('cell')[cidx]] # (NPair, 3, 2)
+        a, c = p0[sidx], p1[sidx]
+        d = c - a
+        s = d[:, None, 0] * (tri[..., 1] - a[:, None, 1]) - d[:, None, 1] * (tri[..., 0] - a[:, None, 0])
+        separated = bm.all(s > 0, axis=1) | bm.all(s < 0, axis=1)
+        for k in range(3):
+            v0 = tri[:, (k+1)%3]
+            v1 = tri[:, (k+2)%3]
+            e = v1 - v0
+            def side(x):
+                return e[:, 0] * (x[..., 1] - v0[:, 1]) - e[:, 1] * (x[..., 0] - v0[:, 0])
+            inner = side(tri[:, k])
+            sa, sc = side(a), side(c)
+            separated = separated | ((sa * inner < 0) & (sc * inner < 0))
+
+        isCrossed = bm.zeros((NC, ), dtype=bm.bool, device=bm.get_device(cidx))
+        isCrossed = bm.set_at(isCrossed, cidx[~separated], True)
+        return isCrossed
 
     def circumcenter(self, index: Index=_S, returnradius=False):
         """
@@ -398,273 +446,286 @@ class TriangleMesh(SimplexMesh, Plotable):
         }
         return options
 
-    def bisect(self, isMarkedCell=None, options={'disp': True}): #TODO
-        if options['disp']:
-            print('Bisection begining......')
+    def bisect(self, isMarkedCell=None, options={'disp': True}, *, returnim=False):
+        """Refine the marked cells by the newest vertex bisection.
+
+        The newest vertex of a cell is `cell[:, 0]`, and the opposite edge is
+        its refinement edge. The conforming closure marks the refinement edges
+        front by front, and every cell is bisected at most twice, both by array
+        operations over all the cells.
 
+        Parameters:
+            isMarkedCell (Tensor | None): The flag of the cells to refine,\
+                all the cells are refined if None.
+            options (dict): See `bisect_options`.
+                - 'data': a dict of data to be transferred to the new mesh in\
+                  place. Data shaped (NC, ) are piecewise constants, data shaped\
+                  (NN, ...) are nodal values interpolated linearly, and data\
+                  shaped (NC, ldof) are Lagrange dofs on cells of degree p.
+                - 'HB': if present, set to the index of the parent cell of\
+                  every new cell.
+                - 'IM': if present, set to the prolongation matrix.
+                - 'disp': whether to log the sizes of the mesh.
+            returnim (bool): Whether to return the prolongation matrix.
+
+        Returns:
+            CSRTensor: The prolongation of the nodal values shaped (NN_new, NN),\
+                only returned if `returnim` is True.
+        """
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
         NE = self.number_of_edges()
+        kwargs = {'dtype': self.itype, 'device': self.device}
 
-        if options['disp']:
-            print('Current number of nodes:', NN)
-            print('Current number of edges:', NE)
-            print('Current number of cells:', NC)
+        if options.get('disp', False):
+            logger.info(f'Bisection begins with {NN} nodes, {NE} edges and {NC} cells.')
 
         if isMarkedCell is None:
-            isMarkedCell = bm.ones(NC, dtype=bm.bool)
+            isMarkedCell = bm.ones(NC, dtype=bm.bool, device=self.device)
 
+        node = self.entity('node')
         cell = self.entity('cell')
         edge = self.entity('edge')
-
         cell2edge = self.cell_to_edge()
-        cell2cell = self.cell_to_cell()
-        #cell2ipoint = self.cell_to_ipoint(self.p)
-        isCutEdge = bm.zeros((NE,), dtype=bm.bool, device=self.device)
-
-        if options['disp']:
-            print('The initial number of marked elements:', isMarkedCell.sum())
+        edge2cell = self.face_to_cell()
+        refEdge = cell2edge[:, 0]
 
+        # 1. conforming closure: a cell with a cut edge must cut its
+        # refinement edge. Every front cuts new edges, so the number of
+        # fronts is bounded by the length of the longest refinement chain.
+        isCutEdge = bm.zeros((NE,), dtype=bm.bool, device=self.device)
         markedCell, = bm.nonzero(isMarkedCell)
-        while len(markedCell) > 0:
-            isCutEdge = bm.set_at(isCutEdge, cell2edge[markedCell, 0], True)
-            refineNeighbor = cell2cell[markedCell, 0]
-            markedCell = refineNeighbor[~isCutEdge[cell2edge[refineNeighbor, 0]]]
-
-        if options['disp']:
-            print('The number of markedg edges: ', isCutEdge.sum())
-
-        edge2newNode = bm.zeros((NE,), dtype=self.itype, device=self.device)
-        edge2newNode = bm.set_at(edge2newNode, isCutEdge, bm.arange(NN, NN + isCutEdge.sum(), dtype=self.itype, device=self.device))
-
-        node = self.node
-        newNode = 0.5 * (node[edge[isCutEdge, 0], :] + node[edge[isCutEdge, 1], :])
-        self.node = bm.concatenate((node, newNode), axis=0)
-        cell2edge0 = cell2edge[:, 0]
-
-        if 'data' in options:
-            pass
-
-        if 'IM' in options:
-            nn = len(newNode)
-            IM = COOTensor( indices=bm.stack((bm.arange(NN), bm.arange(NN)), axis=0),
-                            values=bm.ones(NN), 
-                            shape=(NN + nn, NN))
-            # IM = coo_matrix((bm.ones(NN), (bm.arange(NN), bm.arange(NN))),
-            #                 shape=(NN + nn, NN))
-            val = bm.full((nn,), 0.5)
-            IM += COOTensor(indices=bm.stack((NN + bm.arange(nn), edge[isCutEdge, 0]), axis=0),
-                            values=val,
-                            shape=(NN + nn, NN))
-            # IM += coo_matrix(
-            #     (
-            #         val,
-            #         (
-            #             NN + bm.arange(nn),
-            #             edge[isCutEdge, 0]
-            #         )
-            #     ), shape=(NN + nn, NN))
-            IM += COOTensor(indices=bm.stack((NN + bm.arange(nn), edge[isCutEdge, 1]), axis=0),
-                            values=val,
-                            shape=(NN + nn, NN))
-            # IM += coo_matrix(
-            #     (
-            #         val,
-            #         (
-            #             NN + bm.arange(nn),
-            #             edge[isCutEdge, 1]
-            #         )
-            #     ), shape=(NN + nn, NN))
-            options['IM'] = IM.tocsr()
-
-        if 'HB' in options:
-            options['HB'] = bm.arange(NC)
-
+        while markedCell.shape[0] > 0:
+            e = refEdge[markedCell]
+            isCutEdge = bm.set_at(isCutEdge, e, True)
+            neighbor = edge2cell[e, :2].reshape(-1)
+            markedCell = bm.unique(neighbor[~isCutEdge[refEdge[neighbor]]])
+
+        # 2. new nodes on the cut edges and the prolongation
+        cutEdge, = bm.nonzero(isCutEdge)
+        nn = cutEdge.shape[0]
+        edge2newNode = bm.full((NE,), -1, **kwargs)
+        edge2newNode = bm.set_at(edge2newNode, cutEdge, bm.arange(NN, NN + nn, **kwargs))
+        self.node = bm.concatenate((node, 0.5 * (node[edge[cutEdge, 0]] + node[edge[cutEdge, 1]])), axis=0)
+
+        if options.get('disp', False):
+            logger.info(f'The number of cut edges: {nn}')
+
+        IM = self._bisect_prolongation(NN, edge[cutEdge])
+        if ('IM' in options):
+            options['IM'] = IM
+
+        data = options.get('data', None)
+        if data is not None:
+            for key, value in data.items():
+                if (value.shape[0] == NN) and not ((value.ndim == 1) and (NN == NC)):
+                    data[key] = (IM @ value.reshape(NN, -1)).reshape((NN + nn, ) + value.shape[1:])
+
+        # 3. bisect the cells with a cut refinement edge, twice at most
+        parent = bm.arange(NC, **kwargs)
+        cell2edge0 = refEdge
         for k in range(2):
-            idx, = bm.nonzero(edge2newNode[cell2edge0] > 0)
-            nc = len(idx)
+            idx, = bm.nonzero(edge2newNode[cell2edge0] >= 0)
+            nc = idx.shape[0]
             if nc == 0:
                 break
 
-            if 'HB' in options:
-                HB = options['HB']
-                options['HB'] = bm.concatenate((HB, HB[idx]), axis=0)
-
-            L = idx
-            R = bm.arange(NC, NC + nc)
-            if ('data' in options) and (options['data'] is not None):
-                for key, value in options['data'].items():
-                    if value.shape == (NC,):  # 分片常数
-                        value = bm.concatenate((value[:], value[idx]))
-                        options['data'][key] = value
-                    #elif value.ndim == 2 and value.shape[0] == NC:  # 处理(NC, NQ)的情况
-                    #    value = bm.concatenate((value, value[idx, :])) 
-                    #    options['data'][key] = value
-                    elif value.shape == (NN + k * nn,):
-                        if k == 0:
-                            value = bm.concatenate((value, bm.zeros((nn,),  dtype=self.ftype, device=self.device)))
-                            value = bm.set_at(value , slice(NN, None), 0.5 * (value[edge[isCutEdge, 0]] + value[edge[isCutEdge, 1]]))
-                            options['data'][key] = value
+            if data is not None:
+                for key, value in data.items():
+                    if value.shape[0] != NC:
+                        continue
+                    if value.ndim == 1: # piecewise constants
+                        data[key] = bm.concatenate((value, value[idx]))
                     else:
-                        ldof = value.shape[-1]
-                        p = int((bm.sqrt(1 + 8 * bm.array(ldof)) - 3) // 2)
-                        bc = self.multi_index_matrix(p, etype=2) / p
-
-                        bcl = bm.zeros_like(bc, dtype=self.ftype, device=self.device)
-                        bcl = bm.set_at(bcl , (slice(None), 0), bc[:, 1])
-                        bcl = bm.set_at(bcl , (slice(None), 1), 0.5 * bc[:, 0] + bc[:, 2])
-                        bcl = bm.set_at(bcl , (slice(None), 2), 0.5 * bc[:, 0])
-
-                        bcr = bm.zeros_like(bc,dtype=self.ftype, device=self.device)
-                        bcr = bm.set_at(bcr , (slice(None), 0), bc[:, 2])
-                        bcr = bm.set_at(bcr , (slice(None), 1), 0.5 * bc[:, 0])
-                        bcr = bm.set_at(bcr , (slice(None), 2), 0.5 * bc[:, 0] + bc[:, 1])
-
-                        value = bm.concatenate((value, bm.zeros((nc, ldof), dtype=self.ftype, device=self.device)))
-
-                        phi = self.shape_function(bcr, p=p)
-                        value = bm.set_at(value , slice(NC , None), bm.einsum('cj,kj->ck', value[idx], phi))
-
-                        phi = self.shape_function(bcl, p=p)
-                        value = bm.set_at(value , (idx, slice(None)), bm.einsum('cj,kj->ck', value[idx], phi))
-
-                        options['data'][key] = value
+                        data[key] = self._bisect_cell_data(value, idx)
 
             p0 = cell[idx, 0]
             p1 = cell[idx, 1]
             p2 = cell[idx, 2]
             p3 = edge2newNode[cell2edge0[idx]]
-            cell = bm.concatenate((cell, bm.zeros((nc, 3), dtype=self.itype, device=self.device)), axis=0)
-            
-            cell = bm.set_at(cell , (L, 0), p3)
-            cell = bm.set_at(cell , (L, 1), p0)
-            cell = bm.set_at(cell , (L, 2), p1)
-            cell = bm.set_at(cell , (R, 0), p3)
-            cell = bm.set_at(cell , (R, 1), p2)
-            cell = bm.set_at(cell , (R, 2), p0)
+            cell = bm.concatenate((cell, bm.stack((p3, p2, p0), axis=1)), axis=0)
+            cell = bm.set_at(cell, idx, bm.stack((p3, p0, p1), axis=1))
+            parent = bm.concatenate((parent, parent[idx]))
+
             if k == 0:
-                cell2edge0 = bm.zeros((NC + nc,), dtype=self.itype, device=self.device)
-                cell2edge0 = bm.set_at(cell2edge0 , slice(NC) , cell2edge[:, 0])
-                cell2edge0 = bm.set_at(cell2edge0 , L , cell2edge[idx, 2])
-                cell2edge0 = bm.set_at(cell2edge0 , R , cell2edge[idx, 1])
+                cell2edge0 = bm.concatenate((refEdge, cell2edge[idx, 1]))
+                cell2edge0 = bm.set_at(cell2edge0, idx, cell2edge[idx, 2])
             NC = NC + nc
 
-        self.NN = self.node.shape[0]
+        if 'HB' in options:
+            options['HB'] = parent
+
         self.cell = cell
         self.construct()
 
-    def coarsen(self, isMarkedCell=None, options={}):
-        """
-        @brief
+        if options.get('disp', False):
+            logger.info(f'Bisection ends with {self.number_of_nodes()} nodes and {NC} cells.')
+
+        if returnim:
+            return IM
+
+    def _bisect_prolongation(self, NN: int, cutEdge: TensorLike) -> CSRTensor:
+        """The prolongation from the nodes to the nodes and the midpoints of
+        the cut edges, shaped (NN + nn, NN)."""
+        nn = cutEdge.shape[0]
+        kwargs = {'dtype': self.itype, 'device': self.device}
+        crow = bm.concatenate((bm.arange(NN, **kwargs), NN + 2*bm.arange(nn + 1, **kwargs)))
+        col = bm.concatenate((
+            bm.arange(NN, **kwargs),
+            bm.sort(cutEdge, axis=1).reshape(-1)
+        ))
+        val = bm.concatenate((
+            bm.ones((NN, ), dtype=self.ftype, device=self.device),
+            bm.full((2*nn, ), 0.5, dtype=self.ftype, device=self.device)
+        ))
+        return CSRTensor(crow, col, val, spshape=(NN + nn, NN))
+
+    def _bisect_cell_data(self, value: TensorLike, idx: TensorLike) -> TensorLike:
+        """Transfer the Lagrange dofs on cells, shaped (NC, ldof), to the two
+        children of the cells `idx`. The left child replaces its parent and
+        the right one is appended."""
+        ldof = value.shape[-1]
+        p = int((math.sqrt(1 + 8 * ldof) - 3) // 2)
+        bc = bm.astype(self.multi_index_matrix(p, etype=2), self.ftype) / p
+
+        # the barycentric coordinates of the interpolation points of the
+        # children in the parent
+        bcl = bm.stack((bc[:, 1], 0.5 * bc[:, 0] + bc[:, 2], 0.5 * bc[:, 0]), axis=1)
+        bcr = bm.stack((bc[:, 2], 0.5 * bc[:, 0], 0.5 * bc[:, 0] + bc[:, 1]), axis=1)
+        phil = self.shape_function(bcl, p=p)
+        phir = self.shape_function(bcr, p=p)
+
+        val = value[idx]
+        value = bm.concatenate((value, bm.einsum('cj, kj -> ck', val, phir)))
+        return bm.set_at(value, idx, bm.einsum('cj, kj -> ck', val, phil))
+
+    def coarsen(self, isMarkedCell=None, options={}, *, returnim=False):
+        """Coarsen the marked cells by removing the newest vertices.
+
+        A node is removed if it is the newest vertex of all the cells around
+        it, which are all marked, and it is an interior node of valence 4 or a
+        boundary node of valence 2. The two children of a bisection, with the
+        node at the midpoint of their edges [cell[L, 2], cell[R, 1]], are then
+        merged back. See https://lyc102.github.io/ifem/afem/coarsen/.
 
-        https://lyc102.github.io/ifem/afem/coarsen/
-        """
+        Parameters:
+            isMarkedCell (Tensor | None): The flag of the cells to coarsen.
+            options (dict):
+                - 'data': a dict of data to be transferred to the new mesh in\
+                  place, shaped as in `bisect`. Piecewise constants are averaged\
+                  and nodal values are restricted to the remaining nodes.
+                - 'HB': if present, set to the index of one child of every new cell.
+                - 'IM': if present, set to the restriction matrix.
+            returnim (bool): Whether to return the restriction matrix.
 
+        Returns:
+            CSRTensor: The restriction of the nodal values shaped (NN_new, NN),\
+                only returned if `returnim` is True.
+        """
         if isMarkedCell is None:
             return
 
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
-
-        cell = self.entity('cell')
         node = self.entity('node')
+        cell = self.entity('cell')
+        kwargs = {'dtype': self.itype, 'device': self.device}
+
+        # 1. the candidate nodes
+        valence = bm.zeros((NN, ), **kwargs)
+        valence = bm.index_add(valence, cell.reshape(-1), bm.ones((3*NC, ), **kwargs))
+        newest = cell[isMarkedCell, 0]
+        valenceNew = bm.zeros((NN, ), **kwargs)
+        valenceNew = bm.index_add(valenceNew, newest, bm.ones(newest.shape, **kwargs))
+        isGoodNode = (valence == valenceNew) & ((valence == 4) | (valence == 2))
+
+        # 2. pair the siblings: the cells L = [n, p0, p1] and R = [n, p2, p0]
+        # with n the midpoint of p1 and p2, and the index of L less than R.
+        star, = bm.nonzero(isGoodNode[cell[:, 0]])
+        n = cell[star, 0]
+        keyL = bm.astype(n, bm.int64) * NN + bm.astype(cell[star, 1], bm.int64)
+        keyR = bm.astype(n, bm.int64) * NN + bm.astype(cell[star, 2], bm.int64)
+        order = bm.argsort(keyR)
+        loc = bm.searchsorted(keyR[order], keyL)
+        loc = bm.where(loc < star.shape[0], loc, 0)
+        right = order[loc]
+        L, R = star, star[right]
+        isPair = (keyR[right] == keyL) & (L < R)
+        mid = 0.5 * (node[cell[L, 2]] + node[cell[R, 1]])
+        isPair = isPair & bm.all(bm.abs(mid - node[n]) <= 1e-12 * (1 + bm.abs(node[n])), axis=1)
+        L, R = L[isPair], R[isPair]
+
+        # keep the nodes whose cells are exactly paired
+        npair = bm.zeros((NN, ), **kwargs)
+        npair = bm.index_add(npair, cell[L, 0], bm.ones(L.shape, **kwargs))
+        count = bm.zeros((NC, ), **kwargs)
+        count = bm.index_add(count, L, bm.ones(L.shape, **kwargs))
+        count = bm.index_add(count, R, bm.ones(R.shape, **kwargs))
+        isGoodNode = isGoodNode & (2 * npair == valence)
+        isBadCell = bm.zeros((NN, ), dtype=bm.bool, device=self.device)
+        isBadCell = bm.set_at(isBadCell, cell[count > 1, 0], True)
+        isGoodNode = isGoodNode & ~isBadCell
+        flag = isGoodNode[cell[L, 0]]
+        L, R = L[flag], R[flag]
+
+        # 3. merge the pairs into L, and remove R and the nodes
+        data = options.get('data', None)
+        if data is not None:
+            for key, value in data.items():
+                if value.shape[0] != NC:
+                    continue
+                if value.ndim == 1:
+                    data[key] = bm.set_at(value, L, 0.5 * (value[L] + value[R]))
+                else:
+                    data[key] = self._coarsen_cell_data(value, L, R)
+
+        cell = bm.set_at(cell, L, bm.stack((cell[L, 1], cell[L, 2], cell[R, 1]), axis=1))
+        isKeepCell = bm.ones((NC, ), dtype=bm.bool, device=self.device)
+        isKeepCell = bm.set_at(isKeepCell, R, False)
+
+        isKeepNode = ~isGoodNode
+        NN_new = int(bm.sum(isKeepNode))
+        keepNode, = bm.nonzero(isKeepNode)
+        idxMap = bm.zeros((NN, ), **kwargs)
+        idxMap = bm.set_at(idxMap, keepNode, bm.arange(NN_new, **kwargs))
+        IM = CSRTensor(bm.arange(NN_new + 1, **kwargs), keepNode,
+                       bm.ones((NN_new, ), dtype=self.ftype, device=self.device),
+                       spshape=(NN_new, NN))
+
+        if data is not None:
+            for key, value in data.items():
+                if value.shape[0] == NC:
+                    data[key] = value[isKeepCell]
+                elif value.shape[0] == NN:
+                    data[key] = value[isKeepNode]
+        if 'HB' in options:
+            options['HB'], = bm.nonzero(isKeepCell)
+        if 'IM' in options:
+            options['IM'] = IM
 
-        valence = bm.zeros(NN, dtype=self.itype, device=self.device)
-        bm.add_at(valence, cell, 1)
-
-        valenceNew = bm.zeros(NN, dtype=self.itype, device=self.device)
-        bm.add_at(valenceNew, cell[isMarkedCell][:, 0], 1)
-
-        isIGoodNode = (valence == valenceNew) & (valence == 4)
-        isBGoodNode = (valence == valenceNew) & (valence == 2)
-
-        node2cell = self.node_to_cell()
-
-        I, J = bm.nonzero(node2cell[isIGoodNode, :])
-        nodeStar = J.reshape(-1, 4)
-
-        ix = (cell[nodeStar[:, 0], 2] == cell[nodeStar[:, 3], 1])
-        iy = (cell[nodeStar[:, 1], 1] == cell[nodeStar[:, 2], 2])
-        nodeStar = bm.set_at(nodeStar , ix & (~iy) ,nodeStar[ix & (~iy), :][:, [0, 2, 1, 3]])
-        nodeStar = bm.set_at(nodeStar , (~ix) & iy ,nodeStar[(~ix) & iy, :][:, [0, 3, 1, 2]])
-
-        t0 = nodeStar[:, 0]
-        t1 = nodeStar[:, 1]
-        t2 = nodeStar[:, 2]
-        t3 = nodeStar[:, 3]
-
-        p1 = cell[t0, 2]
-        p2 = cell[t1, 1]
-        p3 = cell[t0, 1]
-        p4 = cell[t2, 1]
-
-        cell = bm.set_at(cell , (t0, 0) , p3)
-        cell = bm.set_at(cell , (t0, 1) , p1)
-        cell = bm.set_at(cell , (t0, 2) , p2)
-        cell = bm.set_at(cell , (t1, 0) , -1)
-
-        cell = bm.set_at(cell , (t2, 0) , p4)
-        cell = bm.set_at(cell , (t2, 1) , p2)
-        cell = bm.set_at(cell , (t2, 2) , p1)
-        cell = bm.set_at(cell , (t3, 0) , -1)
-
-        I, J = bm.nonzero(node2cell[isBGoodNode, :])
-        nodeStar = J.reshape(-1, 2)
-        idx = (cell[nodeStar[:, 0], 2] == cell[nodeStar[:, 1], 1])
-        nodeStar = bm.set_at(nodeStar , idx , nodeStar[idx, :][:, [0, 1]])
-
-        t4 = nodeStar[:, 0]
-        t5 = nodeStar[:, 1]
-        p0 = cell[t4, 0]
-        p1 = cell[t4, 2]
-        p2 = cell[t5, 1]
-        p3 = cell[t4, 1]
-        cell = bm.set_at(cell , (t4, 0) , p3)
-        cell = bm.set_at(cell , (t4, 1) , p1)
-        cell = bm.set_at(cell , (t4, 2) , p2)
-        cell = bm.set_at(cell , (t5, 0) , -1)
-
-        isKeepCell = cell[:, 0] > -1
-        if ('data' in options) and (options['data'] is not None):
-            # value.shape == (NC, (p+1)*(p+2)//2)
-            lidx = bm.concatenate((t0, t2, t4))
-            ridx = bm.concatenate((t1, t3, t5))
-            for key, value in options['data'].items():
-                ldof = value.shape[1]
-                p = int((bm.sqrt(8 * ldof + 1) - 3) / 2)
-                bc = self.multi_index_matrix(p=p, etype=2) / p
-                bcl = bm.zeros_like(bc)
-                bcl = bm.set_at(bcl , (slice(None), 0) , 2 * bc[:, 2])
-                bcl = bm.set_at(bcl , (slice(None), 1) , bc[:, 0])
-                bcl = bm.set_at(bcl , (slice(None), 2) , bc[:, 1] - bc[:, 2])
- 
-                bcr = bm.zeros_like(bc)
-                bar = bm.set_at(bcr , (slice(None), 0) , 2 * bc[:, 1])
-                bar = bm.set_at(bcr , (slice(None), 1) , bc[:, 2] - bc[:, 1])
-                bar = bm.set_at(bcr , (slice(None), 2) , bc[:, 0])
-
-                phi = self.shape_function(bcl, p=p)  # (NQ, ldof)
-                value = bm.set_at(value , lidx , bm.einsum('ci, qi->cq', value[lidx, :], phi))
-
-                phi = self.shape_function(bcr, p=p)  # (NQ, ldof)
-
-                value = bm.add_at(value , lidx , bm.einsum('ci, qi->cq', value[ridx, :], phi))
-                value = bm.set_at(value , lidx , 0.5 * value[lidx])
-                options['data'] = bm.set_at(options['data'],key , value[isKeepCell])
-
-        cell = cell[isKeepCell]
-        isGoodNode = (isIGoodNode | isBGoodNode)
-
-        idxMap = bm.zeros(NN, dtype=self.itype, device=self.device)
-        self.node = node[~isGoodNode]
-
-        NN = self.node.shape[0]
-        idxMap = bm.set_at(idxMap , ~isGoodNode , bm.arange(NN))
-        cell = idxMap[cell]
-
-        self.cell = cell
+        self.node = node[isKeepNode]
+        self.cell = idxMap[cell[isKeepCell]]
         self.construct()
 
+        if returnim:
+            return IM
+
+    def _coarsen_cell_data(self, value: TensorLike, L: TensorLike, R: TensorLike) -> TensorLike:
+        """Transfer the Lagrange dofs on cells, shaped (NC, ldof), from the
+        children L and R to their parent, which replaces L."""
+        ldof = value.shape[-1]
+        p = int((math.sqrt(1 + 8 * ldof) - 3) // 2)
+        bc = bm.astype(self.multi_index_matrix(p, etype=2), self.ftype) / p
+
+        # the barycentric coordinates of the interpolation points of the parent
+        # [p0, p1, p2] in L = [n, p0, p1] and R = [n, p2, p0]
+        bcl = bm.stack((2 * bc[:, 2], bc[:, 0], bc[:, 1] - bc[:, 2]), axis=1)
+        bcr = bm.stack((2 * bc[:, 1], bc[:, 2] - bc[:, 1], bc[:, 0]), axis=1)
+        vl = bm.einsum('cj, kj -> ck', value[L], self.shape_function(bcl, p=p))
+        vr = bm.einsum('cj, kj -> ck', value[R], self.shape_function(bcr, p=p))
+        w = bm.where(bc[:, 1] > bc[:, 2], 1.0, bm.where(bc[:, 1] < bc[:, 2], 0.0, 0.5))
+        return bm.set_at(value, L, w * vl + (1 - w) * vr)
+
     def label(self, node=None, cell=None, cellidx=None):
         """
         单元顶点的重新排列，使得cell[:, [1, 2]] 存储了单元的最长边
@@ -746,60 +807,93 @@ class TriangleMesh(SimplexMesh, Plotable):
         return options
 
     def adaptive(self, eta, options):
+        """Refine and coarsen the mesh by the error indicator `eta` on cells.
+
+        The number of times to refine (positive) or to coarsen (negative) every
+        cell is computed from `eta` by the marking method, and is bounded by
+        'maxrefine' and 'maxcoarsen'. Every round is one `bisect` or `coarsen`
+        of all the cells to be changed, so there are at most 'maxrefine' rounds
+        of refinement and 'maxcoarsen' rounds of coarsening.
+
+        Parameters:
+            eta (Tensor): The error indicator on cells.
+            options (dict): See `adaptive_options`. The data in 'data' are\
+                transferred to the new mesh in place. 'HB' is set to the\
+                index of the original cell of every new cell if it is not None,\
+                and 'IM' is set to the prolongation of nodal values if 'imatrix'\
+                is True.
+        """
         theta = options['theta']
         if options['method'] == 'mean':
-            options['numrefine'] = bm.round(
-                bm.log2(eta / (theta * bm.mean(eta)))
-            )
+            numrefine = bm.round(bm.log2(eta / (theta * bm.mean(eta))))
         elif options['method'] == 'max':
-            options['numrefine'] = bm.round(
-                bm.log2(eta / (theta * bm.max(eta)))
-            )
+            numrefine = bm.round(bm.log2(eta / (theta * bm.max(eta))))
         elif options['method'] == 'median':
-            options['numrefine'] = bm.round(
-                bm.log2(eta / (theta * bm.mean(eta)))
-            )
+            numrefine = bm.round(bm.log2(eta / (theta * bm.mean(eta))))
         elif options['method'] == 'min':
-            options['numrefine'] = bm.round(
-                bm.log2(eta / (theta * bm.min(eta)))
-            )
+            numrefine = bm.round(bm.log2(eta / (theta * bm.min(eta))))
         elif options['method'] == 'target':
             NT = self.number_of_cells()
-            e = options['tol'] / bm.sqrt(NT)
-            options['numrefine'] = bm.round(
-                bm.log2(eta / (theta * e)
-                        ))
+            e = options['tol'] / math.sqrt(NT)
+            numrefine = bm.round(bm.log2(eta / (theta * e)))
         else:
-            raise ValueError(
-                "I don't know anyting about method %s!".format(options['method']))
-
-        flag = options['numrefine'] > options['maxrefine']
-        options['numrefine'][flag] = options['maxrefine']
-        flag = options['numrefine'] < -options['maxcoarsen']
-        options['numrefine'][flag] = -options['maxcoarsen']
+            raise ValueError(f"I don't know anyting about method {options['method']}!")
+
+        maxrefine = options['maxrefine']
+        maxcoarsen = options['maxcoarsen']
+        numrefine = bm.where(numrefine > maxrefine, maxrefine, numrefine)
+        numrefine = bm.where(numrefine < -maxcoarsen, -maxcoarsen, numrefine)
+
+        data = options.get('data', None)
+        data = {} if data is None else data
+        trackHB = options.get('HB', None) is not None
+        HB = bm.arange(self.number_of_cells(), dtype=self.itype, device=self.device)
+        IM = None
+
+        def step(method, isMarkedCell, numrefine):
+            nonlocal HB, IM
+            mdata = dict(data)
+            mdata['_numrefine'] = numrefine
+            opt = {'data': mdata, 'HB': None, 'disp': False}
+            im = method(isMarkedCell, opt, returnim=True)
+            HB = HB[opt['HB']]
+            IM = im if IM is None else im @ IM
+            numrefine = mdata.pop('_numrefine')
+            data.update(mdata)
+            return numrefine
+
+        for _ in range(maxrefine):
+            isMarkedCell = numrefine > 0
+            if not bool(bm.any(isMarkedCell)):
+                break
+            numrefine = step(self.bisect, isMarkedCell,
+                             numrefine - bm.astype(isMarkedCell, numrefine.dtype))
+            if options.get('disp', False):
+                logger.info(f"Number of cells after refine: {self.number_of_cells()}")
+
+        for _ in range(maxcoarsen):
+            isMarkedCell = numrefine < 0
+            if not bool(bm.any(isMarkedCell)):
+                break
+            NC0 = self.number_of_cells()
+            numrefine = step(self.coarsen, isMarkedCell,
+                             numrefine + bm.astype(isMarkedCell, numrefine.dtype))
+            if self.number_of_cells() == NC0:
+                break
+            if options.get('disp', False):
+                logger.info(f"Number of cells after coarsen: {self.number_of_cells()}")
 
-        # refine
-        NC = self.number_of_cells()
-        print("Number of cells before:", NC)
-        isMarkedCell = (options['numrefine'] > 0)
-        while sum(isMarkedCell) > 0:
-            self.bisect_1(isMarkedCell, options)
-            print("Number of cells after refine:", self.number_of_cells())
-            isMarkedCell = (options['numrefine'] > 0)
-
-        # coarsen
-        if options['maxcoarsen'] > 0:
-            isMarkedCell = (options['numrefine'] < 0)
-            while sum(isMarkedCell) > 0:
-                NN0 = self.number_of_cells()
-                self.coarsen(isMarkedCell, options)
-                NN = self.number_of_cells()
-                if NN == NN0:
-                    break
-                print("Number of cells after coarsen:", self.number_of_cells())
-                isMarkedCell = (options['numrefine'] < 0)
+        options['numrefine'] = numrefine
+        if options.get('data', None) is not None:
+            options['data'] = data
+        if trackHB:
+            options['HB'] = HB
+        if options.get('imatrix', False):
+            options['IM'] = IM
 
     def bisect_1(self, isMarkedCell=None, options={'disp': True}):
+        from scipy.sparse import coo_matrix, csr_matrix
+
         GD = self.geo_dimension()
         NN = self.number_of_nodes()
         NC = self.number_of_cells()
@@ -1005,12 +1099,6 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         return J
 
-    def point_to_bc(self, point):
-        """
-        @brief 找到定点 point 所在的单元，并计算其重心坐标 
-        """
-        pass
-
     def mark_interface_cell(self, phi):
         """
         @brief 标记穿过界面的单元
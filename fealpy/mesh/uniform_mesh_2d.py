@@ -6,6 +6,7 @@ from ..typing import TensorLike, Index, _S, Union, Tuple
 from .utils import entitymethod, estr2dim
 
 from .mesh_base import StructuredMesh, TensorMesh
+from .prolongation import grid_prolongation
 from .plot import Plotable
 
 from builtins import tuple, int , float
@@ -817,7 +818,7 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         else:
             raise ValueError(f"entity type: {etype} is wrong!")
     
-    def uniform_refine(self, n: int=1):
+    def uniform_refine(self, n: int=1, returnim: bool=False):
         """
         @brief Uniformly refine the 2D structured mesh.
 
@@ -826,8 +827,18 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         This is necessary because the entities remain the same as before refinement due to caching.
         Structured meshes have their own entity generation methods, so the cache needs to be manually cleared.
         Unstructured meshes do not require this because they do not have entity generation methods.
+
+        @param returnim: return the list of the multilinear interpolation matrices
+        of the nodal values from every mesh to the refined one, as `CSRTensor`
+        shaped (NN_fine, NN_coarse), from the coarsest.
         """
+        if returnim:
+            IM = []
+
         for i in range(n):
+            if returnim:
+                IM.append(grid_prolongation((self.nx + 1, self.ny + 1),
+                                            dtype=self.ftype, device=self.device))
             self.extent = [i * 2 for i in self.extent]
             self.h = [h / 2.0 for h in self.h]
             self.nx = self.extent[1] - self.extent[0]
@@ -846,6 +857,9 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
 
         self.clear() 
 
+        if returnim:
+            return IM
+
     # 界面网格
     def is_cut_cell(self, phi: Callable, *, eps=1e-10) -> TensorLike:
         """Return a bool tensor on cells indicating whether each cell is cut
@@ -8,6 +8,7 @@ from ..typing import TensorLike, Index, _S, Union, Tuple
 from .. import logger
 
 from .mesh_base import StructuredMesh, TensorMesh
+from .prolongation import grid_prolongation
 from .plot import Plotable
 
 class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
@@ -1276,7 +1277,7 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
         else:
             raise ValueError(f"entity type: {etype} is wrong!")
 
-    def uniform_refine(self, n: int=1):
+    def uniform_refine(self, n: int=1, returnim: bool=False):
         """
         @brief Uniformly refine the 2D structured mesh.
 
@@ -1285,8 +1286,18 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
         This is necessary because the entities remain the same as before refinement due to caching.
         Structured meshes have their own entity generation methods, so the cache needs to be manually cleared.
         Unstructured meshes do not require this because they do not have entity generation methods.
+
+        @param returnim: return the list of the multilinear interpolation matrices
+        of the nodal values from every mesh to the refined one, as `CSRTensor`
+        shaped (NN_fine, NN_coarse), from the coarsest.
         """
+        if returnim:
+            IM = []
+
         for i in range(n):
+            if returnim:
+                IM.append(grid_prolongation((self.nx + 1, self.ny + 1, self.nz + 1),
+                                            dtype=self.ftype, device=bm.get_device(self.node)))
             self.extent = [i * 2 for i in self.extent]
             self.h = [h / 2.0 for h in self.h]
             # self.nx = int((self.extent[1] - self.extent[0]) / self.h[0])
@@ -1298,7 +1309,7 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
 
             self.NN = (self.nx + 1) * (self.ny + 1) * (self.nz + 1)
             self.NE = (self.nx + 1) * (self.ny + 1) * self.nz + \
-                    (self.nx + 1) * (self.ny + 1) * self.nz + \
+                    (self.nx + 1) * self.ny * (self.nz + 1) + \
                     self.nx * (self.ny + 1) * (self.nz + 1)
             self.NF = self.nx * self.ny * (self.nz + 1) + \
                     self.nx * (self.ny + 1) * self.nz + \
@@ -1312,5 +1323,8 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
 
         self.clear()
 
+        if returnim:
+            return IM
+
 
 UniformMesh3d.set_ploter('3d')
@@ -1,9 +1,13 @@
 
-from typing import Dict, Callable, TypeVar, Tuple, Any
+from typing import Dict, Callable, TypeVar, Tuple, Any, Iterator
+from functools import wraps
 from math import comb
 
+import numpy as np
+
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
+from ..typing import _S, Index
 from .. import logger
 
 _Meth = TypeVar('_Meth', bound=Callable)
@@ -124,6 +128,38 @@ def entitymethod(top_dim: int):
     return decorator
 
 
+def cachedmethod(meth: _Meth) -> _Meth:
+    """A decorator caching the index maps `meth(self, p, index)` of a mesh,
+    such as `cell_to_ipoint`, by the mesh version.
+
+    The whole map of every `p` is computed once and cached in the mesh, and
+    the `index` is applied to the cached map. See `MeshDS.cached`.
+    The cached numpy arrays are read-only, and the other tensors are copied
+    when sliced, so the callers can not modify the cache in place. A map
+    sharing memory with the entities of the mesh is copied before cached.
+    """
+    key = meth.__qualname__
+
+    def build(self, p: int):
+        value = meth(self, p)
+        if isinstance(value, np.ndarray):
+            # such as the nodes returned for p = 1, which must stay writable
+            if any(isinstance(e, np.ndarray) and np.may_share_memory(value, e)
+                   for e in self.storage().values()):
+                value = value.copy()
+            value.flags.writeable = False
+        return value
+
+    @wraps(meth)
+    def wrapper(self, p: int, index=_S):
+        value = self.cached((key, p), lambda: build(self, p))
+        if isinstance(index, slice) and not isinstance(value, np.ndarray):
+            # the slices of the tensors are views of the cache
+            return bm.copy(value[index])
+        return value[index]
+    return wrapper
+
+
 def simplex_ldof(p: int, iptype: int) -> int:
     """Number of local dofs in a simplex entity."""
     if iptype == 0:
@@ -155,3 +191,13 @@ def tensor_gdof(p: int, nums: Tuple[int, ...]) -> int:
         coef *= (p-1)
         count += coef * nums[i]
     return count
+
+
+def cell_chunks(NC: int, chunk_size: int=0) -> Iterator[Index]:
+    """Iterate over the cells by blocks of `chunk_size`, yielding the slices\
+    of the blocks, or `_S` once for all the cells if `chunk_size` is not positive."""
+    if chunk_size <= 0:
+        yield _S
+        return
+    for start in range(0, NC, chunk_size):
+        yield slice(start, min(start + chunk_size, NC))
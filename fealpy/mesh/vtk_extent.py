@@ -11,9 +11,11 @@ Huayi Wei, weihuayi@xtu.edu.cn
 
 
 import numpy as np
-import vtk
-import vtk.util.numpy_support as vnp
 from fealpy.backend import backend_manager as bm
+from fealpy.lazy import lazy_import
+
+vtk = lazy_import('vtk', hint="Install it by `pip install vtk` to write VTK files.")
+vnp = lazy_import('vtk.util.numpy_support')
 
 from .vtkCellTypes import *
 
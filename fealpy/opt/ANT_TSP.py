@@ -1,17 +1,155 @@
 from fealpy.backend import backend_manager as bm
-import random
+from fealpy.typing import _S
 
 
 def calD(citys):
     n = citys.shape[0]
-    D = bm.zeros((n, n)) 
+    D = bm.zeros((n, n))
     diff = citys[:, None, :] - citys[None, :, :]
     D = bm.sqrt(bm.sum(diff ** 2, axis = -1))
-    D[bm.arange(n), bm.arange(n)] = 1e-4
+    D = bm.set_at(D, (bm.arange(n), bm.arange(n)), 1e-4)
     return D
 
+
+def nearest_citys(D, k):
+    """
+    The candidate lists, i.e. the k nearest cities of every city, shaped (n, k).
+    """
+    n = D.shape[0]
+    k = min(k, n - 1)
+    idx = bm.arange(n, dtype=bm.int64, device=bm.get_device(D))
+    D = bm.set_at(bm.copy(D), (idx, idx), bm.inf)
+    return bm.argsort(D, axis=1)[:, :k]
+
+
+def tour_length(D, tours):
+    """
+    The lengths of the closed tours shaped (m, n).
+    """
+    return bm.sum(D[tours, bm.roll(tours, -1, axis=1)], axis=1)
+
+
+def roulette(w, allowed):
+    """
+    Choose a column of every row with the probabilities proportional to the
+    weights `w` (m, k), by the first entry of the cumulative sum exceeding a
+    random fraction of the total. If all the weights of a row vanish, e.g. by
+    underflow, the column is chosen uniformly among the `allowed` ones.
+    """
+    m, k = w.shape
+    total = bm.sum(w, axis=1)
+    flag = total <= 0
+    if bm.any(flag):
+        w = bm.where(flag[:, None], bm.astype(allowed, w.dtype), w)
+    c = bm.cumsum(w, axis=1)
+    r = bm.random.rand(m, 1) * c[:, -1:]
+    index = bm.sum(c <= r, axis=1)
+    # NOTE: r may round up to the total, then the last positive weight is taken
+    last = k - 1 - bm.argmax(bm.astype(bm.flip(w > 0, axis=1), bm.int32), axis=1)
+    return bm.minimum(index, last)
+
+
+def two_opt(D, tours, neighbors, max_passes=1000, max_moves=64, tol=1e-10):
+    """
+    Improve the tours by the 2-opt moves restricted to the candidate lists.
+
+    In every pass, the gains of all the moves adding an edge from a city to
+    one of its candidates are computed for all the tours at once. Then every
+    tour applies its best moves which do not overlap, i.e. reverses disjoint
+    segments, until no tour is improved or `max_passes` is reached. A pass
+    costs O(m n k + m max_moves^2).
+
+    Parameters:
+        D (Tensor): The distance matrix shaped (n, n).
+        tours (Tensor): The tours shaped (m, n).
+        neighbors (Tensor): The candidate lists shaped (n, k).
+        max_passes (int, optional): The maximum number of passes.
+        max_moves (int, optional): The maximum number of moves of a tour in a pass.
+        tol (float, optional): The minimum gain of a move.
+
+    Returns:
+        Tensor: The improved tours shaped (m, n).
+    """
+    m, n = tours.shape
+    kwargs = {'dtype': bm.int64, 'device': bm.get_device(tours)}
+    rows = bm.arange(m, **kwargs)
+    p = bm.arange(n, **kwargs)
+    # the distances to the candidates, read contiguously below
+    DN = D[bm.arange(D.shape[0], **kwargs)[:, None], neighbors]
+
+    for _ in range(max_passes):
+        succ = bm.roll(tours, -1, axis=1)
+        pos = bm.argsort(tours, axis=1) # the positions of the cities
+        edge = D[tours, succ]
+        # remove the edges (a, succ(a)) and (c, succ(c)),
+        # and add (a, c) and (succ(a), succ(c))
+        c = neighbors[tours]
+        j = pos[rows[:, None, None], c]
+        sc = succ[rows[:, None, None], j]
+        gain = edge[:, :, None] + edge[rows[:, None, None], j] - DN[tours] - D[succ[:, :, None], sc]
+
+        # the best move from every position, and the best positions
+        best = bm.argmax(gain, axis=2)
+        gain = bm.max(gain, axis=2)
+        j = j[rows[:, None], p, best]
+        order = bm.argsort(-gain, axis=1)[:, :max_moves]
+        if not bm.any(gain[rows, order[:, 0]] > tol):
+            break
+
+        # accept the moves greedily, if they do not touch the positions
+        # [s, e + 1] of the accepted ones, so the segments are disjoint
+        K = order.shape[1]
+        S = bm.zeros((m, K), **kwargs)
+        E = bm.zeros((m, K), **kwargs)
+        A = bm.zeros((m, K), dtype=bm.bool, device=bm.get_device(tours))
+        for r in range(K):
+            i = order[:, r]
+            g = gain[rows, i]
+            if not bm.any(g > tol):
+                break
+            s, e = bm.minimum(i, j[rows, i]), bm.maximum(i, j[rows, i])
+            overlap = (s[:, None] <= E + 1) & (S <= e[:, None] + 1)
+            # the position n is the position 0 of the closed tour
+            overlap = overlap | ((e[:, None] == n - 1) & (S == 0)) | ((E == n - 1) & (s[:, None] == 0))
+            S = bm.set_at(S, (_S, r), s)
+            E = bm.set_at(E, (_S, r), e)
+            A = bm.set_at(A, (_S, r), (g > tol) & ~bm.any(A & overlap, axis=1))
+
+        # reverse the segments between the positions s + 1 and e, by the
+        # number of the segment of every position
+        seg = bm.astype(A, bm.int64) * bm.arange(1, K + 1, **kwargs)
+        offset = rows[:, None] * (n + 1)
+        mark = bm.zeros((m * (n + 1), ), **kwargs)
+        mark = bm.index_add(mark, (offset + S + 1).reshape(-1), seg.reshape(-1))
+        mark = bm.index_add(mark, (offset + E + 1).reshape(-1), -seg.reshape(-1))
+        seg = bm.cumsum(mark.reshape(m, n + 1), axis=1)[:, :n]
+        idx = bm.where(seg > 0, seg - 1, 0)
+        lo, hi = S[rows[:, None], idx], E[rows[:, None], idx]
+        tours = tours[rows[:, None], bm.where(seg > 0, lo + 1 + hi - p, p)]
+
+    return tours
+
+
 class Ant_TSP:
-    def __init__(self, m, alpha, beta, rho, Q, Eta, D, iter_max):
+    def __init__(self, m, alpha, beta, rho, Q, Eta, D, iter_max, *,
+                 candidates=0, local_search=False, max_passes=1000):
+        """
+        Parameters:
+            m (int): The number of ants.
+            alpha, beta (float): The importance of the pheromone and of the heuristic.
+            rho (float): The evaporation rate of the pheromone.
+            Q (float): The amount of the pheromone deposited by an ant.
+            Eta (Tensor): The heuristic, usually 1 / D, shaped (n, n).
+            D (Tensor): The distance matrix shaped (n, n).
+            iter_max (int): The number of iterations.
+            candidates (int, optional): The number of the nearest cities an ant\
+                chooses from, 0 for all the cities. An ant whose candidates have\
+                all been visited chooses from all the unvisited cities. Default to 0.
+            local_search (bool, optional): Whether to improve the tours of the\
+                ants by 2-opt. Default to False.
+            max_passes (int, optional): The maximum number of the 2-opt passes in\
+                an iteration. Default to 1000.
+        """
         self.m = m
         self.alpha = alpha
         self.beta = beta
@@ -20,59 +158,86 @@ class Ant_TSP:
         self.Eta = Eta
         self.D = D
         self.iter_max = iter_max
+        self.candidates = candidates
+        self.local_search = local_search
+        self.max_passes = max_passes
 
-    def cal(self, n, Tau, Table, Route_best, Length_best):
-        for iter in range(0, self.iter_max):
-            # 随机产生各个蚂蚁的起点城市
-            start = [random.randint(0, n - 1) for _ in range(self.m)]
-            Table[:, 0] = bm.array(start)    
-            citys_index = bm.arange(n)
+    def construct(self, Tau, start, neighbors=None):
+        """
+        Build the tours of all the ants at once, from the start cities (m, ).
+
+        The visited cities are kept in a bitmap (m, n), and the next city of
+        every ant is chosen by the roulette on the masked weights
+        Tau^alpha * Eta^beta, among all the cities or among the candidates.
+        """
+        m = start.shape[0]
+        n = Tau.shape[0]
+        kwargs = {'dtype': bm.int64, 'device': bm.get_device(Tau)}
+        rows = bm.arange(m, **kwargs)
 
-            P = bm.zeros((self.m, n - 1))
+        if neighbors is None:
+            W = Tau ** self.alpha * self.Eta ** self.beta
+        else:
+            nrows = bm.arange(n, **kwargs)[:, None]
+            W = Tau[nrows, neighbors] ** self.alpha * self.Eta[nrows, neighbors] ** self.beta
 
-            # print('--------------------------------------')         
-            for j in range(1, n):
-                tabu = Table[:, :j] # 已访问的城市集合
+        tours = bm.zeros((m, n), **kwargs)
+        tours = bm.set_at(tours, (_S, 0), start)
+        visited = bm.zeros((m, n), dtype=bm.bool, device=bm.get_device(Tau))
+        visited = bm.set_at(visited, (rows, start), True)
+        cur = start
 
-                w = []
-                for i in range(self.m):
-                    tabu_set = set(tabu[i].tolist())
-                    difference_list = list(set(citys_index.tolist()).difference(tabu_set))
-                    w.append(difference_list)
-                allow = bm.array(w)
+        for j in range(1, n):
+            if neighbors is None:
+                allowed = ~visited
+                nxt = roulette(bm.where(allowed, W[cur], 0.0), allowed)
+            else:
+                cand = neighbors[cur]
+                allowed = ~visited[rows[:, None], cand]
+                nxt = cand[rows, roulette(bm.where(allowed, W[cur], 0.0), allowed)]
+                # the ants whose candidates have all been visited
+                idx = bm.nonzero(~bm.any(allowed, axis=1))[0]
+                if idx.shape[0] > 0:
+                    c = cur[idx]
+                    allowed = ~visited[idx]
+                    w = Tau[c] ** self.alpha * self.Eta[c] ** self.beta
+                    nxt = bm.set_at(nxt, idx, roulette(bm.where(allowed, w, 0.0), allowed))
+            tours = bm.set_at(tours, (_S, j), nxt)
+            visited = bm.set_at(visited, (rows, nxt), True)
+            cur = nxt
 
-                P = (Tau[tabu[:, -1].reshape(-1, 1), allow] ** self.alpha) * (self.Eta[tabu[:, -1].reshape(-1, 1), allow] ** self.beta)
-                P /= P.sum(axis=1, keepdims=True)
-                Pc = bm.cumsum(P, axis=1)
-                rand_vals = bm.random.rand(self.m, 1)
+        return tours
 
-                # target_index = bm.argmax(Pc >= rand_vals, axis=1)
-                target_index = bm.array([bm.where(row >= rand_val)[0][0] if bm.any(row >= rand_val) else -1 for row, rand_val in zip(Pc, rand_vals.flatten())])
-                Table[:, j] = allow[bm.arange(self.m), target_index]
+    def cal(self, n, Tau, Table, Route_best, Length_best):
+        neighbors = None
+        if self.candidates > 0 or self.local_search:
+            k = self.candidates if self.candidates > 0 else 10
+            neighbors = nearest_citys(self.D, k)
+
+        for iter in range(0, self.iter_max):
+            # 随机产生各个蚂蚁的起点城市
+            start = bm.random.randint(0, n, (self.m, ))
+            Table = bm.set_at(Table, _S, self.construct(Tau, start, neighbors if self.candidates > 0 else None))
+            if self.local_search:
+                Table = bm.set_at(Table, _S, two_opt(self.D, Table, neighbors, self.max_passes))
 
             # 计算各个蚂蚁的路径距离
-            route_indices = bm.arange(n - 1)
-            Length = bm.zeros(self.m)
-            Length += bm.sum(self.D[Table[:, route_indices], Table[:, route_indices + 1]], axis=1)
-            Length += self.D[Table[:, -1], Table[:, 0]]
+            Length = tour_length(self.D, Table)
             # 计算最短路径距离及平均距离
             min_index = bm.argmin(Length)
             if iter == 0:
-                Length_best[iter] = Length[min_index]
-                Route_best[iter] = Table[min_index]
+                Length_best = bm.set_at(Length_best, iter, Length[min_index])
+                Route_best = bm.set_at(Route_best, iter, Table[min_index])
             else:
-                min_index = bm.argmin(Length)
-                Length_best[iter] = min(Length_best[iter - 1], Length[min_index])
+                Length_best = bm.set_at(Length_best, iter, min(Length_best[iter - 1], Length[min_index]))
                 if Length_best[iter] == Length[min_index]:
-                    Route_best[iter] = Table[min_index]
+                    Route_best = bm.set_at(Route_best, iter, Table[min_index])
                 else:
-                    Route_best[iter] = Route_best[iter - 1]
-            # 更新信息素
-            Delta_Tau = bm.zeros((n, n))
-            Delta_Tau[Table[:, :-1], Table[:, 1:]] += (self.Q / Length).reshape(-1, 1)
-            Delta_Tau[Table[:, -1], Table[:, 0]] += self.Q / Length
-            Tau = (1 - self.rho) * Tau + Delta_Tau
+                    Route_best = bm.set_at(Route_best, iter, Route_best[iter - 1])
+            # 更新信息素, 同一条边上的信息素累加
+            edge = Table * n + bm.roll(Table, -1, axis=1)
+            Delta = bm.broadcast_to((self.Q / Length)[:, None], Table.shape)
+            Tau = (1 - self.rho) * Tau
+            Tau = bm.index_add(Tau.reshape(-1), edge.reshape(-1), Delta.reshape(-1)).reshape(n, n)
 
         return Length_best, Route_best
-
-
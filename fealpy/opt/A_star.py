@@ -1,15 +1,17 @@
 from fealpy.backend import backend_manager as bm
 import math
-import matplotlib.pyplot as plt
-import matplotlib
-import matplotlib.animation as animation
 import random
 import datetime
 from random import randint
-import pygame
 from enum import Enum
 from functools import total_ordering
-from matplotlib import colors
+
+from ..lazy import lazy_import
+
+plt = lazy_import('matplotlib.pyplot')
+animation = lazy_import('matplotlib.animation')
+colors = lazy_import('matplotlib.colors')
+pygame = lazy_import('pygame', hint="Install it by `pip install pygame` to show the search.")
 
 # 定义全局变量：地图中节点的像素大小
 CELL_WIDTH = 160 #单元格宽度
@@ -1,9 +1,8 @@
-from ..backend import backend_manager as bm 
+from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-import random
 from .optimizer_base import Optimizer
-from app.TSP.TSP_citys import calD
+from .ANT_TSP import Ant_TSP
 
 class AntColonyOptAlg(Optimizer):
     def __init__(self, option, D) -> None:
@@ -13,64 +12,22 @@ class AntColonyOptAlg(Optimizer):
         self.rho = 0.5
         self.Q = 100
         self.D = D
-    
+
     def run(self):
         option = self.options
-        x = option["x0"]
         N = option["NP"]
         T = option["MaxIters"]
         dim = option["ndim"]
-        lb, ub = option["domain"]
 
+        # the tours of the ants are built by the vectorized `Ant_TSP`
         Eta = 1 / self.D
-        Table = bm.zeros((N, dim), dtype=int)
+        ant = Ant_TSP(N, self.alpha, self.beta, self.rho, self.Q, Eta, self.D, T)
+        Table = bm.zeros((N, dim), dtype=bm.int64)
         Tau = bm.ones((dim, dim), dtype=bm.float64)
-        route_id = bm.arange(dim - 1)
-
-        gbest_f = float('inf')
-        gbest = None
-
-        for t in range(T):
-            start = [random.randint(0, dim - 1) for _ in range(N)]
-            
-            Table[:, 0] = bm.array(start)
-            citys_index = bm.arange(dim)
-
-            P = bm.zeros((N, dim - 1))
-            for j in range(1, dim):
-                tabu = Table[:, :j]
-                w = []
-                for i in range(N):
-                    tabu_set = set(tabu[i].tolist())
-                    difference_list = list(set(citys_index.tolist()).difference(tabu_set))
-                    w.append(difference_list)
-                allow = bm.array(w)
-
-                P = (Tau[tabu[:, -1].reshape(-1, 1), allow] ** self.alpha) * (Eta[tabu[:, -1].reshape(-1, 1), allow] ** self.beta)
-                P /= P.sum(axis=1, keepdims=True)
-                Pc = bm.cumsum(P, axis=1)
-                rand_vals = bm.random.rand(N, 1)
-
-                target_index = bm.array([bm.where(row >= rand_val)[0][0] if bm.any(row >= rand_val) else -1 for row, rand_val in zip(Pc, rand_vals.flatten())])
-                Table[:, j] = allow[bm.arange(N), target_index]
-
-                fit_new = bm.zeros(N)
-                fit_new += bm.sum(self.D[Table[:, route_id], Table[:, route_id + 1]], axis=1)
-                fit_new += self.D[Table[:, -1], Table[:, 0]]
-
-                gbest_idx = bm.argmin(fit_new)
-                if fit_new[gbest_idx] < gbest_f:
-                    gbest_f = fit_new[gbest_idx]
-                    gbest = Table[gbest_idx]
-
-            Delta_Tau = bm.zeros((dim, dim))
-            Delta_Tau[Table[:, :-1], Table[:, 1:]] += (self.Q / fit_new).reshape(-1, 1)
-            Delta_Tau[Table[:, -1], Table[:, 0]] += self.Q / fit_new
-            Tau = (1 - self.rho) * Tau + Delta_Tau
+        Route_best = bm.zeros((T, dim), dtype=bm.int64)
+        Length_best = bm.zeros((T, ), dtype=bm.float64)
+        Length_best, Route_best = ant.cal(dim, Tau, Table, Route_best, Length_best)
 
+        gbest = Route_best[-1]
+        gbest_f = Length_best[-1]
         return gbest, gbest_f
-
-            
-
-
-
@@ -1,15 +1,44 @@
+"""The Optimization Module
 
-from .objective import Objective
-from .A_star import AStar, GridMap
-from .ANT_TSP import calD, Ant_TSP
-from .particle_swarm_opt_alg import  PSOProblem, PSO
-from .optimizer_base import opt_alg_options, Optimizer
-from .initialize import initialize
-from .crayfish_opt_alg import CrayfishOptAlg
-from .honeybadger_opt_alg import HoneybadgerOptAlg
-from .quantumparticleswarm_opt_alg import QuantumParticleSwarmOptAlg 
-from .snowmelt_opt_alg import SnowmeltOptAlg 
-from .grey_wolf_optimizer import GreyWolfOptimizer
-from .particle_swarm_opt import ParticleSwarmOptAlg
-from .hippopotamus_opt_alg import HippopotamusOptAlg
-from .Antcolony_opt_alg import AntColonyOptAlg
\ No newline at end of file
+The algorithms are imported on first access, see `fealpy.lazy`.
+"""
+from typing import TYPE_CHECKING
+
+from ..lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'objective': ['Objective'],
+    'A_star': ['AStar', 'GridMap'],
+    'ANT_TSP': ['calD', 'Ant_TSP'],
+    'particle_swarm_opt_alg': ['PSOProblem', 'PSO'],
+    'optimizer_base': ['opt_alg_options', 'Optimizer'],
+    'evaluator': ['PoolEvaluator'],
+    'benchmark_runner': ['run_benchmarks', 'format_results'],
+    'initialize': ['initialize'],
+    'crayfish_opt_alg': ['CrayfishOptAlg'],
+    'honeybadger_opt_alg': ['HoneybadgerOptAlg'],
+    'quantumparticleswarm_opt_alg': ['QuantumParticleSwarmOptAlg'],
+    'snowmelt_opt_alg': ['SnowmeltOptAlg'],
+    'grey_wolf_optimizer': ['GreyWolfOptimizer'],
+    'particle_swarm_opt': ['ParticleSwarmOptAlg'],
+    'hippopotamus_opt_alg': ['HippopotamusOptAlg'],
+    'Antcolony_opt_alg': ['AntColonyOptAlg'],
+})
+
+if TYPE_CHECKING:
+    from .objective import Objective
+    from .A_star import AStar, GridMap
+    from .ANT_TSP import calD, Ant_TSP
+    from .particle_swarm_opt_alg import PSOProblem, PSO
+    from .optimizer_base import opt_alg_options, Optimizer
+    from .evaluator import PoolEvaluator
+    from .benchmark_runner import run_benchmarks, format_results
+    from .initialize import initialize
+    from .crayfish_opt_alg import CrayfishOptAlg
+    from .honeybadger_opt_alg import HoneybadgerOptAlg
+    from .quantumparticleswarm_opt_alg import QuantumParticleSwarmOptAlg
+    from .snowmelt_opt_alg import SnowmeltOptAlg
+    from .grey_wolf_optimizer import GreyWolfOptimizer
+    from .particle_swarm_opt import ParticleSwarmOptAlg
+    from .hippopotamus_opt_alg import HippopotamusOptAlg
+    from .Antcolony_opt_alg import AntColonyOptAlg
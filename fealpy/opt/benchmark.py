@@ -115,7 +115,7 @@ def F25(x):
 def F26(x):
     y1 = bm.sum(x ** 2, axis= -1)
     y2 = bm.sum(bm.cos(2 * bm.pi * x), axis=-1 )
-    n = len(x)
+    n = x.shape[-1]
     return -20 * bm.exp(-0.2 * bm.sqrt(y1 / n)) - bm.exp(y2 / n) + 20 + bm.exp(bm.array(1))
 
 iopt_benchmark_data = [
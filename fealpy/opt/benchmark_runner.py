@@ -0,0 +1,111 @@
+
+from typing import Callable, Dict, List, Optional, Sequence, Any
+import time
+import argparse
+
+from ..backend import backend_manager as bm
+from .optimizer_base import opt_alg_options
+from .benchmark import iopt_benchmark_data
+from .crayfish_opt_alg import CrayfishOptAlg
+from .honeybadger_opt_alg import HoneybadgerOptAlg
+from .quantumparticleswarm_opt_alg import QuantumParticleSwarmOptAlg
+from .snowmelt_opt_alg import SnowmeltOptAlg
+from .grey_wolf_optimizer import GreyWolfOptimizer
+from .particle_swarm_opt import ParticleSwarmOptAlg
+from .hippopotamus_opt_alg import HippopotamusOptAlg
+
+OPTIMIZERS = {
+    'CrayfishOptAlg': CrayfishOptAlg,
+    'HoneybadgerOptAlg': HoneybadgerOptAlg,
+    'QuantumParticleSwarmOptAlg': QuantumParticleSwarmOptAlg,
+    'SnowmeltOptAlg': SnowmeltOptAlg,
+    'GreyWolfOptimizer': GreyWolfOptimizer,
+    'ParticleSwarmOptAlg': ParticleSwarmOptAlg,
+    'HippopotamusOptAlg': HippopotamusOptAlg,
+}
+
+
+def run_benchmarks(optimizers: Optional[Sequence[str]]=None,
+                   functions: Optional[Sequence[int]]=None,
+                   NP: int=100, MaxIters: int=100, *,
+                   evaluator: Optional[Callable[[Callable], Callable]]=None) -> List[Dict[str, Any]]:
+    """Run the optimizers on the benchmark functions F1-F26 of `fealpy.opt.benchmark`.
+
+    Parameters:
+        optimizers (Sequence[str] | None, optional): The names of the optimizers\
+            in `OPTIMIZERS`. Default to all of them.
+        functions (Sequence[int] | None, optional): The numbers of the functions,\
+            from 1 to 26. Default to all of them.
+        NP (int, optional): The size of the population. Default to 100.
+        MaxIters (int, optional): The number of iterations. Default to 100.
+        evaluator (Callable | None, optional): The factory of the evaluator of an\
+            objective, e.g. `lambda f: PoolEvaluator(f, 'thread', vectorized=True)`.\
+            Default to None, calling the objectives on the whole population.
+
+    Returns:
+        List[Dict]: A record for every run, with the keys 'optimizer', 'function',\
+            'ndim', 'best', 'optimal', 'NF', 'time' and 'evals_per_sec'.
+    """
+    names = list(OPTIMIZERS) if optimizers is None else list(optimizers)
+    numbers = range(1, len(iopt_benchmark_data) + 1) if functions is None else functions
+
+    records = []
+    for k in numbers:
+        data = iopt_benchmark_data[k - 1]
+        lb, ub = data['domain']
+        objective = data['objective']
+        for name in names:
+            x0 = lb + bm.random.rand(NP, data['ndim']) * (ub - lb)
+            fun = None if evaluator is None else evaluator(objective)
+            options = opt_alg_options(x0, objective, data['domain'], NP,
+                                      MaxIters=MaxIters, Print=False, Evaluator=fun)
+            optimizer = OPTIMIZERS[name](options)
+            start = time.perf_counter()
+            try:
+                result = optimizer.run()
+            finally:
+                if hasattr(fun, 'close'):
+                    fun.close()
+            elapsed = time.perf_counter() - start
+            records.append({
+                'optimizer': name,
+                'function': f'F{k}',
+                'ndim': data['ndim'],
+                'best': float(bm.reshape(result[1], (-1, ))[0]),
+                'optimal': float(data['optimal']),
+                'NF': optimizer.NF,
+                'time': elapsed,
+                'evals_per_sec': optimizer.NF / elapsed if elapsed > 0 else float('inf'),
+            })
+    return records
+
+
+def format_results(records: List[Dict[str, Any]]) -> str:
+    """Format the records of `run_benchmarks` as a table."""
+    header = (f"{'optimizer':<28}{'function':>9}{'ndim':>6}{'best':>14}{'optimal':>12}"
+              f"{'NF':>10}{'time (s)':>10}{'evals/s':>12}")
+    lines = [header, '-' * len(header)]
+    for r in records:
+        lines.append(f"{r['optimizer']:<28}{r['function']:>9}{r['ndim']:>6}{r['best']:>14.4e}"
+                     f"{r['optimal']:>12.4g}{r['NF']:>10}{r['time']:>10.3f}{r['evals_per_sec']:>12.4g}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run the optimizers on the benchmark functions F1-F26 and "
+                    "report the evaluations per second.")
+    parser.add_argument('--backend', default='numpy', type=str)
+    parser.add_argument('--optimizers', nargs='*', default=None, choices=list(OPTIMIZERS))
+    parser.add_argument('--functions', nargs='*', default=None, type=int)
+    parser.add_argument('--NP', default=100, type=int)
+    parser.add_argument('--MaxIters', default=100, type=int)
+    args = parser.parse_args(argv)
+
+    bm.set_backend(args.backend)
+    records = run_benchmarks(args.optimizers, args.functions, args.NP, args.MaxIters)
+    print(format_results(records))
+
+
+if __name__ == '__main__':
+    main()
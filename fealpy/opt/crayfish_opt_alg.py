@@ -2,7 +2,6 @@
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
-import random
 from .optimizer_base import Optimizer, opt_alg_options
 
 
@@ -37,7 +36,7 @@ class CrayfishOptAlg(Optimizer):
             p = 0.2 * ( 1 / (bm.sqrt(bm.array(2 * bm.pi) * 3))) * bm.exp( bm.array(- (temp - 25) ** 2 / (2 * 3 ** 2)))
             rand = bm.random.rand(N, 1)
             rr = bm.random.rand(4, N, dim)
-            z = [random.randint(0, N - 1) for _ in range(N)]
+            z = bm.random.randint(0, N, (N, ))
 
             gbest = gbest.reshape(1, dim)
 
@@ -50,13 +49,7 @@ class CrayfishOptAlg(Optimizer):
             x_new = x_new + (lb - x_new) * (x_new < lb) + (ub - x_new) * (x_new > ub)          
             fit_new = self.fun(x_new)
 
-            mask = fit_new < fit
-            x, fit = bm.where(mask[:, None], x_new, x), bm.where(mask, fit_new, fit)
-            newbest_id = bm.argmin(fit_new)
-            (global_position, global_fitness) = (x_new[newbest_id], fit_new[newbest_id]) if fit_new[newbest_id] < global_fitness else (global_position, global_fitness)
-            gbest_idx = bm.argmin(fit)
-            if fit[gbest_idx] < gbest_f:
-                gbest_f = fit[gbest_idx]
-                gbest = x[gbest_idx].reshape(1, dim)
-            gbest = gbest.flatten()
+            x, fit = self.update_best(x, fit, x_new, fit_new)
+            global_position, global_fitness = self.update_gbest(x_new, fit_new, global_position, global_fitness)
+            gbest, gbest_f = self.update_gbest(x, fit, gbest.reshape(-1), gbest_f)
         return gbest, gbest_f
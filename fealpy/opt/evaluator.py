@@ -0,0 +1,123 @@
+
+from typing import Callable, Optional, Literal
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import os
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+def _evaluate(objective: Callable, x, vectorized: bool, backend: Optional[str]=None):
+    """Evaluate the objective on the rows of a block of the population."""
+    if backend is not None:
+        # the backend is thread-local, so the threads of the pool are set to
+        # the backend of the caller
+        bm.set_backend(backend)
+    if vectorized:
+        return objective(x)
+    return bm.stack([bm.reshape(bm.asarray(objective(xi)), ()) for xi in x])
+
+
+def _evaluate_numpy(objective: Callable, x: np.ndarray, vectorized: bool) -> np.ndarray:
+    """Evaluate the objective on a block of the population, in a worker process."""
+    bm.set_backend('numpy')
+    return np.asarray(_evaluate(objective, x, vectorized)).reshape(-1)
+
+
+class PoolEvaluator():
+    """Evaluate the objective on a population by a pool of processes or threads.
+
+    The population, shaped (NP, dim), is split into blocks of rows, which are
+    evaluated concurrently. This pays off for the expensive black-box
+    objectives, e.g. a finite element solve for every individual, while the
+    cheap vectorized objectives should be called on the whole population.
+
+    In the processes, the objective runs on the numpy backend, so it should be
+    a picklable (module level) function, and the fitness is converted back to
+    the current backend. In the threads, the objective is called on the blocks
+    of the tensor directly, on the backend of the caller, which is useful when
+    it releases the GIL.
+
+    The pool is created on the first call and reused by the later ones, until
+    `close` is called.
+
+    Example:
+        >>> with PoolEvaluator(solve_and_measure, 'process', max_workers=8) as evaluator:
+        ...     options = opt_alg_options(x0, solve_and_measure, domain, NP, Evaluator=evaluator)
+        ...     gbest, gbest_f = CrayfishOptAlg(options).run()
+    """
+    def __init__(self, objective: Callable,
+                 executor: Literal['process', 'thread']='process',
+                 max_workers: Optional[int]=None, *,
+                 chunk_size: Optional[int]=None,
+                 vectorized: bool=False,
+                 mp_context=None):
+        """
+        Parameters:
+            objective (Callable): The objective function.
+            executor (str, optional): 'process' or 'thread'. Default to 'process'.
+            max_workers (int | None, optional): The number of workers. Default to\
+                the number of CPUs.
+            chunk_size (int | None, optional): The number of rows evaluated by\
+                a task. Default to splitting the population evenly among the workers.
+            vectorized (bool, optional): Whether the objective takes a block of\
+                rows shaped (n, dim) and returns (n, ). Otherwise it takes a single\
+                point shaped (dim, ) and returns a scalar. Default to False.
+            mp_context (optional): The multiprocessing context of the process pool.
+        """
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unknown executor '{executor}', expected 'process' or 'thread'.")
+        self.objective = objective
+        self.executor = executor
+        self.max_workers = os.cpu_count() if max_workers is None else max_workers
+        self.chunk_size = chunk_size
+        self.vectorized = vectorized
+        self.mp_context = mp_context
+        self._pool: Optional[Executor] = None
+
+    def pool(self) -> Executor:
+        if self._pool is None:
+            if self.executor == 'process':
+                self._pool = ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context)
+            else:
+                self._pool = ThreadPoolExecutor(self.max_workers)
+        return self._pool
+
+    def close(self):
+        """Shut down the pool of workers."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __call__(self, x: TensorLike) -> TensorLike:
+        """
+        Parameters:
+            x (Tensor): The population shaped (NP, dim).
+
+        Returns:
+            Tensor: The fitness shaped (NP, ).
+        """
+        NP = x.shape[0]
+        chunk = self.chunk_size or -(-NP // max(self.max_workers, 1))
+        chunk = max(chunk, 1)
+        pool = self.pool()
+
+        if self.executor == 'thread':
+            backend = bm.backend_name
+            futures = [pool.submit(_evaluate, self.objective, x[s:s+chunk], self.vectorized, backend)
+                       for s in range(0, NP, chunk)]
+            return bm.concat([bm.reshape(f.result(), (-1, )) for f in futures])
+
+        xn = bm.to_numpy(x)
+        futures = [pool.submit(_evaluate_numpy, self.objective, xn[s:s+chunk], self.vectorized)
+                   for s in range(0, NP, chunk)]
+        fit = np.concatenate([f.result() for f in futures])
+        return bm.tensor(fit, dtype=x.dtype, device=bm.get_device(x))
@@ -2,7 +2,6 @@
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S
 from .. import logger
-import random
 from .optimizer_base import Optimizer
 from .Levy import levy
 
@@ -38,15 +37,16 @@ class HippopotamusOptAlg(Optimizer):
             Alfa2 = bm.random.rand(i1, dim) 
             Alfa3 = I1 * bm.random.rand(i1, dim) + Ip2
             Alfa4 = bm.random.rand(i1, 1) * bm.ones((i1, dim))
-            AA = bm.array([random.randint(0, 5) for _ in range(i1)])[:, None] 
-            BB = bm.array([random.randint(0, 5) for _ in range(i1)])[:, None]
+            AA = bm.random.randint(0, 6, (i1, 1))
+            BB = bm.random.randint(0, 6, (i1, 1))
             A = (AA == 0) * Alfa0 + (AA == 1) * Alfa1 + (AA == 2) * Alfa2 + (AA == 3) * Alfa3 + (AA == 4) * Alfa4
             B = (BB == 0) * Alfa0 + (BB == 1) * Alfa1 + (BB == 2) * Alfa2 + (BB == 3) * Alfa3 + (BB == 4) * Alfa4
-            RandGroupNumber = [random.randint(1, N + 1) for _ in range(i1)]
-            MeanGroup = bm.zeros((i1, dim))
-            for i in range(i1):
-                RandGroup = bm.random.permutation(N)[: RandGroupNumber[i]]
-                MeanGroup[i] = x[RandGroup].mean(axis=0)
+            # the means of the random groups of the population, where the
+            # group of a row is the individuals of the smallest random keys
+            RandGroupNumber = bm.random.randint(1, N + 2, (i1, 1))
+            rank = bm.argsort(bm.argsort(bm.random.rand(i1, N), axis=1), axis=1)
+            RandGroup = bm.astype(rank < RandGroupNumber, x.dtype)
+            MeanGroup = (RandGroup @ x) / bm.sum(RandGroup, axis=1, keepdims=True)
 
             r1 = bm.random.rand(i1 ,1)
             X_P1 = x[: i1] + r1 * (gbest - I1 * x[: i1]) # Eq.(3)
@@ -54,8 +54,7 @@ class HippopotamusOptAlg(Optimizer):
             F_P1 = self.fun(X_P1)[:, None]
 
             # Eq.(8)
-            mask = F_P1 < fit[: i1]
-            x[: i1], fit[: i1] = bm.where(mask, X_P1, x[: i1]), bm.where(mask, F_P1, fit[: i1])
+            x[: i1], fit[: i1] = self.update_best(x[: i1], fit[: i1], X_P1, F_P1)
 
             if T > 0.6:
                 X_P2 = x[: i1] + A * (gbest - I2 * MeanGroup) # Eq.(6)
@@ -70,18 +69,17 @@ class HippopotamusOptAlg(Optimizer):
             F_P2 = self.fun(X_P2)[:, None]   
             
             # Eq.(9)
-            mask = F_P2 < fit[: i1]
-            x[: i1], fit[: i1] = bm.where(mask, X_P2, x[: i1]), bm.where(mask, F_P2, fit[: i1])
+            x[: i1], fit[: i1] = self.update_best(x[: i1], fit[: i1], X_P2, F_P2)
 
             predator = lb + bm.random.rand(i1, dim) * (ub - lb) # Eq.(10)
             F_HL = self.fun(predator)[:, None]
             distance2Leader = abs(predator - x[i1:]) # Eq.(11)
             RL = 0.05 * levy(i1, dim, 1.5) # Eq.(13)
 
-            b = bm.random.uniform(2, 4, (i1, 1))
-            c = bm.random.uniform(1, 1.5, (i1, 1))
-            d = bm.random.uniform(2, 3, (i1, 1))
-            g = bm.random.uniform(-1, 1, (i1, 1))
+            b = 2 + 2 * bm.random.rand(i1, 1)
+            c = 1 + 0.5 * bm.random.rand(i1, 1)
+            d = 2 + bm.random.rand(i1, 1)
+            g = 2 * bm.random.rand(i1, 1) - 1
 
             # Eq.(12)
             X_P3 = ((fit[i1:] > F_HL) * 
@@ -92,8 +90,7 @@ class HippopotamusOptAlg(Optimizer):
             F_P3 = self.fun(X_P3)[:, None]
 
             # Eq.(15)
-            mask = F_P3 < fit[: i1]
-            x[: i1] , fit[: i1] = bm.where(mask, X_P3, x[: i1]), bm.where(mask, F_P3, fit[: i1])
+            x[: i1], fit[: i1] = self.update_best(x[: i1], fit[: i1], X_P3, F_P3)
 
             # Eq.(16)
             l_local = lb / (it + 1)
@@ -104,18 +101,15 @@ class HippopotamusOptAlg(Optimizer):
             Blfa1 = bm.random.rand(N, 1) * bm.ones((N, dim))
             Blfa2 = bm.random.randn(N, 1) * bm.ones((N, dim))
 
-            DD = bm.random.randint(0, 3, N)[:, None] 
+            DD = bm.random.randint(0, 3, (N, 1))
             D = (DD == 0) * Blfa0 + (DD == 1) * Blfa1 + (DD == 2) * Blfa2
 
-            X_P4 = x + bm.random.rand() * (l_local + D * (h_local - l_local)) # Eq.(17)
+            X_P4 = x + bm.random.rand(1) * (l_local + D * (h_local - l_local)) # Eq.(17)
             X_P4 = X_P4 + (lb - X_P4) * (X_P4 < lb) + (ub - X_P4) * (X_P4 > ub)
             F_P4 = self.fun(X_P4)[:, None]
 
             # Eq.(19)
-            mask = F_P4 < fit
-            x , fit = bm.where(mask, X_P4, x), bm.where(mask, F_P4, fit)
-
-            gbest_idx = bm.argmin(fit)
-            (gbest, gbest_f) = (x[gbest_idx], fit[gbest_idx]) if fit[gbest_idx] < gbest_f else (gbest, gbest_f)
+            x, fit = self.update_best(x, fit, X_P4, F_P4)
+            gbest, gbest_f = self.update_gbest(x, fit, gbest, gbest_f)
             Convergence_curve.append(gbest_f[0])
         return gbest, gbest_f, Convergence_curve
@@ -46,9 +46,7 @@ class HoneybadgerOptAlg(Optimizer):
                       (gbest + F * r7 * alpha * di))
             x_new = x_new + (lb - x_new) * (x_new < lb) + (ub - x_new) * (x_new > ub)
             fit_new = self.fun(x_new)[:, None]
-            mask = fit_new < fit 
-            x, fit = bm.where(mask, x_new, x), bm.where(mask, fit_new, fit)
-            gbest_idx = bm.argmin(fit)
-            (gbest, gbest_f) = (x[gbest_idx], fit[gbest_idx]) if fit[gbest_idx] < gbest_f else (gbest, gbest_f)
+            x, fit = self.update_best(x, fit, x_new, fit_new)
+            gbest, gbest_f = self.update_gbest(x, fit, gbest, gbest_f)
             # print("HBA: The optimum at iteration", t + 1, "is", gbest_f) 
         return gbest, gbest_f
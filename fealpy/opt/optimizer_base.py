@@ -19,6 +19,7 @@ def opt_alg_options(
     NumGrad: int = 10,
     LineSearch: Optional[str] = None,
     Print: bool = True,
+    Evaluator: Optional[Callable] = None,
 ):
     options = {
             "x0": x0,
@@ -36,6 +37,7 @@ def opt_alg_options(
             "NumGrad": NumGrad,
             "LineSearch": LineSearch,
             "Print": Print,
+            "Evaluator": Evaluator,
             }
     return options 
 
@@ -58,15 +60,55 @@ class Optimizer():
         Objective function.
         The counter `self.NF` works automatically when call `fun(x)`.
 
+        The population-based algorithms evaluate the whole population at once,
+        so the objective receives `x` shaped (NP, dim) and returns (NP, ), and
+        every row counts as an evaluation. If the option `Evaluator` is given,
+        e.g. a `PoolEvaluator`, it is called on the population instead.
+
         Parameters:
             x [TensorLike]: Input of objective function.
 
         Return:
             The function value, with gradient value for gradient methods.
         """
-        self.__NF += self.options['NP'] 
+        self.__NF += x.shape[0] if x.ndim > 1 else 1
+        evaluator = self.options.get('Evaluator', None)
+        if evaluator is not None:
+            return evaluator(x)
         return self.options['objective'](x)
 
+    @staticmethod
+    def update_best(x: TensorLike, fit: TensorLike,
+                    x_new: TensorLike, fit_new: TensorLike) -> Tuple[TensorLike, TensorLike]:
+        """
+        Greedy selection, keep the better one of the old and the new individual
+        for every row, e.g. the personal bests.
+
+        Parameters:
+            x, fit [TensorLike]: The individuals (NP, dim) and their fitness, (NP, ) or (NP, 1).
+            x_new, fit_new [TensorLike]: The new ones, in the same shapes.
+
+        Return:
+            The selected individuals and their fitness.
+        """
+        mask = fit_new < fit
+        return bm.where(mask.reshape(-1, 1), x_new, x), bm.where(mask, fit_new, fit)
+
+    @staticmethod
+    def update_gbest(x: TensorLike, fit: TensorLike,
+                     gbest: TensorLike, gbest_f: TensorLike) -> Tuple[TensorLike, TensorLike]:
+        """
+        Replace the global best by the best individual of the population, if it is better.
+
+        Return:
+            The global best and its fitness.
+        """
+        idx = bm.argmin(fit)
+        if fit[idx] < gbest_f:
+            # copied, since some algorithms update the population in place
+            return bm.copy(x[idx]), bm.copy(fit[idx])
+        return gbest, gbest_f
+
 
     def run(self):
         raise NotImplementedError
@@ -38,9 +38,7 @@ class ParticleSwarmOptAlg(Optimizer):
             a = a + v
             a = a + (lb - a) * (a < lb) + (ub - a) * (a > ub)
             fit = self.fun(a)
-            mask = fit < pbest_f
-            pbest, pbest_f = bm.where(mask[:, None], a, pbest), bm.where(fit < pbest_f, fit, pbest_f)
-            gbest_idx = bm.argmin(pbest_f)
-            (gbest_f, gbest) = (pbest_f[gbest_idx], pbest[gbest_idx]) if pbest_f[gbest_idx] < gbest_f else (gbest_f, gbest)
+            pbest, pbest_f = self.update_best(pbest, pbest_f, a, fit)
+            gbest, gbest_f = self.update_gbest(pbest, pbest_f, gbest, gbest_f)
             # print("PSO: The optimum at iteration", it + 1, "is", gbest_f)
         return gbest, gbest_f
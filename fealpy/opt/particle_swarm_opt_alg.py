@@ -1,10 +1,13 @@
 from fealpy.backend import backend_manager as bm
-import networkx as nx
 import scipy.sparse as sp
 from scipy.spatial.distance import pdist, squareform
 from scipy import ndimage
 from scipy.ndimage import label
-import matplotlib.pyplot as plt
+
+from ..lazy import lazy_import
+
+nx = lazy_import('networkx', hint="Install it by `pip install networkx`.")
+plt = lazy_import('matplotlib.pyplot')
 
 class PSOProblem:
     def __init__(self, MAP, dataS, dataE):
@@ -150,8 +153,17 @@ class PSO:
         return fit, a, pbest, pbest_f
     
     def updatePGbest(self, fit, x, pbest_f, pbest):
-        pbest_f, pbest = (fit, x) if fit < pbest_f else (pbest_f, pbest)
-        gbest_f, gbest = (pbest_f, pbest) if pbest_f < self.gbest_f else (self.gbest_f, self.gbest)
+        """
+        Update the personal bests of the whole swarm and the global best, where
+        `fit` is shaped (N, ) and `x` is shaped (N, dim).
+        """
+        mask = fit < pbest_f
+        pbest, pbest_f = bm.where(mask[:, None], x, pbest), bm.where(mask, fit, pbest_f)
+        gbest_idx = bm.argmin(pbest_f)
+        if pbest_f[gbest_idx] < self.gbest_f:
+            gbest_f, gbest = pbest_f[gbest_idx], pbest[gbest_idx]
+        else:
+            gbest_f, gbest = self.gbest_f, self.gbest
         return pbest_f, pbest, gbest_f, gbest
 
     def cal(self):
@@ -167,9 +179,8 @@ class PSO:
             v = v + (self.vlb - v) * (v < self.vlb) + (self.vub - v) * (v > self.vub)
             x = x + v
             x = x + (self.lb - x) * (x < self.lb) + (self.ub - x) * (x > self.ub)
-            for i in range(0, self.N):
-                fit[i,0] = self.fobj(x[i, :])
-                pbest_f[i, 0], pbest[i, :], self.gbest_f, self.gbest = self.updatePGbest(fit[i,0], x[i,:], pbest_f[i, 0], pbest[i, :])  
+            fit = self.fobj(x)
+            pbest_f, pbest, self.gbest_f, self.gbest = self.updatePGbest(fit, x, pbest_f, pbest)
 
 class QPSO(PSO):
     def cal(self):
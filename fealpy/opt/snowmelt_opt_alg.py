@@ -4,8 +4,6 @@ from ..typing import TensorLike, Index, _S
 from .. import logger
 from .optimizer_base import Optimizer
 
-import random
-
 
 class SnowmeltOptAlg(Optimizer):
 
@@ -49,7 +47,6 @@ class SnowmeltOptAlg(Optimizer):
         Convergence_curve.append(Best_score)
         
         #分割
-        index = bm.arange(N)
         Na = int(N / 2)
         Nb = int(N / 2)
 
@@ -66,20 +63,20 @@ class SnowmeltOptAlg(Optimizer):
             #种群质心位置
             X_centroid = bm.mean(X, axis=0)
 
-            # 随机分配索引号
-            index1 = list(set([random.randint(0, N - 1) for _ in range(Na)]))
-            index2 = list(set(index).difference(index1))
-            
-            r1 = bm.random.rand(len(index1), 1)
-            k1 = [random.randint(0,3) for _ in range(len(index1))]
-                  
-            X[index1] = Elite_pool[k1] + RB[index1] * (r1 * (Best_pos - X[index1]) + (1 - r1) * (X_centroid - X[index1]))
-                
+            # 随机分配索引号, 第一组为 Na 个随机下标 (可重复) 中的个体, 其余为第二组
+            index1 = bm.zeros((N, ), dtype=bm.bool)
+            index1 = bm.set_at(index1, bm.random.randint(0, N, (Na, )), True)
+
+            r1 = bm.random.rand(N, 1)
+            k1 = bm.random.randint(0, 4, (N, ))
+            X1 = Elite_pool[k1] + RB * (r1 * (Best_pos - X) + (1 - r1) * (X_centroid - X))
+
             Na, Nb = (Na + 1, Nb - 1) if Na < N else (Na, Nb)
-            
+
             if Nb >=1:
-                r2 = 2 * bm.random.rand(len(index2), 1) - 1
-                X[index2] = M * Best_pos + RB[index2] * (r2 * (Best_pos - X[index2]) + (1 - r2) * (X_centroid - X[index2])) 
+                r2 = 2 * bm.random.rand(N, 1) - 1
+                X = M * Best_pos + RB * (r2 * (Best_pos - X) + (1 - r2) * (X_centroid - X))
+            X = bm.where(index1[:, None], X1, X)
 
             #检查是否超出搜索空间
             X = X + (lb - X) * (X < lb) + (ub - X) * (X > ub)
@@ -1,3 +1,18 @@
-from .VTKPlotter import VTKPlotter
-from .actors import Actor
-from .actors import meshactor
+"""The VTK Plotter Module
+
+The plotters are imported on first access, see `fealpy.lazy`, so that the
+OpenGL plotters in `fealpy.plotter.gl` do not require vtk.
+"""
+from typing import TYPE_CHECKING
+
+from ..lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'VTKPlotter': ['VTKPlotter'],
+    'actors': ['Actor', 'meshactor'],
+})
+
+if TYPE_CHECKING:
+    from .VTKPlotter import VTKPlotter
+    from .actors import Actor
+    from .actors import meshactor
@@ -1,5 +1,16 @@
+from typing import TYPE_CHECKING
 
-from .camera import Camera
-from .opengl_plotter import OpenGLPlotter
-from .ocam_model import OCAMModel
-from .ocam_system import OCAMSystem 
+from ...lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'camera': ['Camera'],
+    'opengl_plotter': ['OpenGLPlotter'],
+    'ocam_model': ['OCAMModel'],
+    'ocam_system': ['OCAMSystem'],
+})
+
+if TYPE_CHECKING:
+    from .camera import Camera
+    from .opengl_plotter import OpenGLPlotter
+    from .ocam_model import OCAMModel
+    from .ocam_system import OCAMSystem
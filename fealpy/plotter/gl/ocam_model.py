@@ -2,16 +2,17 @@ from dataclasses import dataclass, field
 from typing import Callable, Any, Tuple
 
 import numpy as np
-import cv2
 import os
 import pickle
 import glob
-import matplotlib.pyplot as plt
 
-from fealpy.mesh import DistMesher2d
+from ...lazy import lazy_import
 from ...geometry.domain import Domain
 from fealpy.geometry import dintersection,drectangle,dcircle
 
+cv2 = lazy_import('cv2', hint="Install it by `pip install opencv-python`.")
+plt = lazy_import('matplotlib.pyplot')
+
 @dataclass
 class OCAMModel:
     location: np.ndarray
@@ -369,6 +370,7 @@ class OCAMModel:
         return TriangleMesh(node,cell)
         
     def distmeshing(self,hmin=50,fh=None):
+        from fealpy.mesh import DistMesher2d
         domain=OCAMDomain(icenter=self.icenter,radius=self.radius,fh=fh)
         hmin=50
         mesher=DistMesher2d(domain,hmin)
@@ -1,14 +1,16 @@
 import numpy as np
-import gmsh
 import os
-import cv2
-import matplotlib.pyplot as plt
 
 from dataclasses import dataclass, field
 from .ocam_model import OCAMModel
 from fealpy.mesh import TriangleMesh
 import pickle
 from app.svads3d.harmonic_map import *
+from ...lazy import lazy_import
+
+gmsh = lazy_import('gmsh', hint="Install it by `pip install gmsh`.")
+cv2 = lazy_import('cv2', hint="Install it by `pip install opencv-python`.")
+plt = lazy_import('matplotlib.pyplot')
 
 @dataclass
 class GroundMarkPoint:
@@ -1,3 +1,38 @@
+"""The Solver Module
 
-from .conjugate_gradient import cg
-from .direct_solver import spsolve
+The solvers are imported on first access, see `fealpy.lazy`.
+"""
+from typing import TYPE_CHECKING
+
+from ..lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'conjugate_gradient': ['cg'],
+    'minres': ['minres'],
+    'gmres': ['gmres'],
+    'bicgstab': ['bicgstab'],
+    'solver_info': ['SolverInfo'],
+    'preconditioner': [
+        'JacobiPreconditioner',
+        'SSORPreconditioner',
+        'ILU0Preconditioner'
+    ],
+    'direct_solver': ['spsolve', 'factorized', 'FactorizedSolver', 'FactorizationCache'],
+    'amg_solver': ['AMGSolver'],
+    'gmg_solver': ['GMGSolver'],
+})
+
+if TYPE_CHECKING:
+    from .conjugate_gradient import cg
+    from .minres import minres
+    from .gmres import gmres
+    from .bicgstab import bicgstab
+    from .solver_info import SolverInfo
+    from .preconditioner import (
+        JacobiPreconditioner,
+        SSORPreconditioner,
+        ILU0Preconditioner
+    )
+    from .direct_solver import spsolve, factorized, FactorizedSolver, FactorizationCache
+    from .amg_solver import AMGSolver
+    from .gmg_solver import GMGSolver
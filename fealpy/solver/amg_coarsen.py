@@ -0,0 +1,178 @@
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import CSRTensor
+from ..sparse.utils import csr_row_pointer, coalesce_indices
+
+
+def csr_from_triplets(row: TensorLike, col: TensorLike, values: TensorLike,
+                      shape) -> CSRTensor:
+    """Build a CSRTensor from (row, col, value) triplets, summing duplicates."""
+    urow, ucol, location = coalesce_indices(row, col, shape)
+    new_values = bm.zeros((urow.shape[0], ), **bm.context(values))
+    new_values = bm.index_add(new_values, location, values)
+    crow = csr_row_pointer(urow, shape[0])
+
+    return CSRTensor(crow, ucol, new_values, shape)
+
+
+def diagonal(A: CSRTensor) -> TensorLike:
+    """Return the diagonal of a square CSR matrix."""
+    row, col, val = A.row(), A.col(), A.values()
+    flag = (row == col)
+    d = bm.zeros((A.shape[0], ), **bm.context(val))
+    return bm.index_add(d, row[flag], val[flag])
+
+
+def _random_weight(N: int, **kwargs) -> TensorLike:
+    """Deterministic weights in [0, 1) used to break ties between nodes."""
+    idx = bm.arange(N, **kwargs)
+    return (idx * 0.6180339887498949) % 1.0
+
+
+def symmetric_strength(A: CSRTensor, theta: float=0.08) -> TensorLike:
+    """Strength of connection for smoothed aggregation.
+
+    The entry a_ij is strong if |a_ij| > theta * sqrt(|a_ii a_jj|).
+
+    Returns:
+        Tensor: a boolean mask over the non-zeros of `A`.
+    """
+    row, col, val = A.row(), A.col(), A.values()
+    d = bm.abs(diagonal(A))
+    flag = bm.abs(val) > theta * bm.sqrt(d[row] * d[col])
+    return flag & (row != col)
+
+
+def classical_strength(A: CSRTensor, theta: float=0.025) -> TensorLike:
+    """Strength of connection for classical (Ruge-Stuben) AMG.
+
+    The matrix is scaled to have a unit diagonal, then the entry a_ij is strong
+    if -a_ij / sqrt(a_ii a_jj) > theta, see `fealpy.old.solver.amg_coarsen`.
+
+    Returns:
+        Tensor: a boolean mask over the non-zeros of `A`.
+    """
+    row, col, val = A.row(), A.col(), A.values()
+    d = bm.abs(diagonal(A))
+    s = bm.zeros_like(d)
+    flag = d > 0
+    s = bm.set_at(s, flag, 1.0 / bm.sqrt(d[flag]))
+    flag = -val * s[row] * s[col] > theta
+    return flag & (row != col)
+
+
+def independent_set(row: TensorLike, col: TensorLike, weight: TensorLike,
+                    candidate: TensorLike) -> TensorLike:
+    """Find a maximal independent set of a symmetric graph.
+
+    In every round, an undecided node is selected if its weight is larger than
+    that of all its undecided neighbours, and the neighbours of the selected
+    nodes are removed. This is the parallel (Luby-type) algorithm, so every
+    round is a few vectorized operations over the edges.
+
+    Parameters:
+        row (Tensor): the first node of each edge, shaped (NE, ).
+        col (Tensor): the second node of each edge, shaped (NE, ).
+            Both directions of an edge must be present.
+        weight (Tensor): weights of nodes, shaped (N, ). Ties are broken by
+            the node index.
+        candidate (Tensor): boolean mask of the nodes allowed to be selected.
+
+    Returns:
+        Tensor: boolean mask of the selected nodes.
+    """
+    N = weight.shape[0]
+    kwargs = bm.context(row)
+    idx = bm.arange(N, **kwargs)
+    lose = (weight[row] < weight[col]) | \
+           ((weight[row] == weight[col]) & (idx[row] < idx[col]))
+    selected = bm.zeros((N, ), dtype=bm.bool, device=bm.get_device(row))
+    undecided = bm.copy(candidate)
+
+    while bm.any(undecided):
+        flag = undecided[row] & undecided[col] & lose
+        isS = bm.copy(undecided)
+        isS = bm.set_at(isS, row[flag], False)
+        selected = selected | isS
+        undecided = undecided & (~isS)
+        undecided = bm.set_at(undecided, col[isS[row]], False)
+
+    return selected
+
+
+def pmis_coarsen(A: CSRTensor, theta: float=0.025):
+    """C/F splitting by parallel maximal independent set (PMIS).
+
+    The coarse nodes form a maximal independent set of the symmetrized strength
+    graph, where nodes influencing more others are preferred. So every fine
+    node with strong connections has at least one strong coarse neighbour.
+    Unlike the Ruge-Stuben coarsening, there is no second pass, so it is better
+    used with `extended_interpolation` reaching coarse nodes at distance two.
+
+    Parameters:
+        A (CSRTensor): the matrix, shaped (N, N).
+        theta (float, optional): strength threshold, see `classical_strength`.
+
+    Returns:
+        Tuple[Tensor, Tensor]: the boolean mask of coarse nodes, shaped (N, ),
+        and the strength mask over the non-zeros of `A`.
+    """
+    N = A.shape[0]
+    strong = classical_strength(A, theta)
+    row, col = A.row()[strong], A.col()[strong]
+    row, col, _ = coalesce_indices(bm.concat([row, col]), bm.concat([col, row]), A.shape)
+
+    kwargs = bm.context(A.values())
+    measure = bm.zeros((N, ), **kwargs)
+    measure = bm.index_add(measure, col, bm.ones(col.shape, **kwargs))
+    weight = measure + _random_weight(N, **kwargs)
+    isC = independent_set(row, col, weight, measure > 0)
+
+    return isC, strong
+
+
+def aggregation_coarsen(A: CSRTensor, theta: float=0.08):
+    """Group nodes into aggregates for smoothed aggregation AMG.
+
+    Roots of the aggregates are a maximal independent set of the square of the
+    strength graph, so no two roots share a neighbour. Every other node then
+    joins the aggregate of the root next to it, or of an aggregated neighbour.
+    Nodes without any strong connection are left out of aggregates.
+
+    Parameters:
+        A (CSRTensor): the matrix, shaped (N, N).
+        theta (float, optional): strength threshold, see `symmetric_strength`.
+
+    Returns:
+        Tensor: the aggregate index of every node, shaped (N, ),
+        -1 for nodes not aggregated.
+    """
+    N = A.shape[0]
+    strong = symmetric_strength(A, theta)
+    row, col = A.row()[strong], A.col()[strong]
+    row, col, _ = coalesce_indices(bm.concat([row, col]), bm.concat([col, row]), A.shape)
+
+    kwargs = bm.context(A.values())
+    ones = bm.ones(row.shape, **kwargs)
+    G = CSRTensor(csr_row_pointer(row, N), col, ones, A.shape)
+    G2 = G @ G
+    row2, col2 = G2.row(), G2.col()
+    flag = row2 != col2
+
+    degree = bm.zeros((N, ), **kwargs)
+    degree = bm.index_add(degree, row, ones)
+    weight = _random_weight(N, **kwargs)
+    isRoot = independent_set(row2[flag], col2[flag], weight, degree > 0)
+
+    agg = bm.full((N, ), -1, **bm.context(row))
+    NA = int(bm.sum(isRoot))
+    agg = bm.set_at(agg, isRoot, bm.arange(NA, **bm.context(row)))
+
+    # roots do not share neighbours, so every node is next to at most one root
+    flag = isRoot[col] & (agg[row] < 0)
+    agg = bm.set_at(agg, row[flag], agg[col[flag]])
+    flag = (agg[row] < 0) & (agg[col] >= 0)
+    agg = bm.set_at(agg, row[flag], agg[col[flag]])
+
+    return agg
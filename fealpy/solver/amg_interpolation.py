@@ -0,0 +1,188 @@
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import CSRTensor
+from .amg_coarsen import csr_from_triplets, diagonal
+
+
+def direct_interpolation(A: CSRTensor, isC: TensorLike, strong: TensorLike) -> CSRTensor:
+    """Classical direct interpolation from a C/F splitting.
+
+    A coarse node takes its coarse value, and a fine node i interpolates from
+    its strong coarse neighbours C_i with weights
+
+        w_ij = - alpha_i a_ij / a_ii,  alpha_i = sum_{k != i} a_ik / sum_{k in C_i} a_ik,
+
+    which keeps the row sums of A. Fine nodes without strong coarse neighbours
+    get a zero row.
+
+    Parameters:
+        A (CSRTensor): the matrix, shaped (N, N).
+        isC (Tensor): boolean mask of coarse nodes, shaped (N, ).
+        strong (Tensor): boolean mask of the strong connections over the
+            non-zeros of `A`.
+
+    Returns:
+        CSRTensor: the prolongation matrix, shaped (N, NC).
+    """
+    N = A.shape[0]
+    row, col, val = A.row(), A.col(), A.values()
+    kwargs = bm.context(val)
+    d = diagonal(A)
+    coarse = bm.cumsum(bm.astype(isC, row.dtype), axis=0) - 1
+    NC = int(bm.sum(isC))
+
+    offdiag = row != col
+    total = bm.zeros((N, ), **kwargs)
+    total = bm.index_add(total, row[offdiag], val[offdiag])
+    flag = strong & isC[col] & (~isC[row])
+    part = bm.zeros((N, ), **kwargs)
+    part = bm.index_add(part, row[flag], val[flag])
+
+    flag = flag & (part[row] != 0) & (d[row] != 0)
+    frow, fcol, fval = row[flag], col[flag], val[flag]
+    w = -total[frow] / part[frow] * fval / d[frow]
+
+    crow = bm.nonzero(isC)[0]
+    I = bm.concat([crow, frow])
+    J = bm.concat([coarse[crow], coarse[fcol]])
+    V = bm.concat([bm.ones(crow.shape, **kwargs), w])
+
+    return csr_from_triplets(I, J, V, (N, NC))
+
+
+def truncate_interpolation(P: CSRTensor, pmax: int=4) -> CSRTensor:
+    """Keep at most `pmax` largest entries in each row of an interpolation.
+
+    The remaining entries are scaled to keep the row sums.
+    """
+    row, col, val = P.row(), P.col(), P.values()
+    kwargs = bm.context(row)
+    order = bm.lexsort((-bm.abs(val), row))
+    rank = bm.empty(row.shape, **kwargs)
+    rank = bm.set_at(rank, order, bm.arange(row.shape[0], **kwargs) - P.crow()[row[order]])
+    keep = rank < pmax
+
+    N = P.shape[0]
+    total = bm.zeros((N, ), **bm.context(val))
+    total = bm.index_add(total, row, val)
+    part = bm.zeros((N, ), **bm.context(val))
+    part = bm.index_add(part, row[keep], val[keep])
+    scale = bm.ones_like(part)
+    flag = part != 0
+    scale = bm.set_at(scale, flag, total[flag] / part[flag])
+
+    row, col, val = row[keep], col[keep], val[keep]
+    return csr_from_triplets(row, col, val * scale[row], P.shape)
+
+
+def extended_interpolation(A: CSRTensor, isC: TensorLike, strong: TensorLike,
+                           pmax: int=4) -> CSRTensor:
+    """Interpolation reaching coarse nodes at distance two.
+
+    The direct interpolation P0 is improved by one Jacobi step on the fine rows,
+
+        P[i, :] = - 1 / a_ii sum_{j != i} a_ij P0[j, :],  i in F,
+
+    so a fine node also interpolates from the coarse neighbours of its fine
+    neighbours. This keeps the row sums of the direct interpolation, and
+    recovers a good interpolation from the sparse C/F splitting of
+    `pmis_coarsen`. The rows are then truncated to `pmax` entries to keep the
+    coarse matrices sparse.
+
+    Parameters:
+        A (CSRTensor): the matrix, shaped (N, N).
+        isC (Tensor): boolean mask of coarse nodes, shaped (N, ).
+        strong (Tensor): boolean mask of the strong connections over the
+            non-zeros of `A`.
+        pmax (int, optional): maximum number of entries in a row of the
+            interpolation, no truncation if 0. Defaults to 4.
+
+    Returns:
+        CSRTensor: the prolongation matrix, shaped (N, NC).
+    """
+    P0 = direct_interpolation(A, isC, strong)
+    row, col, val = A.row(), A.col(), A.values()
+    d = diagonal(A)
+    flag = (row != col) & (~isC[row]) & (d[row] != 0)
+    AF = csr_from_triplets(row[flag], col[flag], -val[flag] / d[row[flag]], A.shape)
+    AP = AF @ P0
+
+    crow = P0.row()
+    flag = isC[crow]
+    I = bm.concat([crow[flag], AP.row()])
+    J = bm.concat([P0.col()[flag], AP.col()])
+    V = bm.concat([P0.values()[flag], AP.values()])
+    P = csr_from_triplets(I, J, V, P0.shape)
+
+    if pmax > 0:
+        P = truncate_interpolation(P, pmax)
+    return P
+
+
+def spectral_radius(A: CSRTensor, dinv: TensorLike, maxit: int=20) -> float:
+    """Estimate the spectral radius of D^{-1} A by power iteration.
+
+    The estimate is slightly enlarged, since power iteration approaches the
+    spectral radius from below. The Gershgorin bound is returned if it is
+    smaller.
+    """
+    N = A.shape[0]
+    kwargs = bm.context(A.values())
+    rowsum = bm.zeros((N, ), **kwargs)
+    rowsum = bm.index_add(rowsum, A.row(), bm.abs(A.values()))
+    bound = float(bm.max(rowsum * bm.abs(dinv)))
+
+    v = bm.arange(N, **kwargs) * 0.6180339887498949 % 1.0 + 0.5
+    rho = 0.
+    for _ in range(maxit):
+        v = v / bm.linalg.norm(v)
+        v = dinv * (A @ v)
+        rho = float(bm.linalg.norm(v))
+
+    return min(1.1 * rho, bound)
+
+
+def smoothed_aggregation_interpolation(A: CSRTensor, agg: TensorLike,
+                                       omega: float=4/3) -> CSRTensor:
+    """Smoothed aggregation prolongation from aggregates.
+
+    The tentative prolongation interpolates the constant vector piecewise on
+    aggregates, and is smoothed by one damped Jacobi step
+
+        P = (I - omega / rho D^{-1} A) P_tent,
+
+    where rho is the estimated spectral radius of D^{-1} A.
+
+    Parameters:
+        A (CSRTensor): the matrix, shaped (N, N).
+        agg (Tensor): aggregate index of every node, shaped (N, ),
+            -1 for nodes not aggregated.
+        omega (float, optional): damping factor. Defaults to 4/3.
+
+    Returns:
+        CSRTensor: the prolongation matrix, shaped (N, NA).
+    """
+    N = A.shape[0]
+    kwargs = bm.context(A.values())
+    NA = int(bm.max(agg)) + 1 if N > 0 else 0
+
+    node = bm.nonzero(agg >= 0)[0]
+    size = bm.zeros((NA, ), **kwargs)
+    size = bm.index_add(size, agg[node], bm.ones(node.shape, **kwargs))
+    tval = 1.0 / bm.sqrt(size[agg[node]])
+    T = csr_from_triplets(node, agg[node], tval, (N, NA))
+
+    d = diagonal(A)
+    dinv = bm.zeros_like(d)
+    flag = d != 0
+    dinv = bm.set_at(dinv, flag, 1.0 / d[flag])
+    rho = spectral_radius(A, dinv)
+
+    AT = A @ T
+    arow = AT.row()
+    I = bm.concat([T.row(), arow])
+    J = bm.concat([T.col(), AT.col()])
+    V = bm.concat([T.values(), -omega / rho * dinv[arow] * AT.values()])
+
+    return csr_from_triplets(I, J, V, (N, NA))
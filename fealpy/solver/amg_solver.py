@@ -0,0 +1,343 @@
+
+from typing import Optional, Union, List
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+from .. import logger
+from .amg_coarsen import diagonal, pmis_coarsen, aggregation_coarsen, classical_strength
+from .amg_interpolation import (
+    extended_interpolation,
+    smoothed_aggregation_interpolation,
+    spectral_radius
+)
+
+
+class AMGSolver():
+    """Algebraic multigrid solver and preconditioner for sparse SPD systems.
+
+    Two kinds of hierarchies are supported:
+
+    - 'rs': classical Ruge-Stuben AMG, with C/F splitting by parallel maximal
+      independent set and truncated extended interpolation;
+    - 'sa': smoothed aggregation AMG.
+
+    All the work is done with `CSRTensor` and the backend manager, so the
+    solver runs on every backend and device.
+
+    Note that level 0 is the finest level, and the hierarchy built by `setup`
+    is reused by every following `solve`, so the setup cost is paid once for
+    the same matrix.
+
+    Example:
+        >>> solver = AMGSolver(method='sa').setup(A)
+        >>> x = solver.solve(b)
+        >>> M = solver.aspreconditioner()   # M @ r applies one cycle
+    """
+    MAX_DENSE = 5000
+
+    def __init__(self,
+            method: str = 'rs',
+            theta: Optional[float] = None,
+            max_levels: int = 10,
+            coarse_size: int = 200,
+            pmax: int = 4,
+            cycle: str = 'V',
+            smoother: str = 'jacobi',
+            sstep: int = 1,
+            omega: float = 4/3,
+            rtol: float = 1e-8,
+            atol: float = 1e-12,
+            maxiter: int = 200):
+        """
+        Parameters:
+            method (str, optional): 'rs' or 'sa'. Defaults to 'rs'.
+            theta (float | None, optional): strength threshold. Defaults to
+                0.025 for 'rs' and 0.08 for 'sa'.
+            max_levels (int, optional): maximum number of levels. Defaults to 10.
+            coarse_size (int, optional): stop coarsening when the problem size is
+                not larger than this, the coarsest problem is solved directly.
+                Defaults to 200.
+            pmax (int, optional): maximum number of entries in a row of the
+                classical interpolation, no truncation if 0. Defaults to 4.
+            cycle (str, optional): 'V' or 'W'. Defaults to 'V'.
+            smoother (str, optional): 'jacobi' or 'chebyshev'. Defaults to 'jacobi'.
+            sstep (int, optional): number of pre- and post-smoothing steps, or the
+                polynomial degree for the Chebyshev smoother. Defaults to 1.
+            omega (float, optional): damping factor of the Jacobi smoother,
+                which is scaled by the inverse of the estimated spectral radius
+                of D^{-1} A on every level. Defaults to 4/3.
+            rtol (float, optional): relative tolerance of `solve`. Defaults to 1e-8.
+            atol (float, optional): absolute tolerance of `solve`. Defaults to 1e-12.
+            maxiter (int, optional): maximum number of cycles of `solve`.
+                Defaults to 200.
+        """
+        if method not in ('rs', 'sa'):
+            raise ValueError(f"Unknown AMG method '{method}', expected 'rs' or 'sa'.")
+        if cycle not in ('V', 'W'):
+            raise ValueError(f"Unknown cycle type '{cycle}', expected 'V' or 'W'.")
+        if smoother not in ('jacobi', 'chebyshev'):
+            raise ValueError(f"Unknown smoother '{smoother}', "
+                             "expected 'jacobi' or 'chebyshev'.")
+
+        self.method = method
+        self.theta = theta
+        self.max_levels = max_levels
+        self.coarse_size = coarse_size
+        self.pmax = pmax
+        self.cycle = cycle
+        self.smoother = smoother
+        self.sstep = sstep
+        self.omega = omega
+        self.rtol = rtol
+        self.atol = atol
+        self.maxiter = maxiter
+
+        self.A: List[CSRTensor] = []
+        self.P: List[CSRTensor] = []
+        self.R: List[CSRTensor] = []
+        self.splitting = []
+        self.niter = 0
+
+    @property
+    def nlevels(self) -> int:
+        return len(self.A)
+
+    def setup(self, A: Union[COOTensor, CSRTensor]):
+        """Build the multigrid hierarchy of the matrix `A`.
+
+        Parameters:
+            A (COOTensor | CSRTensor): the SPD matrix, shaped (N, N).
+
+        Returns:
+            AMGSolver: self.
+        """
+        A = self._as_csr(A)
+        self.A = [A]
+        self.P = []
+        self.R = []
+        self.splitting = []
+
+        while len(self.A) < self.max_levels and self.A[-1].shape[0] > self.coarse_size:
+            A = self.A[-1]
+            if self.method == 'rs':
+                theta = 0.025 if self.theta is None else self.theta
+                isC, strong = pmis_coarsen(A, theta)
+                split = isC
+                P = extended_interpolation(A, isC, strong, self.pmax)
+            else:
+                theta = 0.08 if self.theta is None else self.theta
+                split = aggregation_coarsen(A, theta)
+                P = smoothed_aggregation_interpolation(A, split)
+
+            NC = P.shape[1]
+            if NC == 0 or NC >= A.shape[0]:
+                break
+            self._add_level(P, split)
+
+        self._setup_smoother()
+        return self
+
+    def update(self, A: Union[COOTensor, CSRTensor]):
+        """Update the hierarchy for new matrix values, keeping the coarsening.
+
+        The C/F splittings or aggregates found by `setup` are reused, while
+        the interpolations and coarse matrices are rebuilt from the new values.
+        This is much cheaper than `setup` when a sequence of matrices with the
+        same structure is solved, e.g. in time stepping.
+
+        Parameters:
+            A (COOTensor | CSRTensor): the SPD matrix with the same shape as
+                the one passed to `setup`.
+
+        Returns:
+            AMGSolver: self.
+        """
+        if len(self.A) == 0:
+            return self.setup(A)
+
+        A = self._as_csr(A)
+        if A.shape != self.A[0].shape:
+            raise ValueError(f"the shape of the new matrix {A.shape} does not "
+                             f"match that of the hierarchy {self.A[0].shape}")
+        splitting = self.splitting
+        self.A = [A]
+        self.P = []
+        self.R = []
+        self.splitting = []
+
+        for split in splitting:
+            A = self.A[-1]
+            if self.method == 'rs':
+                theta = 0.025 if self.theta is None else self.theta
+                P = extended_interpolation(A, split, classical_strength(A, theta), self.pmax)
+            else:
+                P = smoothed_aggregation_interpolation(A, split)
+            self._add_level(P, split)
+
+        self._setup_smoother()
+        return self
+
+    def operator_complexity(self) -> float:
+        """The total number of non-zeros on all levels over that of level 0."""
+        return sum(A.nnz for A in self.A) / self.A[0].nnz
+
+    def solve(self, b: TensorLike, x0: Optional[TensorLike]=None) -> TensorLike:
+        """Solve Ax = b by multigrid cycles.
+
+        Parameters:
+            b (TensorLike): the right-hand side, shaped (N, ) or (N, batch).
+            x0 (TensorLike | None, optional): initial guess. Defaults to zeros.
+
+        Returns:
+            Tensor: the approximate solution, with the same shape as `b`.
+        """
+        if len(self.A) == 0:
+            raise RuntimeError("AMGSolver.setup must be called before solve.")
+        A = self.A[0]
+        x = bm.zeros_like(b) if x0 is None else x0
+        b_norm = bm.linalg.norm(b)
+        self.niter = 0
+
+        while True:
+            r = b - A @ x
+            r_norm = bm.linalg.norm(r)
+
+            if r_norm < self.atol:
+                logger.info(f"AMG: converged in {self.niter} iterations, "
+                            "stopped by absolute tolerance.")
+                break
+
+            if r_norm < self.rtol * b_norm:
+                logger.info(f"AMG: converged in {self.niter} iterations, "
+                            "stopped by relative tolerance.")
+                break
+
+            if self.niter >= self.maxiter:
+                logger.info(f"AMG: failed, stopped by maxiter ({self.maxiter}).")
+                break
+
+            x = x + self._cycle(0, r, bm.zeros_like(r))
+            self.niter += 1
+
+        return x
+
+    def precondition(self, r: TensorLike) -> TensorLike:
+        """Apply one multigrid cycle to `r` with zero initial guess."""
+        return self._cycle(0, r, bm.zeros_like(r))
+
+    def aspreconditioner(self):
+        """Return the multigrid cycle as an operator supporting `M @ r`."""
+        return AMGPreconditioner(self)
+
+    def print(self):
+        """Print the size of every level."""
+        for l, A in enumerate(self.A):
+            print(f"level {l}: shape = {A.shape}, nnz = {A.nnz}")
+        print(f"operator complexity: {self.operator_complexity():.3f}")
+
+    ### Internal ###
+
+    @staticmethod
+    def _as_csr(A) -> CSRTensor:
+        if isinstance(A, COOTensor):
+            A = A.coalesce().tocsr()
+        elif not isinstance(A, CSRTensor):
+            raise TypeError(f"A must be a COOTensor or CSRTensor, but got {type(A).__name__}")
+        if A.values() is None or A.dense_ndim != 0:
+            raise ValueError("A must be a sparse matrix with scalar values")
+        return A
+
+    def _add_level(self, P: CSRTensor, split):
+        R = P.T
+        self.P.append(P)
+        self.R.append(R)
+        self.splitting.append(split)
+        self.A.append(R @ (self.A[-1] @ P))
+
+    def _setup_smoother(self):
+        self.Dinv = []
+        self.rho = []
+
+        for A in self.A:
+            d = diagonal(A)
+            dinv = bm.zeros_like(d)
+            flag = d != 0
+            dinv = bm.set_at(dinv, flag, 1.0 / d[flag])
+            self.Dinv.append(dinv)
+            self.rho.append(spectral_radius(A, dinv))
+
+        NC = self.A[-1].shape[0]
+        if NC <= self.MAX_DENSE:
+            self.coarse_inv = bm.linalg.pinv(self.A[-1].to_dense())
+        else:
+            logger.warning(f"AMG: coarsening stopped at size {NC}, which is too "
+                           "large for a direct solver. The coarsest level is "
+                           "solved by smoothing instead.")
+            self.coarse_inv = None
+
+    def _smooth(self, level: int, b: TensorLike, x: TensorLike) -> TensorLike:
+        A = self.A[level]
+        dinv = self.Dinv[level]
+        if b.ndim == 2:
+            dinv = dinv[:, None]
+
+        if self.smoother == 'jacobi':
+            omega = self.omega / self.rho[level]
+            for _ in range(self.sstep):
+                x = x + omega * dinv * (b - A @ x)
+            return x
+
+        # Chebyshev iteration for D^{-1} A on [upper/30, upper]
+        upper = self.rho[level]
+        lower = upper / 30.
+        theta = (upper + lower) / 2.
+        delta = (upper - lower) / 2.
+        sigma = theta / delta
+        rho_k = 1. / sigma
+        r = dinv * (b - A @ x)
+        d = r / theta
+
+        for _ in range(self.sstep):
+            x = x + d
+            r = r - dinv * (A @ d)
+            rho_new = 1. / (2. * sigma - rho_k)
+            d = rho_new * rho_k * d + 2. * rho_new / delta * r
+            rho_k = rho_new
+
+        return x
+
+    def _cycle(self, level: int, b: TensorLike, x: TensorLike) -> TensorLike:
+        if level == len(self.A) - 1:
+            if self.coarse_inv is not None:
+                return self.coarse_inv @ b
+            for _ in range(10):
+                x = self._smooth(level, b, x)
+            return x
+
+        A = self.A[level]
+        x = self._smooth(level, b, x)
+        rc = self.R[level] @ (b - A @ x)
+        ec = bm.zeros_like(rc)
+
+        for _ in range(1 if self.cycle == 'V' else 2):
+            ec = self._cycle(level + 1, rc, ec)
+            if level + 1 == len(self.A) - 1:
+                break
+
+        x = x + self.P[level] @ ec
+        return self._smooth(level, b, x)
+
+
+class AMGPreconditioner():
+    """Multigrid cycle of an `AMGSolver` as a linear operator."""
+    def __init__(self, solver: AMGSolver):
+        self.solver = solver
+
+    @property
+    def shape(self):
+        return self.solver.A[0].shape
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return self.solver.precondition(r)
@@ -0,0 +1,107 @@
+
+from typing import Optional, Union
+from time import perf_counter
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .solver_info import (
+    SupportsMatmul, SolverInfo, TimedOperator, as_column_operator,
+    column_norm, safe_divide, prepare_system, restore_shape,
+    is_converged, log_result
+)
+from .preconditioner import get_preconditioner
+
+
+def bicgstab(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+             batch_first: bool=False,
+             atol: float=1e-12, rtol: float=1e-8,
+             maxiter: Optional[int]=10000,
+             M: Union[str, SupportsMatmul, None]=None,
+             returninfo: bool=False):
+    """Solve a linear system Ax = b using the Biconjugate Gradient Stabilized (BiCGStab) method.
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
+        Must have the same shape as b when reshaped appropriately.
+        batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
+        is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        M (str | SupportsMatmul | None, optional): The preconditioner, applied\
+        from the right. See `cg`. Default is None.
+        returninfo (bool, optional): Whether to return a `SolverInfo` as well. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        SolverInfo: The convergence report, only returned if `returninfo` is True.
+
+    Note:
+        BiCGStab works for general non-singular matrices with short recurrences,
+        taking two matrix-vector products per iteration.
+        Every column of a batched `b` is stopped independently.
+    """
+    B, X0 = prepare_system(b, x0, batch_first)
+    info = SolverInfo('bicgstab')
+    start = perf_counter()
+    M = as_column_operator(get_preconditioner(A, M), b)
+    sol = _bicgstab_impl(TimedOperator(as_column_operator(A, b), info), B, X0, M, atol, rtol, maxiter, info)
+    info.wall_time = perf_counter() - start
+    log_result(info, maxiter)
+    sol = restore_shape(sol, b, batch_first)
+
+    if returninfo:
+        return sol, info
+    return sol
+
+
+def _bicgstab_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter,
+                   info: SolverInfo):
+    precond = (lambda r: r) if M is None else (lambda r: M @ r)
+
+    x = x0
+    r = b - A @ x
+    rhat = r
+    b_norm = column_norm(b)
+    r_norm = column_norm(r)
+    one = bm.ones_like(r_norm)
+    rho, alpha, omega = one, one, one
+    v = bm.zeros_like(r)
+    p = bm.zeros_like(r)
+    niter = bm.zeros(r_norm.shape, dtype=bm.int64, device=bm.get_device(b))
+    info.residuals.append(r_norm)
+
+    while True:
+        active = ~is_converged(r_norm, b_norm, atol, rtol)
+        if not bool(bm.any(active)):
+            break
+        if (maxiter is not None) and (int(bm.max(niter)) >= maxiter):
+            break
+
+        rho_new = bm.sum(rhat * r, axis=0)
+        beta = safe_divide(rho_new, rho) * safe_divide(alpha, omega)
+        p = r + beta[None, :] * (p - omega[None, :] * v)
+        phat = precond(p)
+        v = A @ phat
+        alpha = safe_divide(rho_new, bm.sum(rhat * v, axis=0))
+        s = r - alpha[None, :] * v
+        shat = precond(s)
+        t = A @ shat
+        omega = safe_divide(bm.sum(t * s, axis=0), bm.sum(t * t, axis=0))
+
+        x_new = x + alpha[None, :] * phat + omega[None, :] * shat
+        r_new = s - omega[None, :] * t
+        x = bm.where(active[None, :], x_new, x)
+        r = bm.where(active[None, :], r_new, r)
+        rho = rho_new
+
+        r_norm = column_norm(r)
+        niter = niter + bm.astype(active, niter.dtype)
+        info.residuals.append(r_norm)
+
+    info.niter = niter
+    info.converged = ~active
+    return x
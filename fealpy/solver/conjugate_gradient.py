@@ -1,21 +1,24 @@
-
-from typing import Optional, Protocol
+from typing import Optional, Union
+from time import perf_counter
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
 
-from .. import logger
-
-
-class SupportsMatmul(Protocol):
-    def __matmul__(self, other: TensorLike) -> TensorLike: ...
+from .solver_info import (
+    SupportsMatmul, SolverInfo, TimedOperator, as_column_operator,
+    column_norm, safe_divide, prepare_system, restore_shape,
+    is_converged, log_result
+)
+from .preconditioner import get_preconditioner
 
 
 def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
        batch_first: bool=False,
        atol: float=1e-12, rtol: float=1e-8,
-       maxiter: Optional[int]=10000) -> TensorLike:
-    """Solve a linear system Ax = b using the Conjugate Gradient (CG) method.
+       maxiter: Optional[int]=10000,
+       M: Union[str, SupportsMatmul, None]=None,
+       returninfo: bool=False):
+    """Solve a linear system Ax = b using the (preconditioned) Conjugate Gradient (CG) method.
 
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
@@ -28,9 +31,14 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
         rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
         maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.\
         If not provided, the method will continue until convergence based on the given tolerances.
+        M (str | SupportsMatmul | None, optional): The preconditioner, approximating\
+        the inverse of A. It can be 'jacobi', 'ssor', 'ilu0', or any object supporting\
+        `M @ r`, such as `AMGSolver.aspreconditioner()`. Default is None.
+        returninfo (bool, optional): Whether to return a `SolverInfo` as well. Default is False.
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
+        SolverInfo: The convergence report, only returned if `returninfo` is True.
 
     Raises:
         ValueError: If inputs do not meet the specified conditions (e.g., A is not sparse, dimensions mismatch).
@@ -38,73 +46,61 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
     Note:
         This implementation assumes that A is a symmetric positive-definite matrix,
         which is a common requirement for the Conjugate Gradient method to work correctly.
+        Every column of a batched `b` is stopped independently, once its residual
+        norm satisfies the absolute or the relative tolerance.
     """
-    assert isinstance(b, TensorLike), "b must be a Tensor"
-    if x0 is not None:
-        assert isinstance(x0, TensorLike), "x0 must be a Tensor if not None"
-    single_vector = b.ndim == 1
-
-    if b.ndim not in {1, 2}:
-        raise ValueError("b must be a 1D or 2D dense tensor")
-
-    if x0 is None:
-        x0 = bm.zeros_like(b)
-    else:
-        if x0.shape != b.shape:
-            raise ValueError("x0 and b must have the same shape")
-
-    if (not single_vector) and batch_first:
-        b = bm.swapaxes(b, 0, 1)
-        x0 = bm.swapaxes(x0, 0, 1)
-
-    sol = _cg_impl(A, b, x0, atol, rtol, maxiter)
-
-    if (not single_vector) and batch_first:
-        sol = bm.swapaxes(sol, 0, 1)
-
+    B, X0 = prepare_system(b, x0, batch_first)
+    info = SolverInfo('cg')
+    start = perf_counter()
+    M = as_column_operator(get_preconditioner(A, M), b)
+    sol = _cg_impl(TimedOperator(as_column_operator(A, b), info), B, X0, M, atol, rtol, maxiter, info)
+    info.wall_time = perf_counter() - start
+    log_result(info, maxiter)
+    sol = restore_shape(sol, b, batch_first)
+
+    if returninfo:
+        return sol, info
     return sol
 
 
-def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, atol, rtol, maxiter):
+def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter,
+             info: SolverInfo):
     # initialize
     x = x0              # (dof, batch)
     r = b - A @ x       # (dof, batch)
-    p = r               # (dof, batch)
-    n_iter = 0
-    b_norm = bm.linalg.norm(b)
-    sum_func = bm.sum
-    sqrt_func = bm.sqrt
+    z = r if M is None else M @ r
+    p = z               # (dof, batch)
+    rz = bm.sum(r*z, axis=0)    # (batch,)
+    b_norm = column_norm(b)
+    r_norm = column_norm(r)
+    niter = bm.zeros(r_norm.shape, dtype=bm.int64, device=bm.get_device(r))
+    info.residuals.append(r_norm)
 
     # iterate
     while True:
-        Ap = A @ p      # (dof, batch)
-        rTr = sum_func(r**2, axis=0)
-        alpha = rTr / sum_func(p*Ap, axis=0)  # r @ r / (p @ Ap) # (batch,)
-        x = x + alpha[None, ...] * p  # (dof, batch)
-        r_new = r - alpha[None, ...] * Ap
-        rTr_new = sum_func(r_new**2, axis=0)  # (batch,)
-        r_norm_new = sqrt_func(sum_func(rTr_new))
-
-        n_iter += 1
-
-        if r_norm_new < atol:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by absolute tolerance.")
+        active = ~is_converged(r_norm, b_norm, atol, rtol)
+        if not bool(bm.any(active)):
             break
-
-        if r_norm_new < rtol * b_norm:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by relative tolerance.")
+        if (maxiter is not None) and (int(bm.max(niter)) >= maxiter):
             break
 
-        if (maxiter is not None) and (n_iter >= maxiter):
-            logger.info(f"CG: failed, stopped by maxiter ({maxiter}).")
-            break
-
-        beta = rTr_new / rTr # (batch,)
-        p = r_new + beta[None, ...] * p
-        r = r_new
-
+        Ap = A @ p      # (dof, batch)
+        alpha = safe_divide(rz, bm.sum(p*Ap, axis=0))  # (batch,)
+        alpha = bm.where(active, alpha, 0.)
+        x = x + alpha[None, ...] * p  # (dof, batch)
+        r = r - alpha[None, ...] * Ap
+        z = r if M is None else M @ r
+        rz_new = bm.sum(r*z, axis=0)  # (batch,)
+        beta = safe_divide(rz_new, rz) # (batch,)
+        p = z + beta[None, ...] * p
+        rz = rz_new
+
+        r_norm = column_norm(r)
+        niter = niter + bm.astype(active, niter.dtype)
+        info.residuals.append(r_norm)
+
+    info.niter = niter
+    info.converged = ~active
     return x
 
     # @staticmethod
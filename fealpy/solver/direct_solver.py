@@ -1,5 +1,12 @@
 
+from typing import Union, Optional, Tuple, Hashable
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from threading import Lock
+import hashlib
+
 from ..backend import backend_manager as bm
+from ..backend import TensorLike
 from ..sparse import COOTensor, CSRTensor
 import numpy as np
 
@@ -104,17 +111,23 @@ def _cupy_solve(A, b):
         x = cp.asnumpy(x)
     return x
 
-def spsolve(A:[COOTensor, CSRTensor], b, solver:str="mumps"):
+def spsolve(A:[COOTensor, CSRTensor], b, solver:str="mumps", reuse:bool=False):
     """Solve a linear system using a direct solver.
 
     Parameters:
         A(COOTensor | CSRTensor): The matrix of the linear system.
         b(Tensor): The right-hand side.
         solver(str): The solver to use. It can be "mumps", "scipy", or "cupy".
+        reuse(bool): Whether to keep the factorization of `A` in the global\
+            cache, so that solving with the same matrix again skips the\
+            factorization. See `factorized`. Default is False.
 
     Returns:
         Tensor: The solution of the linear system.
     """
+    if reuse:
+        return factorized(A, solver, background=False).solve(b)
+
     if solver == "mumps":
         return bm.tensor(_mumps_solve(A, b))
     elif solver == "scipy":
@@ -126,4 +139,261 @@ def spsolve(A:[COOTensor, CSRTensor], b, solver:str="mumps"):
         raise ValueError(f"Unknown solver: {solver}")
 
 
+##################################################
+### Factorization reuse
+##################################################
+
+def _scipy_factorize(A):
+    """Factorize the matrix by SuperLU, returning the solve function."""
+    from scipy.sparse.linalg import splu
+
+    lu = splu(A.to_scipy().tocsc())
+    return lu.solve, None
+
+def _mumps_factorize(A):
+    """Factorize the matrix by MUMPS, returning the solve function and the
+    function releasing the MUMPS instance."""
+    from mumps import DMumpsContext
+
+    ctx = DMumpsContext()
+    ctx.set_silent()
+    ctx.set_centralized_sparse(A.tocoo().to_scipy())
+    ctx.run(job=4) # analysis and factorization
+
+    def solve(b):
+        x = b.copy()
+        if x.ndim == 1:
+            ctx.set_rhs(x)
+            ctx.run(job=3)
+            return x
+        for i in range(x.shape[1]):
+            xi = np.ascontiguousarray(x[:, i])
+            ctx.set_rhs(xi)
+            ctx.run(job=3)
+            x[:, i] = xi
+        return x
+
+    return solve, ctx.destroy
+
+def _cupy_factorize(A):
+    """Factorize the matrix by cupy, returning the solve function."""
+    import cupy as cp
+    from cupyx.scipy.sparse.linalg import factorized as cp_factorized
+
+    A, _ = _to_cupy_data(A.tocoo(), np.zeros(0))
+    lu = cp_factorized(A.tocsc())
+
+    def solve(b):
+        if b.ndim == 1:
+            return cp.asnumpy(lu(cp.asarray(b)))
+        return np.stack([cp.asnumpy(lu(cp.asarray(b[:, i])))
+                         for i in range(b.shape[1])], axis=1)
+
+    return solve, None
+
+_FACTORIZE = {
+    "mumps": _mumps_factorize,
+    "scipy": _scipy_factorize,
+    "cupy": _cupy_factorize,
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='fealpy-factorize')
+    return _executor
+
+
+def matrix_key(A: Union[COOTensor, CSRTensor]) -> Tuple[Hashable, ...]:
+    """Return a hashable key of the matrix made of its shape, dtype, and the
+    digests of its sparsity pattern and of its values.
+
+    Two matrices share a key iff they have the same entries stored in the same
+    order, which is the case for a matrix reassembled from the same mesh and
+    coefficients.
+    """
+    if isinstance(A, COOTensor):
+        pattern = (A.indices(), )
+    elif isinstance(A, CSRTensor):
+        pattern = (A.crow(), A.col())
+    else:
+        raise TypeError(f"A must be a COOTensor or CSRTensor, but got {type(A).__name__}")
+
+    h = hashlib.blake2b(digest_size=16)
+    for idx in pattern:
+        h.update(np.ascontiguousarray(bm.to_numpy(idx)).tobytes())
+    pattern_hash = h.hexdigest()
+    values = np.ascontiguousarray(bm.to_numpy(A.values()))
+    values_hash = hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest()
+
+    return (type(A).__name__, tuple(A.shape), str(values.dtype), pattern_hash, values_hash)
+
+
+class FactorizedSolver():
+    """A factorized sparse matrix solving linear systems for many right-hand sides.
+
+    The factorization is done once, optionally in a background thread so
+    that it overlaps with the work done before the first `solve`, such as
+    assembling the right-hand side.
+
+    Examples:
+        >>> solver = FactorizedSolver(A, 'scipy') # returns immediately
+        >>> b = lform.assembly()
+        >>> x = solver.solve(b) # waits for the factorization if necessary
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], solver: str="scipy", *,
+                 background: bool=True, key: Optional[Tuple[Hashable, ...]]=None):
+        """
+        Parameters:
+            A (COOTensor | CSRTensor): The matrix to factorize, must be square.
+            solver (str, optional): The backend of the factorization, "mumps",\
+                "scipy", or "cupy". Default is "scipy".
+            background (bool, optional): Whether to factorize in a background\
+                thread. Default is True.
+            key (tuple, optional): The precomputed `matrix_key` of A.
+        """
+        if solver not in _FACTORIZE:
+            raise ValueError(f"Unknown solver: {solver}")
+        if A.shape[0] != A.shape[1]:
+            raise ValueError(f"A must be square, but got shape {A.shape}")
 
+        self.shape = tuple(A.shape)
+        self.solver = solver
+        self.key = matrix_key(A) if key is None else key
+        self._closed = False
+
+        if background:
+            self._future = _get_executor().submit(_FACTORIZE[solver], A)
+        else:
+            self._future = Future()
+            try:
+                self._future.set_result(_FACTORIZE[solver](A))
+            except Exception as e:
+                self._future.set_exception(e)
+
+    def ready(self) -> bool:
+        """Whether the factorization has finished."""
+        return self._future.done()
+
+    def wait(self):
+        """Block until the factorization has finished, and return the solve function.
+        Errors raised by the factorization are raised here."""
+        if self._closed:
+            raise RuntimeError("the factorization has been closed")
+        return self._future.result()[0]
+
+    def solve(self, b: TensorLike, *, batch_first: bool=False) -> TensorLike:
+        """Solve Ax = b.
+
+        Parameters:
+            b (Tensor): The right-hand side, shaped (N, ), or (N, batch) for\
+                several right-hand sides at once.
+            batch_first (bool, optional): Whether `b` is shaped (batch, N)\
+                instead. Default is False.
+
+        Returns:
+            Tensor: The solution, shaped like `b`.
+        """
+        solve = self.wait()
+        b = bm.to_numpy(b)
+        if b.ndim == 2 and batch_first:
+            return bm.tensor(solve(np.ascontiguousarray(b.T)).T)
+        return bm.tensor(solve(b))
+
+    def __matmul__(self, b: TensorLike) -> TensorLike:
+        return self.solve(b)
+
+    def close(self):
+        """Release the resources held by the factorization, waiting for it
+        if it is running in the background."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._future.exception() is None:
+            release = self._future.result()[1]
+            if release is not None:
+                release()
+
+    def __del__(self):
+        # release the factorization of an unreferenced solver without blocking,
+        # when the background factorization finishes if it is still running
+        future = getattr(self, '_future', None)
+        if future is None or getattr(self, '_closed', True):
+            return
+        self._closed = True
+        future.add_done_callback(_release)
+
+
+def _release(future: Future):
+    if future.exception() is None:
+        release = future.result()[1]
+        if release is not None:
+            release()
+
+
+class FactorizationCache():
+    """A least-recently-used cache of `FactorizedSolver`, keyed by `matrix_key`.
+
+    Solving with a matrix equal to a cached one reuses the factorization.
+    The least recently used factorization is dropped from the cache when it
+    is full, and released once the solvers returned for it are no longer
+    referenced, so the evicted solvers held by the callers remain usable.
+    """
+    def __init__(self, maxsize: int=8):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, but got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, A: Union[COOTensor, CSRTensor], solver: str="scipy", *,
+            background: bool=True) -> FactorizedSolver:
+        """Return the factorization of `A`, factorizing it if not cached."""
+        key = (solver, ) + matrix_key(A)
+
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+
+            self.misses += 1
+            fs = FactorizedSolver(A, solver, background=background, key=key[1:])
+            self._data[key] = fs
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return fs
+
+    def clear(self):
+        """Drop all the factorizations and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+factorization_cache = FactorizationCache()
+
+def factorized(A: Union[COOTensor, CSRTensor], solver: str="scipy", *,
+               background: bool=True) -> FactorizedSolver:
+    """Factorize the matrix through the global `factorization_cache`.
+
+    Parameters:
+        A (COOTensor | CSRTensor): The matrix of the linear system.
+        solver (str): The solver to use. It can be "mumps", "scipy", or "cupy".\
+            Default is "scipy".
+        background (bool): Whether to factorize in a background thread if\
+            `A` is not cached. Default is True.
+
+    Returns:
+        FactorizedSolver: The factorization, call `solve(b)` to use it.
+    """
+    return factorization_cache.get(A, solver, background=background)
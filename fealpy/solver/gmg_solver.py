@@ -0,0 +1,269 @@
+from typing import Optional, Union, List, Sequence
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+from .. import logger
+from .amg_coarsen import diagonal
+from .amg_interpolation import spectral_radius
+from .amg_solver import AMGSolver, AMGPreconditioner
+
+
+def _power_iteration(A, dinv: TensorLike, maxit: int=20) -> float:
+    """Estimate the spectral radius of D^{-1} A by power iteration, for the\
+    operators only supporting `A @ x`."""
+    N = dinv.shape[0]
+    v = bm.arange(N, **bm.context(dinv)) * 0.6180339887498949 % 1.0 + 0.5
+    rho = 0.
+    for _ in range(maxit):
+        v = v / bm.linalg.norm(v)
+        v = dinv * (A @ v)
+        rho = float(bm.linalg.norm(v))
+    return 1.1 * rho
+
+
+class GMGSolver(AMGSolver):
+    """Geometric multigrid solver and preconditioner on nested meshes.
+
+    The hierarchy is given by the prolongations between the meshes, as
+    returned by `uniform_refine(n, returnim=True)` of the triangle,
+    tetrahedron and uniform meshes. The coarse operators are either
+
+    - Galerkin products R A P of the matrix on the finest mesh, or
+    - given on every level, e.g. rediscretized on the coarse meshes. Then the
+      operators only need to support `A @ x` and `A.diagonal()`, so the
+      matrix-free `StencilOperator` of `fealpy.fdm` can be used.
+
+    The smoothers and the cycles are those of `AMGSolver`, with the F-cycle
+    added. All the work is done by sparse matrix-vector products and
+    vectorized smoothers, so a cycle costs O(N).
+
+    Dirichlet boundary conditions are supported by `isFreeDof`: the rows of
+    the other dofs should be those of the identity, as imposed by
+    `DirichletBC`, and the transfers are restricted to the free dofs.
+
+    Example:
+        >>> mesh = TriangleMesh.from_box(nx=4, ny=4)
+        >>> P = mesh.uniform_refine(6, returnim=True)
+        >>> ...
+        >>> solver = GMGSolver(cycle='V').setup(A, P, isFreeDof=~isDDof)
+        >>> x = solver.solve(b)
+        >>> M = solver.aspreconditioner()
+    """
+    def __init__(self,
+            cycle: str = 'V',
+            smoother: str = 'jacobi',
+            sstep: int = 2,
+            omega: float = 4/3,
+            rtol: float = 1e-8,
+            atol: float = 1e-12,
+            maxiter: int = 200):
+        """
+        Parameters:
+            cycle (str, optional): 'V', 'W' or 'F'. Defaults to 'V'.
+            smoother (str, optional): 'jacobi' or 'chebyshev'. Defaults to 'jacobi'.
+            sstep (int, optional): number of pre- and post-smoothing steps, or the
+                polynomial degree for the Chebyshev smoother. Defaults to 2.
+            omega (float, optional): damping factor of the Jacobi smoother,
+                which is scaled by the inverse of the estimated spectral radius
+                of D^{-1} A on every level. Defaults to 4/3.
+            rtol (float, optional): relative tolerance of `solve`. Defaults to 1e-8.
+            atol (float, optional): absolute tolerance of `solve`. Defaults to 1e-12.
+            maxiter (int, optional): maximum number of cycles of `solve`.
+                Defaults to 200.
+        """
+        if cycle not in ('V', 'W', 'F'):
+            raise ValueError(f"Unknown cycle type '{cycle}', expected 'V', 'W' or 'F'.")
+        super().__init__(smoother=smoother, sstep=sstep, omega=omega,
+                         rtol=rtol, atol=atol, maxiter=maxiter)
+        self.cycle = cycle
+        self.fixed: List[Optional[TensorLike]] = []
+
+    def setup(self, A: Union[COOTensor, CSRTensor, Sequence],
+              P: Sequence[Union[COOTensor, CSRTensor]],
+              isFreeDof: Optional[TensorLike]=None,
+              restriction: str='transpose'):
+        """Build the multigrid hierarchy.
+
+        Parameters:
+            A (COOTensor | CSRTensor | Sequence): the SPD matrix on the finest
+                mesh, whose coarse operators are built by Galerkin products; or
+                the operators on all the meshes, from the coarsest.
+            P (Sequence[COOTensor | CSRTensor]): the prolongations from every
+                mesh to the next finer one, from the coarsest.
+            isFreeDof (Tensor | None, optional): the flag of the free dofs on
+                the finest mesh, shaped (N, ). Defaults to all free.
+            restriction (str, optional): 'transpose' for the transpose of the
+                prolongation, as for finite element matrices; or 'weighting'
+                for the transpose scaled to unit row sums, i.e. the full
+                weighting of the residuals for finite difference operators.
+                Defaults to 'transpose'.
+
+        Returns:
+            GMGSolver: self.
+        """
+        if restriction not in ('transpose', 'weighting'):
+            raise ValueError(f"Unknown restriction '{restriction}', "
+                             "expected 'transpose' or 'weighting'.")
+        P = [self._as_csr(p) for p in reversed(P)]
+        if isinstance(A, (list, tuple)):
+            if len(A) != len(P) + 1:
+                raise ValueError(f"{len(P) + 1} operators are expected for "
+                                 f"{len(P)} prolongations, but got {len(A)}.")
+            operators = list(reversed(A))
+        else:
+            operators = [self._as_csr(A)]
+
+        fixed = None if isFreeDof is None else ~isFreeDof
+        self.A = [operators[0]]
+        self.P = []
+        self.R = []
+        self.fixed = [fixed]
+
+        for level, Pl in enumerate(P):
+            N = self.A[-1].sparse_shape[0]
+            if Pl.shape[0] != N:
+                raise ValueError(f"the prolongation to level {level} is shaped {Pl.shape}, "
+                                 f"which does not match the operator of size {N}.")
+            if fixed is not None:
+                Pl, fixed = self._restrict(Pl, fixed)
+            self.P.append(Pl)
+            self.R.append(self._weighting(Pl.T) if restriction == 'weighting' else Pl.T)
+            self.fixed.append(fixed)
+            if len(operators) > 1:
+                self.A.append(operators[level + 1])
+            else:
+                self.A.append(self.R[-1] @ (self.A[-1] @ Pl))
+
+        self._setup_smoother()
+        return self
+
+    def update(self, A: Union[COOTensor, CSRTensor]):
+        """Update the Galerkin hierarchy for new matrix values, keeping the\
+        transfers.
+
+        Parameters:
+            A (COOTensor | CSRTensor): the SPD matrix with the same shape as
+                the one passed to `setup`.
+
+        Returns:
+            GMGSolver: self.
+        """
+        if len(self.A) == 0:
+            raise RuntimeError("GMGSolver.setup must be called before update.")
+        A = self._as_csr(A)
+        if A.shape != self.A[0].shape:
+            raise ValueError(f"the shape of the new matrix {A.shape} does not "
+                             f"match that of the hierarchy {self.A[0].shape}")
+        self.A = [A]
+        for R, P in zip(self.R, self.P):
+            self.A.append(R @ (self.A[-1] @ P))
+        self._setup_smoother()
+        return self
+
+    def solve(self, b: TensorLike, x0: Optional[TensorLike]=None) -> TensorLike:
+        x = bm.zeros_like(b) if x0 is None else x0
+        return super().solve(b, self._fix(b, x))
+
+    def precondition(self, r: TensorLike) -> TensorLike:
+        """Apply one multigrid cycle to `r` with zero initial guess."""
+        return self._cycle(0, r, self._fix(r, bm.zeros_like(r)))
+
+    def aspreconditioner(self):
+        """Return the multigrid cycle as an operator supporting `M @ r`."""
+        return AMGPreconditioner(self)
+
+    def print(self):
+        """Print the size of every level."""
+        for l, A in enumerate(self.A):
+            nnz = getattr(A, 'nnz', None)
+            print(f"level {l}: shape = {A.sparse_shape}, nnz = {nnz}")
+
+    ### Internal ###
+
+    @staticmethod
+    def _restrict(P: CSRTensor, fixed: TensorLike):
+        """Restrict the prolongation to the free dofs, and find the fixed\
+        dofs of the coarse level as those injected to the fixed fine dofs."""
+        row, col, val = P.row(), P.col(), P.values()
+        fixed_c = bm.zeros((P.shape[1], ), dtype=bm.bool, device=bm.get_device(col))
+        fixed_c = bm.set_at(fixed_c, col[(val == 1) & fixed[row]], True)
+        keep = ~(fixed[row] | fixed_c[col])
+        P = CSRTensor(P.crow(), col, bm.where(keep, val, 0), spshape=P.sparse_shape)
+        return P, fixed_c
+
+    @staticmethod
+    def _weighting(R: CSRTensor) -> CSRTensor:
+        """Scale the rows of the restriction to unit sums."""
+        val = R.values()
+        rowsum = bm.zeros((R.shape[0], ), **bm.context(val))
+        rowsum = bm.index_add(rowsum, R.row(), val)
+        scale = bm.where(rowsum != 0, 1.0 / bm.where(rowsum != 0, rowsum, 1.0), 0.0)
+        return CSRTensor(R.crow(), R.col(), val * scale[R.row()], spshape=R.sparse_shape)
+
+    def _fix(self, b: TensorLike, x: TensorLike) -> TensorLike:
+        """Set the values of the fixed dofs, as their rows are of the identity."""
+        fixed = self.fixed[0] if len(self.fixed) > 0 else None
+        if fixed is None:
+            return x
+        if b.ndim == 2:
+            fixed = fixed[:, None]
+        return bm.where(fixed, b, x)
+
+    def _setup_smoother(self):
+        self.Dinv = []
+        self.rho = []
+
+        for A in self.A:
+            if isinstance(A, CSRTensor):
+                d = diagonal(A)
+            else:
+                d = A.diagonal()
+            dinv = bm.zeros_like(d)
+            flag = d != 0
+            dinv = bm.set_at(dinv, flag, 1.0 / d[flag])
+            self.Dinv.append(dinv)
+            if isinstance(A, CSRTensor):
+                self.rho.append(spectral_radius(A, dinv))
+            else:
+                self.rho.append(_power_iteration(A, dinv))
+
+        A = self.A[-1]
+        NC = A.sparse_shape[0]
+        self.coarse_inv = None
+        if NC <= self.MAX_DENSE:
+            if isinstance(A, CSRTensor):
+                self.coarse_inv = bm.linalg.pinv(A.to_dense())
+            elif hasattr(A, 'to_sparse'):
+                self.coarse_inv = bm.linalg.pinv(A.to_sparse().to_dense())
+        if self.coarse_inv is None:
+            logger.warning(f"GMG: the coarsest level of size {NC} is not solved "
+                           "directly, but by smoothing instead.")
+
+    def _cycle(self, level: int, b: TensorLike, x: TensorLike,
+               cycle: Optional[str]=None) -> TensorLike:
+        cycle = self.cycle if cycle is None else cycle
+        if level == len(self.A) - 1:
+            if self.coarse_inv is not None:
+                return self.coarse_inv @ b
+            for _ in range(10):
+                x = self._smooth(level, b, x)
+            return x
+
+        A = self.A[level]
+        x = self._smooth(level, b, x)
+        rc = self.R[level] @ (b - A @ x)
+        ec = bm.zeros_like(rc)
+
+        if cycle == 'F':
+            ec = self._cycle(level + 1, rc, ec, 'F')
+            ec = self._cycle(level + 1, rc, ec, 'V')
+        else:
+            for _ in range(1 if cycle == 'V' else 2):
+                ec = self._cycle(level + 1, rc, ec, cycle)
+                if level + 1 == len(self.A) - 1:
+                    break
+
+        x = x + self.P[level] @ ec
+        return self._smooth(level, b, x)
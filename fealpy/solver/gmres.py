@@ -0,0 +1,140 @@
+
+from typing import Optional, Union
+from time import perf_counter
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .solver_info import (
+    SupportsMatmul, SolverInfo, TimedOperator, as_column_operator,
+    column_norm, safe_divide, prepare_system, restore_shape,
+    is_converged, log_result
+)
+from .preconditioner import get_preconditioner
+
+
+def gmres(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+          batch_first: bool=False,
+          atol: float=1e-12, rtol: float=1e-8,
+          restart: int=30,
+          maxiter: Optional[int]=10000,
+          M: Union[str, SupportsMatmul, None]=None,
+          returninfo: bool=False):
+    """Solve a linear system Ax = b using the restarted Generalized Minimal Residual (GMRES) method.
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
+        Must have the same shape as b when reshaped appropriately.
+        batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
+        is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        restart (int, optional): Number of iterations between restarts. Default is 30.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        M (str | SupportsMatmul | None, optional): The preconditioner, applied\
+        from the right. See `cg`. Default is None.
+        returninfo (bool, optional): Whether to return a `SolverInfo` as well. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        SolverInfo: The convergence report, only returned if `returninfo` is True.
+
+    Note:
+        GMRES works for general non-singular matrices. With right
+        preconditioning, the residual norms recorded are those of the original
+        system. Every column of a batched `b` is stopped independently.
+    """
+    B, X0 = prepare_system(b, x0, batch_first)
+    info = SolverInfo('gmres')
+    start = perf_counter()
+    M = as_column_operator(get_preconditioner(A, M), b)
+    sol = _gmres_impl(TimedOperator(as_column_operator(A, b), info), B, X0, M, atol, rtol, restart, maxiter, info)
+    info.wall_time = perf_counter() - start
+    log_result(info, maxiter)
+    sol = restore_shape(sol, b, batch_first)
+
+    if returninfo:
+        return sol, info
+    return sol
+
+
+def _gmres_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol,
+                restart, maxiter, info: SolverInfo):
+    precond = (lambda r: r) if M is None else (lambda r: M @ r)
+
+    x = x0
+    b_norm = column_norm(b)
+    r = b - A @ x
+    r_norm = column_norm(r)
+    niter = bm.zeros(r_norm.shape, dtype=bm.int64, device=bm.get_device(b))
+    info.residuals.append(r_norm)
+
+    while True:
+        active = ~is_converged(r_norm, b_norm, atol, rtol)
+        if not bool(bm.any(active)):
+            break
+        if (maxiter is not None) and (int(bm.max(niter)) >= maxiter):
+            break
+
+        # Arnoldi process with the modified Gram-Schmidt orthogonalization,
+        # H is reduced to upper triangular by Givens rotations on the fly.
+        restart_active = active
+        V = [safe_divide(1., r_norm)[None, :] * r]
+        H = []
+        cs, sn = [], []
+        g = [r_norm]
+
+        for j in range(restart):
+            w = A @ precond(V[j])
+            h = []
+            for i in range(j + 1):
+                hij = bm.sum(w * V[i], axis=0)
+                w = w - hij[None, :] * V[i]
+                h.append(hij)
+            hnext = column_norm(w)
+            V.append(safe_divide(1., hnext)[None, :] * w)
+
+            for i in range(j):
+                h[i], h[i+1] = cs[i]*h[i] + sn[i]*h[i+1], -sn[i]*h[i] + cs[i]*h[i+1]
+            denom = bm.sqrt(h[j]**2 + hnext**2)
+            cs.append(bm.where(denom == 0, 1., safe_divide(h[j], denom)))
+            sn.append(safe_divide(hnext, denom))
+            h[j] = cs[j]*h[j] + sn[j]*hnext
+            H.append(h)
+            g.append(-sn[j] * g[j])
+            g[j] = cs[j] * g[j]
+
+            res = bm.abs(g[j+1])
+            niter = niter + bm.astype(active, niter.dtype)
+            r_norm = bm.where(active, res, r_norm)
+            info.residuals.append(r_norm)
+            active = active & ~is_converged(res, b_norm, atol, rtol)
+
+            if not bool(bm.any(active)):
+                break
+            if (maxiter is not None) and (int(bm.max(niter)) >= maxiter):
+                break
+
+        # solve the upper triangular system H y = g by back substitution
+        k = len(H)
+        y = [None] * k
+        for i in range(k - 1, -1, -1):
+            s = g[i]
+            for l in range(i + 1, k):
+                s = s - H[l][i] * y[l]
+            y[i] = safe_divide(s, H[i][i])
+
+        update = y[0][None, :] * V[0]
+        for i in range(1, k):
+            update = update + y[i][None, :] * V[i]
+        x = bm.where(restart_active[None, :], x + precond(update), x)
+
+        r = b - A @ x
+        r_norm = column_norm(r)
+        info.residuals[-1] = r_norm
+
+    info.niter = niter
+    info.converged = ~active
+    return x
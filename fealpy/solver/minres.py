@@ -0,0 +1,130 @@
+
+from typing import Optional, Union
+from time import perf_counter
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .solver_info import (
+    SupportsMatmul, SolverInfo, TimedOperator, as_column_operator,
+    column_norm, safe_divide, prepare_system, restore_shape,
+    is_converged, log_result
+)
+from .preconditioner import get_preconditioner
+
+
+def minres(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+           batch_first: bool=False,
+           atol: float=1e-12, rtol: float=1e-8,
+           maxiter: Optional[int]=10000,
+           M: Union[str, SupportsMatmul, None]=None,
+           returninfo: bool=False):
+    """Solve a linear system Ax = b using the Minimal Residual (MINRES) method.
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
+        x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
+        Must have the same shape as b when reshaped appropriately.
+        batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
+        is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        M (str | SupportsMatmul | None, optional): The preconditioner, which must be\
+        symmetric positive definite. See `cg`. Default is None.
+        returninfo (bool, optional): Whether to return a `SolverInfo` as well. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        SolverInfo: The convergence report, only returned if `returninfo` is True.
+
+    Note:
+        MINRES works for symmetric indefinite matrices, such as the saddle-point
+        systems of mixed methods. The residual norms are the estimates from the
+        Lanczos process, measured in the M^{-1}-norm if preconditioned.
+        Every column of a batched `b` is stopped independently.
+    """
+    B, X0 = prepare_system(b, x0, batch_first)
+    info = SolverInfo('minres')
+    start = perf_counter()
+    M = as_column_operator(get_preconditioner(A, M), b)
+    sol = _minres_impl(TimedOperator(as_column_operator(A, b), info), B, X0, M, atol, rtol, maxiter, info)
+    info.wall_time = perf_counter() - start
+    log_result(info, maxiter)
+    sol = restore_shape(sol, b, batch_first)
+
+    if returninfo:
+        return sol, info
+    return sol
+
+
+def _minres_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter,
+                 info: SolverInfo):
+    precond = (lambda r: r) if M is None else (lambda r: M @ r)
+    eps = bm.finfo(b.dtype).eps
+
+    x = x0
+    r1 = b - A @ x
+    y = precond(r1)
+    beta1 = bm.sqrt(bm.abs(bm.sum(r1*y, axis=0)))
+    if M is None:
+        b_norm = column_norm(b)
+    else:
+        b_norm = bm.sqrt(bm.abs(bm.sum(b*precond(b), axis=0)))
+
+    zero = bm.zeros_like(beta1)
+    oldb, beta, dbar, epsln, phibar = zero, beta1, zero, zero, beta1
+    cs, sn = zero - 1., zero
+    w = bm.zeros_like(x)
+    w2 = bm.zeros_like(x)
+    r2 = r1
+    r_norm = phibar
+    niter = bm.zeros(beta1.shape, dtype=bm.int64, device=bm.get_device(b))
+    info.residuals.append(r_norm)
+
+    while True:
+        active = ~is_converged(r_norm, b_norm, atol, rtol)
+        if not bool(bm.any(active)):
+            break
+        if (maxiter is not None) and (int(bm.max(niter)) >= maxiter):
+            break
+
+        # Lanczos step
+        v = safe_divide(1., beta)[None, :] * y
+        y = A @ v
+        y = y - safe_divide(beta, oldb)[None, :] * r1
+        alfa = bm.sum(v*y, axis=0)
+        y = y - safe_divide(alfa, beta)[None, :] * r2
+        r1 = r2
+        r2 = y
+        y = precond(r2)
+        oldb = beta
+        beta = bm.sqrt(bm.abs(bm.sum(r2*y, axis=0)))
+
+        # apply the previous rotation, and compute the next one
+        oldeps = epsln
+        delta = cs*dbar + sn*alfa
+        gbar = sn*dbar - cs*alfa
+        epsln = sn*beta
+        dbar = -cs*beta
+        gamma = bm.sqrt(gbar**2 + beta**2)
+        gamma = bm.where(gamma < eps, eps, gamma)
+        cs = gbar / gamma
+        sn = beta / gamma
+        phi = cs * phibar
+        phibar = sn * phibar
+
+        # update the solution of the active columns
+        w1 = w2
+        w2 = w
+        w = (v - oldeps[None, :]*w1 - delta[None, :]*w2) / gamma[None, :]
+        x = bm.where(active[None, :], x + phi[None, :] * w, x)
+
+        r_norm = bm.where(active, bm.abs(phibar), r_norm)
+        niter = niter + bm.astype(active, niter.dtype)
+        info.residuals.append(r_norm)
+
+    info.niter = niter
+    info.converged = ~active
+    return x
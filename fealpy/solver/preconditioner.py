@@ -0,0 +1,221 @@
+
+from typing import Union, Optional
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from ..sparse.utils import csr_row_pointer, index_ranges
+from .amg_coarsen import diagonal
+
+
+def _as_csr(A: Union[COOTensor, CSRTensor]) -> CSRTensor:
+    if isinstance(A, COOTensor):
+        return A.coalesce().tocsr()
+    elif isinstance(A, CSRTensor):
+        return A
+    raise TypeError(f"A must be a COOTensor or CSRTensor, but got {type(A).__name__}")
+
+
+class TriangularSolver():
+    """Sparse triangular solver by level scheduling.
+
+    Unknowns are grouped into levels such that every unknown only depends on
+    those in lower levels. All the unknowns in one level are then solved at
+    once by vectorized operations, so the number of sequential steps is the
+    number of levels rather than the number of unknowns.
+    """
+    def __init__(self, row: TensorLike, col: TensorLike, val: TensorLike,
+                 diag: TensorLike):
+        """
+        Parameters:
+            row (Tensor): row indices of the strictly triangular entries.
+            col (Tensor): column indices of the strictly triangular entries.
+            val (Tensor): values of the strictly triangular entries.
+            diag (Tensor): the diagonal, shaped (N, ).
+        """
+        N = diag.shape[0]
+        kwargs = bm.context(row)
+        self.dinv = 1.0 / diag
+
+        # 1. peel off the unknowns whose dependencies are all solved
+        count = bm.zeros((N, ), **kwargs)
+        count = bm.index_add(count, row, bm.ones(row.shape, **kwargs))
+        order = bm.argsort(col, stable=True)
+        dependent = row[order]
+        ptr = csr_row_pointer(col[order], N)
+
+        level = bm.full((N, ), -1, **kwargs)
+        front = bm.nonzero(count == 0)[0]
+        nlevel = 0
+
+        while front.shape[0] > 0:
+            level = bm.set_at(level, front, nlevel)
+            idx = index_ranges(ptr[front], ptr[front + 1] - ptr[front])
+            touched = dependent[idx]
+            count = bm.index_add(count, touched, -bm.ones(touched.shape, **kwargs))
+            front = bm.unique(touched[count[touched] == 0])
+            nlevel += 1
+
+        if bool(bm.any(level < 0)):
+            raise ValueError("the matrix is not triangular")
+
+        # 2. group the unknowns and the entries by levels
+        node = bm.argsort(level, stable=True)
+        nptr = csr_row_pointer(level[node], nlevel)
+        local = bm.empty((N, ), **kwargs)
+        local = bm.set_at(local, node, bm.arange(N, **kwargs) - nptr[level[node]])
+        nptr = bm.to_numpy(nptr).tolist()
+        entry = bm.argsort(level[row], stable=True)
+        eptr = bm.to_numpy(csr_row_pointer(level[row][entry], nlevel)).tolist()
+
+        self.levels = []
+        for k in range(nlevel):
+            nodes = node[nptr[k]:nptr[k+1]]
+            e = entry[eptr[k]:eptr[k+1]]
+            self.levels.append((nodes, local[row[e]], col[e], val[e]))
+
+    @property
+    def nlevels(self) -> int:
+        return len(self.levels)
+
+    def solve(self, b: TensorLike) -> TensorLike:
+        """Solve the triangular system for `b` shaped (N, ) or (N, batch)."""
+        x = bm.zeros_like(b)
+        dinv = self.dinv if b.ndim == 1 else self.dinv[:, None]
+
+        for nodes, local, col, val in self.levels:
+            rhs = b[nodes]
+            if col.shape[0] > 0:
+                src = val * x[col] if b.ndim == 1 else val[:, None] * x[col]
+                acc = bm.zeros_like(rhs)
+                rhs = rhs - bm.index_add(acc, local, src)
+            x = bm.set_at(x, nodes, rhs * dinv[nodes])
+
+        return x
+
+
+class JacobiPreconditioner():
+    """Diagonal (Jacobi) preconditioner M = D."""
+    def __init__(self, A: Union[COOTensor, CSRTensor]):
+        A = _as_csr(A)
+        d = diagonal(A)
+        flag = d != 0
+        self.shape = A.shape
+        self.dinv = bm.set_at(bm.zeros_like(d), flag, 1.0 / d[flag])
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        if r.ndim == 1:
+            return self.dinv * r
+        return self.dinv[:, None] * r
+
+
+class SSORPreconditioner():
+    """Symmetric successive over-relaxation preconditioner
+
+        M = omega / (2 - omega) (D / omega + L) (D / omega)^{-1} (D / omega + U),
+
+    where D, L and U are the diagonal, strictly lower and strictly upper parts
+    of A. The triangular solves use level scheduling, see `TriangularSolver`.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], omega: float=1.0):
+        if not 0 < omega < 2:
+            raise ValueError(f"omega must be in (0, 2), but got {omega}")
+        A = _as_csr(A)
+        row, col, val = A.row(), A.col(), A.values()
+        d = diagonal(A) / omega
+        self.shape = A.shape
+        self.omega = omega
+        self.d = d
+        flag = row > col
+        self.lower = TriangularSolver(row[flag], col[flag], val[flag], d)
+        flag = row < col
+        self.upper = TriangularSolver(row[flag], col[flag], val[flag], d)
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        d = self.d if r.ndim == 1 else self.d[:, None]
+        y = self.lower.solve(r) * d
+        return self.upper.solve(y) * ((2 - self.omega) / self.omega)
+
+
+class ILU0Preconditioner():
+    """Incomplete LU factorization with zero fill-in, M = LU.
+
+    The factors are computed by the fine-grained parallel algorithm of Chow
+    and Patel: every non-zero (i, j) of the pattern satisfies
+
+        l_ij = (a_ij - sum_{k < j} l_ik u_kj) / u_jj,  i > j,
+        u_ij =  a_ij - sum_{k < i} l_ik u_kj,          i <= j,
+
+    which is solved by fixed-point sweeps over all non-zeros at once. The exact
+    ILU(0) factors are the fixed point, and the sweeps stop early when the
+    factors no longer change.
+    """
+    def __init__(self, A: Union[COOTensor, CSRTensor], sweeps: int=10):
+        A = _as_csr(A)
+        N = A.shape[0]
+        row, col, val = A.row(), A.col(), A.values()
+        kwargs = bm.context(row)
+        self.shape = A.shape
+
+        key = bm.astype(row, bm.int64) * N + bm.astype(col, bm.int64)
+        diag = bm.searchsorted(key, bm.astype(bm.arange(N, **kwargs), bm.int64) * (N + 1))
+        diag = bm.clip(diag, 0, key.shape[0] - 1)
+        if not bool(bm.all(row[diag] == col[diag])):
+            raise ValueError("ILU(0) requires all the diagonal entries in the pattern")
+
+        # pairs of (i, k) in L and (k, j) in U, with (i, j) in the pattern
+        is_lower = row > col
+        is_upper = row < col
+        lidx = bm.nonzero(is_lower)[0]
+        upper = bm.nonzero(is_upper)[0]
+        uptr = csr_row_pointer(row[upper], N)
+        k = col[lidx]
+        start, count = uptr[k], uptr[k+1] - uptr[k]
+        pb = upper[index_ranges(start, count)]
+        pa = bm.repeat(lidx, count)
+        query = bm.astype(row[pa], bm.int64) * N + bm.astype(col[pb], bm.int64)
+        pe = bm.clip(bm.searchsorted(key, query), 0, key.shape[0] - 1)
+        flag = key[pe] == query
+        pa, pb, pe = pa[flag], pb[flag], pe[flag]
+
+        udiag = diag[col]
+        f = bm.where(is_lower, val / val[udiag], val)
+        for _ in range(sweeps):
+            s = bm.zeros_like(f)
+            s = bm.index_add(s, pe, f[pa] * f[pb])
+            t = val - s
+            f_new = bm.where(is_lower, t / f[udiag], t)
+            change = bm.max(bm.abs(f_new - f))
+            f = f_new
+            if change <= 1e-12 * bm.max(bm.abs(f)):
+                break
+
+        ones = bm.ones((N, ), **bm.context(val))
+        self.lower = TriangularSolver(row[is_lower], col[is_lower], f[is_lower], ones)
+        self.upper = TriangularSolver(row[is_upper], col[is_upper], f[is_upper], f[diag])
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return self.upper.solve(self.lower.solve(r))
+
+
+_PRECONDITIONERS = {
+    'jacobi': JacobiPreconditioner,
+    'ssor': SSORPreconditioner,
+    'ilu0': ILU0Preconditioner,
+}
+
+
+def get_preconditioner(A, M: Union[str, None, object]) -> Optional[object]:
+    """Build a preconditioner by name, or return `M` if it is an operator.
+
+    Parameters:
+        A (COOTensor | CSRTensor): the matrix.
+        M (str | None | SupportsMatmul): one of 'jacobi', 'ssor' and 'ilu0',
+            or any object supporting `M @ r`, or None for no preconditioner.
+    """
+    if isinstance(M, str):
+        if M not in _PRECONDITIONERS:
+            raise ValueError(f"Unknown preconditioner '{M}', "
+                             f"expected one of {list(_PRECONDITIONERS)}.")
+        return _PRECONDITIONERS[M](A)
+    return M
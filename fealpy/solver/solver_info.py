@@ -0,0 +1,151 @@
+
+from dataclasses import dataclass, field
+from typing import Optional, Protocol, List, Dict, Any
+from time import perf_counter
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .. import logger
+
+
+class SupportsMatmul(Protocol):
+    def __matmul__(self, other: TensorLike) -> TensorLike: ...
+
+
+@dataclass
+class SolverInfo:
+    """Convergence report of an iterative solver.
+
+    Attributes:
+        method (str): name of the solver.
+        niter (Tensor): number of iterations of every column, shaped (batch, ).
+        converged (Tensor): whether every column has converged, shaped (batch, ).
+        residuals (List[Tensor]): residual norms of every column, one tensor
+            shaped (batch, ) for the initial guess and each iteration.
+        matvec_time (List[float]): wall time in seconds of every matrix-vector
+            product.
+        wall_time (float): total wall time of the solve in seconds.
+    """
+    method: str
+    niter: Optional[TensorLike] = None
+    converged: Optional[TensorLike] = None
+    residuals: List[TensorLike] = field(default_factory=list)
+    matvec_time: List[float] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def nmatvec(self) -> int:
+        return len(self.matvec_time)
+
+    @property
+    def residual_history(self) -> TensorLike:
+        """Residual norms shaped (number of records, batch)."""
+        return bm.stack(self.residuals, axis=0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain python data, ready to be logged or serialized."""
+        return {
+            'method': self.method,
+            'niter': bm.to_numpy(self.niter).tolist(),
+            'converged': bm.to_numpy(self.converged).tolist(),
+            'residuals': bm.to_numpy(self.residual_history).tolist(),
+            'nmatvec': self.nmatvec,
+            'matvec_time': sum(self.matvec_time),
+            'wall_time': self.wall_time,
+        }
+
+
+class TimedOperator():
+    """Wrap an operator to record the wall time of every `@` into an info."""
+    def __init__(self, A: SupportsMatmul, info: SolverInfo):
+        self.A = A
+        self.info = info
+
+    def __matmul__(self, x: TensorLike) -> TensorLike:
+        start = perf_counter()
+        y = self.A @ x
+        self.info.matvec_time.append(perf_counter() - start)
+        return y
+
+
+class VectorOperator():
+    """Apply an operator to the (N, 1) iterates of a system given with a 1-D\
+    `b`, through the 1-D vectors that the operator expects."""
+    def __init__(self, A: SupportsMatmul):
+        self.A = A
+
+    def __matmul__(self, x: TensorLike) -> TensorLike:
+        return (self.A @ x[:, 0])[:, None]
+
+
+def as_column_operator(A: Optional[SupportsMatmul], b: TensorLike):
+    """Return the operator to apply to the (N, batch) iterates.
+
+    The operators are called on tensors of the same shape as `b`, so the
+    matrix-free operators which only support 1-D vectors work as well.
+    """
+    if A is None or b.ndim != 1:
+        return A
+    return VectorOperator(A)
+
+
+def column_norm(x: TensorLike) -> TensorLike:
+    """2-norm of every column of a (N, batch) tensor."""
+    return bm.sqrt(bm.sum(x * x, axis=0))
+
+
+def safe_divide(a: TensorLike, b: TensorLike) -> TensorLike:
+    """a / b, with zero where b is zero."""
+    flag = b == 0
+    return bm.where(flag, 0., a / bm.where(flag, 1., b))
+
+
+def prepare_system(b: TensorLike, x0: Optional[TensorLike], batch_first: bool):
+    """Check the right-hand side and initial guess, and reshape them to (N, batch).
+
+    Returns:
+        Tuple[Tensor, Tensor]: b and x0 shaped (N, batch).
+    """
+    assert isinstance(b, TensorLike), "b must be a Tensor"
+    if x0 is not None:
+        assert isinstance(x0, TensorLike), "x0 must be a Tensor if not None"
+
+    if b.ndim not in {1, 2}:
+        raise ValueError("b must be a 1D or 2D dense tensor")
+
+    if x0 is None:
+        x0 = bm.zeros_like(b)
+    elif x0.shape != b.shape:
+        raise ValueError("x0 and b must have the same shape")
+
+    if b.ndim == 1:
+        return b[:, None], x0[:, None]
+    if batch_first:
+        return bm.swapaxes(b, 0, 1), bm.swapaxes(x0, 0, 1)
+    return b, x0
+
+
+def restore_shape(x: TensorLike, b: TensorLike, batch_first: bool) -> TensorLike:
+    """Reshape a (N, batch) solution back to the shape of `b`."""
+    if b.ndim == 1:
+        return x[:, 0]
+    if batch_first:
+        return bm.swapaxes(x, 0, 1)
+    return x
+
+
+def is_converged(r_norm: TensorLike, b_norm: TensorLike, atol: float, rtol: float):
+    """Per-column stopping test by absolute or relative tolerance."""
+    return (r_norm < atol) | (r_norm < rtol * b_norm)
+
+
+def log_result(info: SolverInfo, maxiter: Optional[int]):
+    name = info.method.upper()
+    niter = int(bm.max(info.niter)) if info.niter.shape[0] > 0 else 0
+    if bool(bm.all(info.converged)):
+        logger.info(f"{name}: converged in {niter} iterations.")
+    else:
+        nfail = int(bm.sum(~info.converged))
+        logger.info(f"{name}: failed for {nfail} column(s), "
+                    f"stopped by maxiter ({maxiter}).")
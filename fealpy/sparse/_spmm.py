@@ -48,24 +48,33 @@ def spmm_coo(indices: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
 
 
 def spmm_csr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
+    """Multiply a CSR matrix with a dense vector or (batched) matrix.
+
+    Every non-zero is multiplied with the matching row of `x` in one shot,
+    then the products are reduced into their rows (a segment sum over `crow`),
+    so no Python loop over the matrix rows is involved.
+    """
     _shape_check(spshape, x.shape)
     nrow = spshape[0]
-    unsqueezed = False
+    row = csr_row_indices(crow)
 
     if x.ndim == 1:
-        x = x[:, None]
-        unsqueezed = True
-
-    shape = x.shape[:-2] + (nrow, x.shape[-1])
-    result = bm.zeros(shape, dtype=x.dtype)
+        new_vals = values * x[col] # (*batch, nnz)
+        shape = new_vals.shape[:-1] + (nrow, )
+        result = bm.zeros(shape, dtype=new_vals.dtype)
+        result = bm.index_add(result, row, new_vals, axis=-1)
+        return result
 
-    for i in range(nrow):
-        start = crow[i]
-        end = crow[i + 1]
-        r = bm.einsum('...i, ...ij -> ...j', values[..., start:end], x[..., col[start:end], :])
-        result[..., i, :] = r
+    else: # x.ndim >= 2
+        new_vals = values[..., None] * x[..., col, :] # (*batch, nnz, x_col)
+        shape = new_vals.shape[:-2] + (nrow, x.shape[-1])
+        result = bm.zeros(shape, dtype=new_vals.dtype)
+        result = bm.index_add(result, row, new_vals, axis=-2)
+        return result
 
-    if unsqueezed:
-        result = result[..., 0]
 
-    return result
+def csr_row_indices(crow: _DT) -> _DT:
+    """Expand the compressed row pointers to the row index of every non-zero."""
+    nrow = crow.shape[0] - 1
+    kwargs = bm.context(crow)
+    return bm.repeat(bm.arange(nrow, **kwargs), crow[1:] - crow[:-1])
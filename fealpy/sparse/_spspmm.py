@@ -3,6 +3,7 @@ from typing import Tuple
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike as _DT
+from .utils import csr_row_pointer, coalesce_indices
 
 _Size = Tuple[int, ...]
 
@@ -17,97 +18,82 @@ def _shape_check(spshape1: _Size, spshape2: _Size):
                         f"got shape {spshape1} and {spshape2}.")
 
 
-def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
-               indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
-    _shape_check(spshape1, spshape2)
-
+def _structure_check(values1: _DT, values2: _DT):
     structure = values1.shape[:-1]
     if values2.shape[:-1] != structure:
         raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
                          f"must match that of matrix1 {structure}")
 
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
-
-    for i in range(size):
-        left_col_flag = (indices1[1, :] == i)
 
-        if not bm.any(left_col_flag, axis=0):
-            continue
+def _expand(row1: _DT, col1: _DT, crow2: _DT, col2: _DT):
+    """Expand step: pair every non-zero A[i, k] with every non-zero B[k, j].
 
-        right_row_flag = (indices2[0, :] == i)
+    Returns:
+        Tuple[Tensor, Tensor, Tensor, Tensor]: row and column indices of the
+        products, and the locations of the two factors in the values of A and B.
+    """
+    kwargs = bm.context(col1)
+    start = crow2[col1]
+    count = crow2[col1 + 1] - start
+    offset = bm.cumsum(count, axis=0)
+    total = int(offset[-1]) if offset.shape[0] > 0 else 0
+    offset = offset - count
 
-        if not bm.any(right_row_flag, axis=0):
-            continue
+    left = bm.repeat(bm.arange(col1.shape[0], **kwargs), count)
+    right = start[left] + bm.arange(total, **kwargs) - offset[left]
 
-        row = indices1[0, left_col_flag]
-        col = indices2[1, right_row_flag]
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.meshgrid(row, col, indexing='ij')
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., right_row_flag]
-
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
-        indices_list.append(idx)
-        values_list.append(val)
-
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
-    return indices, values, (spshape1[0], spshape2[1])
-
-
-def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
-               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
-    _shape_check(spshape1, spshape2)
+    return row1[left], col2[right], left, right
 
-    structure = values1.shape[:-1]
-    if values2.shape[:-1] != structure:
-        raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
-                         f"must match that of matrix1 {structure}")
 
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
-    new_crow = bm.zeros(size+1,dtype=bm.int64)
+def _compress(row: _DT, col: _DT, values: _DT, spshape: _Size):
+    """Sort-compress step: sort the products by (row, col) and sum duplicates."""
+    new_row, new_col, location = coalesce_indices(row, col, spshape)
+    new_values = bm.zeros(values.shape[:-1] + (new_row.shape[0], ), **bm.context(values))
+    new_values = bm.index_add(new_values, location, values, axis=-1)
 
-    for i in range(size):
-        row = bm.array([],dtype=bm.int64)
-        left_col_flag = (col1 == i)
+    return new_row, new_col, new_values
 
-        for x in bm.where(left_col_flag == True)[0]+1:
-            flag = ~(x>crow1[:-1])^(x<=crow1[1:])
-            row = bm.concat((row,(bm.where(flag == True))[0]))
 
-        col = col2[crow2[i]:crow2[i+1]]
+def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
+               indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
+    """Sparse-sparse matrix multiplication of two COO matrices.
 
-        if not bm.any(row, axis=0):
-            continue
+    The product is formed by expand-sort-compress: all partial products are
+    generated at once, then sorted by their flattened location and
+    accumulated. The returned indices are sorted and unique.
+    """
+    _shape_check(spshape1, spshape2)
+    _structure_check(values1, values2)
 
-        if not bm.any(col, axis=0):
-            continue
+    # sort the right matrix by rows to find the non-zeros of each row quickly
+    order = bm.argsort(indices2[0], stable=True)
+    row2 = indices2[0, order]
+    col2 = indices2[1, order]
+    crow2 = csr_row_pointer(row2, spshape2[0])
 
-        idx = bm.meshgrid(row, col, indexing='ij')
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., crow2[i]:crow2[i+1]]
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
+    row, col, left, right = _expand(indices1[0], indices1[1], crow2, col2)
+    values = values1[..., left] * values2[..., order][..., right]
+    spshape = (spshape1[0], spshape2[1])
+    row, col, values = _compress(row, col, values, spshape)
 
-        indices_list.append(idx)
-        values_list.append(val)
+    return bm.stack([row, col], axis=0), values, spshape
 
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
 
-    unique_indices, inverse_indices = bm.unique(indices, return_inverse=True, axis=1)
-    new_values = bm.zeros(unique_indices.shape[1])
-    new_values = bm.index_add(new_values, inverse_indices, values, axis=-1)
+def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
+               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _DT, _Size]:
+    """Sparse-sparse matrix multiplication of two CSR matrices.
 
-    for x in unique_indices[0,:]:
-        new_crow[x+1]+=1
+    See `spspmm_coo`. The column indices in each row of the output are sorted.
+    """
+    _shape_check(spshape1, spshape2)
+    _structure_check(values1, values2)
 
-    new_crow=bm.cumsum(new_crow)
+    nrow1 = crow1.shape[0] - 1
+    row1 = bm.repeat(bm.arange(nrow1, **bm.context(crow1)), crow1[1:] - crow1[:-1])
+    row, col, left, right = _expand(row1, col1, crow2, col2)
+    values = values1[..., left] * values2[..., right]
+    spshape = (spshape1[0], spshape2[1])
+    row, col, values = _compress(row, col, values, spshape)
+    crow = csr_row_pointer(row, spshape[0])
 
-    return new_crow, unique_indices[1,:], new_values,(spshape1[0], spshape2[1])
+    return crow, col, values, spshape
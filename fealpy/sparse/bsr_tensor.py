@@ -0,0 +1,290 @@
+from typing import Optional, Union, Tuple
+from math import prod
+
+from ..backend import TensorLike, Number, Size
+from ..backend import backend_manager as bm
+from .sparse_tensor import SparseTensor
+from .utils import csr_row_pointer, coalesce_indices
+
+
+class BSRTensor(SparseTensor):
+    def __init__(self, crow: TensorLike, col: TensorLike, values: TensorLike,
+                 spshape: Optional[Size]=None) -> None:
+        """Initializes BSR (block sparse row) format sparse tensor.
+
+        The matrix is divided into dense blocks of the same shape (R, C), and
+        the non-zero blocks are stored in the CSR layout of the block rows.
+        This suits the systems of vector-valued spaces, where every pair of
+        scalar dofs couples the GD components by a dense GD x GD block, and
+        needs only one index for every block.
+
+        Parameters:
+            crow (Tensor): compressed row pointers of the block rows.
+            col (Tensor): block column indices of non-zero blocks, shaped (nnzb,).
+                Where nnzb is the number of non-zero blocks.
+            values (Tensor): non-zero blocks, shaped (nnzb, R, C).
+            spshape (Size | None, optional): shape of the matrix in scalar entries.
+        """
+        self._crow = crow
+        self._col = col
+        self._values = values
+        self._row = None
+
+        R, C = values.shape[-2:]
+        if spshape is None:
+            nrow = crow.shape[0] - 1
+            ncol = int(bm.max(col)) + 1 if col.shape[0] > 0 else 0
+            self._spshape = (nrow * R, ncol * C)
+        else:
+            self._spshape = tuple(spshape)
+
+        self._check(crow, col, values, self._spshape)
+
+    def _check(self, crow: TensorLike, col: TensorLike, values: TensorLike, spshape: Size):
+        if crow.ndim != 1:
+            raise ValueError(f"crow must be a 1-D tensor, but got {crow.ndim}")
+        if col.ndim != 1:
+            raise ValueError(f"col must be a 1-D tensor, but got {col.ndim}")
+        if not isinstance(values, TensorLike):
+            raise ValueError(f"values must be a Tensor, but got {type(values)}")
+        if values.ndim != 3:
+            raise ValueError(f"values must be a 3-D tensor of blocks, but got {values.ndim}-D")
+        if values.shape[0] != col.shape[0]:
+            raise ValueError(f"values must have the same number of blocks as col "
+                             f"({col.shape[0]}), but got {values.shape[0]}")
+        if len(spshape) != 2:
+            raise ValueError(f"spshape must be a 2-tuple for BSR format, but got {spshape}")
+
+        R, C = values.shape[-2:]
+        if (spshape[0] % R != 0) or (spshape[1] % C != 0):
+            raise ValueError(f"spshape {spshape} is not divisible by the block shape {(R, C)}")
+        if spshape[0] // R != crow.shape[0] - 1:
+            raise ValueError(f"crow.shape[0] - 1 must be equal to the number of block "
+                             f"rows {spshape[0] // R}, but got {crow.shape[0] - 1}")
+
+    def __repr__(self) -> str:
+        return f"BSRTensor(crow={self._crow}, col={self._col}, "\
+               + f"values={self._values}, shape={self.shape}, blockshape={self.blockshape})"
+
+    ### 1. Data Fetching ###
+    @property
+    def itype(self): return self._crow.dtype
+
+    @property
+    def nnz(self): return prod(self._values.shape)
+
+    @property
+    def nnzb(self):
+        """Number of non-zero blocks."""
+        return self._col.shape[0]
+
+    @property
+    def blockshape(self) -> Tuple[int, int]:
+        return tuple(self._values.shape[-2:])
+
+    @property
+    def dense_shape(self): return tuple()
+    @property
+    def dense_ndim(self): return 0
+
+    def crow(self) -> TensorLike:
+        """Return the block row location of non-zero blocks."""
+        return self._crow
+
+    def row(self) -> TensorLike:
+        """Generate the block row id of non-zero blocks."""
+        if self._row is None:
+            crow = self._crow
+            self._row = bm.repeat(
+                bm.arange(crow.shape[0] - 1, dtype=crow.dtype, device=bm.get_device(crow)),
+                crow[1:] - crow[:-1]
+            )
+        return self._row
+
+    def col(self) -> TensorLike:
+        """Return the block column of non-zero blocks."""
+        return self._col
+
+    def values(self) -> TensorLike:
+        """Return the non-zero blocks, shaped (nnzb, R, C)."""
+        return self._values
+
+    ### 2. Data Type & Device Management ###
+    def astype(self, dtype=None, /, *, copy=True):
+        values = bm.astype(self._values, dtype, copy=copy)
+        return BSRTensor(self._crow, self._col, values, self._spshape)
+
+    def device_put(self, device=None, /):
+        return BSRTensor(bm.device_put(self._crow, device),
+                         bm.device_put(self._col, device),
+                         bm.device_put(self._values, device),
+                         self._spshape)
+
+    ### 3. Format Conversion ###
+    def _scalar_indices(self):
+        """Scalar row and column of the entries in the order of (block, i, j)."""
+        R, C = self.blockshape
+        kwargs = bm.context(self._col)
+        row = self.row()[:, None, None] * R + bm.arange(R, **kwargs)[None, :, None]
+        col = self._col[:, None, None] * C + bm.arange(C, **kwargs)[None, None, :]
+        shape = (self.nnzb, R, C)
+        return bm.broadcast_to(row, shape).reshape(-1), bm.broadcast_to(col, shape).reshape(-1)
+
+    def to_dense(self, *, fill_value: Number=1.0) -> TensorLike:
+        return self.tocoo().to_dense(fill_value=fill_value)
+
+    def tocoo(self, *, copy=False):
+        from .coo_tensor import COOTensor
+        row, col = self._scalar_indices()
+        values = self._values.reshape(-1)
+        if copy:
+            values = bm.copy(values)
+        return COOTensor(bm.stack([row, col], axis=0), values, self._spshape,
+                         is_coalesced=True)
+
+    def tocsr(self, *, copy=False):
+        from .csr_tensor import CSRTensor
+        row, col = self._scalar_indices()
+        # NOTE: the blocks of a block row are sorted by columns, so sorting the
+        # entries stably by scalar rows gives sorted columns in every row.
+        order = bm.argsort(row, stable=True)
+        crow = csr_row_pointer(row[order], self._spshape[0])
+        return CSRTensor(crow, col[order], self._values.reshape(-1)[order], self._spshape)
+
+    def tobsr(self, *, copy=False):
+        if copy:
+            return self.copy()
+        return self
+
+    ### 4. Object Conversion ###
+    def to_scipy(self):
+        from scipy.sparse import bsr_matrix
+
+        return bsr_matrix(
+            (bm.to_numpy(self._values), bm.to_numpy(self._col), bm.to_numpy(self._crow)),
+            shape = self._spshape
+        )
+
+    @classmethod
+    def from_scipy(cls, mat, /):
+        mat = mat.tobsr()
+        crow = bm.from_numpy(mat.indptr)
+        col = bm.from_numpy(mat.indices)
+        values = bm.from_numpy(mat.data)
+        return cls(crow, col, values, mat.shape)
+
+    @classmethod
+    def from_blocks(cls, entity_to_global: Union[TensorLike, Tuple[TensorLike, TensorLike]],
+                    local_tensor: TensorLike, shape: Size) -> 'BSRTensor':
+        """Assemble a BSR tensor from the local blocks of entities.
+
+        Parameters:
+            entity_to_global (Tensor | (Tensor, Tensor)): The global block index\
+                of the local blocks, shaped (NC, ldof); or a tuple of the\
+                block rows (NC, vldof) and the block columns (NC, uldof).
+            local_tensor (Tensor): The local blocks, shaped (NC, vldof, uldof, R, C).
+            shape (Size): Shape of the matrix in scalar entries.
+
+        Returns:
+            BSRTensor: The assembled matrix, with duplicated blocks summed.
+        """
+        if isinstance(entity_to_global, tuple):
+            ve2g, ue2g = entity_to_global
+        else:
+            ve2g = ue2g = entity_to_global
+        NC, vldof, uldof, R, C = local_tensor.shape
+        local_shape = (NC, vldof, uldof)
+        I = bm.broadcast_to(ve2g[:, :, None], local_shape).reshape(-1)
+        J = bm.broadcast_to(ue2g[:, None, :], local_shape).reshape(-1)
+        return cls.from_coo_blocks(I, J, local_tensor.reshape(-1, R, C), shape)
+
+    @classmethod
+    def from_coo_blocks(cls, row: TensorLike, col: TensorLike, blocks: TensorLike,
+                        shape: Size) -> 'BSRTensor':
+        """Build a BSR tensor from blocks in any order, summing the duplicated ones.
+
+        Parameters:
+            row (Tensor): block row of the blocks, shaped (N, ).
+            col (Tensor): block column of the blocks, shaped (N, ).
+            blocks (Tensor): the blocks, shaped (N, R, C).
+            shape (Size): Shape of the matrix in scalar entries.
+        """
+        R, C = blocks.shape[-2:]
+        nbrow, nbcol = shape[0] // R, shape[1] // C
+        row, col, location = coalesce_indices(row, col, (nbrow, nbcol))
+        crow = csr_row_pointer(row, nbrow)
+        values = bm.zeros((col.shape[0], R, C), **bm.context(blocks))
+        values = bm.index_add(values, location, blocks)
+        return cls(crow, col, values, shape)
+
+    ### 5. Manipulation ###
+    def copy(self):
+        return BSRTensor(bm.copy(self._crow), bm.copy(self._col),
+                         bm.copy(self._values), self._spshape)
+
+    def coalesce(self, accumulate: bool=True) -> 'BSRTensor':
+        return self
+
+    def diagonal_blocks(self, *, inverse: bool=False) -> TensorLike:
+        """Return the diagonal blocks, as used by the block-Jacobi method.
+
+        Parameters:
+            inverse (bool, optional): Whether to return the inverse of the\
+                diagonal blocks. Defaults to False.
+
+        Returns:
+            Tensor: The diagonal blocks shaped (NBR, R, C), zeros for the\
+                block rows without a diagonal block.
+        """
+        R, C = self.blockshape
+        if R != C:
+            raise ValueError(f"diagonal blocks require square blocks, but got {(R, C)}")
+        NBR = self._crow.shape[0] - 1
+        row = self.row()
+        flag = row == self._col
+        D = bm.zeros((NBR, R, C), **self.values_context())
+        D = bm.index_add(D, row[flag], self._values[flag])
+        if inverse:
+            D = bm.linalg.inv(D)
+        return D
+
+    ### 6. Arithmetic Operations ###
+    def neg(self) -> 'BSRTensor':
+        return BSRTensor(self._crow, self._col, -self._values, self._spshape)
+
+    def mul(self, other: Number) -> 'BSRTensor':
+        if isinstance(other, (int, float)):
+            return BSRTensor(self._crow, self._col, self._values * other, self._spshape)
+        raise TypeError(f'Unsupported type {type(other).__name__} in mul')
+
+    def matmul(self, other: TensorLike) -> TensorLike:
+        """Matrix-multiply this BSRTensor with a dense tensor.
+
+        Parameters:
+            other (Tensor): A 1-D tensor for matrix-vector multiply, or a 2-D\
+                tensor shaped (N, K) for K right-hand sides.
+
+        Returns:
+            Tensor: The product, shaped (M, ) or (M, K).
+        """
+        if not isinstance(other, TensorLike):
+            raise TypeError(f"Unsupported type {type(other).__name__} in matmul")
+        if other.ndim not in (1, 2):
+            raise ValueError(f"BSRTensor only multiplies 1-D or 2-D tensors, but got {other.ndim}-D")
+        if other.shape[0] != self._spshape[1]:
+            raise ValueError("Incompatible shapes detected in sparse-dense matrix "
+                             f"multiplication, {self._spshape} and {tuple(other.shape)}")
+
+        try:
+            return bm.bsr_spmm(self._crow, self._col, self._values, self._spshape, other)
+        except (AttributeError, NotImplementedError):
+            pass
+
+        R, C = self.blockshape
+        K = 1 if other.ndim == 1 else other.shape[1]
+        x = other.reshape(-1, C, K)[self._col] # (nnzb, C, K)
+        y = bm.matmul(self._values, x) # (nnzb, R, K)
+        NBR = self._crow.shape[0] - 1
+        out = bm.zeros((NBR, R, K), dtype=y.dtype, device=bm.get_device(y))
+        out = bm.index_add(out, self.row(), y)
+        return out.reshape(-1) if other.ndim == 1 else out.reshape(-1, K)
@@ -6,6 +6,7 @@ from ..backend import TensorLike, Number, Size
 from ..backend import backend_manager as bm
 from .sparse_tensor import SparseTensor
 from .utils import (
+    csr_row_pointer,
     flatten_indices, tril_coo,
     check_shape_match, check_spshape_match
 )
@@ -136,8 +137,7 @@ class COOTensor(SparseTensor):
 
         order = bm.argsort(self._indices[0], stable=True)
         new_row = self._indices[0, order]
-        crow = bm.nonzero((bm.not_equal(new_row, bm.roll(new_row, 1))))[0]
-        crow = bm.concat([crow, bm.tensor([self.nnz], **bm.context(crow))])
+        crow = csr_row_pointer(new_row, self._spshape[0])
         new_col = bm.copy(self._indices[-1, order])
 
         if self.values() is None:
@@ -448,7 +448,7 @@ class COOTensor(SparseTensor):
                 self.indices(), self.values(), self.sparse_shape,
                 other.indices(), other.values(), other.sparse_shape,
             )
-            return COOTensor(indices, values, spshape).coalesce()
+            return COOTensor(indices, values, spshape, is_coalesced=True)
 
         elif isinstance(other, TensorLike):
             if self.values() is None:
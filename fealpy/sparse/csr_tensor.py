@@ -6,6 +6,7 @@ from ..backend import TensorLike, Number, Size
 from ..backend import backend_manager as bm
 from .sparse_tensor import SparseTensor
 from .utils import (
+    csr_row_pointer,
     flatten_indices,
     check_shape_match, check_spshape_match
 )
@@ -210,7 +211,16 @@ class CSRTensor(SparseTensor):
 
     @property
     def T(self):
-        raise NotImplementedError
+        order = bm.argsort(self._col, stable=True)
+        new_crow = csr_row_pointer(self._col[order], self._spshape[1])
+        new_col = self.row()[order]
+
+        if self._values is None:
+            new_values = None
+        else:
+            new_values = self._values[..., order]
+
+        return CSRTensor(new_crow, new_col, new_values, self._spshape[::-1])
 
     def partial(self, index: Union[TensorLike, slice]):
         crow = self.crow()
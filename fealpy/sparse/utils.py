@@ -50,6 +50,55 @@ def flatten_indices(indices: TensorLike, shape: Size) -> TensorLike:
     return flatten[None, ...]
 
 
+def csr_row_pointer(row: TensorLike, nrow: int) -> TensorLike:
+    """Build the compressed row pointers from a row-sorted row index array."""
+    kwargs = bm.context(row)
+    count = bm.zeros((nrow, ), **kwargs)
+    count = bm.index_add(count, row, bm.ones(row.shape, **kwargs))
+    zero = bm.zeros((1, ), **kwargs)
+    return bm.concat([zero, bm.cumsum(count, axis=0)], axis=0)
+
+
+def index_ranges(start: TensorLike, count: TensorLike) -> TensorLike:
+    """Concatenate the index ranges [start[i], start[i] + count[i])."""
+    kwargs = bm.context(start)
+    offset = bm.cumsum(count, axis=0)
+    total = int(offset[-1]) if offset.shape[0] > 0 else 0
+    offset = offset - count
+    seg = bm.repeat(bm.arange(start.shape[0], **kwargs), count)
+    return start[seg] + bm.arange(total, **kwargs) - offset[seg]
+
+
+def coalesce_indices(row: TensorLike, col: TensorLike, spshape: Size):
+    """Sort 2-D sparse indices by (row, col) and merge the duplicated ones.
+
+    Parameters:
+        row (Tensor): row indices, shaped (nnz, ).
+        col (Tensor): column indices, shaped (nnz, ).
+        spshape (Size): shape of the sparse matrix.
+
+    Returns:
+        Tuple[Tensor, Tensor, Tensor]: the sorted unique row and column indices,
+        and the location of each input entry in the unique ones, which can be
+        used to accumulate values by `index_add`.
+    """
+    if row.shape[0] == 0:
+        return row, col, bm.copy(row)
+
+    key = bm.astype(row, bm.int64) * spshape[1] + bm.astype(col, bm.int64)
+    order = bm.argsort(key, stable=True)
+    key = key[order]
+    unique_mask = bm.concat([
+        bm.ones((1, ), dtype=bm.bool, device=bm.get_device(key)),
+        key[1:] != key[:-1]
+    ], axis=0)
+    add_index = bm.cumsum(unique_mask, axis=0) - 1
+    location = bm.empty(add_index.shape, **bm.context(add_index))
+    location = bm.set_at(location, order, add_index)
+
+    return row[order][unique_mask], col[order][unique_mask], location
+
+
 def tril_coo(indices: TensorLike, values: TensorLike, k: int=0):
     """Copy the lower triangular portion of a sparse COO matrix in the last two dimensions."""
     tril_pos = (indices[-2] + k) >= indices[-1]
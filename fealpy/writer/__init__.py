@@ -1,2 +1,19 @@
-from .MeshWriter import MeshWriter
-from .VTKMeshWriter import VTKMeshWriter
+"""The Writer Module
+
+The writers are imported on first access, see `fealpy.lazy`, so that the
+other writers do not require vtk.
+"""
+from typing import TYPE_CHECKING
+
+from ..lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'time_series_writer': ['TimeSeriesWriter'],
+    'MeshWriter': ['MeshWriter'],
+    'VTKMeshWriter': ['VTKMeshWriter'],
+})
+
+if TYPE_CHECKING:
+    from .time_series_writer import TimeSeriesWriter
+    from .MeshWriter import MeshWriter
+    from .VTKMeshWriter import VTKMeshWriter
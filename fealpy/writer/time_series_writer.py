@@ -0,0 +1,273 @@
+
+from typing import Optional, Dict, Any, Tuple
+import os
+import threading
+import queue
+import zipfile
+import io
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+# XDMF topology of the VTK cell types
+_XDMF_TOPOLOGY = {
+    3: 'Polyline',
+    5: 'Triangle',
+    9: 'Quadrilateral',
+    10: 'Tetrahedron',
+    12: 'Hexahedron',
+}
+
+# VTK cell types by (topological dimension, number of vertices)
+_VTK_CELL_TYPE = {
+    (1, 2): 3,
+    (2, 3): 5,
+    (2, 4): 9,
+    (3, 4): 10,
+    (3, 8): 12,
+}
+
+
+def _mesh_arrays(mesh) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Return the node, cell and the VTK cell type of the mesh in numpy."""
+    node = np.ascontiguousarray(bm.to_numpy(mesh.entity('node')))
+    cell = np.ascontiguousarray(bm.to_numpy(mesh.entity('cell')))
+    if hasattr(mesh, 'vtk_cell_type'):
+        cell_type = mesh.vtk_cell_type()
+    else:
+        key = (mesh.top_dimension(), cell.shape[-1])
+        if key not in _VTK_CELL_TYPE:
+            raise ValueError(f"Unsupported cell with {cell.shape[-1]} vertices "
+                             f"in {key[0]}-d for the time series.")
+        cell_type = _VTK_CELL_TYPE[key]
+    return node, cell, cell_type
+
+
+class _NPZContainer():
+    """Time series in a zip archive of compressed npy members, readable by
+    `numpy.load`: 'node', 'cell', 'time', and '<name>/<step>' for the fields."""
+    def __init__(self, fname: str, node, cell, cell_type: int, compression: int):
+        self.fname = fname + '.npz'
+        self.compresslevel = compression
+        self.times = []
+        self.file = zipfile.ZipFile(self.fname, mode='w')
+        self._add('node', node)
+        self._add('cell', cell)
+        self._add('cell_type', np.array(cell_type))
+
+    def _add(self, name: str, value: np.ndarray):
+        buffer = io.BytesIO()
+        np.lib.format.write_array(buffer, value, allow_pickle=False)
+        self.file.writestr(name + '.npy', buffer.getvalue(),
+                           compress_type=zipfile.ZIP_DEFLATED,
+                           compresslevel=self.compresslevel)
+
+    def write_step(self, step: int, t: float, nodedata: Dict, celldata: Dict):
+        for name, value in {**nodedata, **celldata}.items():
+            self._add(f'{name}/{step:06d}', value)
+        self.times.append(t)
+
+    def close(self):
+        self._add('time', np.array(self.times, dtype=np.float64))
+        self.file.close()
+
+
+class _XDMFContainer():
+    """Time series in an HDF5 file with an XDMF index, readable by ParaView.
+    The mesh is stored once in '/mesh', and every field of every step in a
+    chunked, gzip-compressed dataset '/<nodedata|celldata>/<name>/<step>'."""
+    def __init__(self, fname: str, node, cell, cell_type: int, compression: int):
+        import h5py
+
+        if cell_type not in _XDMF_TOPOLOGY:
+            raise ValueError(f"Unsupported VTK cell type {cell_type} for XDMF.")
+        self.h5name = fname + '.h5'
+        self.xdmfname = fname + '.xdmf'
+        self.compression = compression
+        self.file = h5py.File(self.h5name, 'w')
+        if node.shape[1] == 2:
+            node = np.concatenate([node, np.zeros((node.shape[0], 1), dtype=node.dtype)], axis=1)
+        self._dataset('mesh/node', node)
+        self._dataset('mesh/cell', cell)
+        self.NN, self.NC, self.NV = node.shape[0], cell.shape[0], cell.shape[1]
+        self.dtypes = (node.dtype, cell.dtype)
+        self.topology = _XDMF_TOPOLOGY[cell_type]
+        self.steps = []
+
+    def _dataset(self, path: str, value: np.ndarray):
+        chunks = value.shape if value.ndim > 0 and value.size > 0 else None
+        self.file.create_dataset(path, data=value, chunks=chunks,
+                                 compression='gzip', compression_opts=self.compression)
+
+    def write_step(self, step: int, t: float, nodedata: Dict, celldata: Dict):
+        fields = []
+        for center, data in (('Node', nodedata), ('Cell', celldata)):
+            for name, value in data.items():
+                if value.ndim == 2 and value.shape[1] == 2:
+                    value = np.concatenate([value, np.zeros_like(value[:, :1])], axis=1)
+                path = f'{center.lower()}data/{name}/{step:06d}'
+                self._dataset(path, value)
+                fields.append((name, center, path, value.shape, value.dtype))
+        self.steps.append((t, fields))
+        self.file.flush()
+
+    def _item(self, path: str, shape, dtype) -> str:
+        ntype = 'Int' if np.issubdtype(dtype, np.integer) else 'Float'
+        dims = ' '.join(str(n) for n in shape)
+        h5 = os.path.basename(self.h5name)
+        return (f'<DataItem Dimensions="{dims}" NumberType="{ntype}" '
+                f'Precision="{dtype.itemsize}" Format="HDF">{h5}:/{path}</DataItem>')
+
+    def close(self):
+        self.file.close()
+        mesh = (f'<Topology TopologyType="{self.topology}" NumberOfElements="{self.NC}">'
+                + self._item('mesh/cell', (self.NC, self.NV), self.dtypes[1]) + '</Topology>'
+                + '<Geometry GeometryType="XYZ">'
+                + self._item('mesh/node', (self.NN, 3), self.dtypes[0]) + '</Geometry>')
+        grids = []
+        for t, fields in self.steps:
+            attrs = []
+            for name, center, path, shape, dtype in fields:
+                atype = 'Scalar' if len(shape) == 1 else 'Vector'
+                attrs.append(f'<Attribute Name="{name}" AttributeType="{atype}" '
+                             f'Center="{center}">' + self._item(path, shape, dtype)
+                             + '</Attribute>')
+            grids.append(f'<Grid Name="mesh" GridType="Uniform"><Time Value="{t!r}"/>'
+                         + mesh + ''.join(attrs) + '</Grid>')
+        with open(self.xdmfname, 'w') as f:
+            f.write('<?xml version="1.0"?>\n<Xdmf Version="3.0"><Domain>'
+                    '<Grid Name="TimeSeries" GridType="Collection" CollectionType="Temporal">\n'
+                    + '\n'.join(grids) + '\n</Grid></Domain></Xdmf>\n')
+
+
+class TimeSeriesWriter():
+    """Write the fields of a time-dependent simulation on a fixed mesh.
+
+    Unlike writing a VTU file for every step, the mesh is stored only once
+    and the fields of every step are appended to a compressed container:
+
+    - 'xdmf': an HDF5 file with an XDMF index, which can be opened by
+      ParaView. Requires `h5py`.
+    - 'npz': a zip archive of compressed npy members, which can be read by
+      `numpy.load`. Needs no other package.
+
+    The fields are copied when submitted, and written by a background
+    thread through a bounded queue, so the solver only waits when more
+    than `maxsize` steps are pending.
+
+    Examples:
+        >>> with TimeSeriesWriter('result/heat', mesh) as writer:
+        ...     for t in timeline:
+        ...         ...
+        ...         writer.write(t, nodedata={'uh': uh})
+    """
+    def __init__(self, fname: str, mesh, *, format: Optional[str]=None,
+                 maxsize: int=8, compression: int=4):
+        """
+        Parameters:
+            fname (str): The file name without suffix.
+            mesh (Mesh): The mesh of the fields.
+            format (str | None, optional): 'xdmf' or 'npz'. Default to 'xdmf'\
+                if h5py is installed, otherwise 'npz'.
+            maxsize (int, optional): The maximum number of pending steps. Default is 8.
+            compression (int, optional): The compression level from 0 to 9. Default is 4.
+        """
+        if format is None:
+            try:
+                import h5py
+                format = 'xdmf'
+            except ImportError:
+                format = 'npz'
+        if format not in ('xdmf', 'npz'):
+            raise ValueError(f"format should be 'xdmf' or 'npz', but got '{format}'.")
+
+        dirname = os.path.dirname(fname)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        node, cell, cell_type = _mesh_arrays(mesh)
+        Container = _XDMFContainer if format == 'xdmf' else _NPZContainer
+        self.format = format
+        self.NN = node.shape[0]
+        self.NC = cell.shape[0]
+        self._container = Container(fname, node, cell, cell_type, compression)
+
+        self._step = 0
+        self._error: Optional[BaseException] = None
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    break
+                if self._error is None:
+                    self._container.write_step(*item)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _check_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Failed to write the time series.") from error
+
+    def _to_numpy(self, data: Optional[Dict[str, TensorLike]], n: int, kind: str):
+        result = {}
+        for name, value in (data or {}).items():
+            value = np.array(bm.to_numpy(value), copy=True)
+            if value.dtype == np.bool_:
+                value = value.astype(np.int8)
+            if value.shape[0] != n:
+                raise ValueError(f"{kind} '{name}' should have {n} rows, "
+                                 f"but got shape {value.shape}.")
+            result[name] = value
+        return result
+
+    def write(self, t: float, nodedata: Optional[Dict[str, TensorLike]]=None,
+              celldata: Optional[Dict[str, TensorLike]]=None):
+        """Submit the fields of a step at time t.
+
+        Parameters:
+            t (float): The time of the step.
+            nodedata (Dict[str, Tensor] | None, optional): Fields on the nodes,\
+                shaped (NN, ...).
+            celldata (Dict[str, Tensor] | None, optional): Fields on the cells,\
+                shaped (NC, ...).
+        """
+        if self._closed:
+            raise RuntimeError("The time series writer has been closed.")
+        self._check_error()
+        nodedata = self._to_numpy(nodedata, self.NN, 'nodedata')
+        celldata = self._to_numpy(celldata, self.NC, 'celldata')
+        self._queue.put((self._step, float(t), nodedata, celldata))
+        self._step += 1
+
+    def flush(self):
+        """Wait until all the submitted steps are written."""
+        self._queue.join()
+        self._check_error()
+
+    def close(self):
+        """Write the pending steps and close the files."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self._check_error()
+        finally:
+            self._container.close()
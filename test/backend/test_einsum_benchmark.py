@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+NUM_CELLS = [10**2, 10**5]
+
+# (subscripts, shapes of operands for C cells) of the assembly kernels
+PATTERNS = {
+    'mass': ('q, c, cqid, cqjd -> cij',
+             lambda C: [(6, ), (C, ), (C, 6, 10, 1), (C, 6, 10, 1)]),
+    'diffusion': ('q, c, cqid, cqjd -> cij',
+                  lambda C: [(6, ), (C, ), (C, 6, 10, 2), (C, 6, 10, 2)]),
+    'coef_diffusion': ('q, c, cqid, cqjd, ...cqd -> ...cij',
+                       lambda C: [(6, ), (C, ), (C, 6, 10, 2), (C, 6, 10, 2), (C, 6, 2)]),
+    'source': ('c, q, cqid, ...cq -> ...cid',
+               lambda C: [(C, ), (6, ), (C, 6, 10, 1), (C, 6)]),
+}
+
+
+def _make_input(pattern: str, C: int):
+    subscripts, shapes = PATTERNS[pattern]
+    operands = [bm.from_numpy(np.random.rand(*s)) for s in shapes(C)]
+    return subscripts, operands
+
+
+@pytest.mark.benchmark(group="einsum")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("pattern", list(PATTERNS))
+@pytest.mark.parametrize("C", NUM_CELLS)
+def test_einsum(benchmark, C, pattern, backend):
+    bm.set_backend(backend)
+    subscripts, operands = _make_input(pattern, C)
+    benchmark(bm.einsum, subscripts, *operands)
+
+
+@pytest.mark.benchmark(group="einsum")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("pattern", list(PATTERNS))
+@pytest.mark.parametrize("C", NUM_CELLS)
+def test_einsum_plan(benchmark, C, pattern, backend):
+    bm.set_backend(backend)
+    subscripts, operands = _make_input(pattern, C)
+    plan = bm.einsum_plan(subscripts, *[op.shape for op in operands])
+    result = benchmark(plan, *operands)
+    expected = bm.einsum(subscripts, *operands)
+    np.testing.assert_allclose(bm.to_numpy(result), bm.to_numpy(expected))
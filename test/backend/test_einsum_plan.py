@@ -0,0 +1,40 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+
+
+PATTERNS = [
+    ('q, c, cqid, cqjd -> cij', [(3, ), (7, ), (7, 3, 4, 2), (7, 3, 5, 2)], 'bmm'),
+    ('q, c, cqid, cqjd, ...cqd -> ...cij', [(3, ), (7, ), (7, 3, 4, 2), (7, 3, 5, 2), (7, 3, 2)], 'bmm'),
+    ('q, c, cqid, cqjd, ...cqd -> ...cij', [(3, ), (7, ), (7, 3, 4, 1), (7, 3, 5, 1), (2, 7, 3, 1)], 'einsum'),
+    ('c, q, cqid, ...cq -> ...cid', [(7, ), (3, ), (7, 3, 4, 1), (7, 3)], 'bmm'),
+    ('c, q, cq... -> c...', [(7, ), (3, ), (7, 3, 4, 2)], 'einsum'),
+    ('cqid, cqjd -> jic', [(7, 3, 4, 2), (7, 3, 5, 2)], 'bmm'),
+]
+
+
+class TestEinsumPlan:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("subscripts, shapes, kind", PATTERNS)
+    def test_plan(self, subscripts, shapes, kind, backend):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(0)
+        operands = [rng.random(s) for s in shapes]
+        plan = bm.einsum_plan(subscripts, *shapes)
+        result = plan(*[bm.from_numpy(op) for op in operands])
+        np.testing.assert_allclose(bm.to_numpy(result), np.einsum(subscripts, *operands))
+        if backend == 'numpy':
+            assert plan.kind == kind
+
+    def test_cache(self):
+        bm.set_backend('numpy')
+        shapes = [(3, ), (7, ), (7, 3, 4, 2), (7, 3, 4, 2)]
+        plan = bm.einsum_plan('q, c, cqid, cqjd -> cij', *shapes)
+        assert bm.einsum_plan('q, c, cqid, cqjd -> cij', *shapes) is plan
+        assert bm.einsum_plan('q, c, cqid, cqjd -> cij', *shapes[:3], (7, 3, 5, 2)) is not plan
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_einsum_plan.py"])
@@ -0,0 +1,102 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.fdm import LaplaceOperator, GradientOperator, DivergenceOperator
+from fealpy.solver import cg
+
+
+def uniform_mesh(TD, n):
+    if TD == 2:
+        return UniformMesh2d((0, n, 0, n + 2), h=(1/n, 1/(n + 2)))
+    return UniformMesh3d((0, n, 0, n, 0, n + 1), h=(1/n, 1/n, 1/(n + 1)))
+
+
+def cube_mesh(TD, n):
+    if TD == 2:
+        return UniformMesh2d((0, n, 0, n), h=(1/n, 1/n))
+    return UniformMesh3d((0, n, 0, n, 0, n), h=(1/n, 1/n, 1/n))
+
+
+class TestLaplaceOperator:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("TD, stencil", [(2, 5), (2, 9), (3, 7), (3, 27)])
+    def test_matches_sparse(self, backend, TD, stencil):
+        bm.set_backend(backend)
+        mesh = cube_mesh(TD, 6)
+        A = LaplaceOperator(mesh, coef=2.0, stencil=stencil)
+        S = A.to_sparse()
+        assert S.nnz <= A.N * stencil
+        u = bm.from_numpy(np.random.rand(A.N, 3))
+        np.testing.assert_allclose(bm.to_numpy(A @ u), bm.to_numpy(S @ u), atol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(A.diagonal()),
+                                   bm.to_numpy(S.to_dense()).diagonal())
+        # constants are in the kernel away from the boundary
+        r = bm.to_numpy(A @ bm.ones((A.N, ), dtype=bm.float64))
+        flag = bm.to_numpy(A.boundary_node_flag())
+        np.testing.assert_allclose(r[~flag], 0.0, atol=1e-9)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_variable_coef(self, backend):
+        bm.set_backend(backend)
+        mesh = uniform_mesh(2, 5)
+        A = LaplaceOperator(mesh, coef=lambda p: 1 + p[..., 0]**2)
+        S = bm.to_numpy(A.to_sparse().to_dense())
+        np.testing.assert_allclose(S, S.T, atol=1e-10)
+        u = bm.from_numpy(np.random.rand(A.N))
+        np.testing.assert_allclose(bm.to_numpy(A @ u), S @ bm.to_numpy(u), atol=1e-10)
+
+        B = LaplaceOperator(mesh, coef=bm.full((A.N, ), 3.0, dtype=bm.float64))
+        C = LaplaceOperator(mesh, coef=3.0)
+        np.testing.assert_allclose(bm.to_numpy(B @ u), bm.to_numpy(C @ u), atol=1e-10)
+
+        with pytest.raises(ValueError):
+            LaplaceOperator(mesh, stencil=9)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("TD, stencil", [(2, 5), (2, 9), (3, 7)])
+    def test_poisson(self, backend, TD, stencil):
+        bm.set_backend(backend)
+        errors = []
+        for n in (8, 16):
+            mesh = cube_mesh(TD, n)
+            node = mesh.entity('node')
+            u = bm.prod(bm.sin(bm.pi * node), axis=-1)
+            f = TD * bm.pi**2 * u
+            A = LaplaceOperator(mesh, stencil=stencil)
+            A, b = A.apply_dirichlet(f, u)
+            uh = cg(A, b, atol=1e-12, rtol=1e-12)
+            errors.append(float(bm.max(bm.abs(uh - u))))
+
+            S = A.to_sparse()
+            np.testing.assert_allclose(bm.to_numpy(S @ uh), bm.to_numpy(b), atol=1e-8)
+        assert errors[0] / errors[1] > 3.5
+
+
+class TestGradientOperator:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("TD", [2, 3])
+    def test_linear(self, backend, TD):
+        bm.set_backend(backend)
+        mesh = uniform_mesh(TD, 4)
+        node = mesh.entity('node')
+        a = bm.arange(1, TD + 1, dtype=bm.float64)
+        u = node @ a
+        G = GradientOperator(mesh)
+        g = G @ u
+        assert g.shape == (G.N, TD)
+        np.testing.assert_allclose(bm.to_numpy(g), np.broadcast_to(bm.to_numpy(a), g.shape))
+        gs = G.to_sparse() @ u
+        np.testing.assert_allclose(bm.to_numpy(gs), bm.to_numpy(g.T.reshape(-1)), atol=1e-10)
+
+        D = DivergenceOperator(mesh)
+        d = D @ node
+        np.testing.assert_allclose(bm.to_numpy(d), TD, atol=1e-10)
+        ds = D.to_sparse() @ node.T.reshape(-1)
+        np.testing.assert_allclose(bm.to_numpy(ds), bm.to_numpy(d), atol=1e-10)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_stencil_operator.py"])
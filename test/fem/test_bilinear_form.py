@@ -5,7 +5,7 @@ from fealpy.backend import backend_manager as bm
 from fealpy.mesh import TriangleMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
     )
 
 from bilinear_form_data import *
@@ -43,6 +43,104 @@ class TestBilinearFormInterface:
         z = bm.to_numpy(bform @ x)
         assert np.linalg.norm(y-z) < 1e-12 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    def test_reuse_pattern(self, backend, data, p):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        mass = ScalarMassIntegrator(coef=1.0)
+        bform.add_integrator(ScalarDiffusionIntegrator(), mass)
+
+        for coef in [1.0, 2.0, 3.0]:
+            mass.coef = coef
+            mass.clear()
+            expected = bform.assembly()
+            A = bform.assembly(reuse_pattern=True)
+            np.testing.assert_array_equal(bm.to_numpy(A.crow()), bm.to_numpy(expected.crow()))
+            np.testing.assert_array_equal(bm.to_numpy(A.col()), bm.to_numpy(expected.col()))
+            np.testing.assert_allclose(bm.to_numpy(A.values()), bm.to_numpy(expected.values()),
+                                       atol=1e-12)
+
+        pattern = bform._pattern
+        crow = pattern[1]
+        A = bform.assembly(reuse_pattern=True)
+        assert bform._pattern is pattern
+        assert A.crow() is crow
+
+        A = bform.assembly(format='coo', reuse_pattern=True)
+        assert A.is_coalesced
+        np.testing.assert_allclose(bm.to_numpy(A.to_dense()), bm.to_numpy(expected.to_dense()),
+                                   atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100])
+    def test_chunk_size(self, backend, chunk_size):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, 2)
+        NC = mesh.number_of_cells()
+
+        def coef(p):
+            return 1 + p[..., 0]**2
+        coef.coordtype = 'cartesian'
+
+        index = bm.arange(NC)[NC//3:]
+        integrators = lambda: (ScalarDiffusionIntegrator(coef=coef),
+                               ScalarMassIntegrator(coef=2.0))
+
+        bform = BilinearForm(space)
+        bform.add_integrator(*integrators())
+        bform.add_integrator(ScalarMassIntegrator(index=index))
+        expected = bm.to_numpy(bform.assembly().to_dense())
+
+        bform = BilinearForm(space, chunk_size=chunk_size)
+        bform.add_integrator(*integrators())
+        bform.add_integrator(ScalarMassIntegrator(index=index))
+        A = bform.assembly()
+        np.testing.assert_allclose(bm.to_numpy(A.to_dense()), expected, atol=1e-12)
+        A = bform.assembly(reuse_pattern=True)
+        np.testing.assert_allclose(bm.to_numpy(A.to_dense()), expected, atol=1e-12)
+
+        for group in bform.integrators.values():
+            for int_ in group:
+                assert int_._value is None
+        assert bm.all(bform.integrators['_group_1'][0].index == index)
+        for group in bform.integrators.values():
+            for int_ in group:
+                int_.clear(result_only=False)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("shape", ['cell', 'cell_quad'])
+    def test_chunk_size_tensor_coef(self, backend, shape):
+        bm.set_backend(backend)
+
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        space = LagrangeFESpace(mesh, 1)
+        NC = mesh.number_of_cells()
+        NQ = mesh.quadrature_formula(3).number_of_quadrature_points()
+        coef = 1 + bm.arange(NC, dtype=bm.float64) / NC
+        if shape == 'cell_quad':
+            coef = bm.broadcast_to(coef[:, None], (NC, NQ)) + bm.arange(NQ, dtype=bm.float64)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarMassIntegrator(coef=coef, q=3))
+        expected = bm.to_numpy(bform.assembly().to_dense())
+
+        bform = BilinearForm(space, chunk_size=20)
+        integrator = ScalarMassIntegrator(coef=coef, q=3)
+        bform.add_integrator(integrator)
+        np.testing.assert_allclose(bm.to_numpy(bform.assembly().to_dense()), expected, atol=1e-12)
+        assert integrator.coef is coef
+
 
 if __name__ == "__main__":
     pytest.main(['./test_bilinear_form.py', '-k', 'test_matmul'])
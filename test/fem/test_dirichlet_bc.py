@@ -0,0 +1,81 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+    LinearForm, ScalarSourceIntegrator, DirichletBC
+)
+
+
+def solution(p):
+    x, y = p[..., 0], p[..., 1]
+    return bm.sin(bm.pi*x) * bm.sin(bm.pi*y) + x*y
+
+
+def assemble(fmt):
+    mesh = TriangleMesh.from_box(nx=4, ny=4)
+    space = LagrangeFESpace(mesh, p=2)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator(), ScalarMassIntegrator())
+    lform = LinearForm(space)
+    lform.add_integrator(ScalarSourceIntegrator(1.0))
+    return space, bform.assembly(format=fmt), lform.assembly()
+
+
+def solve(A, f):
+    return np.linalg.solve(bm.to_numpy(A.to_dense()), bm.to_numpy(f))
+
+
+class TestDirichletBC:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("fmt", ['coo', 'csr'])
+    @pytest.mark.parametrize("mode", ['symmetric', 'row', 'penalty'])
+    def test_modes(self, mode, fmt, backend):
+        bm.set_backend(backend)
+        space, A, f = assemble(fmt)
+        A0, f0 = DirichletBC(space, gd=solution).apply(A, f)
+        expected = solve(A0, f0)
+
+        nnz = A.nnz
+        values = A.values()
+        A1, f1 = DirichletBC(space, gd=solution, mode=mode).apply(A, f)
+        assert A1 is A and A1.values() is values # in place
+        assert A1.nnz == nnz
+        np.testing.assert_allclose(solve(A1, f1), expected, atol=1e-8)
+        if mode == 'symmetric':
+            np.testing.assert_allclose(bm.to_numpy(A1.to_dense()),
+                                       bm.to_numpy(A0.to_dense()))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_time_loop(self, backend):
+        bm.set_backend(backend)
+        space, A, f = assemble('csr')
+        bc = DirichletBC(space, gd=solution, mode='symmetric')
+        A0, f0 = DirichletBC(space, gd=solution).apply(A.copy(), f)
+        A, _ = bc.apply(A, f)
+        pattern = bc._pattern
+        for _ in range(2):
+            A, f1 = bc.apply(A, f)
+            assert bc._pattern is pattern
+        np.testing.assert_allclose(bm.to_numpy(f1), bm.to_numpy(f0))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_batched_lifting(self, backend):
+        bm.set_backend(backend)
+        space, A, f = assemble('coo')
+        bc = DirichletBC(space, gd=solution, mode='symmetric')
+        uh = [space.boundary_interpolate(solution, bm.zeros_like(f))[0],
+              space.boundary_interpolate(0.5, bm.zeros_like(f))[0]]
+        fs = bc.apply_lifting(bm.stack([f, 2*f], axis=1), A, bm.stack(uh, axis=1))
+        f0 = bc.apply_lifting(f, A, uh[0])
+        f1 = bc.apply_lifting(2*f, A, uh[1])
+        np.testing.assert_allclose(bm.to_numpy(fs[:, 0]), bm.to_numpy(f0))
+        np.testing.assert_allclose(bm.to_numpy(fs[:, 1]), bm.to_numpy(f1))
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_dirichlet_bc.py"])
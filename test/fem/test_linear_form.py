@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from fealpy.backend import backend_manager as bm
+
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import LinearForm, ScalarSourceIntegrator
+
+
+class TestLinearFormInterface:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("chunk_size", [1, 5, 1000])
+    @pytest.mark.parametrize("Mesh", [TriangleMesh, TetrahedronMesh])
+    def test_chunk_size(self, backend, chunk_size, Mesh):
+        bm.set_backend(backend)
+        mesh = Mesh.from_box(nx=2, ny=2, nz=2) if Mesh is TetrahedronMesh \
+               else Mesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, 2)
+
+        def source(p):
+            return bm.sin(p[..., 0]) * bm.cos(p[..., 1])
+        source.coordtype = 'cartesian'
+
+        lform = LinearForm(space)
+        lform.add_integrator(ScalarSourceIntegrator(source))
+        expected = bm.to_numpy(lform.assembly())
+
+        lform = LinearForm(space, chunk_size=chunk_size)
+        lform.add_integrator(ScalarSourceIntegrator(source))
+        F = bm.to_numpy(lform.assembly())
+
+        np.testing.assert_allclose(F, expected, atol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_linear_form.py', '-k', 'test_chunk_size'])
@@ -0,0 +1,49 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+    LinearForm, ScalarSourceIntegrator, ParallelAssembler
+)
+
+
+@cartesian
+def source(p):
+    return bm.prod(bm.sin(bm.pi * p), axis=-1)
+
+
+def poisson(mesh):
+    space = LagrangeFESpace(mesh, p=2)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator(coef=2.0))
+    lform = LinearForm(space)
+    lform.add_integrator(ScalarSourceIntegrator(source))
+    return bform, lform
+
+
+class TestParallelAssembler:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('max_workers', [0, 2])
+    def test_poisson(self, backend, max_workers):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=8, ny=8)
+        bform, lform = poisson(mesh)
+        A0 = bm.to_numpy(bform.assembly(format='csr').to_dense())
+        F0 = bm.to_numpy(lform.assembly())
+
+        assembler = ParallelAssembler(mesh, poisson, nparts=3, method='rcb',
+                                      max_workers=max_workers)
+        A, F = assembler.assembly()
+        assert bm.backend_name == backend
+        np.testing.assert_allclose(bm.to_numpy(A.to_dense()), A0, atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(F), F0, atol=1e-12)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_parallel_assembly.py"])
@@ -0,0 +1,91 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import RecoveryAlg
+
+
+@cartesian
+def solution(p):
+    return bm.prod(bm.sin(bm.pi * p), axis=-1)
+
+
+class TestFunctionEvaluate:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("variable", ['value', 'grad_value'])
+    def test_chunked(self, backend, variable):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=5, ny=5)
+        space = LagrangeFESpace(mesh, p=2)
+        uh = space.function()
+        uh[:] = space.interpolate(solution)
+        bcs = mesh.quadrature_formula(3).get_quadrature_points_and_weights()[0]
+
+        expected = bm.to_numpy(getattr(uh, variable)(bcs))
+        val = uh.evaluate(bcs, variable, chunk_size=7)
+        np.testing.assert_allclose(bm.to_numpy(val), expected)
+
+        out = bm.zeros(val.shape, dtype=bm.float64)
+        val = uh.evaluate(bcs, variable, chunk_size=16, out=out)
+        assert val is out
+        np.testing.assert_allclose(bm.to_numpy(out), expected)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_batch(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        space = LagrangeFESpace(mesh, p=1)
+        uh = space.function(batch=3)
+        assert uh.batch_ndim == 1
+        for i in range(3):
+            uh[i, :] = space.interpolate(solution) * (i + 1)
+        bcs = mesh.quadrature_formula(2).get_quadrature_points_and_weights()[0]
+
+        val = uh(bcs)
+        gval = uh.grad_value(bcs)
+        assert val.shape == (3, mesh.number_of_cells(), bcs.shape[0])
+        for i in range(3):
+            ui = space.function(uh[i, :])
+            np.testing.assert_allclose(bm.to_numpy(val[i]), bm.to_numpy(ui(bcs)))
+            np.testing.assert_allclose(bm.to_numpy(gval[i]), bm.to_numpy(ui.grad_value(bcs)))
+
+        # integrals and errors of the batch are those of every function
+        e = mesh.error(uh, solution, chunk_size=5)
+        s = mesh.integral(uh, chunk_size=5)
+        assert e.shape == (3, ) and s.shape == (3, )
+        for i in range(3):
+            ui = space.function(uh[i, :])
+            np.testing.assert_allclose(float(e[i]), float(mesh.error(ui, solution)))
+            np.testing.assert_allclose(float(s[i]), float(mesh.integral(ui)))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_error(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=3, ny=3, nz=3)
+        space = LagrangeFESpace(mesh, p=1)
+        uh = space.function()
+        uh[:] = space.interpolate(solution)
+
+        for power in (1, 2, bm.inf):
+            e0 = mesh.error(uh, solution, power=power)
+            e1 = mesh.error(uh, solution, power=power, chunk_size=11)
+            np.testing.assert_allclose(float(e1), float(e0))
+            ec = mesh.error(uh, solution, power=power, celltype=True, chunk_size=11)
+            assert ec.shape == (mesh.number_of_cells(), )
+        assert float(e0) == pytest.approx(float(bm.max(ec)))
+        assert float(mesh.integral(1.0, chunk_size=11)) == pytest.approx(1.0)
+
+        ec = mesh.cell_reduce(solution, 'min', chunk_size=11)
+        assert float(bm.min(ec)) >= 0.0
+
+        eta0 = RecoveryAlg().recovery_estimate(uh)
+        eta1 = RecoveryAlg().recovery_estimate(uh, chunk_size=10)
+        np.testing.assert_allclose(bm.to_numpy(eta1), bm.to_numpy(eta0))
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_function_evaluate.py"])
@@ -0,0 +1,76 @@
+
+import subprocess
+import sys
+
+import pytest
+
+from fealpy.lazy import lazy_import, LazyModule
+
+# modules which must not be imported by `import fealpy.xxx`
+HEAVY = ('scipy', 'torch', 'jax', 'matplotlib', 'vtk', 'cv2', 'gmsh', 'meshio', 'taichi')
+
+
+def imported_modules(code: str):
+    """Run `code` in a fresh interpreter and return the imported modules."""
+    script = f"{code}\nimport sys\nprint(' '.join(sorted(sys.modules)))"
+    out = subprocess.run([sys.executable, '-c', script], check=True,
+                         capture_output=True, text=True)
+    return set(out.stdout.split())
+
+
+def heavy(modules):
+    return sorted(m for m in modules if m.split('.')[0] in HEAVY)
+
+
+class TestLazyImport:
+    def test_import_fealpy(self):
+        modules = imported_modules("import fealpy")
+        assert 'numpy' not in modules
+        assert not any(m.startswith('fealpy.') and m != 'fealpy.lazy' for m in modules)
+
+    @pytest.mark.parametrize("package", ['mesh', 'functionspace', 'fem', 'solver',
+                                         'opt', 'writer', 'plotter', 'plotter.gl'])
+    def test_import_package(self, package):
+        modules = imported_modules(f"import fealpy.{package}")
+        assert heavy(modules) == []
+        # only the package itself, none of the classes
+        local = [m for m in modules if m.startswith(f'fealpy.{package}.')]
+        assert local == [], local
+
+    def test_first_access(self):
+        modules = imported_modules("from fealpy.mesh import TriangleMesh, UniformMesh2d")
+        assert 'fealpy.mesh.triangle_mesh' in modules
+        assert 'fealpy.mesh.tetrahedron_mesh' not in modules
+        assert heavy(modules) == []
+
+        import fealpy
+        import fealpy.mesh
+        assert 'TriangleMesh' in dir(fealpy.mesh)
+        assert fealpy.mesh.TriangleMesh is fealpy.mesh.triangle_mesh.TriangleMesh
+        with pytest.raises(AttributeError):
+            fealpy.mesh.NoSuchMesh
+
+    def test_shadowed_submodule(self):
+        # the module `minres` does not shadow the function `minres`
+        import fealpy.solver.minres
+        from fealpy.solver import minres
+        assert callable(minres) and not isinstance(minres, type(fealpy))
+
+    def test_optional_dependency(self):
+        mod = lazy_import('fealpy_no_such_module', hint="Install it.")
+        assert isinstance(mod, LazyModule)
+        with pytest.raises(ImportError, match="Install it."):
+            mod.anything
+        assert lazy_import('sys') is sys
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize("package", ['fealpy', 'fealpy.mesh', 'fealpy.fem'])
+def test_import_time(benchmark, package):
+    cmd = [sys.executable, '-c', f"import {package}"]
+    benchmark.pedantic(subprocess.run, args=(cmd, ), kwargs={'check': True},
+                       rounds=3, iterations=1)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_lazy_import.py"])
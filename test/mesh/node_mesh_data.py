@@ -13,9 +13,9 @@ mesh_data = [
             [0.4, 0.4], [0.5, 0.8], [0.3, 0.8], [0.9, 0.3], [0.2, 0.5], [0.2, 0.9], [0.7, 0.1], [0.6, 0.3], [0.8, 0.1]], dtype=np.float64),
         "cutoff": 0.2,
         "box_size": 1.0,
-        "index": np.array([5, 10, 0, 2, 15, 1, 14, 1, 2, 8, 14, 0, 5, 10, 3, 13, 6, 4, 0, 10, 3, 8, 5, 4, 9, 17, 16, 6, 13, 18, 7, 3, 14, 5,\
-                 8, 17, 6, 16, 9, 0, 5, 3, 10, 11, 15, 11, 12, 7, 4, 13, 3, 8, 5, 14, 12, 1, 15, 6, 9, 18, 16, 9, 6, 17, 7, 16, 18], dtype=np.int32),
-        "indptr": np.array([0, 3, 6, 9, 15, 18, 23, 28, 31, 35, 39, 43, 44, 47, 50, 54, 57, 61, 64, 67], dtype=np.int32),
+        "index": np.array([0, 5, 10, 1, 2, 15, 1, 2, 3, 5, 8, 10, 14, 4, 6, 13, 0, 3, 5, 8, 10, 4, 6, 9, 16, 17, 7, 13, 18, 3, 5, 8, 14, 6, 9, 16, 17, 0, 3, 5,\
+                 10, 11, 12, 15, 4, 7, 13, 3, 8, 14, 1, 12, 15, 6, 9, 16, 18, 6, 9, 17, 7, 16, 18], dtype=np.int64),
+        "indptr": np.array([0, 3, 6, 8, 13, 16, 21, 26, 29, 33, 37, 41, 42, 44, 47, 50, 53, 57, 60, 63], dtype=np.int64),
         "tgv_num": 2500,
         "ht_num": 800,
         "fht_num": 1200,
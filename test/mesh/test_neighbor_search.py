@@ -0,0 +1,84 @@
+
+import os
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh.neighbor_search import NeighborList, cell_list_neighbors
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def brute_force(points, cutoff, box_size=None):
+    d = points[:, None, :] - points[None, :, :]
+    if box_size is not None:
+        d -= box_size * np.round(d / box_size)
+    flag = np.sum(d**2, axis=-1) < cutoff**2
+    return [set(np.nonzero(row)[0].tolist()) for row in flag]
+
+
+def rows(index, indptr):
+    index, indptr = bm.to_numpy(index), bm.to_numpy(indptr)
+    return [index[indptr[i]:indptr[i+1]] for i in range(indptr.shape[0] - 1)]
+
+
+class TestNeighborSearch:
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    @pytest.mark.parametrize('GD', [1, 2, 3])
+    @pytest.mark.parametrize('box_size, cutoff', [(1.0, 0.15), (1.0, 0.45), (None, 0.15), (None, 2.0)])
+    def test_brute_force(self, backend, GD, box_size, cutoff):
+        bm.set_backend(backend)
+        points = np.random.default_rng(0).random((300, GD))
+        index, indptr = cell_list_neighbors(bm.from_numpy(points), cutoff, box_size,
+                                            chunk_size=70)
+        expected = brute_force(points, cutoff, box_size)
+        for row, e in zip(rows(index, indptr), expected):
+            assert row.shape[0] == len(e)
+            assert set(row.tolist()) == e
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_exclude_self(self, backend):
+        bm.set_backend(backend)
+        points = bm.from_numpy(np.random.default_rng(1).random((100, 2)))
+        index, indptr = cell_list_neighbors(points, 0.2, (1.0, 1.0), include_self=False)
+        for i, row in enumerate(rows(index, indptr)):
+            assert i not in row
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_skin(self, backend):
+        bm.set_backend(backend)
+        rng = np.random.default_rng(2)
+        points = bm.from_numpy(rng.random((400, 2)))
+        velocity = bm.from_numpy(rng.random((400, 2)) - 0.5)
+        nlist = NeighborList(0.1, 1.0, skin=0.02)
+        for _ in range(10):
+            points = (points + 0.002 * velocity) % 1.0
+            index, indptr = nlist.update(points)
+            expected = brute_force(bm.to_numpy(points), 0.1, 1.0)
+            for row, e in zip(rows(index, indptr), expected):
+                assert set(row.tolist()) == e
+        # moving at most 0.001 * sqrt(2) per step, the list is rebuilt every 7 steps
+        assert nlist.number_of_builds == 2
+
+
+@pytest.mark.benchmark(group="neighbor_search")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("size", [
+    10**4,
+    pytest.param(10**6, marks=pytest.mark.skipif(
+        not os.environ.get('FEALPY_LARGE_BENCHMARK'),
+        reason="takes minutes, set FEALPY_LARGE_BENCHMARK=1 to run it"))
+])
+def test_cell_list_benchmark(benchmark, size, backend):
+    bm.set_backend(backend)
+    points = bm.from_numpy(np.random.default_rng(0).random((size, 2)))
+    cutoff = 3.0 / np.sqrt(size)
+    index, indptr = benchmark(cell_list_neighbors, points, cutoff, 1.0, chunk_size=10**5)
+    assert indptr.shape == (size + 1, )
+    # about pi * 3^2 neighbors and itself for every particle
+    assert abs(index.shape[0] / size - np.pi * 9 - 1) < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '--benchmark-group-by=param:size', __file__])
@@ -0,0 +1,89 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.mesh.particle_transfer import (
+    particle_stencil, particle_to_grid_matrix, particle_to_grid, grid_to_particle
+)
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def meshes():
+    return [UniformMesh2d((0, 8, 0, 8), h=(1/8, 1/8), origin=(0.0, 0.0)),
+            UniformMesh3d((0, 4, 0, 5, 0, 3), h=(1/4, 1/5, 1/3), origin=(0.0, 0.0, 0.0))]
+
+
+def random_points(GD, NP=500, seed=0):
+    # inside the grid, at least one step size away from the boundary
+    return bm.from_numpy(np.random.default_rng(seed).random((NP, GD)) * 0.6 + 0.2)
+
+
+class TestParticleTransfer:
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    @pytest.mark.parametrize('kernel, S', [('linear', 2), ('quadratic', 3)])
+    def test_stencil(self, backend, kernel, S):
+        bm.set_backend(backend)
+        for mesh in meshes():
+            GD = mesh.geo_dimension()
+            points = random_points(GD)
+            index, weight = particle_stencil(mesh, points, kernel)
+            assert index.shape == (500, S**GD)
+            np.testing.assert_allclose(bm.to_numpy(bm.sum(weight, axis=1)), 1.0)
+            # the linear functions are reproduced by both kernels
+            node = mesh.entity('node')
+            coef = bm.arange(1, GD + 1, dtype=bm.float64)
+            f = lambda p: 1.0 + bm.sum(p * coef, axis=-1)
+            value = grid_to_particle(mesh, f(node), points, kernel)
+            np.testing.assert_allclose(bm.to_numpy(value), bm.to_numpy(f(points)), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    @pytest.mark.parametrize('kernel', ['linear', 'quadratic'])
+    def test_matrix_and_scatter(self, backend, kernel):
+        bm.set_backend(backend)
+        for mesh in meshes():
+            GD = mesh.geo_dimension()
+            points = random_points(GD)
+            W = particle_to_grid_matrix(mesh, points, kernel)
+            assert W.shape == (500, mesh.number_of_nodes())
+            assert W.nnz == 500 * (2 if kernel == 'linear' else 3)**GD
+            mass = bm.from_numpy(np.random.default_rng(1).random((500, )))
+            velocity = bm.from_numpy(np.random.default_rng(2).random((500, GD)))
+            m = particle_to_grid(mesh, points, mass, kernel)
+            np.testing.assert_allclose(bm.to_numpy(m), bm.to_numpy(W.T @ mass), atol=1e-12)
+            np.testing.assert_allclose(float(bm.sum(m)), float(bm.sum(mass)))
+            p = particle_to_grid(mesh, points, mass[:, None] * velocity, kernel)
+            assert p.shape == (mesh.number_of_nodes(), GD)
+            np.testing.assert_allclose(bm.to_numpy(p[:, 0]), bm.to_numpy(W.T @ (mass * velocity[:, 0])),
+                                       atol=1e-12)
+            u = bm.from_numpy(np.random.default_rng(3).random((mesh.number_of_nodes(), )))
+            np.testing.assert_allclose(bm.to_numpy(grid_to_particle(mesh, u, points, kernel)),
+                                       bm.to_numpy(W @ u), atol=1e-12)
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_boundary(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 4, 0, 4), h=(1/4, 1/4), origin=(0.0, 0.0))
+        points = bm.tensor([[0.0, 0.0], [1.0, 1.0], [0.01, 0.99]], dtype=bm.float64)
+        for kernel in ('linear', 'quadratic'):
+            index, weight = particle_stencil(mesh, points, kernel)
+            assert bm.all(index >= 0) and bm.all(index < mesh.number_of_nodes())
+            np.testing.assert_allclose(bm.to_numpy(bm.sum(weight, axis=1)), 1.0)
+
+
+@pytest.mark.benchmark(group="particle_to_grid")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("size", [10**4, 10**6])
+def test_p2g_benchmark(benchmark, size, backend):
+    bm.set_backend(backend)
+    mesh = UniformMesh2d((0, 100, 0, 100), h=(0.01, 0.01), origin=(0.0, 0.0))
+    points = bm.from_numpy(np.random.default_rng(0).random((size, 2)))
+    mass = bm.ones((size, ), dtype=bm.float64)
+    m = benchmark(particle_to_grid, mesh, points, mass)
+    np.testing.assert_allclose(float(bm.sum(m)), size)
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '--benchmark-group-by=param:size', __file__])
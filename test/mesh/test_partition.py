@@ -0,0 +1,83 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh
+from fealpy.mesh.partition import (
+    dual_graph, rcb_partition, sfc_partition, partition_mesh, extract_submesh
+)
+from fealpy.functionspace import LagrangeFESpace
+
+
+class TestPartition:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_dual_graph(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        xadj, adjncy = dual_graph(mesh)
+        xadj, adjncy = bm.to_numpy(xadj), bm.to_numpy(adjncy)
+        NC = mesh.number_of_cells()
+        assert xadj.shape == (NC + 1, )
+        face2cell = bm.to_numpy(mesh.face_to_cell())
+        ninterior = np.sum(face2cell[:, 0] != face2cell[:, 1])
+        assert xadj[-1] == 2 * ninterior
+        # the graph is symmetric
+        edges = {(i, j) for i in range(NC) for j in adjncy[xadj[i]:xadj[i+1]]}
+        assert all((j, i) in edges for i, j in edges)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('method', [rcb_partition, sfc_partition])
+    @pytest.mark.parametrize('nparts', [1, 3, 4, 7])
+    def test_balance(self, backend, method, nparts):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=3, ny=3, nz=3)
+        parts = bm.to_numpy(method(mesh.entity_barycenter('cell'), nparts))
+        NC = mesh.number_of_cells()
+        count = np.bincount(parts, minlength=nparts)
+        assert count.shape == (nparts, )
+        assert count.max() - count.min() <= 1
+        assert count.sum() == NC
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_auto_fallback(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=6, ny=6)
+        parts = bm.to_numpy(partition_mesh(mesh, 4))
+        assert set(parts.tolist()) == {0, 1, 2, 3}
+        with pytest.raises(ValueError):
+            partition_mesh(mesh, 4, method='unknown')
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('meshtype', [TriangleMesh, QuadrangleMesh])
+    def test_extract_submesh(self, backend, meshtype):
+        bm.set_backend(backend)
+        mesh = meshtype.from_box(nx=6, ny=6)
+        parts = partition_mesh(mesh, 3, method='rcb')
+        gspace = LagrangeFESpace(mesh, p=2)
+        gc2d = bm.to_numpy(gspace.cell_to_dof())
+        NO = 0
+        for part in range(3):
+            sub = extract_submesh(mesh, parts, part, nghost=1)
+            cell_l2g = bm.to_numpy(sub.cell_l2g)
+            ghost = bm.to_numpy(sub.is_ghost_cell())
+            NO += sub.number_of_owned_cells
+            assert np.all(bm.to_numpy(parts)[cell_l2g[~ghost]] == part)
+            assert np.all(bm.to_numpy(parts)[cell_l2g[ghost]] != part)
+            assert ghost.sum() > 0
+            # the local cells are the global ones
+            node = bm.to_numpy(sub.mesh.entity('node'))
+            cell = bm.to_numpy(sub.mesh.entity('cell'))
+            gnode = bm.to_numpy(mesh.entity('node'))
+            gcell = bm.to_numpy(mesh.entity('cell'))
+            np.testing.assert_allclose(node[cell], gnode[gcell[cell_l2g]])
+            # the local dofs are mapped to the global ones
+            lspace = LagrangeFESpace(sub.mesh, p=2)
+            l2g = bm.to_numpy(sub.dof_l2g(lspace, gspace))
+            lc2d = bm.to_numpy(lspace.cell_to_dof())
+            np.testing.assert_array_equal(l2g[lc2d], gc2d[cell_l2g])
+        assert NO == mesh.number_of_cells()
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_partition.py"])
@@ -0,0 +1,63 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, QuadrangleMesh, TetrahedronMesh, HexahedronMesh
+
+
+MESHES = [
+    (TriangleMesh, lambda: TriangleMesh.from_box(nx=3, ny=2)),
+    (QuadrangleMesh, lambda: QuadrangleMesh.from_box(nx=3, ny=2)),
+    (TetrahedronMesh, lambda: TetrahedronMesh.from_box(nx=2, ny=3, nz=2)),
+    (HexahedronMesh, lambda: HexahedronMesh.from_box(nx=2, ny=2, nz=1)),
+]
+
+
+def entity_map(e0, e1):
+    """The index in e0 of every entity in e1, compared as node sets."""
+    key = {tuple(sorted(r)): i for i, r in enumerate(e0)}
+    return np.array([key[tuple(sorted(r))] for r in e1])
+
+
+class TestRefineTopology:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("Mesh, init", MESHES)
+    def test_incremental(self, Mesh, init, backend):
+        bm.set_backend(backend)
+        mesh = init()
+        mesh.uniform_refine(2, incremental=True)
+        expected = Mesh(mesh.node, mesh.cell) # constructed by sorting
+
+        face = bm.to_numpy(mesh.face)
+        perm = entity_map(bm.to_numpy(expected.face), face)
+        assert face.shape[0] == expected.number_of_faces()
+        np.testing.assert_array_equal(np.sort(perm), np.arange(face.shape[0]))
+        np.testing.assert_array_equal(perm[bm.to_numpy(mesh.cell2face)],
+                                      bm.to_numpy(expected.cell2face))
+        # the same orientation and adjacency as construct()
+        np.testing.assert_array_equal(face, bm.to_numpy(expected.face)[perm])
+        np.testing.assert_array_equal(bm.to_numpy(mesh.face2cell),
+                                      bm.to_numpy(expected.face2cell)[perm])
+
+        edge = bm.to_numpy(mesh.edge)
+        perm = entity_map(bm.to_numpy(expected.edge), edge)
+        assert edge.shape[0] == expected.number_of_edges()
+        np.testing.assert_array_equal(perm[bm.to_numpy(mesh.cell2edge)],
+                                      bm.to_numpy(expected.cell2edge))
+
+    @pytest.mark.parametrize("Mesh, init", MESHES)
+    def test_measure(self, Mesh, init):
+        bm.set_backend('numpy')
+        m0, m1 = init(), init()
+        m0.uniform_refine(2)
+        m1.uniform_refine(2, incremental=True)
+        assert m0.number_of_edges() == m1.number_of_edges()
+        np.testing.assert_allclose(np.sort(bm.to_numpy(m0.entity_measure('face'))),
+                                   np.sort(bm.to_numpy(m1.entity_measure('face'))))
+        np.testing.assert_allclose(bm.to_numpy(m0.boundary_face_flag()).sum(),
+                                   bm.to_numpy(m1.boundary_face_flag()).sum())
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_refine_topology.py"])
@@ -0,0 +1,81 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, QuadrangleMesh
+from fealpy.mesh.tabulation import TabulationCache, tabulation_cache
+
+
+class TestTabulationCache:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_shared_tables(self, backend):
+        bm.set_backend(backend)
+        tabulation_cache.clear()
+        m0 = TriangleMesh.from_box(nx=2, ny=2)
+        m1 = TriangleMesh.from_box(nx=5, ny=3)
+        bcs0, _ = m0.quadrature_formula(4).get_quadrature_points_and_weights()
+        bcs1, _ = m1.quadrature_formula(4).get_quadrature_points_and_weights()
+
+        phi = m0.shape_function(bcs0, 2)
+        assert tabulation_cache.misses == 1
+        assert m1.shape_function(bcs1, 2) is phi # equal points share one table
+        assert tabulation_cache.hits == 1
+        m1.shape_function(bcs1, 3)
+        assert tabulation_cache.misses == 2
+
+        mi = bm.multi_index_matrix(2, 2, dtype=m0.itype)
+        np.testing.assert_allclose(bm.to_numpy(phi),
+                                   bm.to_numpy(bm.simplex_shape_function(bcs0, 2, mi)))
+        gphi = m0.grad_shape_function(bcs0, 2, variables='x')
+        assert gphi.shape == (m0.number_of_cells(), bcs0.shape[0], 6, 2)
+
+        if backend == 'numpy':
+            with pytest.raises(ValueError):
+                phi[0, 0] = 1.0
+
+    def test_tensor_mesh(self):
+        bm.set_backend('numpy')
+        tabulation_cache.clear()
+        mesh = QuadrangleMesh.from_box(nx=2, ny=2)
+        bcs = mesh.quadrature_formula(3).get_quadrature_points_and_weights()[0]
+        g0 = mesh.grad_shape_function(bcs, 2, variables='x')
+        misses = tabulation_cache.misses
+        g1 = mesh.grad_shape_function(bcs, 2, variables='x')
+        assert tabulation_cache.misses == misses
+        np.testing.assert_array_equal(g0, g1)
+
+    def test_lru(self):
+        bm.set_backend('numpy')
+        cache = TabulationCache(maxsize=2)
+        points = [bm.array([[0.5, 0.5]]) * i for i in range(3)]
+        for i, p in enumerate(points):
+            cache.get('table', p, lambda: p + 1.0, 1)
+        assert len(cache) == 2
+        cache.get('table', points[0], lambda: points[0] + 1.0, 1)
+        assert cache.misses == 4 and cache.hits == 0
+
+    def test_points_key(self):
+        bm.set_backend('numpy')
+        from fealpy.mesh import tabulation
+        points = bm.array([[0.2, 0.3, 0.5]])
+        key = tabulation.points_key(points)
+        assert tabulation.points_key(points) is key # hashed once
+        assert tabulation.points_key(bm.copy(points)) == key
+        i = id(points)
+        del points
+        assert i not in tabulation._KEYS
+
+    def test_autograd(self):
+        bm.set_backend('pytorch')
+        import torch
+        tabulation_cache.clear()
+        mesh = TriangleMesh.from_box(nx=1, ny=1)
+        bcs = torch.tensor([[0.2, 0.3, 0.5]], dtype=torch.float64, requires_grad=True)
+        phi = mesh.shape_function(bcs, 2)
+        assert phi.requires_grad
+        assert len(tabulation_cache) == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_tabulation.py"])
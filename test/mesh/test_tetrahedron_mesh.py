@@ -338,6 +338,34 @@ class TestTetrahedronMeshInterfaces:
         cell = mesh.cell
         np.testing.assert_array_equal(bm.to_numpy(cell), data["cell"])
 
+    @pytest.mark.parametrize("backend", ["numpy", "pytorch"])
+    def test_point_to_bc(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], nx=4, ny=5, nz=3)
+        points = np.random.rand(500, 3)
+        points[0] = [0.5, 0.5, 1.5]
+        points = bm.from_numpy(points)
+
+        cell, bc = mesh.point_to_bc(points)
+        cell, bc = bm.to_numpy(cell), bm.to_numpy(bc)
+        assert cell[0] == -1
+        assert np.all(cell[1:] >= 0)
+        assert np.all(bc[1:] >= -1e-12)
+        cnode = bm.to_numpy(mesh.entity('node'))[bm.to_numpy(mesh.entity('cell'))[cell[1:]]]
+        np.testing.assert_allclose(np.einsum('pi, pij -> pj', bc[1:], cnode),
+                                   bm.to_numpy(points)[1:], atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_ipoint_cache_node(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+        ipoints = LagrangeFESpace(mesh, p=1).interpolation_points()
+        np.testing.assert_array_equal(bm.to_numpy(ipoints), bm.to_numpy(mesh.node))
+        # the cached points for p = 1 do not freeze the nodes of the mesh
+        mesh.node = bm.set_at(mesh.node, (0, 0), 0.5)
+        mesh.node += 0.1
+        assert float(mesh.node[0, 0]) == pytest.approx(0.6)
+
 if __name__ == "__main__":
     #pytest.main(["./test_tetrahedron_mesh.py", "-k", "test_init"])
     pytest.main(["./test_tetrahedron_mesh.py", "-k", "test_from_one_tetrahedron"])
@@ -3,6 +3,7 @@ import pytest
 
 from fealpy.backend import backend_manager as bm
 from fealpy.mesh.triangle_mesh import TriangleMesh
+from fealpy.sparse import CSRTensor
 from fealpy.functionspace import LagrangeFESpace
 from scipy.sparse.linalg import spsolve
 from fealpy.fem import (
@@ -375,6 +376,118 @@ class TestTriangleMeshInterfaces:
         np.testing.assert_array_equal(bm.to_numpy(face2cell), data["face2cell"])
         np.testing.assert_allclose(u , data['u'])
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_bisect_coarsen(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=4, ny=4)
+        cell0 = bm.to_numpy(mesh.entity('cell'))
+        f = lambda p: 1 + 2*p[..., 0] + 3*p[..., 1]
+        g = lambda p: p[..., 0]**2 + p[..., 1]
+
+        NC = mesh.number_of_cells()
+        ip = mesh.interpolation_points(2)
+        data = {'u': f(mesh.entity('node')),
+                'c': bm.arange(NC, dtype=bm.float64),
+                'q': g(ip)[mesh.cell_to_ipoint(2)]}
+        isMarkedCell = bm.zeros(NC, dtype=bm.bool)
+        isMarkedCell = bm.set_at(isMarkedCell, 3, True)
+        options = mesh.bisect_options(data=data, HB=True, IM=True, disp=False)
+        P = mesh.bisect(isMarkedCell, options=options, returnim=True)
+
+        node = mesh.entity('node')
+        assert isinstance(P, CSRTensor)
+        assert P.shape == (mesh.number_of_nodes(), 25)
+        np.testing.assert_allclose(bm.to_numpy(data['u']), bm.to_numpy(f(node)), atol=1e-14)
+        np.testing.assert_array_equal(bm.to_numpy(data['c']), bm.to_numpy(options['HB']))
+        ip = mesh.interpolation_points(2)
+        np.testing.assert_allclose(bm.to_numpy(data['q']),
+                                   bm.to_numpy(g(ip)[mesh.cell_to_ipoint(2)]), atol=1e-14)
+        assert abs(float(bm.sum(mesh.entity_measure('cell'))) - 1.0) < 1e-14
+
+        # coarsen back to the initial mesh
+        for _ in range(2):
+            NC = mesh.number_of_cells()
+            R = mesh.coarsen(bm.ones(NC, dtype=bm.bool), {'data': data}, returnim=True)
+        assert mesh.number_of_nodes() == 25
+        assert R.shape[0] == 25
+        cell = np.sort(bm.to_numpy(mesh.entity('cell')), axis=1)
+        np.testing.assert_array_equal(np.unique(cell, axis=0), np.unique(np.sort(cell0, axis=1), axis=0))
+        np.testing.assert_allclose(bm.to_numpy(data['u']), bm.to_numpy(f(mesh.entity('node'))), atol=1e-14)
+        ip = mesh.interpolation_points(2)
+        np.testing.assert_allclose(bm.to_numpy(data['q']),
+                                   bm.to_numpy(g(ip)[mesh.cell_to_ipoint(2)]), atol=1e-14)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_point_to_bc(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 2, 0, 1], nx=13, ny=7)
+        points = np.random.rand(1000, 2) * [2.0, 1.0]
+        points[:3] = [[3.0, 0.5], [-1e-3, 0.2], [2.0, 1.0]]
+        points = bm.from_numpy(points)
+
+        for _ in range(2):
+            cell, bc = mesh.point_to_bc(points)
+            cell, bc = bm.to_numpy(cell), bm.to_numpy(bc)
+            assert cell[0] == -1 and cell[1] == -1 and cell[2] >= 0
+            assert np.all(cell[2:] >= 0)
+            assert np.all(bc[2:] >= -1e-12)
+            node = bm.to_numpy(mesh.entity('node'))
+            cnode = node[bm.to_numpy(mesh.entity('cell'))[cell[2:]]]
+            np.testing.assert_allclose(np.einsum('pi, pij -> pj', bc[2:], cnode),
+                                       bm.to_numpy(points)[2:], atol=1e-12)
+            np.testing.assert_array_equal(bm.to_numpy(mesh.location(points)), cell)
+            mesh.uniform_refine() # the index is refreshed by the next query
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_is_crossed_cell(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=10, ny=10)
+        point = bm.from_numpy(np.array([[0.05, 0.13], [0.92, 0.71], [0.31, 0.87]]))
+        segment = bm.from_numpy(np.array([[0, 1], [1, 2]]))
+        isCrossed = bm.to_numpy(mesh.is_crossed_cell(point, segment))
+
+        # every cell containing a point of the segments is crossed
+        t = np.linspace(0, 1, 2001)[:, None]
+        p = bm.to_numpy(point)
+        samples = np.concatenate([(1-t)*p[0] + t*p[1], (1-t)*p[1] + t*p[2]], axis=0)
+        cell = bm.to_numpy(mesh.location(bm.from_numpy(samples)))
+        assert np.all(isCrossed[cell])
+        assert np.sum(isCrossed) == len(np.unique(cell))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_ipoint_cache(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=3, ny=3)
+        c2p = mesh.cell_to_ipoint(3)
+        info = mesh.cache_info()
+        assert info['misses'] == 2 # cell_to_ipoint and edge_to_ipoint
+        np.testing.assert_array_equal(bm.to_numpy(mesh.cell_to_ipoint(3, index=bm.arange(2))),
+                                      bm.to_numpy(c2p)[:2])
+        assert mesh.cache_info()['hits'] == 1
+
+        # refinement and node moves evict the cache
+        version = mesh.version
+        mesh.uniform_refine()
+        assert mesh.version > version
+        assert mesh.cache_info()['size'] == 0
+        assert mesh.cell_to_ipoint(3).shape == (mesh.number_of_cells(), 10)
+        ips = mesh.interpolation_points(2)
+        mesh.node = mesh.node * 2.0
+        np.testing.assert_allclose(bm.to_numpy(mesh.interpolation_points(2)),
+                                   2.0 * bm.to_numpy(ips))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_ipoint_cache_mutation(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=3, ny=3)
+        c2p = bm.to_numpy(mesh.cell_to_ipoint(2)).copy()
+        value = mesh.cell_to_ipoint(2)
+        try:
+            value[:] = -1
+        except ValueError: # the read-only numpy arrays
+            pass
+        np.testing.assert_array_equal(bm.to_numpy(mesh.cell_to_ipoint(2)), c2p)
+
 if __name__ == "__main__":
     #a = TestTriangleMeshInterfaces()
     #a.test_from_box(from_box[0], 'pytorch')
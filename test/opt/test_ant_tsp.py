@@ -0,0 +1,98 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.opt import AntColonyOptAlg
+from fealpy.opt.optimizer_base import opt_alg_options
+from fealpy.opt.ANT_TSP import calD, Ant_TSP, nearest_citys, tour_length, two_opt, roulette
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def random_citys(n, seed=0):
+    return bm.from_numpy(np.random.default_rng(seed).random((n, 2)) * 100)
+
+
+def is_permutation(tours):
+    tours = bm.to_numpy(tours)
+    return np.all(np.sort(tours, axis=-1) == np.arange(tours.shape[-1]))
+
+
+def solve(n, m, iter_max, **kwargs):
+    D = calD(random_citys(n))
+    ant = Ant_TSP(m, 1, 5, 0.5, 1, 1 / D, D, iter_max, **kwargs)
+    Tau = bm.ones((n, n), dtype=bm.float64)
+    Table = bm.zeros((m, n), dtype=bm.int64)
+    Route_best = bm.zeros((iter_max, n), dtype=bm.int64)
+    Length_best = bm.zeros((iter_max, ), dtype=bm.float64)
+    Length_best, Route_best = ant.cal(n, Tau, Table, Route_best, Length_best)
+    return D, Table, Length_best, Route_best
+
+
+class TestAntTSP:
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_roulette(self, backend):
+        bm.set_backend(backend)
+        w = bm.tensor([[0.0, 1.0, 0.0, 3.0]] * 4000, dtype=bm.float64)
+        index = bm.to_numpy(roulette(w, w > 0))
+        assert set(index.tolist()) == {1, 3}
+        assert abs(np.mean(index == 3) - 0.75) < 0.05
+        # the vanishing weights, chosen among the allowed ones
+        w = bm.zeros((100, 4), dtype=bm.float64)
+        allowed = bm.tensor([[False, True, True, False]] * 100)
+        assert set(bm.to_numpy(roulette(w, allowed)).tolist()) <= {1, 2}
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    @pytest.mark.parametrize('kwargs', [{}, {'candidates': 5}, {'local_search': True},
+                                        {'candidates': 5, 'local_search': True}])
+    def test_cal(self, backend, kwargs):
+        bm.set_backend(backend)
+        n, iter_max = 40, 10
+        D, Table, Length_best, Route_best = solve(n, 8, iter_max, **kwargs)
+        assert is_permutation(Table) and is_permutation(Route_best)
+        np.testing.assert_allclose(bm.to_numpy(tour_length(D, Route_best)),
+                                   bm.to_numpy(Length_best))
+        assert np.all(np.diff(bm.to_numpy(Length_best)) <= 0)
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_two_opt(self, backend):
+        bm.set_backend(backend)
+        n, m = 200, 4
+        D = calD(random_citys(n, 1))
+        neighbors = nearest_citys(D, 8)
+        assert neighbors.shape == (n, 8)
+        assert not np.any(bm.to_numpy(neighbors) == np.arange(n)[:, None])
+        tours = bm.stack([bm.from_numpy(np.random.default_rng(i).permutation(n)) for i in range(m)])
+        new = two_opt(D, tours, neighbors)
+        assert is_permutation(new)
+        assert np.all(bm.to_numpy(tour_length(D, new)) < 0.5 * bm.to_numpy(tour_length(D, tours)))
+        # no improving move is left
+        again = two_opt(D, new, neighbors, max_passes=1)
+        np.testing.assert_array_equal(bm.to_numpy(again), bm.to_numpy(new))
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_ant_colony_opt_alg(self, backend):
+        bm.set_backend(backend)
+        n, NP = 30, 10
+        D = calD(random_citys(n))
+        x0 = bm.random.rand(NP, n)
+        option = opt_alg_options(x0, None, (0, 1), NP, MaxIters=5)
+        gbest, gbest_f = AntColonyOptAlg(option, D).run()
+        assert is_permutation(gbest)
+        np.testing.assert_allclose(float(tour_length(D, gbest[None, :])[0]), float(gbest_f))
+
+
+@pytest.mark.benchmark(group="ant_tsp")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("n", [200, 2000])
+def test_ant_tsp_benchmark(benchmark, n, backend):
+    bm.set_backend(backend)
+    D, Table, Length_best, Route_best = benchmark.pedantic(
+        solve, args=(n, 10, 1), kwargs={'candidates': 10, 'local_search': True},
+        rounds=1, iterations=1)
+    assert is_permutation(Route_best)
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '--benchmark-group-by=param:n', __file__])
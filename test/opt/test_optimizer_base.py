@@ -0,0 +1,78 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.opt import CrayfishOptAlg, PSO
+from fealpy.opt.optimizer_base import Optimizer, opt_alg_options
+from fealpy.opt.evaluator import PoolEvaluator
+from fealpy.opt.benchmark import F1, F2
+from fealpy.opt.benchmark_runner import run_benchmarks, format_results
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+class TestOptimizerBase:
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    @pytest.mark.parametrize('executor', ['thread', 'process'])
+    @pytest.mark.parametrize('vectorized', [True, False])
+    def test_pool_evaluator(self, backend, executor, vectorized):
+        bm.set_backend(backend)
+        x = bm.from_numpy(np.random.default_rng(0).random((23, 5)))
+        with PoolEvaluator(F1, executor, max_workers=2, chunk_size=4,
+                           vectorized=vectorized) as evaluator:
+            fit = evaluator(x)
+            fit2 = evaluator(x[:7])
+        assert fit.shape == (23, ) and fit2.shape == (7, )
+        np.testing.assert_allclose(bm.to_numpy(fit), bm.to_numpy(F1(x)))
+        np.testing.assert_allclose(bm.to_numpy(fit2), bm.to_numpy(F1(x[:7])))
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_evaluator_option(self, backend):
+        bm.set_backend(backend)
+        NP, MaxIters = 20, 5
+        x0 = -5.12 + bm.random.rand(NP, 4) * 10.24
+        with PoolEvaluator(F1, 'thread', max_workers=2, vectorized=True) as evaluator:
+            options = opt_alg_options(x0, F1, (-5.12, 5.12), NP, MaxIters=MaxIters,
+                                      Evaluator=evaluator)
+            optimizer = CrayfishOptAlg(options)
+            gbest, gbest_f = optimizer.run()
+        assert optimizer.NF == NP * (MaxIters + 1)
+        np.testing.assert_allclose(float(F1(gbest[None, :])[0]), float(gbest_f))
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_update_best(self, backend):
+        bm.set_backend(backend)
+        x = bm.tensor([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]], dtype=bm.float64)
+        fit = bm.tensor([3.0, 1.0, 2.0], dtype=bm.float64)
+        x_new = x + 10
+        fit_new = bm.tensor([2.0, 5.0, 0.5], dtype=bm.float64)
+        x, fit = Optimizer.update_best(x, fit, x_new, fit_new)
+        np.testing.assert_array_equal(bm.to_numpy(x[:, 0]), [10.0, 1.0, 12.0])
+        np.testing.assert_array_equal(bm.to_numpy(fit), [2.0, 1.0, 0.5])
+        gbest, gbest_f = Optimizer.update_gbest(x, fit, x[1], fit[1])
+        np.testing.assert_array_equal(bm.to_numpy(gbest), [12.0, 12.0])
+        assert float(gbest_f) == 0.5
+        gbest, gbest_f = Optimizer.update_gbest(x, fit, x[0], bm.tensor(0.1, dtype=bm.float64))
+        assert float(gbest_f) == 0.1
+
+    @pytest.mark.parametrize('backend', ALL_BACKENDS)
+    def test_pso(self, backend):
+        bm.set_backend(backend)
+        pso = PSO(30, 5, 10.0, -10.0, 50, F2)
+        pso.cal()
+        assert float(pso.gbest_f) < 1.0
+        np.testing.assert_allclose(float(F2(pso.gbest[None, :])[0]), float(pso.gbest_f))
+
+    def test_run_benchmarks(self):
+        bm.set_backend('numpy')
+        records = run_benchmarks(['ParticleSwarmOptAlg', 'HippopotamusOptAlg'], [1, 26],
+                                 NP=20, MaxIters=5)
+        assert len(records) == 4
+        for r in records:
+            assert r['NF'] > 0 and r['evals_per_sec'] > 0
+        assert 'evals/s' in format_results(records)
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', __file__])
@@ -0,0 +1,72 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.solver import AMGSolver
+from fealpy.sparse import COOTensor
+
+
+def laplace_2d(n: int):
+    NN = n * n
+    idx = np.arange(NN).reshape(n, n)
+    row, col, val = [idx.ravel()], [idx.ravel()], [np.full(NN, 4.0)]
+    for a, b in [(idx[1:, :], idx[:-1, :]), (idx[:, 1:], idx[:, :-1])]:
+        row += [a.ravel(), b.ravel()]
+        col += [b.ravel(), a.ravel()]
+        val += [np.full(a.size, -1.0)] * 2
+    indices = bm.from_numpy(np.stack([np.concatenate(row), np.concatenate(col)]))
+    values = bm.from_numpy(np.concatenate(val))
+    return COOTensor(indices, values, (NN, NN)).coalesce()
+
+
+class TestAMGSolver:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('method', ['rs', 'sa'])
+    @pytest.mark.parametrize('smoother', ['jacobi', 'chebyshev'])
+    def test_solve(self, backend, method, smoother):
+        bm.set_backend(backend)
+        A = laplace_2d(40)
+        x = bm.from_numpy(np.random.rand(A.shape[0]))
+        b = A @ x
+
+        solver = AMGSolver(method=method, smoother=smoother, sstep=2,
+                           coarse_size=50, rtol=1e-10).setup(A)
+        assert solver.nlevels > 2
+        assert solver.operator_complexity() < 3.0
+        x0 = solver.solve(b)
+        assert solver.niter < 60
+        np.testing.assert_allclose(bm.to_numpy(x0), bm.to_numpy(x), atol=1e-7)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('method', ['rs', 'sa'])
+    def test_reuse(self, backend, method):
+        bm.set_backend(backend)
+        A = laplace_2d(30)
+        X = bm.from_numpy(np.random.rand(A.shape[0], 3))
+
+        solver = AMGSolver(method=method, coarse_size=50, rtol=1e-10).setup(A)
+        X0 = solver.solve(A @ X)
+        assert X0.shape == X.shape
+        np.testing.assert_allclose(bm.to_numpy(X0), bm.to_numpy(X), atol=1e-7)
+
+        nlevels = solver.nlevels
+        A2 = A * 2.0
+        solver.update(A2)
+        assert solver.nlevels == nlevels
+        X0 = solver.solve(A2 @ X)
+        np.testing.assert_allclose(bm.to_numpy(X0), bm.to_numpy(X), atol=1e-7)
+
+        M = solver.aspreconditioner()
+        assert M.shape == A.shape
+        assert (M @ X).shape == X.shape
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            AMGSolver(method='unknown')
+        with pytest.raises(RuntimeError):
+            AMGSolver().solve(bm.ones((4, )))
+
+
+if __name__ == '__main__':
+    pytest.main(['-q', __file__])
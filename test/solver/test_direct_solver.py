@@ -4,7 +4,7 @@ import pytest
 import scipy.sparse as sp
 
 from fealpy.backend import backend_manager as bm
-from fealpy.solver import spsolve
+from fealpy.solver import spsolve, factorized, FactorizedSolver, FactorizationCache
 from fealpy.sparse import COOTensor, CSRTensor
 
 class TestDirectSolver:
@@ -50,6 +50,90 @@ class TestDirectSolver:
         assert self._check_solution(x0, x), "Pytorch GPU test failed!!!!!!!!!!!!!!!!!!!!!!!!"
         print("Pytorch GPU test passed!")
 
+
+class TestFactorizedSolver:
+
+    def _get_data(self, n=30):
+        A = sp.rand(n, n, density=0.2, random_state=0) + 4 * sp.eye(n)
+        return COOTensor.from_scipy(A.tocoo())
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('background', [True, False])
+    def test_solve(self, backend, background):
+        bm.set_backend(backend)
+        A = self._get_data()
+        Ad = bm.to_numpy(A.to_dense())
+        solver = FactorizedSolver(A, 'scipy', background=background)
+
+        b = np.random.rand(30)
+        x = solver.solve(bm.tensor(b))
+        assert solver.ready()
+        np.testing.assert_allclose(bm.to_numpy(x), np.linalg.solve(Ad, b), atol=1e-10)
+
+        B = np.random.rand(30, 4)
+        X = solver.solve(bm.tensor(B))
+        np.testing.assert_allclose(bm.to_numpy(X), np.linalg.solve(Ad, B), atol=1e-10)
+        X = solver.solve(bm.tensor(B.T), batch_first=True)
+        np.testing.assert_allclose(bm.to_numpy(X), np.linalg.solve(Ad, B).T, atol=1e-10)
+        solver.close()
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_cache(self, backend):
+        bm.set_backend(backend)
+        cache = FactorizationCache(maxsize=2)
+        A = self._get_data()
+        s0 = cache.get(A)
+        assert cache.get(A) is s0
+        assert cache.get(A.tocsr()) is not s0 # a different format is a different key
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        # same pattern, new values
+        A2 = COOTensor(A.indices(), A.values() * 2, A.sparse_shape)
+        s2 = cache.get(A2)
+        assert s2 is not s0
+        assert len(cache) == 2
+        assert cache.get(A) is not s0 # evicted as the least recently used
+        b = bm.tensor(np.random.rand(30))
+        np.testing.assert_allclose(bm.to_numpy(s2.solve(b)),
+                                   bm.to_numpy(spsolve(A, b, 'scipy')) / 2, atol=1e-10)
+        cache.clear()
+        assert len(cache) == 0
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('background', [True, False])
+    def test_cache_evicted(self, backend, background):
+        bm.set_backend(backend)
+        cache = FactorizationCache(maxsize=1)
+        A = self._get_data()
+        A2 = COOTensor(A.indices(), A.values() * 2, A.sparse_shape)
+        s = cache.get(A, background=background)
+        cache.get(A2, background=background)
+        assert len(cache) == 1
+        # the evicted solver held by the caller is still usable
+        b = bm.tensor(np.random.rand(30))
+        np.testing.assert_allclose(bm.to_numpy(s.solve(b)),
+                                   bm.to_numpy(spsolve(A, b, 'scipy')), atol=1e-10)
+        cache.clear()
+        np.testing.assert_allclose(bm.to_numpy(s.solve(b)),
+                                   bm.to_numpy(spsolve(A, b, 'scipy')), atol=1e-10)
+
+    def test_spsolve_reuse(self):
+        bm.set_backend('numpy')
+        A = self._get_data()
+        b = bm.tensor(np.random.rand(30))
+        x0 = spsolve(A, b, 'scipy', reuse=True)
+        assert factorized(A, 'scipy') is factorized(A, 'scipy')
+        np.testing.assert_allclose(x0, spsolve(A, b, 'scipy'), atol=1e-10)
+
+    def test_invalid(self):
+        bm.set_backend('numpy')
+        with pytest.raises(ValueError):
+            FactorizedSolver(self._get_data(), 'unknown')
+        solver = FactorizedSolver(COOTensor.from_scipy(sp.coo_matrix((3, 3))), 'scipy')
+        with pytest.raises(RuntimeError): # singular
+            solver.solve(bm.ones((3, )))
+
+
 if __name__ == '__main__':
     test = TestDirectSolver()
     #test.test_cpu('numpy', 'scipy')
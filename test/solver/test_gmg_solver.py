@@ -0,0 +1,99 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.decorator import cartesian
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, UniformMesh2d
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+    BilinearForm, ScalarDiffusionIntegrator,
+    LinearForm, ScalarSourceIntegrator, DirichletBC
+)
+from fealpy.fdm import LaplaceOperator
+from fealpy.solver import GMGSolver, cg
+
+
+@cartesian
+def solution(p):
+    return bm.prod(bm.sin(bm.pi * p), axis=-1)
+
+
+@cartesian
+def source(p):
+    return p.shape[-1] * bm.pi**2 * solution(p)
+
+
+def poisson_system(mesh):
+    space = LagrangeFESpace(mesh, p=1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    lform = LinearForm(space)
+    lform.add_integrator(ScalarSourceIntegrator(source))
+    A, f = bform.assembly(format='csr'), lform.assembly()
+    bc = DirichletBC(space, gd=solution)
+    A, f = bc.apply(A, f)
+    return A, f, ~bc.is_boundary_dof
+
+
+class TestGMGSolver:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('cycle', ['V', 'W', 'F'])
+    def test_refined_triangle(self, backend, cycle):
+        bm.set_backend(backend)
+        niter = []
+        for n in (3, 4):
+            mesh = TriangleMesh.from_box(nx=2, ny=2)
+            P = mesh.uniform_refine(n, returnim=True)
+            assert len(P) == n
+            A, f, isFreeDof = poisson_system(mesh)
+            solver = GMGSolver(cycle=cycle, rtol=1e-10).setup(A, P, isFreeDof=isFreeDof)
+            assert solver.nlevels == n + 1
+            x = solver.solve(f)
+            niter.append(solver.niter)
+            r = bm.to_numpy(f - A @ x)
+            assert np.linalg.norm(r) <= 1e-9 * np.linalg.norm(bm.to_numpy(f))
+        # the number of cycles does not grow with the size
+        assert niter[1] <= niter[0] + 2
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_preconditioner(self, backend):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=2, ny=2, nz=2)
+        P = mesh.uniform_refine(2, returnim=True)
+        A, f, isFreeDof = poisson_system(mesh)
+        solver = GMGSolver(smoother='chebyshev').setup(A, P, isFreeDof=isFreeDof)
+        x, info = cg(A, f, M=solver.aspreconditioner(), rtol=1e-10, returninfo=True)
+        assert info.niter < 20
+        r = bm.to_numpy(f - A @ x)
+        assert np.linalg.norm(r) <= 1e-9 * np.linalg.norm(bm.to_numpy(f))
+
+        solver.update(A * 2.0)
+        x2 = solver.solve(f * 2.0)
+        np.testing.assert_allclose(bm.to_numpy(x2), bm.to_numpy(x), atol=1e-7)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_rediscretization(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 4, 0, 4), h=(1/4, 1/4))
+        operators = []
+        for level in range(4):
+            A = LaplaceOperator(mesh)
+            zero = bm.zeros((A.N, ), dtype=bm.float64)
+            operators.append(A.apply_dirichlet(zero, zero)[0])
+            if level < 3:
+                P = mesh.uniform_refine(returnim=True) if level == 0 else \
+                    P + mesh.uniform_refine(returnim=True)
+
+        A = LaplaceOperator(mesh)
+        u = solution(mesh.entity('node'))
+        A, b = A.apply_dirichlet(2 * bm.pi**2 * u, u)
+        solver = GMGSolver(rtol=1e-10).setup(operators, P, isFreeDof=~A.boundary_node_flag(),
+                                             restriction='weighting')
+        x = solver.solve(b)
+        assert solver.niter < 20
+        np.testing.assert_allclose(bm.to_numpy(A @ x), bm.to_numpy(b), atol=1e-7)
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_gmg_solver.py"])
@@ -0,0 +1,145 @@
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from fealpy.backend import backend_manager as bm
+from fealpy.solver import (
+    cg, minres, gmres, bicgstab,
+    SolverInfo, AMGSolver,
+    JacobiPreconditioner, SSORPreconditioner, ILU0Preconditioner
+)
+from fealpy.sparse import COOTensor
+
+
+def laplace_2d(n: int):
+    A = sp.kron(sp.eye(n), sp.diags([-1, 2, -1], [-1, 0, 1], shape=(n, n))) \
+      + sp.kron(sp.diags([-1, 2, -1], [-1, 0, 1], shape=(n, n)), sp.eye(n))
+    return COOTensor.from_scipy(A.tocoo()).coalesce().tocsr()
+
+
+def saddle_point(n: int):
+    """[[A, B^T], [B, 0]] with a full rank B."""
+    A = sp.kron(sp.eye(n), sp.diags([-1, 2, -1], [-1, 0, 1], shape=(n, n))) \
+      + sp.kron(sp.diags([-1, 2, -1], [-1, 0, 1], shape=(n, n)), sp.eye(n))
+    B = sp.eye(n*n, format='csr')[::3]
+    K = sp.bmat([[A, B.T], [B, None]])
+    return COOTensor.from_scipy(K.tocoo()).coalesce().tocsr()
+
+
+ALL_SOLVERS = [cg, minres, gmres, bicgstab]
+
+
+class TestIterativeSolver:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('solver', ALL_SOLVERS)
+    @pytest.mark.parametrize('M', [None, 'jacobi', 'ssor', 'ilu0', 'amg'])
+    def test_preconditioned(self, backend, solver, M):
+        bm.set_backend(backend)
+        A = laplace_2d(20)
+        x = bm.from_numpy(np.random.rand(A.shape[0]))
+        b = A @ x
+        if M == 'amg':
+            M = AMGSolver(method='sa', coarse_size=50).setup(A).aspreconditioner()
+
+        x0, info = solver(A, b, M=M, rtol=1e-10, returninfo=True)
+        np.testing.assert_allclose(bm.to_numpy(x0), bm.to_numpy(x), atol=1e-6)
+        assert isinstance(info, SolverInfo)
+        assert info.converged.shape == (1, )
+        assert bool(info.converged[0])
+        assert info.residual_history.shape[1] == 1
+        assert info.nmatvec == len(info.matvec_time) > 0
+        assert info.wall_time > 0.
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('solver', ALL_SOLVERS)
+    def test_batch(self, backend, solver):
+        bm.set_backend(backend)
+        A = laplace_2d(15)
+        N = A.shape[0]
+        X = np.random.rand(N, 3)
+        X[:, 1] = 0.0   # the zero column converges immediately
+        B = A @ bm.from_numpy(X)
+
+        X0, info = solver(A, B, rtol=1e-10, returninfo=True)
+        np.testing.assert_allclose(bm.to_numpy(X0), X, atol=1e-6)
+        assert info.niter.shape == (3, )
+        assert int(info.niter[1]) == 0
+        assert int(info.niter[0]) > 0
+        assert bool(bm.all(info.converged))
+
+        X1 = solver(A, bm.swapaxes(B, 0, 1), batch_first=True, rtol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(X1), X.T, atol=1e-6)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('solver', [minres, gmres, bicgstab])
+    def test_saddle_point(self, backend, solver):
+        bm.set_backend(backend)
+        K = saddle_point(10)
+        x = bm.from_numpy(np.random.rand(K.shape[0]))
+        x0 = solver(K, K @ x, rtol=1e-10, maxiter=2000)
+        np.testing.assert_allclose(bm.to_numpy(x0), bm.to_numpy(x), atol=1e-6)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('solver', ALL_SOLVERS)
+    def test_matrix_free(self, backend, solver):
+        bm.set_backend(backend)
+
+        class Diagonal():
+            """A matrix-free operator which only supports 1-D vectors."""
+            def __init__(self, d):
+                self.d = d
+            def __matmul__(self, x):
+                assert x.ndim == 1
+                return self.d * x
+
+        d = bm.arange(1, 6, dtype=bm.float64)
+        b = bm.ones((5, ), dtype=bm.float64)
+        x = solver(Diagonal(d), b, rtol=1e-12)
+        assert x.shape == (5, )
+        np.testing.assert_allclose(bm.to_numpy(x), 1 / np.arange(1, 6), atol=1e-10)
+        x = solver(Diagonal(d), b, M=Diagonal(1 / d), rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(x), 1 / np.arange(1, 6), atol=1e-10)
+
+    def test_maxiter(self):
+        bm.set_backend('numpy')
+        A = laplace_2d(20)
+        b = bm.ones((A.shape[0], ), dtype=bm.float64)
+        _, info = cg(A, b, maxiter=5, returninfo=True)
+        assert int(info.niter[0]) == 5
+        assert not bool(info.converged[0])
+        assert info.to_dict()['niter'] == [5]
+
+
+class TestPreconditioner:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_exact_on_triangular(self, backend):
+        bm.set_backend(backend)
+        A = sp.random(50, 50, density=0.1, random_state=0) + 4 * sp.eye(50)
+        L = COOTensor.from_scipy(sp.tril(A).tocoo()).coalesce().tocsr()
+        r = np.random.rand(50, 2)
+
+        # ILU(0) of a triangular matrix is the matrix itself
+        y = ILU0Preconditioner(L) @ bm.from_numpy(r)
+        expected = np.linalg.solve(sp.tril(A).toarray(), r)
+        np.testing.assert_allclose(bm.to_numpy(y), expected, atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_ssor(self, backend):
+        bm.set_backend(backend)
+        A = laplace_2d(8)
+        Ad = bm.to_numpy(A.to_dense())
+        omega = 1.2
+        D = np.diag(np.diag(Ad))
+        L = np.tril(Ad, -1)
+        Mat = omega / (2 - omega) * (D/omega + L) @ np.linalg.inv(D/omega) @ (D/omega + L.T)
+        r = np.random.rand(A.shape[0])
+
+        y = SSORPreconditioner(A, omega=omega) @ bm.from_numpy(r)
+        np.testing.assert_allclose(bm.to_numpy(y), np.linalg.solve(Mat, r), atol=1e-10)
+        y = JacobiPreconditioner(A) @ bm.from_numpy(r)
+        np.testing.assert_allclose(bm.to_numpy(y), r / np.diag(Ad), atol=1e-12)
+
+
+if __name__ == '__main__':
+    pytest.main(['-q', __file__])
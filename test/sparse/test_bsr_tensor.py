@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import BSRTensor, CSRTensor
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import BilinearForm, LinearElasticIntegrator
+from fealpy.material.elastic_material import LinearElasticMaterial
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+
+
+def random_bsr(nbrow=4, nbcol=5, R=2, C=3, seed=0):
+    rng = np.random.default_rng(seed)
+    I = rng.integers(0, nbrow, 12)
+    J = rng.integers(0, nbcol, 12)
+    blocks = rng.random((12, R, C))
+    dense = np.zeros((nbrow*R, nbcol*C))
+    for i, j, b in zip(I, J, blocks):
+        dense[i*R:(i+1)*R, j*C:(j+1)*C] += b
+    bsr = BSRTensor.from_coo_blocks(bm.from_numpy(I), bm.from_numpy(J),
+                                    bm.from_numpy(blocks), (nbrow*R, nbcol*C))
+    return bsr, dense
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_from_blocks(backend):
+    bm.set_backend(backend)
+    bsr, dense = random_bsr()
+    assert bsr.shape == (8, 15)
+    assert bsr.blockshape == (2, 3)
+    np.testing.assert_allclose(bm.to_numpy(bsr.to_dense()), dense)
+    np.testing.assert_allclose(bsr.to_scipy().toarray(), dense)
+    np.testing.assert_allclose(BSRTensor.from_scipy(bsr.to_scipy()).to_scipy().toarray(), dense)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_tocsr(backend):
+    bm.set_backend(backend)
+    bsr, dense = random_bsr()
+    csr = bsr.tocsr()
+    assert isinstance(csr, CSRTensor)
+    np.testing.assert_allclose(csr.to_scipy().toarray(), dense)
+    assert csr.to_scipy().has_sorted_indices
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("width", [0, 1, 4])
+def test_matmul(backend, width):
+    bm.set_backend(backend)
+    bsr, dense = random_bsr()
+    shape = (15, ) if width == 0 else (15, width)
+    x = np.random.rand(*shape)
+    y = bsr @ bm.from_numpy(x)
+    np.testing.assert_allclose(bm.to_numpy(y), dense @ x)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_diagonal_blocks(backend):
+    bm.set_backend(backend)
+    bsr, dense = random_bsr(4, 4, 2, 2)
+    D = bm.to_numpy(bsr.diagonal_blocks())
+    for i in range(4):
+        np.testing.assert_allclose(D[i], dense[2*i:2*i+2, 2*i:2*i+2])
+    with pytest.raises(ValueError):
+        random_bsr()[0].diagonal_blocks()
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_elasticity_assembly(backend):
+    bm.set_backend(backend)
+    mesh = TriangleMesh.from_box(nx=3, ny=3)
+    space = TensorFunctionSpace(LagrangeFESpace(mesh, p=2), shape=(-1, 2))
+    material = LinearElasticMaterial(name='E', elastic_modulus=1, poisson_ratio=0.3,
+                                     hypo='plane_stress')
+    bform = BilinearForm(space)
+    bform.add_integrator(LinearElasticIntegrator(material=material, q=4))
+    K = bform.assembly()
+    B = bform.assembly(format='bsr')
+    assert B.blockshape == (2, 2)
+    assert B.nnzb * 4 == K.nnz
+    np.testing.assert_allclose(B.to_scipy().toarray(), K.to_scipy().toarray(), atol=1e-12)
+
+    x = bm.from_numpy(np.random.rand(K.shape[1]))
+    np.testing.assert_allclose(bm.to_numpy(B @ x), bm.to_numpy(K @ x), atol=1e-12)
+
+    dof_space = TensorFunctionSpace(LagrangeFESpace(mesh, p=1), shape=(2, -1))
+    bform = BilinearForm(dof_space)
+    bform.add_integrator(LinearElasticIntegrator(material=material, q=3))
+    with pytest.raises(ValueError):
+        bform.assembly(format='bsr')
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_bsr_tensor.py"])
@@ -1,8 +1,9 @@
 
+import numpy as np
 import pytest
 
 from fealpy.backend import backend_manager as bm
-from fealpy.sparse._spmm import spmm_coo
+from fealpy.sparse._spmm import spmm_coo, spmm_csr
 
 ALL_BACKENDS = ['numpy', 'pytorch']
 
@@ -140,3 +141,76 @@ def test_spmm_coo_invalid_spshape(backend):
     # Expect a ValueError to be raised
     with pytest.raises(ValueError):
         spmm_coo(indices, values, spshape, x)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr_1d_vector(backend):
+    bm.set_backend(backend)
+    crow = bm.tensor([0, 3, 4, 6, 8])
+    col = bm.tensor([0, 2, 3, 2, 0, 3, 1, 3])
+    values = bm.tensor([1, 2, 4, -1, 3, -1, 5, -2], dtype=bm.float32)
+    spshape = (4, 4)
+    x = bm.tensor([-3, -1, 1, 2], dtype=bm.float32)
+
+    expected = bm.tensor([7, -1, -11, -9], dtype=bm.float32)
+    output = spmm_csr(crow, col, values, spshape, x)
+
+    assert bm.allclose(output, expected), f"Expected {expected} but got {output}"
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr_2d_batch_vector(backend):
+    bm.set_backend(backend)
+    # The second row is empty.
+    crow = bm.tensor([0, 3, 3, 6])
+    col = bm.tensor([0, 2, 3, 0, 1, 3])
+    values = bm.tensor([1, 2, 4, 3, 2, 5], dtype=bm.float32)
+    spshape = (3, 4)
+    x = bm.tensor([[-1, -1, -1, -1, -1],
+                   [6, 9, 1, 2, 7],
+                   [2, 2, 2, 2, 1],
+                   [1, 8, 2, 2, 5]], dtype=bm.float32)
+
+    expected = bm.tensor([[7, 35, 11, 11, 21],
+                          [0, 0, 0, 0, 0],
+                          [14, 55, 9, 11, 36]], dtype=bm.float32)
+    output = spmm_csr(crow, col, values, spshape, x)
+
+    assert bm.allclose(output, expected), f"Expected {expected} but got {output}"
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr_batched_values(backend):
+    bm.set_backend(backend)
+    crow = bm.tensor([0, 3, 4, 7])
+    col = bm.tensor([0, 2, 3, 2, 0, 1, 3])
+    values = bm.tensor([[1, 2, 4, -1, 3, 2, 5],
+                        [2, 4, 8, -2, 6, 4, 10]], dtype=bm.float64)
+    spshape = (3, 4)
+    x = bm.tensor([[[-1, -1], [6, 9], [2, 2], [1, 8]],
+                   [[1, 1], [-6, -9], [-2, -2], [-1, -8]]], dtype=bm.float64)
+
+    expected = bm.tensor([[[7, 35], [-2, -2], [14, 55]],
+                          [[-14, -70], [4, 4], [-28, -110]]], dtype=bm.float64)
+    output = spmm_csr(crow, col, values, spshape, x)
+
+    assert bm.allclose(output, expected), f"Expected {expected} but got {output}"
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr_matches_coo(backend):
+    bm.set_backend(backend)
+    from fealpy.sparse import COOTensor
+
+    NN, nnz = 50, 300
+    indices = bm.from_numpy(np.random.randint(0, NN, (2, nnz)))
+    values = bm.from_numpy(np.random.rand(nnz))
+    coo = COOTensor(indices, values, (NN, NN)).coalesce()
+    csr = coo.tocsr()
+
+    for x in [np.random.rand(NN), np.random.rand(NN, 3), np.random.rand(2, NN, 3)]:
+        x = bm.from_numpy(x)
+        expected = spmm_coo(coo.indices(), coo.values(), coo.sparse_shape, x)
+        output = spmm_csr(csr.crow(), csr.col(), csr.values(), csr.sparse_shape, x)
+        np.testing.assert_allclose(bm.to_numpy(output), bm.to_numpy(expected), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(csr @ x), bm.to_numpy(expected), atol=1e-12)
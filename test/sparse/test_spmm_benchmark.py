@@ -0,0 +1,75 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import COOTensor
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+SIZES = [10**3, 10**5]
+BATCH_WIDTHS = [1, 8]
+
+
+def laplace_2d(n: int):
+    """Five-point Laplacian on a n x n grid, returned as a coalesced COOTensor."""
+    NN = n * n
+    idx = np.arange(NN).reshape(n, n)
+    row = [idx.ravel()]
+    col = [idx.ravel()]
+    val = [np.full(NN, 4.0)]
+
+    for a, b in [(idx[1:, :], idx[:-1, :]), (idx[:, 1:], idx[:, :-1])]:
+        row += [a.ravel(), b.ravel()]
+        col += [b.ravel(), a.ravel()]
+        val += [np.full(a.size, -1.0)] * 2
+
+    indices = bm.from_numpy(np.stack([np.concatenate(row), np.concatenate(col)]))
+    values = bm.from_numpy(np.concatenate(val))
+    return COOTensor(indices, values, (NN, NN)).coalesce()
+
+
+def _make_input(size: int, width: int):
+    n = int(np.sqrt(size))
+    coo = laplace_2d(n)
+    shape = (n*n, ) if width == 1 else (n*n, width)
+    x = bm.from_numpy(np.random.rand(*shape))
+    return coo, x
+
+
+@pytest.mark.benchmark(group="spmm_coo")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("width", BATCH_WIDTHS)
+@pytest.mark.parametrize("size", SIZES)
+def test_coo_matmul(benchmark, size, width, backend):
+    bm.set_backend(backend)
+    coo, x = _make_input(size, width)
+    result = benchmark(coo.matmul, x)
+    expected = coo.to_scipy() @ bm.to_numpy(x)
+    np.testing.assert_allclose(bm.to_numpy(result), expected)
+
+
+@pytest.mark.benchmark(group="spmm_csr")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("width", BATCH_WIDTHS)
+@pytest.mark.parametrize("size", SIZES)
+def test_csr_matmul(benchmark, size, width, backend):
+    bm.set_backend(backend)
+    coo, x = _make_input(size, width)
+    csr = coo.tocsr()
+    result = benchmark(csr.matmul, x)
+    expected = coo.to_scipy() @ bm.to_numpy(x)
+    np.testing.assert_allclose(bm.to_numpy(result), expected)
+
+
+@pytest.mark.benchmark(group="spmm_scipy")
+@pytest.mark.parametrize("width", BATCH_WIDTHS)
+@pytest.mark.parametrize("size", SIZES)
+def test_scipy_matmul(benchmark, size, width):
+    bm.set_backend('numpy')
+    coo, x = _make_input(size, width)
+    mat = coo.tocsr().to_scipy()
+    benchmark(mat.__matmul__, x)
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '--benchmark-group-by=param:size', __file__])
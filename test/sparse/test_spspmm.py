@@ -1,9 +1,10 @@
 
+import numpy as np
 import pytest
 
 from fealpy.backend import backend_manager as bm
 from fealpy.sparse._spspmm import spspmm_coo
-from fealpy.sparse import COOTensor
+from fealpy.sparse import COOTensor, CSRTensor
 
 ALL_BACKENDS = ['numpy', 'pytorch']
 
@@ -47,5 +48,109 @@ def test_spspmm_coo_valid_input(backend):
 
     assert bm.allclose(result, expected)
 
-# Additional tests can be added here to cover more edge cases, different shapes,
-# or to ensure consistency with other matrix multiplication methods under various conditions.
+
+def _random_coo(shape, nnz, seed):
+    rng = np.random.default_rng(seed)
+    indices = np.stack([rng.integers(0, shape[0], nnz),
+                        rng.integers(0, shape[1], nnz)])
+    values = rng.random(nnz)
+    return indices, values
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("shapes", [((30, 40), (40, 20)), ((50, 50), (50, 50)), ((7, 100), (100, 3))])
+def test_spspmm_coo_matches_scipy(backend, shapes):
+    bm.set_backend(backend)
+    from scipy.sparse import coo_matrix
+    shape1, shape2 = shapes
+    idx1, val1 = _random_coo(shape1, 120, 0)
+    idx2, val2 = _random_coo(shape2, 90, 1)
+
+    A = COOTensor(bm.from_numpy(idx1), bm.from_numpy(val1), shape1)
+    B = COOTensor(bm.from_numpy(idx2), bm.from_numpy(val2), shape2)
+    C = A @ B
+
+    expected = (coo_matrix((val1, idx1), shape1) @ coo_matrix((val2, idx2), shape2)).toarray()
+    assert C.is_coalesced
+    assert C.sparse_shape == expected.shape
+    np.testing.assert_allclose(bm.to_numpy(C.to_dense()), expected, atol=1e-12)
+
+    indices = bm.to_numpy(C.indices())
+    flat = indices[0] * shape2[1] + indices[1]
+    assert np.all(flat[1:] > flat[:-1])
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_csr_matches_scipy(backend):
+    bm.set_backend(backend)
+    from scipy.sparse import coo_matrix
+    idx1, val1 = _random_coo((60, 45), 150, 2)
+    idx2, val2 = _random_coo((45, 30), 100, 3)
+    # leave some empty rows in both matrices
+    idx1[0, idx1[0] < 5] = 5
+    idx2[0, idx2[0] > 40] = 40
+
+    A = CSRTensor.from_scipy(coo_matrix((val1, idx1), (60, 45)).tocsr())
+    B = CSRTensor.from_scipy(coo_matrix((val2, idx2), (45, 30)).tocsr())
+    C = A @ B
+
+    expected = (coo_matrix((val1, idx1), (60, 45)) @ coo_matrix((val2, idx2), (45, 30))).tocsr()
+    expected.sort_indices()
+    np.testing.assert_array_equal(bm.to_numpy(C.crow()), expected.indptr)
+    np.testing.assert_array_equal(bm.to_numpy(C.col()), expected.indices)
+    np.testing.assert_allclose(bm.to_numpy(C.values()), expected.data, atol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_coo_batched_values(backend):
+    bm.set_backend(backend)
+    idx1, val1 = _random_coo((20, 25), 60, 4)
+    idx2, val2 = _random_coo((25, 15), 50, 5)
+    val1 = np.stack([val1, 2*val1, -val1])
+    val2 = np.stack([val2, val2, 3*val2])
+
+    indices, values, spshape = spspmm_coo(
+        bm.from_numpy(idx1), bm.from_numpy(val1), (20, 25),
+        bm.from_numpy(idx2), bm.from_numpy(val2), (25, 15)
+    )
+    C = bm.to_numpy(COOTensor(indices, values, spshape).to_dense())
+
+    for i in range(3):
+        A = np.zeros((20, 25))
+        np.add.at(A, tuple(idx1), val1[i])
+        B = np.zeros((25, 15))
+        np.add.at(B, tuple(idx2), val2[i])
+        np.testing.assert_allclose(C[i], A @ B, atol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_galerkin_product(backend):
+    bm.set_backend(backend)
+    from scipy.sparse import coo_matrix
+    idx, val = _random_coo((40, 40), 200, 6)
+    pidx, pval = _random_coo((40, 10), 60, 7)
+    A = COOTensor(bm.from_numpy(idx), bm.from_numpy(val), (40, 40))
+    P = COOTensor(bm.from_numpy(pidx), bm.from_numpy(pval), (40, 10))
+
+    As = coo_matrix((val, idx), (40, 40))
+    Ps = coo_matrix((pval, pidx), (40, 10))
+    expected = (Ps.T @ As @ Ps).toarray()
+
+    np.testing.assert_allclose(bm.to_numpy((P.T @ A @ P).to_dense()), expected, atol=1e-12)
+
+    A, P = A.coalesce().tocsr(), P.coalesce().tocsr()
+    np.testing.assert_allclose(bm.to_numpy((P.T @ A @ P).to_dense()), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_empty_product(backend):
+    bm.set_backend(backend)
+    indices1 = bm.tensor([[0, 1], [0, 0]])
+    values1 = bm.tensor([1.0, 2.0], dtype=bm.float64)
+    indices2 = bm.tensor([[1], [2]])
+    values2 = bm.tensor([3.0], dtype=bm.float64)
+
+    indices, values, spshape = spspmm_coo(indices1, values1, (2, 2), indices2, values2, (2, 3))
+    assert indices.shape == (2, 0)
+    assert values.shape == (0, )
+    assert spshape == (2, 3)
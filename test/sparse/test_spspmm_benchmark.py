@@ -0,0 +1,46 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+
+from test_spmm_benchmark import laplace_2d
+
+ALL_BACKENDS = ['numpy', 'pytorch']
+SIZES = [10**3, 10**5]
+
+
+@pytest.mark.benchmark(group="spspmm_coo")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("size", SIZES)
+def test_coo_spspmm(benchmark, size, backend):
+    bm.set_backend(backend)
+    A = laplace_2d(int(np.sqrt(size)))
+    result = benchmark(A.matmul, A)
+    expected = (A.to_scipy() @ A.to_scipy()).tocsr()
+    expected.sort_indices()
+    np.testing.assert_allclose(bm.to_numpy(result.tocsr().values()), expected.data)
+
+
+@pytest.mark.benchmark(group="spspmm_csr")
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.parametrize("size", SIZES)
+def test_csr_spspmm(benchmark, size, backend):
+    bm.set_backend(backend)
+    A = laplace_2d(int(np.sqrt(size))).tocsr()
+    result = benchmark(A.matmul, A)
+    expected = (A.to_scipy() @ A.to_scipy())
+    expected.sort_indices()
+    np.testing.assert_allclose(bm.to_numpy(result.values()), expected.data)
+
+
+@pytest.mark.benchmark(group="spspmm_scipy")
+@pytest.mark.parametrize("size", SIZES)
+def test_scipy_spspmm(benchmark, size):
+    bm.set_backend('numpy')
+    A = laplace_2d(int(np.sqrt(size))).tocsr().to_scipy()
+    benchmark(A.__matmul__, A)
+
+
+if __name__ == "__main__":
+    pytest.main(['-q', '--benchmark-group-by=param:size', __file__])
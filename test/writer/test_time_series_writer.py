@@ -0,0 +1,83 @@
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.writer import TimeSeriesWriter
+
+
+class TestTimeSeriesWriter:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_npz(self, backend, tmp_path):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        NN, NC = mesh.number_of_nodes(), mesh.number_of_cells()
+        uh = bm.zeros((NN, ), dtype=bm.float64)
+        fname = str(tmp_path / 'out' / 'run')
+
+        with TimeSeriesWriter(fname, mesh, format='npz', maxsize=2) as writer:
+            for i in range(5):
+                uh = bm.set_at(uh, slice(None), float(i)) # modified in place after submitted
+                writer.write(0.1*i, nodedata={'uh': uh},
+                             celldata={'flag': bm.ones((NC, ), dtype=bm.bool)})
+
+        data = np.load(fname + '.npz')
+        np.testing.assert_array_equal(data['cell'], bm.to_numpy(mesh.cell))
+        np.testing.assert_allclose(data['node'], bm.to_numpy(mesh.node))
+        np.testing.assert_allclose(data['time'], 0.1*np.arange(5))
+        for i in range(5):
+            np.testing.assert_array_equal(data[f'uh/{i:06d}'], np.full(NN, float(i)))
+        assert data['flag/000004'].shape == (NC, )
+
+    def test_errors(self, tmp_path):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        writer = TimeSeriesWriter(str(tmp_path / 'run'), mesh, format='npz')
+        with pytest.raises(ValueError):
+            writer.write(0.0, nodedata={'uh': bm.zeros(3)})
+        writer.close()
+        with pytest.raises(RuntimeError):
+            writer.write(0.0, nodedata={'uh': bm.zeros(mesh.number_of_nodes())})
+
+    @pytest.mark.parametrize("format", ['npz', 'xdmf'])
+    def test_close_after_error(self, format, tmp_path):
+        if format == 'xdmf':
+            pytest.importorskip('h5py')
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        writer = TimeSeriesWriter(str(tmp_path / 'run'), mesh, format=format)
+        container = writer._container
+
+        def write_step(*args):
+            raise OSError("disk full")
+        container.write_step = write_step
+        writer.write(0.0, nodedata={'uh': bm.zeros(mesh.number_of_nodes())})
+        with pytest.raises(RuntimeError):
+            writer.close()
+        # the file is closed although the error is raised
+        if format == 'xdmf':
+            assert not container.file
+        else:
+            assert container.file.fp is None
+
+    def test_xdmf(self, tmp_path):
+        h5py = pytest.importorskip('h5py')
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        NN = mesh.number_of_nodes()
+        fname = str(tmp_path / 'run')
+
+        with TimeSeriesWriter(fname, mesh, format='xdmf') as writer:
+            for i in range(3):
+                writer.write(0.1*i, nodedata={'uh': bm.full((NN, ), float(i))})
+
+        with h5py.File(fname + '.h5', 'r') as f:
+            np.testing.assert_array_equal(f['mesh/cell'][:], bm.to_numpy(mesh.cell))
+            assert len(f['nodedata/uh']) == 3
+        with open(fname + '.xdmf') as f:
+            assert f.read().count('<Grid Name="mesh"') == 3
+
+
+if __name__ == "__main__":
+    pytest.main(["./test_time_series_writer.py"])